@@ -0,0 +1,325 @@
+"""
+비동기 임베딩 클라이언트 (OpenAI 호환 /embeddings 엔드포인트)
+
+- 토큰 예산 묶음: 요청 1회의 총 토큰(max_tokens_per_request)과 입력 수(max_inputs_per_request) 안에서 텍스트를 묶음
+- 입력 1개 한도(max_tokens_per_input)를 넘는 긴 텍스트는 토큰 창으로 나눠 임베딩 후 토큰 수 가중 평균
+- 동시 요청(concurrency) + 분당 요청/토큰 한도(requests_per_minute, tokens_per_minute, 호출 간 버킷 상태 유지)
+- 429/5xx/네트워크 오류는 지수 백오프 재시도 (Retry-After 우선)
+- 토큰 초과(400/413) 응답은 요청을 반으로 나눠 재시도, 입력 1개면 텍스트를 반으로 나눠 평균
+- base_url만 바꾸면 로컬 모의 서버(mock_embedding_server.py)나 다른 호환 서버에도 그대로 사용
+"""
+
+import time
+import random
+import asyncio
+import logging
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASE_URL = "https://api.openai.com/v1"
+OVERFLOW_MARKERS = ("maximum context length", "too many tokens", "max_tokens_per_request", "maximum request size")
+
+
+class TokenCounter:
+    """tiktoken 토큰 수 계산 (없거나 인코딩 파일을 못 받으면 UTF-8 바이트 기반 보수적 추정)"""
+
+    def __init__(self, model: str):
+        self.encoding = None
+        try:
+            import tiktoken
+            try:
+                self.encoding = tiktoken.encoding_for_model(model)
+            except KeyError:
+                self.encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            logger.info(f"tiktoken 사용 불가, 토큰 수 추정치 사용: {e}")
+
+    def count(self, text: str) -> int:
+        if self.encoding is not None:
+            return len(self.encoding.encode(text, disallowed_special=()))
+        return len(text.encode('utf-8')) // 2 + 1
+
+    def split(self, text: str, max_tokens: int) -> List[str]:
+        """max_tokens 이하 조각으로 분할"""
+        if self.encoding is not None:
+            tokens = self.encoding.encode(text, disallowed_special=())
+            return [self.encoding.decode(tokens[i:i + max_tokens]) for i in range(0, len(tokens), max_tokens)]
+        if self.count(text) <= max_tokens or len(text) < 2:
+            return [text]
+        middle = len(text) // 2
+        return self.split(text[:middle], max_tokens) + self.split(text[middle:], max_tokens)
+
+
+class AsyncRateLimiter:
+    """
+    분당 한도 토큰 버킷 (rate_per_minute <= 0이면 제한 없음)
+
+    버킷 상태(남은 양, 갱신 시각)는 클라이언트 수명 동안 유지하고 asyncio.Lock만 이벤트 루프별로 생성
+    → embed()를 여러 번(매번 새 루프) 호출해도 매번 가득 찬 버킷으로 시작하지 않음
+    """
+
+    def __init__(self, rate_per_minute: float):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = rate_per_minute
+        self._available = rate_per_minute
+        self._updated = time.monotonic()
+        self._state_lock = threading.Lock()
+        self._loop_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+    def _loop_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        with self._state_lock:
+            lock = self._loop_locks.get(loop)
+            if lock is None:
+                lock = self._loop_locks[loop] = asyncio.Lock()
+            return lock
+
+    def _take(self, amount: float) -> float:
+        """가능하면 차감 후 0, 아니면 기다려야 할 시간(초)"""
+        with self._state_lock:
+            now = time.monotonic()
+            self._available = min(self.capacity, self._available + (now - self._updated) * self.rate)
+            self._updated = now
+            if self._available >= amount:
+                self._available -= amount
+                return 0.0
+            return (amount - self._available) / self.rate
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        if self.rate <= 0:
+            return
+        amount = min(amount, self.capacity)  # 한도보다 큰 요청은 버킷 전체를 사용
+        async with self._loop_lock():
+            while True:
+                wait = self._take(amount)
+                if not wait:
+                    return
+                await asyncio.sleep(wait)
+
+
+class EmbeddingRequestError(Exception):
+    """재시도 후에도 실패한 임베딩 요청"""
+
+
+class RequestOverflowError(EmbeddingRequestError):
+    """요청 토큰 한도 초과 (나눠서 재시도 대상)"""
+
+
+@dataclass
+class ClientStats:
+    """요청 통계"""
+    requests: int = 0
+    retries: int = 0
+    splits: int = 0
+    failed_inputs: int = 0
+    tokens: int = 0
+
+
+@dataclass
+class _Unit:
+    """임베딩 요청 단위 (원본 텍스트 번호, 조각 텍스트, 토큰 수)"""
+    owner: int
+    text: str
+    tokens: int
+
+
+class AsyncEmbeddingClient:
+    """OpenAI 호환 임베딩 엔드포인트용 동시/속도 제한 클라이언트"""
+
+    def __init__(self,
+                 model: str,
+                 api_key: Optional[str] = None,
+                 base_url: str = DEFAULT_BASE_URL,
+                 max_tokens_per_request: int = 300_000,
+                 max_tokens_per_input: int = 8191,
+                 max_inputs_per_request: int = 2048,
+                 concurrency: int = 4,
+                 requests_per_minute: float = 0,
+                 tokens_per_minute: float = 0,
+                 max_retries: int = 5,
+                 timeout: float = 120.0):
+        """
+        생성자
+
+        Args:
+            model: 임베딩 모델명
+            api_key: Bearer 토큰 (로컬 서버는 생략 가능)
+            base_url: OpenAI 호환 API 주소 (.../v1)
+            max_tokens_per_request: 요청 1회 총 토큰 한도
+            max_tokens_per_input: 입력 1개 토큰 한도 (넘으면 창으로 분할)
+            max_inputs_per_request: 요청 1회 입력 수 한도
+            concurrency: 동시 요청 수
+            requests_per_minute: 분당 요청 한도 (0이면 제한 없음)
+            tokens_per_minute: 분당 토큰 한도 (0이면 제한 없음)
+            max_retries: 429/5xx/네트워크 오류 재시도 횟수
+            timeout: 요청 타임아웃(초)
+        """
+        self.model = model
+        self.api_key = api_key
+        self.base_url = base_url.rstrip('/')
+        self.max_tokens_per_request = max_tokens_per_request
+        self.max_tokens_per_input = min(max_tokens_per_input, max_tokens_per_request)
+        self.max_inputs_per_request = max_inputs_per_request
+        self.concurrency = max(1, concurrency)
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.counter = TokenCounter(model)
+        self.stats = ClientStats()
+        self._stats_lock = threading.Lock()
+        self._request_limiter = AsyncRateLimiter(requests_per_minute)
+        self._token_limiter = AsyncRateLimiter(tokens_per_minute)
+
+    # ---------- 묶음 구성 ----------
+
+    def _units(self, texts: Sequence[str]) -> List[_Unit]:
+        units = []
+        for owner, text in enumerate(texts):
+            tokens = self.counter.count(text)
+            if tokens <= self.max_tokens_per_input:
+                units.append(_Unit(owner, text, tokens))
+                continue
+            for piece in self.counter.split(text, self.max_tokens_per_input):
+                units.append(_Unit(owner, piece, self.counter.count(piece)))
+        return units
+
+    def _pack(self, units: List[_Unit]) -> List[List[_Unit]]:
+        """입력 순서대로 토큰/입력 수 한도 안에서 요청 묶음 구성"""
+        requests, current, current_tokens = [], [], 0
+        for unit in units:
+            if current and (current_tokens + unit.tokens > self.max_tokens_per_request
+                            or len(current) >= self.max_inputs_per_request):
+                requests.append(current)
+                current, current_tokens = [], 0
+            current.append(unit)
+            current_tokens += unit.tokens
+        if current:
+            requests.append(current)
+        return requests
+
+    # ---------- 요청 ----------
+
+    def _count(self, **deltas) -> None:
+        with self._stats_lock:
+            for name, delta in deltas.items():
+                setattr(self.stats, name, getattr(self.stats, name) + delta)
+
+    async def _post(self, http: httpx.AsyncClient, inputs: List[str], tokens: int) -> List[np.ndarray]:
+        """요청 1회 (재시도 포함), 토큰 초과면 RequestOverflowError"""
+        for attempt in range(self.max_retries + 1):
+            await self._request_limiter.acquire(1)
+            await self._token_limiter.acquire(tokens)
+            delay = None
+            try:
+                async with self._semaphore:
+                    self._count(requests=1)
+                    response = await http.post(
+                        "/embeddings",
+                        json={"model": self.model, "input": inputs, "encoding_format": "float"}
+                    )
+                if response.status_code == 200:
+                    self._count(tokens=tokens)
+                    data = sorted(response.json()["data"], key=lambda item: item["index"])
+                    return [np.asarray(item["embedding"], dtype=np.float32) for item in data]
+                if response.status_code in (400, 413) and (
+                        response.status_code == 413 or
+                        any(marker in response.text.lower() for marker in OVERFLOW_MARKERS)):
+                    raise RequestOverflowError(f"{response.status_code}: {response.text[:200]}")
+                if response.status_code != 429 and response.status_code < 500:
+                    raise EmbeddingRequestError(f"{response.status_code}: {response.text[:200]}")
+                retry_after = response.headers.get("retry-after")
+                delay = float(retry_after) if retry_after else None
+                error = f"{response.status_code}: {response.text[:200]}"
+            except (httpx.TransportError, httpx.TimeoutException) as e:
+                error = f"{type(e).__name__}: {e}"
+
+            if attempt == self.max_retries:
+                raise EmbeddingRequestError(f"재시도 {self.max_retries}회 초과 ({error})")
+            self._count(retries=1)
+            delay = delay if delay is not None else min(60.0, 2 ** attempt) * (0.5 + random.random())
+            logger.warning(f"임베딩 요청 재시도 {attempt + 1}/{self.max_retries} ({delay:.1f}초 후): {error}")
+            await asyncio.sleep(delay)
+
+    async def _embed_units(self, http: httpx.AsyncClient, units: List[_Unit]) -> List[Tuple[_Unit, np.ndarray]]:
+        """묶음 임베딩, 토큰 초과 시 반으로 나눠 재귀 (입력 1개면 텍스트를 나눠 평균)"""
+        try:
+            vectors = await self._post(http, [unit.text for unit in units], sum(unit.tokens for unit in units))
+            return list(zip(units, vectors))
+        except RequestOverflowError:
+            self._count(splits=1)
+            if len(units) > 1:
+                middle = len(units) // 2
+                halves = await asyncio.gather(self._embed_units(http, units[:middle]),
+                                              self._embed_units(http, units[middle:]))
+                return halves[0] + halves[1]
+            unit = units[0]
+            if len(unit.text) < 2:
+                raise
+            middle = len(unit.text) // 2
+            pieces = [_Unit(unit.owner, part, max(1, unit.tokens // 2))
+                      for part in (unit.text[:middle], unit.text[middle:])]
+            embedded = await asyncio.gather(self._embed_units(http, pieces[:1]), self._embed_units(http, pieces[1:]))
+            return embedded[0] + embedded[1]
+
+    async def aembed(self, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """
+        텍스트 목록 임베딩
+
+        Returns:
+            텍스트 순서대로 float32 벡터 (여러 조각이면 토큰 가중 평균 후 정규화, 실패는 None)
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+        # 세마포어는 이벤트 루프에 묶이므로 실행마다 생성 (분당 한도 버킷은 클라이언트에 유지)
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+
+        units = self._units(texts)
+        requests = self._pack(units)
+        headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+        async with httpx.AsyncClient(base_url=self.base_url, headers=headers, timeout=self.timeout,
+                                     limits=httpx.Limits(max_connections=self.concurrency)) as http:
+            results = await asyncio.gather(*(self._embed_units(http, request) for request in requests),
+                                           return_exceptions=True)
+
+        sums: List[Optional[np.ndarray]] = [None] * len(texts)
+        failed = set()
+        for request, result in zip(requests, results):
+            if isinstance(result, BaseException):
+                logger.error(f"임베딩 요청 실패 ({len(request)}개 입력): {result}")
+                failed.update(unit.owner for unit in request)
+                continue
+            for unit, vector in result:
+                weighted = vector * unit.tokens
+                sums[unit.owner] = weighted if sums[unit.owner] is None else sums[unit.owner] + weighted
+
+        embeddings: List[Optional[np.ndarray]] = []
+        for owner, total in enumerate(sums):
+            if owner in failed or total is None:
+                embeddings.append(None)
+                continue
+            norm = np.linalg.norm(total)
+            embeddings.append((total / norm if norm else total).astype(np.float32))
+        self._count(failed_inputs=len(failed))
+        return embeddings
+
+    def embed(self, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """동기 호출용 (이미 이벤트 루프 안이면 별도 스레드에서 실행)"""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.aembed(texts))
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self.aembed(texts)).result()
+
+    def stats_dict(self) -> Dict[str, Any]:
+        return asdict(self.stats)
@@ -14,6 +14,9 @@ import multiprocessing as mp
 from functools import partial
 import threading
 import yaml
+from contextlib import nullcontext
+from offline_pipeline import Prefetcher, BackgroundWriter, GPUUtilizationMonitor
+from run_manifest import RunManifest, file_sha256, prompt_version, atomic_write_json, STATUS_DONE, STATUS_FAILED
 
 # Import prompt generation functions from ai-engine-dev modules
 import sys
@@ -130,6 +133,14 @@ if config and 'base_model' in config:
     TENSOR_PARALLEL_SIZE = config['base_model'].get('tensor_parallel_size', 1)
     GPU_MEMORY_UTILIZATION = config['base_model'].get('gpu_memory_utilization', 0.7)
     MAX_MODEL_LEN = config['base_model'].get('max_model_len', 16384)
+    GLOBAL_BATCHING = config['base_model'].get('global_batching', True)
+    BATCH_TOKEN_BUDGET = config['base_model'].get('batch_token_budget', 200000)
+    RESUME = config['base_model'].get('resume', True)
+    RUN_MANIFEST_PATH = config['base_model'].get('run_manifest')
+    PREFETCH_FILES = config['base_model'].get('prefetch_files', 4)
+    PREFETCH_WORKERS = config['base_model'].get('prefetch_workers', 2)
+    WRITER_WORKERS = config['base_model'].get('writer_workers', 2)
+    GPU_MONITOR_INTERVAL = config['base_model'].get('gpu_monitor_interval', 1.0)
 else:
     # 기본값
     model_path = "Qwen/Qwen3-4B-AWQ"
@@ -140,6 +151,14 @@ else:
     TENSOR_PARALLEL_SIZE = 1
     GPU_MEMORY_UTILIZATION = 0.7
     MAX_MODEL_LEN = 16384
+    GLOBAL_BATCHING = True  # 여러 파일의 청크를 하나의 엔진 배치로 처리
+    BATCH_TOKEN_BUDGET = 200000  # 엔진에 동시에 넣을 (프롬프트 + 최대 출력) 토큰 합계
+    RESUME = True  # 실행 매니페스트에 완료로 기록된 청크는 건너뜀
+    RUN_MANIFEST_PATH = None  # None이면 출력 디렉토리의 run_manifest.sqlite
+    PREFETCH_FILES = 4  # 생성 중에 미리 로드/토큰화할 회의 파일 수 (0이면 미리 읽지 않음)
+    PREFETCH_WORKERS = 2  # 미리 읽기 스레드 수
+    WRITER_WORKERS = 2  # 결과 저장 스레드 수 (0이면 메인 스레드에서 저장)
+    GPU_MONITOR_INTERVAL = 1.0  # GPU 사용률 샘플링 간격(초), 0이면 샘플링 없이 생성 구간 비율만
 
 print(f"🚀 선택된 모델: {model_path}")
 
@@ -147,6 +166,12 @@ print(f"🚀 선택된 모델: {model_path}")
 llm = None
 tokenizer = None
 sampling_params = None
+run_manifest = None
+gpu_monitor = None
+
+def generation_span():
+    """생성 호출 구간 (GPU 사용률 집계용)"""
+    return gpu_monitor.busy() if gpu_monitor is not None else nullcontext()
 
 def initialize_model():
     """각 프로세스에서 모델 초기화"""
@@ -272,33 +297,78 @@ def process_utterances_to_text(utterances, speakers_set=None):
     full_text = '\n'.join(meeting_lines)
     return full_text, list(speakers)
 
-# generate_chunk_summary 함수는 배치 처리 방식으로 대체됨
-# 개별 청크 처리 대신 process_single_file_parallel에서 배치로 처리
+SYSTEM_PROMPT = """당신은 회의록을 분석하여 체계적인 프로젝트 기획안을 작성하는 전문가입니다.
+회의에서 논의된 내용을 바탕으로 명확하고 실행 가능한 기획안을 작성해주세요.
+응답은 반드시 요청된 JSON 형식으로만 제공하세요."""
 
-def process_single_file_parallel(input_file_path, output_dir, model_used, folder_name, chunk_size=None, overlap=None):
-    """단일 파일을 처리하여 청크별로 저장 (배치 처리 방식)"""
-    from pathlib import Path
-    
+def default_notion_output():
+    """JSON 추출/파싱 실패 시 사용하는 기본 구조"""
+    return {
+        "project_name": "회의 기반 프로젝트",
+        "project_purpose": "회의 내용 기반 프로젝트 추진",
+        "project_period": "미정",
+        "project_manager": "미정",
+        "core_objectives": [
+            "목표 1: 구체적인 목표",
+            "목표 2: 구체적인 목표",
+            "목표 3: 구체적인 목표"
+        ],
+        "core_idea": "핵심 아이디어 설명",
+        "idea_description": "아이디어의 기술적/비즈니스적 설명",
+        "execution_plan": "단계별 실행 계획과 일정",
+        "expected_effects": [
+            "기대효과 1: 자세한 설명",
+            "기대효과 2: 자세한 설명",
+            "기대효과 3: 자세한 설명"
+        ]
+    }
+
+def current_prompt_version():
+    """결과에 영향을 주는 프롬프트 템플릿/청킹/생성 설정의 버전 해시"""
+    return prompt_version(
+        SYSTEM_PROMPT,
+        generate_notion_project_prompt("{meeting_transcript}"),
+        generate_meeting_analysis_user_prompt("{transcript}", "{additional_context}"),
+        CHUNK_SIZE, CHUNK_OVERLAP, TEMPERATURE, MAX_TOKENS
+    )
+
+def open_run_manifest(output_base_dir):
+    """출력 디렉토리 기준 실행 매니페스트 열기 (재실행 시 완료 청크 건너뛰기용)"""
+    global run_manifest
+    manifest_path = RUN_MANIFEST_PATH or os.path.join(output_base_dir, "run_manifest.sqlite")
+    run_manifest = RunManifest(manifest_path, model_path, current_prompt_version())
+    print(f"🗂️ 실행 매니페스트: {os.path.relpath(manifest_path, os.getcwd())} (프롬프트 버전 {run_manifest.prompt_version})")
+    return run_manifest
+
+def record_job_status(job, status, error=None):
+    """청크 처리 결과를 매니페스트에 기록 (매니페스트가 없으면 무시)"""
+    if run_manifest is None:
+        return
+    run_manifest.mark(
+        job["input_hash"], job["chunk_idx"], status,
+        source=job["metadata"]["source_file"],
+        output_path=job["chunk_dir"] / "result.json",
+        error=error
+    )
+
+def prepare_file_jobs(input_file_path, output_dir, folder_name, chunk_size=None, overlap=None):
+    """단일 파일 → 청크별 생성 작업 목록 (프롬프트 + 저장 위치), 데이터가 없으면 None"""
     # 상대 경로로 표시
     rel_input_path = os.path.relpath(input_file_path, os.getcwd())
     print(f"\n📁 처리 중: {rel_input_path}")
     
-    # 모델 초기화 (메인 프로세스에서)
-    if llm is None:
-        initialize_model()
-    
     # 발화 데이터를 텍스트로 변환
     utterances = load_json_file(input_file_path)
     if not utterances:
         print(f"⚠️  {input_file_path}에서 유효한 데이터를 찾을 수 없습니다.")
-        return 0, 1  # (성공, 실패) 튜플 반환
+        return None
     
     # 발화를 텍스트로 변환
     full_text, speakers = process_utterances_to_text(utterances)
     
     if not full_text:
         print(f"⚠️  {input_file_path}에서 텍스트를 추출할 수 없습니다.")
-        return 0, 1
+        return None
     
     # 메타데이터 생성 (상대 경로로 변경)
     metadata = {
@@ -331,14 +401,15 @@ def process_single_file_parallel(input_file_path, output_dir, model_used, folder
             "total_chunks": 1
         }
     
-    success_count = 0
-    fail_count = 0
     output_path = Path(output_dir)
     total_chunks = len(chunks)
     
+    # 이전 실행에서 완료된 청크 (같은 입력 내용/모델/프롬프트 버전)
+    input_hash = file_sha256(input_file_path)
+    completed = run_manifest.completed_chunks(input_hash) if (run_manifest is not None and RESUME) else set()
+    
     # 모든 청크에 대한 프롬프트를 한 번에 준비 (배치 처리)
-    all_prompts = []
-    chunk_infos = []
+    jobs = []
     summary_accum = ""
     
     for chunk_idx, chunk_text in enumerate(chunks):
@@ -350,13 +421,20 @@ def process_single_file_parallel(input_file_path, output_dir, model_used, folder
             chunk_dir = output_path / f"{folder_name}_chunk_{chunk_idx+1}"
             chunk_id = f"{folder_name}_chunk_{chunk_idx+1}"
         
-        chunk_infos.append({
-            "chunk_dir": chunk_dir,
-            "chunk_id": chunk_id,
-            "chunk_idx": chunk_idx,
-            "chunk_text": chunk_text,
-            "summary_accum": summary_accum
-        })
+        if chunk_idx in completed:
+            jobs.append({
+                "prompt": None,
+                "chunk_dir": chunk_dir,
+                "chunk_id": chunk_id,
+                "chunk_idx": chunk_idx,
+                "total_chunks": total_chunks,
+                "folder_name": folder_name,
+                "metadata": metadata,
+                "input_hash": input_hash,
+                "completed": True
+            })
+            summary_accum += f"청크 {chunk_idx+1} 처리 예정\n"
+            continue
         
         # 프롬프트 준비
         participants_str = ", ".join(speakers) if speakers else "알 수 없음"
@@ -364,10 +442,6 @@ def process_single_file_parallel(input_file_path, output_dir, model_used, folder
 
 {chunk_text}"""
         
-        system_prompt = """당신은 회의록을 분석하여 체계적인 프로젝트 기획안을 작성하는 전문가입니다.
-회의에서 논의된 내용을 바탕으로 명확하고 실행 가능한 기획안을 작성해주세요.
-응답은 반드시 요청된 JSON 형식으로만 제공하세요."""
-        
         if chunk_idx == 0:
             # 첫 번째 청크는 노션 프로젝트 프롬프트 사용
             user_prompt = generate_notion_project_prompt(meeting_transcript)
@@ -377,7 +451,7 @@ def process_single_file_parallel(input_file_path, output_dir, model_used, folder
             user_prompt = generate_meeting_analysis_user_prompt(chunk_text, additional_context)
         
         messages = [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": SYSTEM_PROMPT},
             {"role": "user", "content": user_prompt}
         ]
         
@@ -387,158 +461,332 @@ def process_single_file_parallel(input_file_path, output_dir, model_used, folder
             add_generation_prompt=True
         )
         
-        all_prompts.append(formatted_prompt)
+        jobs.append({
+            "prompt": formatted_prompt,
+            "prompt_tokens": len(tokenizer.encode(formatted_prompt)),  # 토큰 예산 계산용 (미리 읽기 스레드에서 계산)
+            "chunk_dir": chunk_dir,
+            "chunk_id": chunk_id,
+            "chunk_idx": chunk_idx,
+            "total_chunks": total_chunks,
+            "folder_name": folder_name,
+            "metadata": metadata,
+            "input_hash": input_hash,
+            "completed": False
+        })
         summary_accum += f"청크 {chunk_idx+1} 처리 예정\n"
     
-    # 배치로 모든 청크 처리
-    print(f"🚀 {len(all_prompts)}개 청크 배치 처리 시작")
-    outputs = llm.generate(all_prompts, sampling_params)
+    skipped = sum(1 for job in jobs if job["completed"])
+    if skipped:
+        print(f"⏭️ 이전 실행에서 완료된 청크 {skipped}/{total_chunks}개 건너뜀")
+    return jobs
+
+def parse_generation_output(result):
+    """모델 출력 → notion_output (raw_text 없이 JSON만 추출, 실패 시 기본 구조)"""
+    try:
+        # <think> 태그가 있으면 JSON 부분만 추출
+        if "<think>" in result and "{" in result:
+            # <think> 태그 이후의 JSON 부분 찾기
+            json_start = result.find("{", result.find("</think>") if "</think>" in result else 0)
+            if json_start != -1:
+                # JSON 끝 찾기
+                bracket_count = 0
+                json_end = json_start
+                for i, char in enumerate(result[json_start:], json_start):
+                    if char == '{':
+                        bracket_count += 1
+                    elif char == '}':
+                        bracket_count -= 1
+                        if bracket_count == 0:
+                            json_end = i + 1
+                            break
+                json_str = result[json_start:json_end]
+            else:
+                json_str = None
+        elif "```json" in result:
+            start = result.find("```json") + 7
+            end = result.find("```", start)
+            if end != -1:
+                json_str = result[start:end].strip()
+            else:
+                json_str = result[start:].strip()
+        elif result.startswith("{"):
+            json_str = result
+        else:
+            json_str = None
+        
+        if json_str:
+            return json.loads(json_str)
+        # raw_text 대신 기본 구조 생성
+        return default_notion_output()
+    except (json.JSONDecodeError, Exception):
+        # JSON 파싱 실패 시 기본 구조 생성
+        return default_notion_output()
+
+def save_job_output(job, output, error=None):
+    """vLLM 출력 1개를 청크 결과 파일로 저장, 성공 여부 반환 (error: 생성 실패 원인, 매니페스트에 기록)"""
+    chunk_dir = job["chunk_dir"]
+    chunk_idx = job["chunk_idx"]
+    total_chunks = job["total_chunks"]
+    
+    chunk_dir.mkdir(parents=True, exist_ok=True)
+    
+    if not (output and output.outputs):
+        if total_chunks > 1:
+            print(f"❌ 청크 {chunk_idx+1}/{total_chunks} 생성 실패")
+        else:
+            print(f"❌ 생성 실패")
+        record_job_status(job, STATUS_FAILED, error or "empty generation output")
+        return False
+    
+    result_data = parse_generation_output(output.outputs[0].text.strip())
+    
+    # 결과 저장 (원래 구조대로 복원)
+    chunk_result = {
+        "id": job["chunk_id"],
+        "source_dir": job["folder_name"],  # folder_name이 이미 result_로 시작함
+        "notion_output": result_data,
+        "metadata": {
+            **job["metadata"],
+            "is_chunk": total_chunks > 1,
+            "chunk_index": chunk_idx + 1 if total_chunks > 1 else None,
+            "processing_date": datetime.now().isoformat()
+        }
+    }
+    
+    # 임시 파일 → rename (중단되어도 반쯤 쓰인 result.json이 남지 않음)
+    atomic_write_json(chunk_dir / "result.json", chunk_result)
+    record_job_status(job, STATUS_DONE)
+    
+    if total_chunks > 1:
+        print(f"✅ 청크 {chunk_idx+1}/{total_chunks} 저장 완료: {chunk_dir.name}")
+    else:
+        print(f"✅ 저장 완료: {chunk_dir.name}")
+    return True
+
+def abort_requests(engine, request_ids):
+    """엔진에서 요청 중단 (중단 자체가 실패해도 다음 작업은 계속)"""
+    if not request_ids or not hasattr(engine, "abort_request"):
+        return
+    try:
+        engine.abort_request(request_ids)
+    except Exception as e:
+        print(f"⚠️ 요청 중단 실패 ({len(request_ids)}개): {e}")
+
+def generate_with_token_budget(jobs, token_budget, on_complete):
+    """
+    여러 파일의 청크 작업을 엔진에 연속 투입하여 큰 배치로 처리
+    
+    진행 중인 요청의 (프롬프트 토큰 + MAX_TOKENS) 합계가 token_budget을 넘지 않도록 투입하고,
+    완료된 요청부터 on_complete(job, output)를 호출한 뒤 빈 자리만큼 다음 작업을 투입
+    
+    Args:
+        jobs: prepare_file_jobs 작업 iterable (필요할 때만 다음 파일을 읽도록 제너레이터 권장)
+        token_budget: 동시 투입 토큰 예산 (작업 1개가 예산보다 커도 단독으로는 투입)
+        on_complete: 완료 콜백 on_complete(job, output, error) (투입/생성 실패 시 output None + 오류 메시지)
     
-    # 결과 저장
-    for idx, (output, chunk_info) in enumerate(zip(outputs, chunk_infos)):
-        chunk_dir = chunk_info["chunk_dir"]
-        chunk_id = chunk_info["chunk_id"]
-        chunk_idx = chunk_info["chunk_idx"]
+    투입(add_request)이나 엔진 step()이 실패하면 해당 작업(step 실패는 진행 중인 작업 전체)을
+    엔진에서 중단(abort)하고 실패로 완료 처리한 뒤 다음 작업을 계속 투입
+    """
+    engine = getattr(llm, "llm_engine", None)
+    if engine is None or not hasattr(engine, "add_request") or not hasattr(engine, "step"):
+        # 엔진 API를 쓸 수 없으면 예산 단위로 묶어 llm.generate 호출
+        batch, batch_tokens = [], 0
+        def run_batch(batch):
+            try:
+                with generation_span():
+                    outputs = llm.generate([j["prompt"] for j in batch], sampling_params)
+            except Exception as e:
+                print(f"❌ 배치 생성 실패 ({len(batch)}개 청크): {e}")
+                for done in batch:
+                    on_complete(done, None, f"generate: {e}")
+                return
+            for output, done in zip(outputs, batch):
+                on_complete(done, output, None)
         
-        chunk_dir.mkdir(parents=True, exist_ok=True)
+        for job in jobs:
+            cost = job["prompt_tokens"] + MAX_TOKENS
+            if batch and batch_tokens + cost > token_budget:
+                run_batch(batch)
+                batch, batch_tokens = [], 0
+            batch.append(job)
+            batch_tokens += cost
+        if batch:
+            run_batch(batch)
+        return
+    
+    job_iter = iter(jobs)
+    in_flight = {}  # request_id → (작업, 토큰 비용)
+    in_flight_tokens = 0
+    pending = None
+    exhausted = False
+    next_request_id = 0
+    
+    while True:
+        # 예산 안에서 최대한 투입
+        while not exhausted:
+            if pending is None:
+                job = next(job_iter, None)
+                if job is None:
+                    exhausted = True
+                    break
+                pending = (job, job["prompt_tokens"] + MAX_TOKENS)
+            if in_flight and in_flight_tokens + pending[1] > token_budget:
+                break
+            request_id = f"chunk-{next_request_id}"
+            next_request_id += 1
+            job, cost = pending
+            pending = None
+            try:
+                engine.add_request(request_id, job["prompt"], sampling_params)
+            except Exception as e:
+                print(f"❌ {job['chunk_id']} 투입 실패: {e}")
+                abort_requests(engine, [request_id])
+                on_complete(job, None, f"add_request: {e}")
+                continue
+            in_flight[request_id] = (job, cost)
+            in_flight_tokens += cost
+        
+        if not in_flight:
+            break
         
-        if output and output.outputs:
-            result = output.outputs[0].text.strip()
+        try:
+            with generation_span():
+                step_outputs = engine.step()
+        except Exception as e:
+            # 진행 중인 요청을 모두 중단하고 실패 처리 (엔진에 남겨 두면 다음 step에서 다시 실패하거나 예산을 계속 차지)
+            print(f"❌ 엔진 step 실패, 진행 중인 {len(in_flight)}개 청크 중단: {e}")
+            failed = list(in_flight.values())
+            abort_requests(engine, list(in_flight))
+            in_flight.clear()
+            in_flight_tokens = 0
+            for job, _ in failed:
+                on_complete(job, None, f"engine step: {e}")
+            continue
+        for output in step_outputs:
+            if output.finished and output.request_id in in_flight:
+                job, cost = in_flight.pop(output.request_id)
+                in_flight_tokens -= cost
+                on_complete(job, output, None)
+
+class FolderResults:
+    """폴더별 성공/실패 청크 수 집계 (저장 스레드에서 호출되므로 잠금 사용)"""
+    
+    def __init__(self, pbar=None):
+        self.counts = {}
+        self.remaining = {}
+        self.pbar = pbar
+        self._lock = threading.Lock()
+    
+    def _finish(self):
+        if self.pbar is not None:
+            self.pbar.update(1)
+    
+    def start(self, folder_name, jobs):
+        """준비된 작업 등록, 생성할 작업 목록 반환 (이미 완료된 청크는 성공으로 집계)"""
+        pending = [job for job in jobs if not job["completed"]]
+        with self._lock:
+            self.counts[folder_name] = {"success": len(jobs) - len(pending), "fail": 0}
+            self.remaining[folder_name] = len(pending)
+        if not pending:
+            self._finish()
+        return pending
+    
+    def fail(self, folder_name):
+        """준비 단계 실패"""
+        with self._lock:
+            self.counts[folder_name] = {"success": 0, "fail": 1}
+        self._finish()
+    
+    def record(self, job, saved):
+        folder_name = job["folder_name"]
+        with self._lock:
+            self.counts[folder_name]["success" if saved else "fail"] += 1
+            self.remaining[folder_name] -= 1
+            finished = self.remaining[folder_name] == 0
+        if finished:
+            self._finish()
+
+def submit_job_output(writer, results, job, output, error=None):
+    """결과 저장을 저장 스레드에 넘기고 완료 시 집계 (error: 생성 실패 원인)"""
+    def on_done(saved, error):
+        if error is not None:
+            print(f"❌ {job['chunk_id']} 저장 실패: {error}")
+            record_job_status(job, STATUS_FAILED, str(error))
+        results.record(job, bool(saved) and error is None)
+    
+    writer.submit(save_job_output, job, output, error, on_done=on_done)
+
+def prefetch_folder_jobs(subfolders):
+    """다음 PREFETCH_FILES개 폴더의 입력 로드/프롬프트 구성/토큰화를 생성과 겹쳐 실행"""
+    def prepare(subfolder):
+        folder_name, output_dir, json_file, _ = subfolder
+        return prepare_file_jobs(json_file, output_dir, folder_name, CHUNK_SIZE, CHUNK_OVERLAP)
+    
+    prefetcher = Prefetcher(prepare, depth=PREFETCH_FILES, workers=PREFETCH_WORKERS)
+    for subfolder, jobs, error in prefetcher.map(subfolders):
+        if error is not None:
+            print(f"❌ {subfolder[0]} 준비 실패: {error}")
+        yield subfolder[0], jobs
+
+def process_folders_global_batching(subfolders, token_budget, pbar=None):
+    """
+    전체 폴더의 청크를 파일 경계 없이 토큰 예산 단위로 묶어 처리
+    
+    Returns:
+        {폴더명: {"success": 성공 청크 수, "fail": 실패 청크 수}}
+    """
+    results = FolderResults(pbar)
+    
+    def iter_jobs():
+        for folder_name, jobs in prefetch_folder_jobs(subfolders):
+            if not jobs:
+                results.fail(folder_name)
+                continue
+            yield from results.start(folder_name, jobs)
+    
+    with BackgroundWriter(WRITER_WORKERS) as writer:
+        generate_with_token_budget(
+            iter_jobs(), token_budget,
+            lambda job, output, error: submit_job_output(writer, results, job, output, error)
+        )
+    return results.counts
+
+def process_folders_sequential(subfolders, pbar=None):
+    """
+    폴더 단위로 생성 (다음 폴더 준비와 결과 저장은 생성과 겹쳐 실행)
+    
+    Returns:
+        {폴더명: {"success": 성공 청크 수, "fail": 실패 청크 수}}
+    """
+    results = FolderResults(pbar)
+    
+    with BackgroundWriter(WRITER_WORKERS) as writer:
+        for folder_name, jobs in prefetch_folder_jobs(subfolders):
+            if not jobs:
+                results.fail(folder_name)
+                continue
+            pending = results.start(folder_name, jobs)
+            if not pending:
+                continue
             
-            # JSON 응답 처리 - raw_text 없이 JSON만 추출
+            print(f"🚀 {len(pending)}개 청크 배치 처리 시작")
+            error = None
             try:
-                # <think> 태그가 있으면 JSON 부분만 추출
-                if "<think>" in result and "{" in result:
-                    # <think> 태그 이후의 JSON 부분 찾기
-                    json_start = result.find("{", result.find("</think>") if "</think>" in result else 0)
-                    if json_start != -1:
-                        # JSON 끝 찾기
-                        bracket_count = 0
-                        json_end = json_start
-                        for i, char in enumerate(result[json_start:], json_start):
-                            if char == '{':
-                                bracket_count += 1
-                            elif char == '}':
-                                bracket_count -= 1
-                                if bracket_count == 0:
-                                    json_end = i + 1
-                                    break
-                        json_str = result[json_start:json_end]
-                    else:
-                        json_str = None
-                elif "```json" in result:
-                    start = result.find("```json") + 7
-                    end = result.find("```", start)
-                    if end != -1:
-                        json_str = result[start:end].strip()
-                    else:
-                        json_str = result[start:].strip()
-                elif result.startswith("{"):
-                    json_str = result
-                else:
-                    json_str = None
-                
-                if json_str:
-                    result_data = json.loads(json_str)
-                else:
-                    # raw_text 대신 기본 구조 생성
-                    result_data = {
-                        "project_name": "회의 기반 프로젝트",
-                        "project_purpose": "회의 내용 기반 프로젝트 추진",
-                        "project_period": "미정",
-                        "project_manager": "미정",
-                        "core_objectives": [
-                            "목표 1: 구체적인 목표",
-                            "목표 2: 구체적인 목표",
-                            "목표 3: 구체적인 목표"
-                        ],
-                        "core_idea": "핵심 아이디어 설명",
-                        "idea_description": "아이디어의 기술적/비즈니스적 설명",
-                        "execution_plan": "단계별 실행 계획과 일정",
-                        "expected_effects": [
-                            "기대효과 1: 자세한 설명",
-                            "기대효과 2: 자세한 설명",
-                            "기대효과 3: 자세한 설명"
-                        ]
-                    }
-            except (json.JSONDecodeError, Exception) as e:
-                # JSON 파싱 실패 시 기본 구조 생성
-                result_data = {
-                    "project_name": "회의 기반 프로젝트",
-                    "project_purpose": "회의 내용 기반 프로젝트 추진",
-                    "project_period": "미정",
-                    "project_manager": "미정",
-                    "core_objectives": [
-                        "목표 1: 구체적인 목표",
-                        "목표 2: 구체적인 목표",
-                        "목표 3: 구체적인 목표"
-                    ],
-                    "core_idea": "핵심 아이디어 설명",
-                    "idea_description": "아이디어의 기술적/비즈니스적 설명",
-                    "execution_plan": "단계별 실행 계획과 일정",
-                    "expected_effects": [
-                        "기대효과 1: 자세한 설명",
-                        "기대효과 2: 자세한 설명",
-                        "기대효과 3: 자세한 설명"
-                    ]
-                }
-            
-            # 결과 저장 (원래 구조대로 복원)
-            chunk_result = {
-                "id": chunk_id,
-                "source_dir": folder_name,  # folder_name이 이미 result_로 시작함
-                "notion_output": result_data,
-                "metadata": {
-                    **metadata,
-                    "is_chunk": total_chunks > 1,
-                    "chunk_index": chunk_idx + 1 if total_chunks > 1 else None,
-                    "processing_date": datetime.now().isoformat()
-                }
-            }
-            
-            with open(chunk_dir / "result.json", 'w', encoding='utf-8') as f:
-                json.dump(chunk_result, f, ensure_ascii=False, indent=2)
-            
-            success_count += 1
-            if total_chunks > 1:
-                print(f"✅ 청크 {chunk_idx+1}/{total_chunks} 저장 완료: {chunk_dir.name}")
-            else:
-                print(f"✅ 저장 완료: {chunk_dir.name}")
-        else:
-            fail_count += 1
-            if total_chunks > 1:
-                print(f"❌ 청크 {chunk_idx+1}/{total_chunks} 생성 실패")
-            else:
-                print(f"❌ 생성 실패")
-    
-    return success_count, fail_count
+                with generation_span():
+                    outputs = llm.generate([job["prompt"] for job in pending], sampling_params)
+            except Exception as e:
+                print(f"❌ {folder_name} 생성 실패: {e}")
+                outputs = [None] * len(pending)
+                error = f"generate: {e}"
+            for output, job in zip(outputs, pending):
+                submit_job_output(writer, results, job, output, error)
+    return results.counts
 
 # save_final_result_as_txt 함수는 더 이상 필요하지 않음 (각 청크별로 개별 JSON 저장)
 # qwen3_lora_meeting_generator_vllm.py 방식으로 저장
 
-def process_file_wrapper(args):
-    """ThreadPoolExecutor를 위한 래퍼 함수"""
-    folder_name, folder_path, json_file, model_used = args
-    
-    try:
-        # 청킹 설정 (qwen3_lora_meeting_generator_vllm.py와 동일하게)
-        success_count, fail_count = process_single_file_parallel(
-            json_file, 
-            folder_path, 
-            model_used, 
-            folder_name,
-            chunk_size=CHUNK_SIZE,  # 문자 기반 청킹 크기
-            overlap=CHUNK_OVERLAP   # 오버랩 크기
-        )
-        
-        if success_count > 0:
-            return (folder_name, True, f"성공: {success_count}, 실패: {fail_count}")
-        else:
-            return (folder_name, False, f"모든 청크 처리 실패 (총 {fail_count}개)")
-    except Exception as e:
-        return (folder_name, False, str(e))
-
-def batch_process_folders_parallel(base_dir, model_used, output_base_dir=None, max_workers=None):
+def batch_process_folders_parallel(base_dir, model_used, output_base_dir=None, max_workers=None,
+                                   global_batching=None, token_budget=None):
     """순차적으로 여러 폴더 처리 (vLLM 안정성 확보)
     
     Args:
@@ -546,7 +794,13 @@ def batch_process_folders_parallel(base_dir, model_used, output_base_dir=None, m
         model_used: 사용 모델명
         output_base_dir: 출력 디렉토리 (None이면 입력 디렉토리와 동일한 위치에 생성)
         max_workers: (사용하지 않음, 호환성 유지)
+        global_batching: 여러 파일의 청크를 묶어 처리 (None이면 설정값)
+        token_budget: 전역 배치의 동시 투입 토큰 예산 (None이면 설정값)
     """
+    if global_batching is None:
+        global_batching = GLOBAL_BATCHING
+    if token_budget is None:
+        token_budget = BATCH_TOKEN_BUDGET
     
     if not os.path.exists(base_dir):
         # 상대 경로로 표시
@@ -591,34 +845,42 @@ def batch_process_folders_parallel(base_dir, model_used, output_base_dir=None, m
     
     # 메인 프로세스에서 모델 초기화
     initialize_model()
+    open_run_manifest(output_base_dir)
     
     success_count = 0
     failed_folders = []
     
-    # 순차 처리로 변경 (vLLM 안정성 확보)
+    global gpu_monitor
+    gpu_monitor = GPUUtilizationMonitor(GPU_MONITOR_INTERVAL).start()
+    
     total_chunks_processed = 0
     with tqdm(total=len(subfolders), desc="📁 전체 폴더 처리", unit="folder") as pbar:
-        for args in subfolders:
-            folder_name = args[0]
-            try:
-                folder_name, success, message = process_file_wrapper(args)
-                if success:
-                    success_count += 1
-                    # 성공/실패 청크 수 파싱
-                    if "성공:" in message:
-                        chunk_count = int(message.split("성공: ")[1].split(",")[0])
-                        total_chunks_processed += chunk_count
-                else:
-                    failed_folders.append((folder_name, message))
-            except Exception as e:
-                failed_folders.append((folder_name, str(e)))
-            
-            pbar.update(1)
+        if global_batching:
+            # 파일 경계 없이 토큰 예산 단위로 엔진 배치 구성
+            print(f"🚀 전역 배치 처리 (토큰 예산 {token_budget:,})")
+            folder_results = process_folders_global_batching(subfolders, token_budget, pbar)
+        else:
+            # 폴더 단위 생성 (vLLM 안정성 확보)
+            folder_results = process_folders_sequential(subfolders, pbar)
+    
+    gpu_monitor.stop()
+    for folder_name, counts in folder_results.items():
+        if counts["success"] > 0:
+            success_count += 1
+            total_chunks_processed += counts["success"]
+        else:
+            failed_folders.append((folder_name, f"모든 청크 처리 실패 (총 {counts['fail']}개)"))
     
     # 결과 출력
     print(f"\n🎉 배치 처리 완료!")
     print(f"✅ 성공한 폴더: {success_count}/{len(subfolders)}")
     print(f"📊 처리된 총 청크 수: {total_chunks_processed}")
+    if run_manifest is not None:
+        print(f"🗂️ 매니페스트 상태: {run_manifest.summary()}")
+    usage = gpu_monitor.summary()
+    gpu_util = f"평균 {usage['gpu_util_mean']}% (p50 {usage['gpu_util_p50']}%)" if usage["gpu_util_samples"] else "측정 불가"
+    print(f"🖥️ GPU 사용률: {gpu_util}, 생성 구간 비율 {usage['busy_ratio']} "
+          f"({usage['generate_time']}s / {usage['wall_time']}s)")
     
     if failed_folders:
         print(f"\n❌ 실패한 폴더들:")
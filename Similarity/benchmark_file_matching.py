@@ -0,0 +1,163 @@
+"""
+gold/result 폴더 매칭 벤치마크
+
+합성 디렉토리 트리(gold: val_XXX_result_NAME_chunk_N, result: result_NAME_chunk_N)에서
+기존 매칭(결과 폴더마다 gold 디렉토리 재스캔)과 인덱스 매칭(file_matching)을 비교
+- 소요 시간
+- 매칭 결과 일치 여부 (pre: glob 접미사 매칭, post: 부분 문자열 매칭)
+
+사용법:
+    python benchmark_file_matching.py --sizes 100 500 --seed 42
+"""
+
+import os
+import re
+import time
+import random
+import argparse
+import tempfile
+from pathlib import Path
+from typing import List, Tuple
+
+from file_matching import match_folders, folder_key
+
+Pair = Tuple[str, str]  # (gold 폴더명, result 폴더명)
+
+
+def legacy_pre_matches(gold_path: Path, result_path: Path) -> List[Pair]:
+    """기존 pre_SimilarityEvaluator.FileMatcher.find_matches 매칭 규칙"""
+    pairs = []
+    for result_folder in [f for f in result_path.iterdir() if f.is_dir() and f.name.startswith("result_")]:
+        if not (result_folder / "result.json").exists():
+            continue
+        folder_name = result_folder.name
+        match = re.search(r'result_([A-Za-z0-9]+)_chunk_(\d+)', folder_name)
+        if not match:
+            match = re.search(r'result_([A-Za-z0-9]+)$', folder_name)
+            if match:
+                base_name, chunk_num = match.group(1), ""
+            else:
+                base_name, chunk_num = folder_name.replace("result_", ""), ""
+        else:
+            base_name, chunk_num = match.group(1), match.group(2)
+
+        if chunk_num:
+            for pattern in [f"*result_{base_name}_chunk_{chunk_num}", f"*result_{base_name}_chunk{chunk_num}"]:
+                matching_folders = list(gold_path.glob(pattern))
+                if matching_folders:
+                    pairs.append((matching_folders[0].name, folder_name))
+                    break
+        else:
+            matching_folders = list(gold_path.glob(f"*result_{base_name}"))
+            if matching_folders:
+                pairs.append((matching_folders[0].name, folder_name))
+            elif (gold_path / folder_name).exists():
+                pairs.append((folder_name, folder_name))
+    return pairs
+
+
+def legacy_post_matches(gold_path: Path, result_path: Path) -> List[Pair]:
+    """기존 post_SimilarityEvaluator.FileMatcher.find_matches 매칭 규칙"""
+    pairs = []
+    for result_folder in [d for d in result_path.iterdir() if d.is_dir() and d.name.startswith('result_')]:
+        folder_name = result_folder.name
+        match = re.search(r'result_(.+)_chunk_(\d+)$', folder_name)
+        if match:
+            base_name, chunk_num = match.group(1), match.group(2)
+        else:
+            match = re.search(r'result_(.+)$', folder_name)
+            if not match:
+                continue
+            base_name, chunk_num = match.group(1), ""
+
+        for folder in gold_path.iterdir():
+            if not (folder.is_dir() and folder.name.startswith('val_')):
+                continue
+            if chunk_num:
+                hit = (f"_result_{base_name}_chunk_{chunk_num}" in folder.name or
+                       f"_result_{base_name}_chunk{chunk_num}" in folder.name)
+            else:
+                hit = f"_result_{base_name}" in folder.name and not re.search(r'_chunk_?\d+$', folder.name)
+            if hit:
+                pairs.append((folder.name, folder_name))
+                break
+    return pairs
+
+
+def build_tree(root: Path, num_meetings: int, seed: int) -> Tuple[Path, Path]:
+    """합성 gold/result 트리 생성 (영문/한글 회의명, 단일/다중 청크, 일부 누락)"""
+    rng = random.Random(seed)
+    gold_path, result_path = root / "gold", root / "result"
+    gold_path.mkdir()
+    result_path.mkdir()
+
+    meetings = []
+    for i in range(num_meetings):
+        if i % 5 == 0:
+            name = f"제22대국회 제{400 + i}회(임시회) 제{i % 9 + 1}차 상임위원회(전체회의) (2025.07.{i % 28 + 1:02d}.)"
+        else:
+            name = f"{rng.choice(['Bed', 'Bmr', 'Bro', 'IS', 'TS'])}{i:04d}{rng.choice(['', 'a', 'd'])}"
+        meetings.append((name, rng.choice([1, 1, 2, 3, 12, 25])))
+
+    entries = []
+    for idx, (name, num_chunks) in enumerate(meetings):
+        for chunk in range(1, num_chunks + 1):
+            suffix = "" if num_chunks == 1 else f"_chunk_{chunk}"
+            entries.append((f"val_{idx:03d}_result_{name}{suffix}", f"result_{name}{suffix}"))
+    rng.shuffle(entries)  # 디렉토리 생성 순서 = 스캔 순서
+
+    for gold_name, result_name in entries:
+        if rng.random() > 0.02:  # 일부 gold 누락 → 매칭 실패 케이스
+            (gold_path / gold_name).mkdir()
+        (result_path / result_name).mkdir()
+        (result_path / result_name / "result.json").write_text("{}", encoding="utf-8")
+    return gold_path, result_path
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def run(num_meetings: int, seed: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        gold_path, result_path = build_tree(Path(tmp), num_meetings, seed)
+        num_gold = len(os.listdir(gold_path))
+        num_result = len(os.listdir(result_path))
+        print(f"\n📂 회의 {num_meetings}개 → gold {num_gold}개 / result {num_result}개")
+
+        # pre: 결과 파일 경로 + 같은 이름 폴백
+        legacy, legacy_time = timed(legacy_pre_matches, gold_path, result_path)
+        (indexed, _), indexed_time = timed(
+            lambda: match_folders(gold_path, result_path, result_file="result.json", exact_name_fallback=True)
+        )
+        indexed_pairs = [(gold.name, result.parent.name) for gold, result, _ in indexed]
+        print(f"  pre : 기존 {legacy_time:.3f}s / 인덱스 {indexed_time:.3f}s "
+              f"(x{legacy_time / max(indexed_time, 1e-9):.0f}), 매칭 {len(indexed_pairs)}개, "
+              f"일치 {'✅' if legacy == indexed_pairs else '❌'}")
+
+        # post: val_ 폴더만, 결과 폴더 경로
+        legacy, legacy_time = timed(legacy_post_matches, gold_path, result_path)
+        (indexed, _), indexed_time = timed(lambda: match_folders(gold_path, result_path, gold_prefix="val_"))
+        indexed_pairs = [(gold.name, result.name) for gold, result, _ in indexed]
+        # 기존 부분 문자열 매칭은 chunk_2 ↔ chunk_21 같이 접두사가 겹치는 다른 청크와도 매칭됨
+        mismatched = [pair for pair in legacy if folder_key(pair[0]) != folder_key(pair[1])]
+        legacy_exact = [pair for pair in legacy if pair not in mismatched]
+        same = legacy_exact == [pair for pair in indexed_pairs if pair[1] in {r for _, r in legacy_exact}]
+        print(f"  post: 기존 {legacy_time:.3f}s / 인덱스 {indexed_time:.3f}s "
+              f"(x{legacy_time / max(indexed_time, 1e-9):.0f}), 매칭 {len(indexed_pairs)}개, "
+              f"일치 {'✅' if same else '❌'} (기존 방식의 잘못된 청크 매칭 {len(mismatched)}개 제외)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="gold/result 폴더 매칭 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 300], help="합성 회의 수")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    for size in args.sizes:
+        run(size, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+코퍼스 단위 TF-IDF 코사인 유사도
+
+쌍마다 TfidfVectorizer를 새로 학습하면 IDF가 문서 2개 기준이라 의미가 없고 학습 비용이 평가 시간을 차지함
+- corpus: 평가 대상 전체(gold + result) 코퍼스로 한 번만 학습 → 하나의 희소 행렬로 변환
+          → 모든 쌍의 코사인을 행 단위 희소 내적 한 번으로 계산
+- frozen: 저장된 기준 어휘/IDF를 불러와 사용 (모델 간 점수 비교 시 같은 기준 유지)
+- pair: 기존 방식 (쌍마다 학습, 이전 결과와 호환되는 점수)
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+logger = logging.getLogger(__name__)
+
+TFIDF_MODES = ("corpus", "pair")
+
+
+class CorpusTfidf:
+    """코퍼스 기준 TF-IDF 벡터화 + 쌍별 코사인"""
+
+    def __init__(self, max_features: int = 5000, ngram_range: Tuple[int, int] = (1, 2)):
+        """
+        생성자
+
+        Args:
+            max_features: 최대 특징 수
+            ngram_range: N-gram 범위
+        """
+        self.max_features = max_features
+        self.ngram_range = tuple(ngram_range)
+        self.vectorizer: Optional[TfidfVectorizer] = None
+
+    @property
+    def is_fitted(self) -> bool:
+        return self.vectorizer is not None
+
+    def fit(self, texts: Iterable[str]) -> "CorpusTfidf":
+        """코퍼스 전체로 어휘/IDF 학습 (기본 l2 정규화 → 행 내적 = 코사인), 제너레이터는 한 번만 순회"""
+        self.vectorizer = TfidfVectorizer(
+            max_features=self.max_features,
+            ngram_range=self.ngram_range,
+            stop_words=None
+        )
+        count = 0
+
+        def counted():
+            nonlocal count
+            for text in texts:
+                count += 1
+                yield text
+
+        self.vectorizer.fit(counted())
+        logger.info(f"TF-IDF 코퍼스 학습 완료: 문서 {count}개, 어휘 {len(self.vectorizer.vocabulary_)}개")
+        return self
+
+    def fit_paired_cosine(self, texts1: Sequence[str], texts2: Sequence[str]) -> np.ndarray:
+        """코퍼스 학습과 변환을 한 번에 (문서당 토큰화 1회), 쌍별 코사인 반환"""
+        if len(texts1) != len(texts2):
+            raise ValueError(f"텍스트 수 불일치: {len(texts1)} != {len(texts2)}")
+        self.vectorizer = TfidfVectorizer(
+            max_features=self.max_features,
+            ngram_range=self.ngram_range,
+            stop_words=None
+        )
+        matrix = self.vectorizer.fit_transform(list(texts1) + list(texts2)).tocsr()
+        logger.info(f"TF-IDF 코퍼스 학습 완료: 문서 {matrix.shape[0]}개, 어휘 {len(self.vectorizer.vocabulary_)}개")
+        count = len(texts1)
+        return _row_dot(matrix[:count], matrix[count:])
+
+    def save(self, path: Union[str, Path]) -> None:
+        """기준 어휘/IDF 저장 (JSON)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "ngram_range": list(self.ngram_range),
+            "vocabulary": {term: int(index) for term, index in self.vectorizer.vocabulary_.items()},
+            "idf": self.vectorizer.idf_.tolist()
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        logger.info(f"TF-IDF 기준 어휘 저장: {path}")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "CorpusTfidf":
+        """저장된 기준 어휘/IDF로 고정된 벡터화기 생성"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        instance = cls(max_features=len(data["vocabulary"]), ngram_range=tuple(data["ngram_range"]))
+        instance.vectorizer = TfidfVectorizer(
+            vocabulary=data["vocabulary"],
+            ngram_range=instance.ngram_range,
+            stop_words=None
+        )
+        instance.vectorizer.idf_ = np.asarray(data["idf"], dtype=np.float64)
+        logger.info(f"TF-IDF 기준 어휘 로드: {path} (어휘 {len(data['vocabulary'])}개)")
+        return instance
+
+    def paired_cosine(self, texts1: Sequence[str], texts2: Sequence[str]) -> np.ndarray:
+        """texts1[i] ↔ texts2[i] 코사인 유사도 배열 (행 단위 희소 내적)"""
+        if len(texts1) != len(texts2):
+            raise ValueError(f"텍스트 수 불일치: {len(texts1)} != {len(texts2)}")
+        if not texts1:
+            return np.zeros(0)
+        return _row_dot(self.vectorizer.transform(texts1), self.vectorizer.transform(texts2))
+
+
+def _row_dot(matrix1, matrix2) -> np.ndarray:
+    """행 단위 희소 내적 (l2 정규화된 행이면 코사인)"""
+    return np.asarray(matrix1.multiply(matrix2).sum(axis=1)).ravel()
+
+
+def corpus_tfidf_cosines(texts1: Sequence[str],
+                         texts2: Sequence[str],
+                         max_features: int = 5000,
+                         ngram_range: Tuple[int, int] = (1, 2),
+                         vocabulary_path: Optional[Union[str, Path]] = None) -> List[float]:
+    """
+    코퍼스 기준 쌍별 TF-IDF 코사인
+
+    Args:
+        texts1, texts2: 같은 길이의 비교 텍스트 목록 (보통 gold, result)
+        vocabulary_path: 지정 시 해당 파일의 기준 어휘 사용, 파일이 없으면 이번 코퍼스로 학습 후 저장
+
+    Returns:
+        쌍별 코사인 유사도
+    """
+    if vocabulary_path and Path(vocabulary_path).exists():
+        return CorpusTfidf.load(vocabulary_path).paired_cosine(texts1, texts2).tolist()
+
+    tfidf = CorpusTfidf(max_features, ngram_range)
+    similarities = tfidf.fit_paired_cosine(texts1, texts2)
+    if vocabulary_path:
+        tfidf.save(vocabulary_path)
+    return similarities.tolist()
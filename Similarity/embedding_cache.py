@@ -0,0 +1,161 @@
+"""
+내용 주소 기반 임베딩 캐시 (float32 바이너리 저장소)
+
+- 키: SHA-256(모델명 + 전체 텍스트) → 프로세스/실행이 달라도 같은 키, 앞부분이 같은 다른 문서와 충돌 없음
+- 벡터: {cache_dir}/vectors.f32 에 float32로 이어 붙이기만 함 (append-only), 읽을 때 np.memmap
+- 인덱스: {cache_dir}/index.tsv 에 "키\t시작 위치\t차원" 한 줄씩 추가
+- 지연 로드: 첫 조회 시 인덱스만 읽고, 벡터는 필요한 것만 memmap에서 읽음
+- 증분 저장: flush()는 마지막 저장 이후 추가된 벡터만 파일 끝에 기록
+  (벡터 → 인덱스 순서로 기록하므로 중간에 중단되어도 인덱스가 없는 벡터만 남고 기존 항목은 유지)
+"""
+
+import os
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+VECTORS_FILE = "vectors.f32"
+INDEX_FILE = "index.tsv"
+ITEM_SIZE = np.dtype(np.float32).itemsize
+
+
+def embedding_key(text: str, model: str) -> str:
+    """캐시 키 (모델명 + 전체 텍스트의 SHA-256)"""
+    digest = hashlib.sha256()
+    digest.update(model.encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(text.encode('utf-8'))
+    return digest.hexdigest()
+
+
+class EmbeddingCache:
+    """모델별 임베딩 캐시 (여러 모델이 같은 디렉토리를 공유해도 키로 구분)"""
+
+    def __init__(self, cache_dir: Union[str, Path], model: str):
+        """
+        생성자
+
+        Args:
+            cache_dir: 캐시 디렉토리 (vectors.f32 + index.tsv)
+            model: 임베딩 모델명 (키에 포함)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.model = model
+        self.vectors_path = self.cache_dir / VECTORS_FILE
+        self.index_path = self.cache_dir / INDEX_FILE
+        self._index: Optional[Dict[str, Tuple[int, int]]] = None  # 키 → (시작 위치(float 단위), 차원)
+        self._pending: Dict[str, np.ndarray] = {}  # 아직 저장하지 않은 벡터
+        self._vectors: Optional[np.memmap] = None
+        self._lock = threading.Lock()
+
+    def _load_index(self) -> Dict[str, Tuple[int, int]]:
+        if self._index is not None:
+            return self._index
+
+        index = {}
+        if self.index_path.exists() and self.vectors_path.exists():
+            stored = self.vectors_path.stat().st_size // ITEM_SIZE
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    parts = line.rstrip('\n').split('\t')
+                    if not line.endswith('\n') or len(parts) != 3:
+                        continue  # 중단으로 잘린 마지막 줄
+                    key, offset, dim = parts[0], int(parts[1]), int(parts[2])
+                    if offset + dim <= stored:
+                        index[key] = (offset, dim)
+        self._index = index
+        logger.info(f"임베딩 캐시 로드: {len(index)}개 항목 ({self.cache_dir})")
+        return index
+
+    def _truncate_torn_index(self) -> None:
+        """인덱스 파일이 줄바꿈 없이 끝나면 (중단된 기록) 마지막 완전한 줄 뒤로 잘라냄"""
+        if not self.index_path.exists():
+            return
+        with open(self.index_path, 'r+b') as f:
+            size = f.seek(0, os.SEEK_END)
+            tail_start = max(0, size - 4096)
+            f.seek(tail_start)
+            tail = f.read()
+            if not tail or tail.endswith(b'\n'):
+                return
+            last_newline = tail.rfind(b'\n')
+            f.truncate(tail_start + last_newline + 1 if last_newline >= 0 else 0)
+
+    def _read(self, offset: int, dim: int) -> np.ndarray:
+        if self._vectors is None or offset + dim > self._vectors.shape[0]:
+            self._vectors = np.memmap(self.vectors_path, dtype=np.float32, mode='r')
+        return np.array(self._vectors[offset:offset + dim])
+
+    def key(self, text: str) -> str:
+        return embedding_key(text, self.model)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load_index()) + len(self._pending)
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        """캐시된 임베딩 (없으면 None)"""
+        return self.get_many([text])[0]
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """텍스트 순서대로 캐시된 임베딩 (없으면 None)"""
+        with self._lock:
+            index = self._load_index()
+            results = []
+            for text in texts:
+                key = self.key(text)
+                if key in self._pending:
+                    results.append(self._pending[key])
+                elif key in index:
+                    results.append(self._read(*index[key]))
+                else:
+                    results.append(None)
+            return results
+
+    def put(self, text: str, embedding: Sequence[float]) -> None:
+        """임베딩 추가 (flush 전까지 메모리에만 보관)"""
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        with self._lock:
+            key = self.key(text)
+            if key not in self._pending and key not in self._load_index():
+                self._pending[key] = vector
+
+    def flush(self) -> int:
+        """새로 추가된 벡터만 파일 끝에 기록, 기록한 항목 수 반환"""
+        with self._lock:
+            if not self._pending:
+                return 0
+            index = self._load_index()
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+            with open(self.vectors_path, 'ab') as f:
+                position = f.tell()
+                if position % ITEM_SIZE:  # 중단으로 잘린 벡터 뒤에서 정렬 맞춤
+                    f.write(b'\0' * (ITEM_SIZE - position % ITEM_SIZE))
+                    position = f.tell()
+                offset = position // ITEM_SIZE
+                lines = []
+                for key, vector in self._pending.items():
+                    f.write(vector.tobytes())
+                    lines.append((key, offset, vector.shape[0]))
+                    offset += vector.shape[0]
+                f.flush()
+                os.fsync(f.fileno())
+
+            self._truncate_torn_index()
+            with open(self.index_path, 'a', encoding='utf-8') as f:
+                f.writelines(f"{key}\t{offset}\t{dim}\n" for key, offset, dim in lines)
+                f.flush()
+                os.fsync(f.fileno())
+
+            for key, offset, dim in lines:
+                index[key] = (offset, dim)
+            count = len(self._pending)
+            self._pending = {}
+            return count
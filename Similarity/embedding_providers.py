@@ -0,0 +1,325 @@
+"""
+임베딩 제공자 (유사도 평가용)
+
+평가기는 EmbeddingProvider.embed()만 사용하므로 백엔드를 설정으로 교체 가능
+- openai: OpenAI 호환 임베딩 API (async_embedding_client: 토큰 예산 묶음 + 동시 요청 + 속도 제한/재시도)
+- local: sentence-transformers 한국어 인코더를 CPU에서 배치 추론 (backend: torch | onnx), 인터넷 불필요
+- hashing: 문자 n-gram HashingVectorizer (학습/다운로드 없음, 항상 같은 벡터 → 테스트/파이프라인 점검용)
+- none: 임베딩 유사도를 계산하지 않음 (명시적으로 지정한 경우만, 다른 제공자의 초기화 실패는 시작 시 오류)
+
+공통: 빈 텍스트는 None, 배치 단위 호출, 처리량(texts/s, chars/s) 집계 및 진행 로그
+"""
+
+import os
+import time
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LOCAL_MODEL = "jhgan/ko-sroberta-multitask"
+DISABLED_PROVIDER = "none"  # 임베딩 유사도를 명시적으로 끄는 설정값
+
+
+@dataclass
+class EmbeddingStats:
+    """임베딩 처리량 집계"""
+    texts: int = 0
+    chars: int = 0
+    batches: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "texts": self.texts,
+            "chars": self.chars,
+            "batches": self.batches,
+            "failed": self.failed,
+            "seconds": round(self.seconds, 2),
+            "texts_per_sec": round(self.texts / self.seconds, 2) if self.seconds else None,
+            "chars_per_sec": round(self.chars / self.seconds, 1) if self.seconds else None
+        }
+
+
+class EmbeddingProvider:
+    """임베딩 제공자 기본 클래스 (하위 클래스는 _embed_batch만 구현)"""
+
+    name = "base"
+
+    def __init__(self, batch_size: int = 32):
+        self.batch_size = max(1, batch_size)
+        self.stats = EmbeddingStats()
+
+    @property
+    def model_id(self) -> str:
+        """캐시 키에 사용하는 모델 식별자 (벡터가 달라지는 설정은 모두 포함)"""
+        raise NotImplementedError
+
+    def _embed_batch(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        raise NotImplementedError
+
+    def embed(self, texts: Sequence[str], desc: str = "임베딩") -> List[Optional[np.ndarray]]:
+        """
+        텍스트 목록 임베딩 (batch_size 단위 호출)
+
+        Args:
+            texts: 임베딩할 텍스트 목록
+            desc: 진행 로그 접두사
+
+        Returns:
+            텍스트 순서대로 float32 벡터 (빈 텍스트/실패한 배치는 None)
+        """
+        embeddings: List[Optional[np.ndarray]] = [None] * len(texts)
+        indices = [i for i, text in enumerate(texts) if text and text.strip()]
+        if not indices:
+            return embeddings
+
+        start = time.perf_counter()
+        for batch_start in range(0, len(indices), self.batch_size):
+            batch_indices = indices[batch_start:batch_start + self.batch_size]
+            batch_texts = [texts[i] for i in batch_indices]
+            batch_time = time.perf_counter()
+            try:
+                vectors = self._embed_batch(batch_texts)
+                for i, vector in zip(batch_indices, vectors):
+                    if vector is None:
+                        self.stats.failed += 1
+                        continue
+                    embeddings[i] = np.asarray(vector, dtype=np.float32)
+            except Exception as e:
+                logger.error(f"{desc} 배치 실패 ({self.name}, {len(batch_texts)}개): {e}")
+                self.stats.failed += len(batch_texts)
+            finally:
+                self.stats.batches += 1
+                self.stats.texts += len(batch_texts)
+                self.stats.chars += sum(len(text) for text in batch_texts)
+                self.stats.seconds += time.perf_counter() - batch_time
+
+            done = min(batch_start + self.batch_size, len(indices))
+            elapsed = time.perf_counter() - start
+            logger.info(f"{desc} [{done}/{len(indices)}] {done / elapsed:.1f} texts/s ({self.name})")
+        return embeddings
+
+
+class OpenAIEmbeddingProvider(EmbeddingProvider):
+    """OpenAI 호환 임베딩 API (토큰 예산 묶음 + 동시 요청)"""
+
+    name = "openai"
+
+    def __init__(self,
+                 model: str = "text-embedding-3-large",
+                 api_key: Optional[str] = None,
+                 base_url: Optional[str] = None,
+                 batch_size: int = 256,
+                 **client_options):
+        """
+        생성자
+
+        Args:
+            model: 임베딩 모델
+            api_key: API 키 (없으면 OPENAI_API_KEY 환경변수, base_url을 지정한 로컬 서버는 생략 가능)
+            base_url: OpenAI 호환 API 주소 (없으면 OPENAI_BASE_URL 환경변수 → OpenAI)
+            batch_size: 사용하지 않음 (설정 호환용, 전체 목록을 한 번에 넘기고 요청은 토큰 예산으로 묶음)
+            **client_options: AsyncEmbeddingClient 옵션 (concurrency, requests_per_minute, tokens_per_minute,
+                              max_tokens_per_request, max_tokens_per_input, max_retries ...)
+        """
+        super().__init__(batch_size)
+        from async_embedding_client import AsyncEmbeddingClient, DEFAULT_BASE_URL
+        api_key = api_key or os.getenv("OPENAI_API_KEY")
+        base_url = base_url or os.getenv("OPENAI_BASE_URL") or DEFAULT_BASE_URL
+        if not api_key and base_url == DEFAULT_BASE_URL:
+            raise ValueError("OPENAI_API_KEY가 설정되지 않음")
+        self.model = model
+        self.client = AsyncEmbeddingClient(model, api_key=api_key, base_url=base_url, **client_options)
+
+    @property
+    def model_id(self) -> str:
+        return self.model
+
+    def _embed_batch(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        embeddings = self.client.embed(texts)
+        stats = self.client.stats
+        logger.info(f"임베딩 요청 누적: {stats.requests}회 (재시도 {stats.retries}, 분할 {stats.splits}, 실패 입력 {stats.failed_inputs})")
+        return embeddings
+
+    def embed(self, texts: Sequence[str], desc: str = "임베딩") -> List[Optional[np.ndarray]]:
+        """
+        텍스트 목록 임베딩 (batch_size로 나누지 않고 전체를 aembed 1회로 전달)
+
+        요청 묶음/동시성/속도 제한은 클라이언트가 토큰 예산 기준으로 처리하므로
+        batch_size 단위로 끊으면 배치 경계마다 동시 요청이 비고 마지막 요청을 기다리게 됨
+        """
+        embeddings: List[Optional[np.ndarray]] = [None] * len(texts)
+        indices = [i for i, text in enumerate(texts) if text and text.strip()]
+        if not indices:
+            return embeddings
+
+        batch_texts = [texts[i] for i in indices]
+        start = time.perf_counter()
+        try:
+            vectors = self._embed_batch(batch_texts)
+            for i, vector in zip(indices, vectors):
+                if vector is None:
+                    self.stats.failed += 1
+                    continue
+                embeddings[i] = np.asarray(vector, dtype=np.float32)
+        except Exception as e:
+            logger.error(f"{desc} 실패 ({self.name}, {len(batch_texts)}개): {e}")
+            self.stats.failed += len(batch_texts)
+        finally:
+            elapsed = time.perf_counter() - start
+            self.stats.batches += 1
+            self.stats.texts += len(batch_texts)
+            self.stats.chars += sum(len(text) for text in batch_texts)
+            self.stats.seconds += elapsed
+        logger.info(f"{desc} [{len(indices)}/{len(indices)}] {len(indices) / max(elapsed, 1e-9):.1f} texts/s ({self.name})")
+        return embeddings
+
+
+class LocalEmbeddingProvider(EmbeddingProvider):
+    """sentence-transformers 로컬 인코더 (CPU 배치 추론, 선택적으로 ONNX)"""
+
+    name = "local"
+
+    def __init__(self,
+                 model: Optional[str] = None,
+                 device: str = "cpu",
+                 backend: str = "torch",
+                 window_chars: int = 1000,
+                 batch_size: int = 32):
+        """
+        생성자
+
+        Args:
+            model: 로컬 경로 또는 HF 모델명 (한국어 인코더, 오프라인이면 미리 받아 둔 경로)
+            device: 추론 장치
+            backend: torch | onnx (onnx는 sentence-transformers>=3.2 + optimum/onnxruntime 필요)
+            window_chars: 긴 문서를 이 길이로 나눠 인코딩 후 평균 (인코더 최대 길이를 넘는 부분이 잘리지 않도록), 0이면 나누지 않음
+            batch_size: 인코더 1회 호출당 텍스트 수
+        """
+        super().__init__(batch_size)
+        from sentence_transformers import SentenceTransformer
+        self.model = model or DEFAULT_LOCAL_MODEL
+        self.device = device
+        self.backend = backend
+        self.window_chars = window_chars
+        options = {"device": device}
+        if backend != "torch":
+            options["backend"] = backend
+        self.encoder = SentenceTransformer(self.model, **options)
+        logger.info(f"로컬 임베딩 모델 로드: {self.model} ({device}, {backend})")
+
+    @property
+    def model_id(self) -> str:
+        return f"local:{self.model}:{self.backend}:w{self.window_chars}"
+
+    def _windows(self, text: str) -> List[str]:
+        if not self.window_chars or len(text) <= self.window_chars:
+            return [text]
+        return [text[i:i + self.window_chars] for i in range(0, len(text), self.window_chars)]
+
+    def _embed_batch(self, texts: List[str]) -> List[np.ndarray]:
+        # 배치의 모든 창을 한 번에 인코딩한 뒤 문서별 평균 → 다시 정규화
+        windows, owners = [], []
+        for i, text in enumerate(texts):
+            for window in self._windows(text):
+                windows.append(window)
+                owners.append(i)
+        encoded = self.encoder.encode(
+            windows,
+            batch_size=self.batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        )
+        owners = np.asarray(owners)
+        vectors = []
+        for i in range(len(texts)):
+            vector = encoded[owners == i].mean(axis=0)
+            vectors.append(vector / (np.linalg.norm(vector) or 1.0))
+        return vectors
+
+
+class HashingEmbeddingProvider(EmbeddingProvider):
+    """문자 n-gram 해싱 벡터 (결정적, 외부 모델 없음)"""
+
+    name = "hashing"
+
+    def __init__(self, n_features: int = 1024, ngram_range: Tuple[int, int] = (2, 4), batch_size: int = 256):
+        """
+        생성자
+
+        Args:
+            n_features: 벡터 차원
+            ngram_range: 문자 n-gram 범위 (한국어는 2~4 권장)
+            batch_size: 변환 1회당 텍스트 수
+        """
+        super().__init__(batch_size)
+        from sklearn.feature_extraction.text import HashingVectorizer
+        self.n_features = n_features
+        self.ngram_range = tuple(ngram_range)
+        self.vectorizer = HashingVectorizer(
+            n_features=n_features,
+            analyzer='char_wb',
+            ngram_range=self.ngram_range,
+            alternate_sign=False,
+            norm='l2'
+        )
+
+    @property
+    def model_id(self) -> str:
+        return f"hashing:{self.n_features}:{self.ngram_range[0]}-{self.ngram_range[1]}"
+
+    def _embed_batch(self, texts: List[str]) -> List[np.ndarray]:
+        return list(self.vectorizer.transform(texts).toarray().astype(np.float32))
+
+
+EMBEDDING_PROVIDERS = {
+    OpenAIEmbeddingProvider.name: OpenAIEmbeddingProvider,
+    LocalEmbeddingProvider.name: LocalEmbeddingProvider,
+    HashingEmbeddingProvider.name: HashingEmbeddingProvider,
+}
+
+
+def create_embedding_provider(name: str,
+                              model: Optional[str] = None,
+                              batch_size: Optional[int] = None,
+                              **options) -> Optional[EmbeddingProvider]:
+    """
+    설정으로 임베딩 제공자 생성
+
+    Args:
+        name: openai | local | hashing | none
+        model: openai/local 모델명 (hashing은 무시)
+        batch_size: 배치 크기 (None이면 제공자 기본값)
+        **options: 제공자별 추가 옵션 (device, backend, window_chars, n_features, api_key ...)
+
+    Returns:
+        제공자 (none으로 명시적으로 끈 경우만 None → 임베딩 유사도는 기록하지 않음)
+
+    Raises:
+        RuntimeError: 제공자 초기화 실패 (키 누락, 모델/패키지 없음 등, 조용히 0점으로 기록하지 않도록 시작 시 중단)
+    """
+    if name == DISABLED_PROVIDER:
+        logger.info("임베딩 제공자: none (임베딩 유사도 계산 안 함)")
+        return None
+    provider_class = EMBEDDING_PROVIDERS.get(name)
+    if provider_class is None:
+        raise ValueError(f"알 수 없는 임베딩 제공자: {name} "
+                         f"(사용 가능: {', '.join([*EMBEDDING_PROVIDERS, DISABLED_PROVIDER])})")
+
+    if model and provider_class is not HashingEmbeddingProvider:
+        options["model"] = model
+    if batch_size:
+        options["batch_size"] = batch_size
+    try:
+        provider = provider_class(**options)
+    except Exception as e:
+        raise RuntimeError(f"임베딩 제공자 초기화 실패 ({name}): {e} "
+                           f"(임베딩 유사도 없이 평가하려면 embedding_provider: none)") from e
+    logger.info(f"임베딩 제공자: {name} ({provider.model_id})")
+    return provider
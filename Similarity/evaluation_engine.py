@@ -0,0 +1,1167 @@
+"""
+로컬 회의록 유사도 평가 엔진 (pre/post 공용)
+
+- 학습 전/후 평가는 경로/매칭 규칙(EvaluationLayout)만 다르고 같은 엔진을 사용
+  (pre_similarity/pre_SimilarityEvaluator.py, post_similarity/post_SimilarityEvaluator.py는 실행 진입점)
+- 스트리밍 평가: batch_size개 쌍씩 추출 → 점수 계산 → 결과 JSONL에 추가 기록 후 텍스트 해제
+  → 평가 대상이 늘어도 메모리와 중간 저장 비용이 일정
+- 재개: 결과 JSONL의 첫 줄(실행 정보)이 같으면 기록된 쌍은 건너뛰고 이어서 평가
+- 요약 통계: 평균/표준편차/최소/최대 + 포아송 부트스트랩 신뢰구간을 점수가 나올 때마다 누적
+- 최종 JSON/CSV/요약 파일은 결과 JSONL을 한 줄씩 읽어 작성
+"""
+
+import os
+import json
+import time
+import heapq
+import hashlib
+import random
+import logging
+import argparse
+import textwrap
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+import yaml
+
+from file_matching import match_folders
+from corpus_tfidf import CorpusTfidf, corpus_tfidf_cosines
+from text_extraction import TextExtractor
+from lexical_metrics import FIELD_SCORING_VERSION, SCHEMA_FIELDS, compute_lexical_metrics
+from embedding_cache import EmbeddingCache
+from embedding_providers import DEFAULT_LOCAL_MODEL, create_embedding_provider
+from streaming_stats import StreamingSummary
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+SIMILARITY_DIR = Path(__file__).resolve().parent
+SUMMARY_METRICS = ("tfidf_cosine", "embedding_cosine", "rouge_l", "chrf")
+
+
+@dataclass
+class EvaluationLayout:
+    """학습 전/후 평가의 경로/매칭 규칙"""
+    training_type: str  # config.yaml similarity_evaluation 아래 키 (pre_training | post_training)
+    label: str  # 출력용 이름
+    default_model: str  # 기본 모델 크기
+    output_prefix: str  # 기본 출력 파일명 접두사
+    script_dir: str  # 실행 스크립트 폴더 (.env 위치)
+    gold_prefix: str = ""  # gold 폴더명 접두사 필터
+    result_file: Optional[str] = None  # 결과 폴더 안의 결과 파일 (None이면 폴더 자체)
+    exact_name_fallback: bool = False  # 키 매칭 실패 시 같은 이름의 gold 폴더 사용
+    report_unmatched: bool = False  # 매칭 실패 목록을 결과 폴더의 unmatched_files.txt로 저장
+
+    def with_matching(self, matching: Optional[Dict[str, Any]]) -> "EvaluationLayout":
+        """config.yaml의 matching 항목으로 매칭 규칙 덮어쓰기"""
+        if not matching:
+            return self
+        options = asdict(self)
+        for key in ("gold_prefix", "result_file", "exact_name_fallback", "report_unmatched"):
+            if key in matching:
+                options[key] = matching[key]
+        return EvaluationLayout(**options)
+
+
+LAYOUTS = {
+    "pre_training": EvaluationLayout(
+        training_type="pre_training",
+        label="학습 전",
+        default_model="1.7B",
+        output_prefix="pretrain",
+        script_dir="pre_similarity",
+        result_file="result.json",
+        exact_name_fallback=True  # 키 매칭 실패 시 같은 이름의 gold 폴더 (한글 이름 등)
+    ),
+    "post_training": EvaluationLayout(
+        training_type="post_training",
+        label="학습 후",
+        default_model="8B",
+        output_prefix="post",
+        script_dir="post_similarity",
+        gold_prefix="val_",
+        report_unmatched=True
+    ),
+}
+
+
+@dataclass
+class EvaluationConfig:
+    """평가 설정"""
+    tfidf_max_features: int = 5000
+    tfidf_ngram_range: Tuple[int, int] = (1, 2)
+    tfidf_mode: str = "corpus"  # corpus: 평가 코퍼스 전체로 한 번 학습, pair: 쌍마다 학습 (이전 점수 호환)
+    tfidf_vocabulary_path: Optional[str] = None  # 고정 기준 어휘 파일 (없으면 이번 코퍼스로 학습 후 저장)
+    sample_size: int = 100  # 랜덤 샘플링 크기 (0이면 전체)
+    random_seed: int = 42  # 재현 가능한 랜덤 샘플링을 위한 시드 (부트스트랩 가중치에도 사용)
+    text_format: str = "compact"  # 비교 텍스트 형식 (compact: 키: 값 줄 단위 / json: 이전 버전 indent=2 JSON)
+    extraction_workers: int = 8  # 텍스트 추출 스레드 수
+    text_cache_path: Optional[str] = None  # 추출 텍스트 캐시 (sqlite, 파일 mtime/크기가 같으면 재사용)
+    embedding_provider: str = "openai"  # 임베딩 제공자 (openai | local | hashing | none)
+    embedding_model: str = "text-embedding-3-large"  # openai 임베딩 모델
+    local_embedding_model: str = DEFAULT_LOCAL_MODEL  # local 임베딩 모델 (로컬 경로 또는 HF 모델명)
+    embedding_batch_size: Optional[int] = None  # 임베딩 호출 1회당 텍스트 수 (None이면 제공자 기본값)
+    embedding_options: Dict[str, Any] = field(default_factory=dict)  # 제공자별 옵션 (device, backend, window_chars ...)
+    lexical_metrics: bool = True  # ROUGE-L / chrF / 필드별 F1 계산 여부 (API 호출 없음)
+    lexical_workers: int = 4  # 어휘 지표 프로세스 수
+    field_metrics: List[str] = field(default_factory=lambda: list(SCHEMA_FIELDS))  # 필드별 점수 대상 스키마 필드
+    batch_size: int = 100  # 한 번에 추출/평가 후 결과 파일에 기록할 쌍 수
+    use_cache: bool = True  # 임베딩 캐시 사용 여부
+    cache_dir: str = "embedding_cache"  # 임베딩 캐시 디렉토리 (vectors.f32 + index.tsv)
+    resume: bool = True  # 결과 JSONL이 같은 실행이면 이어서 평가
+    bootstrap_samples: int = 1000  # 평균 신뢰구간 부트스트랩 반복 수 (0이면 생략)
+    confidence_level: float = 0.95  # 신뢰수준
+
+    @property
+    def provider_model(self) -> Optional[str]:
+        """선택한 임베딩 제공자에 넘길 모델명 (hashing/none은 모델 없음)"""
+        if self.embedding_provider == "openai":
+            return self.embedding_model
+        if self.embedding_provider == "local":
+            return self.local_embedding_model
+        return None
+
+
+@dataclass
+class FileMatch:
+    """파일 매칭 정보"""
+    gold_folder: Path
+    result_file: Path
+    suffix: str
+    gold_text: str = ""
+    result_text: str = ""
+    gold_fields: Optional[Dict[str, str]] = None  # notion 객체에서 추출한 필드별 텍스트 (필드별 F1용)
+    result_fields: Optional[Dict[str, str]] = None
+
+
+@dataclass
+class EvaluationScore:
+    """개별 평가 점수"""
+    file_name: str
+    tfidf_cosine: float
+    embedding_cosine: Optional[float]  # 임베딩 제공자가 없거나 임베딩 실패 시 None (평균에서 제외)
+    rouge_l: Optional[float] = None  # 어휘 지표 비활성화 시 None
+    chrf: Optional[float] = None
+    field_scores: Dict[str, Dict[str, float]] = field(default_factory=dict)  # 필드 → precision/recall/f1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """딕셔너리 변환"""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EvaluationScore":
+        return cls(
+            file_name=data['file_name'],
+            tfidf_cosine=data['tfidf_cosine'],
+            embedding_cosine=data['embedding_cosine'],
+            rouge_l=data.get('rouge_l'),
+            chrf=data.get('chrf'),
+            field_scores=data.get('field_scores') or {}
+        )
+
+
+class ScoreLog:
+    """
+    추가 기록 전용 결과 JSONL
+
+    - 첫 줄: {"run": 실행 정보} (샘플/점수 설정이 바뀌면 이어서 쓰지 않음)
+    - 이후: 쌍마다 {"key", 점수...} 또는 {"key", "file_name", "skipped"} 한 줄
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    def _truncate_torn_tail(self) -> None:
+        """중단으로 줄바꿈 없이 끝난 마지막 줄 제거"""
+        with open(self.path, 'r+b') as f:
+            size = f.seek(0, os.SEEK_END)
+            tail_start = max(0, size - 65536)
+            f.seek(tail_start)
+            tail = f.read()
+            if not tail or tail.endswith(b'\n'):
+                return
+            last_newline = tail.rfind(b'\n')
+            f.truncate(tail_start + last_newline + 1 if last_newline >= 0 else 0)
+
+    def records(self) -> Iterator[Dict[str, Any]]:
+        """점수 줄을 순서대로 (실행 정보 줄 제외)"""
+        if not self.path.exists():
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.endswith('\n'):
+                    break
+                record = json.loads(line)
+                if "run" not in record:
+                    yield record
+
+    def open(self, run_info: Dict[str, Any], resume: bool = True) -> Iterator[Dict[str, Any]]:
+        """
+        실행 시작: 같은 실행이면 기록된 점수 줄을 돌려주고, 아니면 새 파일 시작
+
+        Returns:
+            이어서 평가할 때 이미 기록된 점수 줄
+        """
+        if resume and self.path.exists() and self.path.stat().st_size:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                first = f.readline()
+            try:
+                previous = json.loads(first).get("run") if first.endswith('\n') else None
+            except ValueError:
+                previous = None
+            if previous == run_info:
+                self._truncate_torn_tail()
+                return self.records()
+            backup = self.path.with_name(self.path.name + ".bak")
+            os.replace(self.path, backup)
+            logger.warning(f"실행 설정이 다른 결과 파일 → {backup.name}로 옮기고 새로 시작")
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({"run": run_info}, ensure_ascii=False) + "\n")
+        return iter(())
+
+    def append(self, records: Sequence[Dict[str, Any]]) -> None:
+        """점수 줄 추가 (기록 후 fsync → 중단되어도 기록된 줄은 유지)"""
+        if not records:
+            return
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.writelines(json.dumps(record, ensure_ascii=False) + "\n" for record in records)
+            f.flush()
+            os.fsync(f.fileno())
+
+
+@dataclass
+class EvaluationResult:
+    """전체 평가 결과 (점수는 결과 JSONL에 있고, 요약 통계만 메모리에 보관)"""
+    results_file: Path
+    summary: StreamingSummary
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    sample_size: int = 0
+    total_available: int = 0
+    skipped: int = 0  # 빈 텍스트로 제외된 쌍 수
+    embedding_stats: Dict[str, Any] = field(default_factory=dict)  # 임베딩 제공자/처리량
+
+    def iter_scores(self) -> Iterator[EvaluationScore]:
+        """결과 JSONL의 점수를 한 줄씩 읽기"""
+        for record in ScoreLog(self.results_file).records():
+            if not record.get("skipped"):
+                yield EvaluationScore.from_dict(record)
+
+    @property
+    def scores(self) -> List[EvaluationScore]:
+        """전체 점수 목록 (모두 메모리에 올림, 큰 평가에서는 iter_scores 사용)"""
+        return list(self.iter_scores())
+
+    @property
+    def total_files(self) -> int:
+        return self.summary.count("tfidf_cosine")
+
+    @property
+    def mean_tfidf_cosine(self) -> float:
+        return self.summary.mean("tfidf_cosine") or 0.0
+
+    @property
+    def mean_embedding_cosine(self) -> Optional[float]:
+        return self.summary.mean("embedding_cosine")
+
+    @property
+    def mean_rouge_l(self) -> Optional[float]:
+        return self.summary.mean("rouge_l")
+
+    @property
+    def mean_chrf(self) -> Optional[float]:
+        return self.summary.mean("chrf")
+
+    @property
+    def field_summary(self) -> Dict[str, Dict[str, float]]:
+        """필드별 평균 정밀도/재현율/F1"""
+        return self.summary.field_summary()
+
+    def to_dict(self, include_details: bool = True) -> Dict[str, Any]:
+        """딕셔너리 변환"""
+        data = {
+            "timestamp": self.timestamp,
+            "sampling_info": {
+                "sample_size": self.sample_size,
+                "total_available": self.total_available,
+                "sampling_rate": f"{(self.sample_size/self.total_available*100):.1f}%" if self.total_available > 0 else "0%"
+            },
+            "summary": {
+                "total_files": self.total_files,
+                "skipped_files": self.skipped,
+                "mean_tfidf_cosine": self.mean_tfidf_cosine,
+                "mean_embedding_cosine": self.mean_embedding_cosine,
+                "mean_rouge_l": self.mean_rouge_l,
+                "mean_chrf": self.mean_chrf
+            },
+            "statistics": self.summary.to_dict(),
+            "fields": self.field_summary,
+            "embedding": self.embedding_stats,
+            "results_file": str(self.results_file)
+        }
+        if include_details:
+            data["details"] = [_detail(score) for score in self.iter_scores()]
+        return data
+
+    def write_json(self, path: str) -> None:
+        """결과 JSON 저장 (details는 결과 JSONL에서 한 줄씩 옮겨 씀)"""
+        head = json.dumps(self.to_dict(include_details=False), ensure_ascii=False, indent=2)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(head[:-2] + ',\n  "details": [')  # 마지막 "\n}"를 떼고 details 배열 이어 쓰기
+            for i, score in enumerate(self.iter_scores()):
+                f.write(("," if i else "") + "\n")
+                f.write(textwrap.indent(json.dumps(_detail(score), ensure_ascii=False, indent=2), "    "))
+            f.write("\n  ]\n}\n")
+
+
+def _detail(score: EvaluationScore) -> Dict[str, Any]:
+    return {
+        "file_name": score.file_name,
+        "tfidf_cosine": score.tfidf_cosine,
+        "embedding_cosine": score.embedding_cosine,
+        "rouge_l": score.rouge_l,
+        "chrf": score.chrf,
+        "fields": score.field_scores
+    }
+
+
+def _format_score(value: Optional[float]) -> str:
+    return "N/A" if value is None else f"{value:.4f}"
+
+
+def top_bottom(scores: Iterable[EvaluationScore], metric: str, count: int = 10) -> Tuple[List, List]:
+    """점수를 한 번 훑으며 상위/하위 count개 (하위는 높은 순, 이전 sorted()[-count:]와 같은 순서)"""
+    top: List[Tuple[float, int, EvaluationScore]] = []
+    bottom: List[Tuple[float, int, EvaluationScore]] = []
+    for i, score in enumerate(scores):
+        value = getattr(score, metric)
+        if value is None:
+            continue
+        item = (value, -i, score)
+        if len(top) < count:
+            heapq.heappush(top, item)
+        else:
+            heapq.heappushpop(top, item)
+        item = (-value, i, score)
+        if len(bottom) < count:
+            heapq.heappush(bottom, item)
+        else:
+            heapq.heappushpop(bottom, item)
+    top_scores = [score for _, _, score in sorted(top, key=lambda x: (x[0], x[1]), reverse=True)]
+    bottom_scores = [score for _, _, score in sorted(bottom)]
+    return top_scores, bottom_scores
+
+
+class FileMatcher:
+    """파일 매칭 유틸리티"""
+
+    def __init__(self, layout: EvaluationLayout = LAYOUTS["pre_training"]):
+        self.layout = layout
+
+    def find_matches(self, gold_base_path: str, result_base_path: str) -> List[FileMatch]:
+        """정답과 결과 파일 매칭 (폴더명 키 인덱스 조인, 매칭 규칙은 layout)"""
+        matches = []
+        gold_path = Path(gold_base_path)
+        result_path = Path(result_base_path)
+
+        if not gold_path.exists() or not result_path.exists():
+            logger.error(f"경로가 존재하지 않음: {gold_base_path} 또는 {result_base_path}")
+            return matches
+
+        logger.info("파일 매칭 시작...")
+
+        # gold/result 디렉토리를 각각 한 번만 스캔하여 (base_name, chunk_num) 키로 조인
+        pairs, unmatched_results = match_folders(
+            gold_path, result_path,
+            gold_prefix=self.layout.gold_prefix,
+            result_file=self.layout.result_file,
+            exact_name_fallback=self.layout.exact_name_fallback
+        )
+        for gold_folder, result_target, identifier in pairs:
+            matches.append(FileMatch(gold_folder, result_target, identifier))
+            logger.debug(f"매칭 성공: {gold_folder.name} <-> {result_target}")
+
+        # 매칭 실패한 파일들 보고
+        if unmatched_results and self.layout.report_unmatched:
+            logger.warning(f"\n매칭 실패한 결과 파일 {len(unmatched_results)}개:")
+            for unmatched in unmatched_results:
+                logger.warning(f"  - {unmatched}")
+
+            # 파일로도 저장
+            unmatched_file = result_path / "unmatched_files.txt"
+            with open(unmatched_file, 'w', encoding='utf-8') as f:
+                f.write(f"매칭 실패한 파일 목록 ({datetime.now().isoformat()})\n")
+                f.write("=" * 60 + "\n\n")
+                for unmatched in unmatched_results:
+                    f.write(f"{unmatched}\n")
+            logger.info(f"매칭 실패 파일 목록 저장: {unmatched_file}")
+
+        logger.info(f"총 {len(matches)}개 파일 쌍 매칭 완료, {len(unmatched_results)}개 실패")
+        return matches
+
+    @staticmethod
+    def random_sample_matches(matches: List[FileMatch], sample_size: int, seed: int = 42) -> List[FileMatch]:
+        """매칭된 파일 중 랜덤 샘플링 (sample_size가 0이면 전체)"""
+        if sample_size <= 0 or len(matches) <= sample_size:
+            logger.info(f"전체 파일 수({len(matches)})가 샘플 크기({sample_size})보다 작거나 같음. 전체 사용")
+            return matches
+
+        random.seed(seed)
+        sampled = random.sample(matches, sample_size)
+        logger.info(f"총 {len(matches)}개 중 {sample_size}개 랜덤 샘플링 완료 (시드: {seed})")
+        return sampled
+
+
+class SimilarityMetrics:
+    """유사도 메트릭 계산"""
+
+    def __init__(self, config: EvaluationConfig, env_dirs: Sequence[Path] = ()):
+        """
+        초기화
+
+        Args:
+            config: 평가 설정
+            env_dirs: OPENAI_API_KEY를 찾을 .env 파일 폴더 (환경변수가 없을 때)
+        """
+        self.config = config
+        self.tfidf_vectorizer = TfidfVectorizer(
+            max_features=config.tfidf_max_features,
+            ngram_range=config.tfidf_ngram_range,
+            stop_words=None
+        )
+        self.tfidf_model: Optional[CorpusTfidf] = None  # corpus 모드에서 prepare_tfidf로 학습
+
+        # 임베딩 제공자 (OpenAI는 환경변수 → .env 순으로 API 키 확인)
+        options = dict(config.embedding_options)
+        if config.embedding_provider == "openai" and "api_key" not in options:
+            options["api_key"] = self._read_api_key(env_dirs)
+        self.embedding_provider = create_embedding_provider(
+            config.embedding_provider,
+            model=config.provider_model,
+            batch_size=config.embedding_batch_size,
+            **options
+        )
+
+        # 임베딩 캐시 (제공자 모델 식별자별 키, 첫 조회 시 인덱스 로드)
+        self.embedding_cache = None
+        if config.use_cache and self.embedding_provider is not None:
+            self.embedding_cache = EmbeddingCache(config.cache_dir, self.embedding_provider.model_id)
+
+    @staticmethod
+    def _read_api_key(env_dirs: Sequence[Path] = ()) -> Optional[str]:
+        """OPENAI_API_KEY 환경변수, 없으면 env_dirs → 현재 폴더 순으로 .env 파일"""
+        api_key = os.getenv("OPENAI_API_KEY")
+        if api_key:
+            return api_key
+        for env_dir in [*env_dirs, Path.cwd()]:
+            env_path = Path(env_dir) / ".env"
+            if env_path.exists():
+                with open(env_path, 'r') as f:
+                    for line in f:
+                        if line.startswith("OPENAI_API_KEY="):
+                            return line.split("=", 1)[1].strip()
+        return None
+
+    @property
+    def embedding_model_id(self) -> Optional[str]:
+        return self.embedding_provider.model_id if self.embedding_provider is not None else None
+
+    def embedding_stats(self) -> Dict[str, Any]:
+        """임베딩 제공자 정보 + 처리량"""
+        if self.embedding_provider is None:
+            return {}
+        return {
+            "provider": self.embedding_provider.name,
+            "model": self.embedding_provider.model_id,
+            **self.embedding_provider.stats.to_dict()
+        }
+
+    def save_cache(self):
+        """캐시 저장"""
+        if self.embedding_cache is not None:
+            try:
+                saved = self.embedding_cache.flush()
+                if saved:
+                    logger.info(f"임베딩 캐시 저장: 신규 {saved}개 (전체 {len(self.embedding_cache)}개 항목)")
+            except Exception as e:
+                logger.error(f"캐시 저장 실패: {e}")
+
+    def prepare_tfidf(self, text_pairs: Iterable[Tuple[str, str]]) -> None:
+        """
+        corpus 모드: 평가 대상 전체 쌍으로 어휘/IDF를 한 번 학습 (청크별 점수가 같은 기준을 쓰도록)
+
+        Args:
+            text_pairs: (gold, result) 텍스트 쌍 (제너레이터면 한 번만 순회, 기준 어휘 파일이 있으면 순회하지 않음)
+        """
+        if self.config.tfidf_mode == "pair":
+            return
+        vocabulary_path = self.config.tfidf_vocabulary_path
+        try:
+            if vocabulary_path and Path(vocabulary_path).exists():
+                self.tfidf_model = CorpusTfidf.load(vocabulary_path)
+                return
+            model = CorpusTfidf(self.config.tfidf_max_features, self.config.tfidf_ngram_range)
+            model.fit(text for pair in text_pairs for text in pair)
+            if vocabulary_path:
+                model.save(vocabulary_path)
+            self.tfidf_model = model
+        except Exception as e:
+            logger.error(f"코퍼스 TF-IDF 학습 실패: {e}")
+            self.tfidf_model = None
+
+    def compute_tfidf_cosine_similarity(self, text1: str, text2: str) -> float:
+        """TF-IDF 기반 코사인 유사도 계산"""
+        try:
+            all_texts = [text1, text2]
+            tfidf_matrix = self.tfidf_vectorizer.fit_transform(all_texts)
+            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+            return float(similarity)
+        except Exception as e:
+            logger.error(f"TF-IDF 코사인 유사도 계산 실패: {e}")
+            return 0.0
+
+    def compute_tfidf_cosine_batch(self, texts1: List[str], texts2: List[str]) -> List[float]:
+        """쌍별 TF-IDF 코사인 유사도 (corpus 모드: 학습된 기준 또는 입력 코퍼스로 한 번 학습 + 행 단위 희소 내적)"""
+        if self.config.tfidf_mode == "pair":
+            return [self.compute_tfidf_cosine_similarity(text1, text2) for text1, text2 in zip(texts1, texts2)]
+        # 빈 텍스트 쌍은 평가에서 제외되므로 IDF 학습에도 넣지 않음
+        similarities = [0.0] * len(texts1)
+        valid = [i for i, (text1, text2) in enumerate(zip(texts1, texts2)) if text1.strip() and text2.strip()]
+        if not valid:
+            return similarities
+        valid_texts1 = [texts1[i] for i in valid]
+        valid_texts2 = [texts2[i] for i in valid]
+        try:
+            if self.tfidf_model is not None:
+                valid_similarities = self.tfidf_model.paired_cosine(valid_texts1, valid_texts2).tolist()
+            else:
+                valid_similarities = corpus_tfidf_cosines(
+                    valid_texts1, valid_texts2,
+                    max_features=self.config.tfidf_max_features,
+                    ngram_range=self.config.tfidf_ngram_range,
+                    vocabulary_path=self.config.tfidf_vocabulary_path
+                )
+        except Exception as e:
+            logger.error(f"코퍼스 TF-IDF 코사인 유사도 계산 실패: {e}")
+            return similarities
+        for i, similarity in zip(valid, valid_similarities):
+            similarities[i] = similarity
+        return similarities
+
+    def compute_lexical_batch(self,
+                              texts1: List[str],
+                              texts2: List[str],
+                              executor: Optional[ProcessPoolExecutor] = None,
+                              fields1: Optional[List[Optional[Dict[str, str]]]] = None,
+                              fields2: Optional[List[Optional[Dict[str, str]]]] = None) -> List[Optional[Dict[str, Any]]]:
+        """ROUGE-L / chrF / 필드별 F1을 프로세스 풀로 계산 (비활성화 시 None, 필드 텍스트가 없으면 텍스트를 나눔)"""
+        if not self.config.lexical_metrics:
+            return [None] * len(texts1)
+        return compute_lexical_metrics(
+            texts1,
+            texts2,
+            fields=self.config.field_metrics,
+            workers=self.config.lexical_workers,
+            executor=executor,
+            fields1=fields1,
+            fields2=fields2
+        )
+
+    def get_batch_embeddings(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """배치 임베딩 얻기 (캐시에 없는 텍스트만 계산)"""
+        if self.embedding_provider is None:
+            return [None] * len(texts)
+
+        if self.embedding_cache is not None:
+            embeddings = self.embedding_cache.get_many(texts)
+        else:
+            embeddings = [None] * len(texts)
+        uncached_indices = [i for i, embedding in enumerate(embeddings) if embedding is None]
+
+        if uncached_indices:
+            computed = self.embedding_provider.embed([texts[i] for i in uncached_indices])
+            for idx, embedding in zip(uncached_indices, computed):
+                if embedding is None:
+                    continue
+                embeddings[idx] = embedding
+                if self.embedding_cache is not None:
+                    self.embedding_cache.put(texts[idx], embedding)
+
+        return embeddings
+
+    def get_embedding(self, text: str) -> Optional[np.ndarray]:
+        """임베딩 얻기 (캐시 지원)"""
+        return self.get_batch_embeddings([text])[0]
+
+    def compute_embedding_cosine_batch(self, texts1: List[str], texts2: List[str]) -> List[Optional[float]]:
+        """쌍별 임베딩 코사인 유사도 (양쪽 텍스트를 한 번에 배치 임베딩, 임베딩이 없는 쌍은 None)"""
+        embeddings = self.get_batch_embeddings(list(texts1) + list(texts2))
+        similarities: List[Optional[float]] = []
+        for embedding1, embedding2 in zip(embeddings[:len(texts1)], embeddings[len(texts1):]):
+            if embedding1 is None or embedding2 is None:
+                similarities.append(None)
+                continue
+            similarity = cosine_similarity(embedding1.reshape(1, -1), embedding2.reshape(1, -1))[0][0]
+            similarities.append(float(similarity))
+        return similarities
+
+    def compute_embedding_cosine_similarity(self, text1: str, text2: str) -> Optional[float]:
+        """임베딩 기반 코사인 유사도 계산"""
+        return self.compute_embedding_cosine_batch([text1], [text2])[0]
+
+
+class LocalSimilarityEvaluator:
+    """로컬 유사도 평가기 (스트리밍)"""
+
+    def __init__(self, config: Optional[EvaluationConfig] = None, layout: Optional[EvaluationLayout] = None):
+        """
+        초기화
+
+        Args:
+            config: 평가 설정
+            layout: 학습 전/후 경로/매칭 규칙 (기본: pre_training)
+        """
+        self.config = config or EvaluationConfig()
+        self.layout = layout or LAYOUTS["pre_training"]
+        self.model_size = self.layout.default_model  # 기본값
+        self.output_config = None  # 출력 설정
+
+        self.file_matcher = FileMatcher(self.layout)
+        self.text_extractor = TextExtractor(
+            text_format=self.config.text_format,
+            cache_path=self.config.text_cache_path,
+            workers=self.config.extraction_workers
+        )
+        self.metrics = SimilarityMetrics(self.config, env_dirs=[SIMILARITY_DIR / self.layout.script_dir])
+
+        logger.info(f"로컬 유사도 평가기 초기화 완료 ({self.layout.label})")
+        logger.info(f"샘플 크기: {self.config.sample_size}")
+        logger.info(f"배치 크기: {self.config.batch_size}")
+        logger.info(f"캐시 사용: {self.config.use_cache}")
+
+    def _output_files(self) -> Dict[str, str]:
+        if self.output_config:
+            files = dict(self.output_config)
+        else:
+            # 기본값
+            name = f"{self.model_size}_{self.layout.output_prefix}_similarity"
+            files = {
+                'json_file': f"{name}_results.json",
+                'csv_file': f"{name}_results.csv",
+                'summary_file': f"{name}_summary.txt"
+            }
+        files.setdefault('results_file', str(Path(files['json_file']).with_suffix(".jsonl")))
+        return files
+
+    def _run_info(self, matches: List[FileMatch], total_available: int) -> Dict[str, Any]:
+        """결과 JSONL 첫 줄 (이어서 평가할 수 있는지 판단하는 실행 정보)"""
+        return {
+            "training_type": self.layout.training_type,
+            "model_size": self.model_size,
+            "sample_size": len(matches),
+            "sample_hash": hashlib.sha256("\n".join(sorted(match.suffix for match in matches)).encode("utf-8")).hexdigest(),
+            "total_available": total_available,
+            "random_seed": self.config.random_seed,
+            "text_format": self.config.text_format,
+            "tfidf_mode": self.config.tfidf_mode,
+            "tfidf_max_features": self.config.tfidf_max_features,
+            "tfidf_ngram_range": list(self.config.tfidf_ngram_range),
+            "tfidf_vocabulary": self.config.tfidf_vocabulary_path,
+            "embedding_model": self.metrics.embedding_model_id,
+            "lexical_metrics": self.config.lexical_metrics,
+            "field_metrics": list(self.config.field_metrics) if self.config.lexical_metrics else [],
+            "field_scoring": FIELD_SCORING_VERSION if self.config.lexical_metrics else None
+        }
+
+    def _new_summary(self) -> StreamingSummary:
+        return StreamingSummary(
+            SUMMARY_METRICS,
+            bootstrap_samples=self.config.bootstrap_samples,
+            confidence=self.config.confidence_level,
+            seed=self.config.random_seed
+        )
+
+    @staticmethod
+    def _add_to_summary(summary: StreamingSummary, record: Dict[str, Any]) -> None:
+        summary.add(record["key"], {name: record.get(name) for name in SUMMARY_METRICS}, record.get("field_scores"))
+
+    def _iter_text_pairs(self, matches: List[FileMatch]) -> Iterator[Tuple[str, str]]:
+        """청크 단위로 추출하며 (gold, result) 텍스트 쌍 생성 (빈 쌍 제외, 청크가 끝나면 텍스트 해제)"""
+        for chunk_start in range(0, len(matches), self.config.batch_size):
+            chunk = matches[chunk_start:chunk_start + self.config.batch_size]
+            self.text_extractor.extract_matches(chunk)
+            for match in chunk:
+                if match.gold_text.strip() and match.result_text.strip():
+                    yield match.gold_text, match.result_text
+                match.gold_text = match.result_text = ""
+                match.gold_fields = match.result_fields = None
+
+    def evaluate_single(self, ground_truth: str, prediction: str, file_name: str,
+                        tfidf_cosine: Optional[float] = None,
+                        embedding_cosine: Optional[float] = None,
+                        lexical: Optional[Dict[str, Any]] = None) -> EvaluationScore:
+        """단일 파일 평가 (유사도/어휘 지표가 주어지면 재계산하지 않음)"""
+        # TF-IDF 코사인 유사도 계산
+        if tfidf_cosine is None:
+            tfidf_cosine = self.metrics.compute_tfidf_cosine_similarity(ground_truth, prediction)
+
+        # 임베딩 코사인 유사도 계산 (임베딩 제공자가 없거나 실패하면 None)
+        if embedding_cosine is None:
+            embedding_cosine = self.metrics.compute_embedding_cosine_similarity(ground_truth, prediction)
+
+        # 어휘 지표 (ROUGE-L / chrF / 필드별 F1)
+        if lexical is None:
+            lexical = self.metrics.compute_lexical_batch([ground_truth], [prediction])[0] or {}
+
+        return EvaluationScore(
+            file_name=file_name,
+            tfidf_cosine=tfidf_cosine,
+            embedding_cosine=embedding_cosine,
+            rouge_l=lexical.get("rouge_l"),
+            chrf=lexical.get("chrf"),
+            field_scores=lexical.get("fields", {})
+        )
+
+    def _evaluate_chunk(self,
+                        chunk: List[FileMatch],
+                        executor: Optional[ProcessPoolExecutor]) -> List[Dict[str, Any]]:
+        """청크 하나 추출 + 점수 계산 → 결과 JSONL 줄 (텍스트는 계산 후 해제)"""
+        self.text_extractor.extract_matches(chunk)
+        gold_texts = [match.gold_text for match in chunk]
+        result_texts = [match.result_text for match in chunk]
+
+        tfidf_sims = self.metrics.compute_tfidf_cosine_batch(gold_texts, result_texts)
+        embedding_sims = self.metrics.compute_embedding_cosine_batch(gold_texts, result_texts)
+        lexical_scores = self.metrics.compute_lexical_batch(
+            gold_texts, result_texts, executor=executor,
+            fields1=[match.gold_fields for match in chunk],
+            fields2=[match.result_fields for match in chunk]
+        )
+
+        records = []
+        for match, tfidf_sim, embedding_sim, lexical in zip(chunk, tfidf_sims, embedding_sims, lexical_scores):
+            if not match.gold_text.strip() or not match.result_text.strip():
+                logger.warning(f"빈 텍스트: {match.suffix}")
+                records.append({"key": match.suffix, "file_name": match.gold_folder.name, "skipped": "empty_text"})
+            else:
+                score = self.evaluate_single(
+                    match.gold_text,
+                    match.result_text,
+                    match.gold_folder.name,
+                    tfidf_cosine=tfidf_sim,
+                    embedding_cosine=embedding_sim,
+                    lexical=lexical or {}
+                )
+                records.append({"key": match.suffix, **score.to_dict()})
+
+                logger.info(
+                    f"  {score.file_name}: "
+                    f"TF-IDF={score.tfidf_cosine:.4f}, "
+                    f"Embedding={_format_score(score.embedding_cosine)}"
+                    + (f", ROUGE-L={score.rouge_l:.4f}, chrF={score.chrf:.4f}" if score.rouge_l is not None else "")
+                )
+            match.gold_text = match.result_text = ""
+            match.gold_fields = match.result_fields = None
+        return records
+
+    def evaluate_batch(self, matches: List[FileMatch], total_available: Optional[int] = None) -> EvaluationResult:
+        """
+        스트리밍 평가 (batch_size개씩 평가 → 결과 JSONL에 추가, 같은 실행이면 이어서 평가)
+
+        Args:
+            matches: 평가할 매칭 (샘플링 후)
+            total_available: 샘플링 전 전체 매칭 수
+
+        Returns:
+            요약 통계 + 결과 JSONL 경로
+        """
+        total_available = total_available or len(matches)
+        logger.info(f"배치 평가 시작: {len(matches)}개 파일")
+
+        score_log = ScoreLog(Path(self._output_files()['results_file']))
+        summary = self._new_summary()
+        done = set()
+        skipped = 0
+        for record in score_log.open(self._run_info(matches, total_available), resume=self.config.resume):
+            done.add(record["key"])
+            if record.get("skipped"):
+                skipped += 1
+            else:
+                self._add_to_summary(summary, record)
+
+        pending = [match for match in matches if match.suffix not in done]
+        if done:
+            logger.info(f"이전 결과에서 재개: {len(done)}개 완료, {len(pending)}개 남음 ({score_log.path})")
+
+        if pending:
+            # corpus TF-IDF는 샘플 전체로 학습 (재개해도 중단 없이 실행한 것과 같은 IDF)
+            self.metrics.prepare_tfidf(self._iter_text_pairs(matches))
+
+            executor = None
+            if self.config.lexical_metrics and self.config.lexical_workers > 1:
+                executor = ProcessPoolExecutor(max_workers=self.config.lexical_workers)
+            try:
+                for chunk_start in range(0, len(pending), self.config.batch_size):
+                    chunk = pending[chunk_start:chunk_start + self.config.batch_size]
+                    completed = len(done) + chunk_start + len(chunk)
+                    logger.info(f"배치 처리 [{len(done) + chunk_start + 1}-{completed}/{len(matches)}]")
+
+                    records = self._evaluate_chunk(chunk, executor)
+                    score_log.append(records)
+                    self.metrics.save_cache()
+                    for record in records:
+                        if record.get("skipped"):
+                            skipped += 1
+                        else:
+                            self._add_to_summary(summary, record)
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+
+        return EvaluationResult(
+            results_file=score_log.path,
+            summary=summary,
+            sample_size=len(matches),
+            total_available=total_available,
+            skipped=skipped,
+            embedding_stats=self.metrics.embedding_stats()
+        )
+
+    def evaluate_from_paths(self, gold_base_path: str, result_base_path: str) -> Optional[EvaluationResult]:
+        """경로 기반 평가 (랜덤 샘플링 적용)"""
+        logger.info("=" * 80)
+        logger.info(f"로컬 회의록 유사도 평가 시작 ({self.layout.label})")
+        logger.info(f"정답 경로: {gold_base_path}")
+        logger.info(f"비교 경로: {result_base_path}")
+        logger.info("=" * 80)
+
+        start_time = time.time()
+
+        # 파일 매칭
+        all_matches = self.file_matcher.find_matches(gold_base_path, result_base_path)
+
+        if not all_matches:
+            logger.error("매칭되는 파일 없음")
+            return None
+
+        # 랜덤 샘플링
+        sampled_matches = self.file_matcher.random_sample_matches(
+            all_matches,
+            self.config.sample_size,
+            self.config.random_seed
+        )
+
+        # 평가 수행
+        result = self.evaluate_batch(sampled_matches, total_available=len(all_matches))
+
+        # 소요 시간
+        elapsed_time = time.time() - start_time
+        logger.info(f"평가 완료: {elapsed_time:.2f}초 소요")
+
+        # 결과 출력
+        self._print_results(result)
+
+        # 결과 저장
+        self._save_results(result)
+
+        return result
+
+    @staticmethod
+    def _format_mean(result: EvaluationResult, metric: str) -> str:
+        mean = result.summary.mean(metric)
+        if mean is None:
+            return "N/A"
+        low, high = result.summary.interval(metric)
+        if low is None:
+            return f"{mean:.4f}"
+        return f"{mean:.4f} ({result.summary.confidence:.0%} CI {low:.4f}~{high:.4f})"
+
+    def _print_results(self, result: EvaluationResult):
+        """결과 출력"""
+        print("\n" + "=" * 80)
+        print(f"평가 결과 요약 ({self.layout.label})")
+        print("=" * 80)
+        print(f"전체 가능 파일 수: {result.total_available}")
+        print(f"샘플링된 파일 수: {result.sample_size}")
+        print(f"실제 평가 파일 수: {result.total_files}")
+        print(f"샘플링 비율: {(result.sample_size/result.total_available*100):.1f}%")
+        print("-" * 80)
+        print(f"평균 TF-IDF 코사인 유사도: {self._format_mean(result, 'tfidf_cosine')}")
+        print(f"평균 Embedding 코사인 유사도: {self._format_mean(result, 'embedding_cosine')}")
+        if result.mean_rouge_l is not None:
+            print(f"평균 ROUGE-L: {self._format_mean(result, 'rouge_l')}")
+            print(f"평균 chrF: {self._format_mean(result, 'chrf')}")
+            for name, values in result.field_summary.items():
+                print(f"  - {name}: P={values['precision']:.4f}, R={values['recall']:.4f}, "
+                      f"F1={values['f1']:.4f} ({values['count']}개)")
+        stats = result.embedding_stats
+        if stats:
+            print(f"임베딩: {stats['provider']} ({stats['model']}) - 신규 {stats['texts']}개, "
+                  f"{stats['texts_per_sec'] or 0:.1f} texts/s, 실패 {stats['failed']}개")
+        print(f"점수 기록: {result.results_file}")
+        print("=" * 80)
+
+        # 상위/하위 10개 결과 (TF-IDF와 Embedding 각각 표시)
+        if result.total_files >= 20:
+            for metric, label in (("tfidf_cosine", "TF-IDF"), ("embedding_cosine", "Embedding")):
+                if result.summary.mean(metric) is None:
+                    continue
+                top, bottom = top_bottom(result.iter_scores(), metric)
+                for title, scores in (("상위", top), ("하위", bottom)):
+                    print(f"\n[{label} 기준] {title} 10개 파일:")
+                    for i, score in enumerate(scores, 1):
+                        print(f"{i:2d}. {score.file_name[:50]:50s}: TF-IDF={score.tfidf_cosine:.4f}, "
+                              f"Embedding={_format_score(score.embedding_cosine)}")
+
+    def _save_results(self, result: EvaluationResult):
+        """결과 저장 (결과 JSONL을 한 줄씩 읽어 JSON/CSV 작성)"""
+        files = self._output_files()
+        json_file = files['json_file']
+        csv_file = files['csv_file']
+        summary_file = files['summary_file']
+
+        # JSON 저장
+        result.write_json(json_file)
+        logger.info(f"JSON 결과 저장: {json_file}")
+
+        # CSV 형식 저장
+        with open(csv_file, 'w', encoding='utf-8') as f:
+            lexical = result.mean_rouge_l is not None
+            f.write("파일명,TF-IDF_Cosine,Embedding_Cosine" + (",ROUGE-L,chrF" if lexical else "") + "\n")
+            for score in result.iter_scores():
+                embedding = "" if score.embedding_cosine is None else f"{score.embedding_cosine:.4f}"
+                line = f"{score.file_name},{score.tfidf_cosine:.4f},{embedding}"
+                if lexical:
+                    line += f",{score.rouge_l or 0.0:.4f},{score.chrf or 0.0:.4f}"
+                f.write(line + "\n")
+        logger.info(f"CSV 결과 저장: {csv_file}")
+
+        # 요약 텍스트 저장
+        with open(summary_file, 'w', encoding='utf-8') as f:
+            f.write("=" * 60 + "\n")
+            f.write(f"로컬 회의록 유사도 평가 요약 ({self.layout.label})\n")
+            f.write("=" * 60 + "\n\n")
+            f.write(f"평가 시간: {result.timestamp}\n")
+            f.write(f"전체 파일 수: {result.total_available}\n")
+            f.write(f"샘플링 크기: {result.sample_size}\n")
+            f.write(f"실제 평가 파일 수: {result.total_files}\n")
+            f.write(f"샘플링 비율: {(result.sample_size/result.total_available*100):.1f}%\n")
+            f.write(f"랜덤 시드: {self.config.random_seed}\n\n")
+            f.write("평균 점수:\n")
+            f.write(f"  - TF-IDF 코사인 유사도: {self._format_mean(result, 'tfidf_cosine')}\n")
+            f.write(f"  - Embedding 코사인 유사도: {self._format_mean(result, 'embedding_cosine')}\n")
+            if result.mean_rouge_l is not None:
+                f.write(f"  - ROUGE-L: {self._format_mean(result, 'rouge_l')}\n")
+                f.write(f"  - chrF: {self._format_mean(result, 'chrf')}\n")
+                f.write("\n필드별 정밀도/재현율/F1 (문자 bigram):\n")
+                for name, values in result.field_summary.items():
+                    f.write(f"  - {name}: P={values['precision']:.4f}, R={values['recall']:.4f}, "
+                            f"F1={values['f1']:.4f} ({values['count']}개)\n")
+
+            # 상위/하위 10개 결과 추가
+            if result.total_files >= 20:
+                f.write("\n" + "=" * 60 + "\n")
+                f.write("상위/하위 성능 파일\n")
+                f.write("=" * 60 + "\n")
+
+                for metric, label in (("tfidf_cosine", "TF-IDF"), ("embedding_cosine", "Embedding")):
+                    if result.summary.mean(metric) is None:
+                        continue
+                    top, bottom = top_bottom(result.iter_scores(), metric)
+                    for title, scores in (("상위", top), ("하위", bottom)):
+                        f.write(f"\n[{label} 기준] {title} 10개 파일:\n")
+                        for i, score in enumerate(scores, 1):
+                            f.write(f"{i:2d}. {score.file_name}\n")
+                            f.write(f"    - TF-IDF: {score.tfidf_cosine:.4f}, "
+                                    f"Embedding: {_format_score(score.embedding_cosine)}\n")
+
+        logger.info(f"요약 저장: {summary_file}")
+
+
+def load_config(config_path: Optional[str] = None) -> Dict:
+    """설정 파일 로드 (YAML 형식)"""
+    if config_path is None:
+        # 기본 config.yaml 파일 경로
+        config_path = str(SIMILARITY_DIR / "config.yaml")
+
+    if not os.path.exists(config_path):
+        # 구버전 JSON 설정 파일 확인
+        json_config_path = SIMILARITY_DIR / "config.json"
+        if json_config_path.exists():
+            logger.warning("config.yaml을 찾을 수 없어 config.json을 사용합니다.")
+            with open(json_config_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        raise FileNotFoundError(f"Config file not found: {config_path}")
+
+    with open(config_path, 'r', encoding='utf-8') as f:
+        config_data = yaml.safe_load(f)
+
+    return config_data
+
+
+def get_layout(config_data: Dict, training_type: str) -> EvaluationLayout:
+    """학습 전/후 매칭 규칙 (config.yaml similarity_evaluation.<training_type>.matching으로 덮어쓰기 가능)"""
+    layout = LAYOUTS[training_type]
+    sim_config = config_data.get('similarity_evaluation', {}).get(training_type, {})
+    return layout.with_matching(sim_config.get('matching'))
+
+
+def get_paths(config_data: Dict, model_size: str = "1.7B", training_type: str = "pre_training") -> Tuple[str, str, Dict]:
+    """설정에서 경로 추출 (YAML 형식, 상대 경로는 Similarity 폴더 기준)"""
+    parent_dir = str(SIMILARITY_DIR)
+
+    # YAML 설정 구조 확인
+    if 'similarity_evaluation' in config_data:
+        # 새로운 YAML 구조
+        sim_config = config_data['similarity_evaluation'][training_type]
+
+        # Gold 데이터 경로
+        gold_relative = sim_config['gold_data_path']
+        gold_path = os.path.join(parent_dir, gold_relative)
+
+        # 모델 결과 경로
+        result_relative = sim_config['results'][model_size]
+        result_path = os.path.join(parent_dir, result_relative)
+
+        # 출력 설정
+        output_dir = sim_config['output_dir']
+        output_prefix = sim_config['output_prefix']
+        output_config = {
+            'json_file': os.path.join(output_dir, f"{model_size}_{output_prefix}_similarity_results.json"),
+            'csv_file': os.path.join(output_dir, f"{model_size}_{output_prefix}_similarity_results.csv"),
+            'summary_file': os.path.join(output_dir, f"{model_size}_{output_prefix}_similarity_summary.txt"),
+            'results_file': os.path.join(output_dir, f"{model_size}_{output_prefix}_similarity_results.jsonl")
+        }
+    else:
+        # 구버전 JSON 구조 (호환성 유지)
+        gold_relative = config_data['paths']['gold_standard_data']
+        gold_path = os.path.join(parent_dir, gold_relative.replace('../', '').replace('./', ''))
+
+        result_relative = config_data['paths'][training_type][model_size]
+        result_path = os.path.join(parent_dir, result_relative.replace('./', ''))
+        output_config = config_data['output'][training_type][model_size]
+
+    # 절대 경로로 변환
+    gold_path = os.path.abspath(gold_path)
+    result_path = os.path.abspath(result_path)
+
+    return gold_path, result_path, output_config
+
+
+def build_config(eval_config: Dict, args: argparse.Namespace) -> EvaluationConfig:
+    """evaluation_params (구버전 JSON은 evaluation) + 명령줄 인자 → EvaluationConfig"""
+    embedding_provider = args.embedding_provider or eval_config.get('embedding_provider', 'openai')
+    embedding_model = eval_config.get('embedding_model', 'text-embedding-3-large')
+    local_embedding_model = eval_config.get('local_embedding_model') or DEFAULT_LOCAL_MODEL
+    # --embedding-model은 선택한 제공자의 모델만 덮어씀
+    if args.embedding_model and embedding_provider == 'openai':
+        embedding_model = args.embedding_model
+    elif args.embedding_model and embedding_provider == 'local':
+        local_embedding_model = args.embedding_model
+    elif args.embedding_model:
+        logger.warning(f"--embedding-model은 {embedding_provider} 제공자에서 사용하지 않습니다: {args.embedding_model}")
+    return EvaluationConfig(
+        sample_size=eval_config['sample_size'],
+        random_seed=eval_config['random_seed'],
+        tfidf_max_features=eval_config['tfidf_max_features'],
+        tfidf_ngram_range=tuple(eval_config['tfidf_ngram_range']),
+        tfidf_mode=eval_config.get('tfidf_mode', 'corpus'),
+        tfidf_vocabulary_path=eval_config.get('tfidf_vocabulary'),
+        text_format=eval_config.get('text_format', 'compact'),
+        extraction_workers=eval_config.get('extraction_workers', 8),
+        text_cache_path=eval_config.get('text_cache'),
+        embedding_provider=embedding_provider,
+        embedding_model=embedding_model,
+        local_embedding_model=local_embedding_model,
+        embedding_batch_size=eval_config.get('embedding_batch_size'),
+        embedding_options=eval_config.get('embedding_options') or {},
+        lexical_metrics=eval_config.get('lexical_metrics', True),
+        lexical_workers=eval_config.get('lexical_workers', 4),
+        field_metrics=eval_config.get('field_metrics') or list(SCHEMA_FIELDS),
+        batch_size=args.batch_size or eval_config.get('batch_size', 100),
+        use_cache=False if args.no_cache else eval_config.get('use_cache', True),
+        cache_dir=eval_config.get('cache_dir', 'embedding_cache'),
+        resume=not args.restart,
+        bootstrap_samples=eval_config.get('bootstrap_samples', 1000),
+        confidence_level=eval_config.get('confidence_level', 0.95)
+    )
+
+
+def run(training_type: str, model_size: Optional[str] = None, config_path: Optional[str] = None):
+    """
+    명령줄 실행 (pre/post 평가 스크립트의 main)
+
+    Args:
+        training_type: pre_training | post_training
+        model_size: 기본 모델 크기 (None이면 layout 기본값)
+        config_path: 설정 파일 경로 (None이면 기본 경로 사용)
+    """
+    layout = LAYOUTS[training_type]
+
+    # 명령줄 인자 파싱
+    parser = argparse.ArgumentParser(description=f'{layout.label} 모델 유사도 평가')
+    parser.add_argument('--model', default=model_size or layout.default_model, choices=['1.7B', '4B', '8B'],
+                        help='평가할 모델 크기')
+    parser.add_argument('--config', default=config_path, help='설정 파일 경로')
+    parser.add_argument('--embedding-provider', default=None, choices=['openai', 'local', 'hashing', 'none'],
+                        help='임베딩 제공자 (기본값: 설정 파일에서 읽기, 오프라인이면 local)')
+    parser.add_argument('--embedding-model', default=None,
+                        help='선택한 임베딩 제공자의 모델 (openai: 모델명 / local: 로컬 경로 또는 HF 모델명, 기본값: 설정 파일에서 읽기)')
+    parser.add_argument('--batch-size', type=int, default=None, help='배치 크기 (기본값: 설정 파일에서 읽기)')
+    parser.add_argument('--no-cache', action='store_true', help='캐시 비활성화')
+    parser.add_argument('--restart', action='store_true', help='이전 결과 JSONL을 이어서 쓰지 않고 새로 평가')
+    args = parser.parse_args()
+
+    # 설정 로드 (YAML 구조 확인, 없으면 구버전 JSON 구조)
+    config_data = load_config(args.config)
+    if 'similarity_evaluation' in config_data:
+        eval_config = config_data['similarity_evaluation']['evaluation_params']
+    else:
+        eval_config = config_data['evaluation']
+    config = build_config(eval_config, args)
+
+    # 평가기 초기화
+    evaluator = LocalSimilarityEvaluator(config, get_layout(config_data, training_type))
+    evaluator.model_size = args.model
+
+    # 경로 가져오기
+    gold_path, result_path, output_config = get_paths(config_data, args.model, training_type)
+
+    # 출력 디렉토리 생성
+    if 'json_file' in output_config:
+        output_dir = os.path.dirname(output_config['json_file'])
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir, exist_ok=True)
+            logger.info(f"출력 디렉토리 생성: {output_dir}")
+
+    evaluator.output_config = output_config
+
+    print(f"\n평가 시작: {args.model} 모델 ({layout.label})")
+    print(f"Gold 데이터: {gold_path}")
+    print(f"모델 결과: {result_path}")
+    print(f"배치 크기: {config.batch_size}")
+    print(f"캐시 사용: {config.use_cache}")
+
+    result = evaluator.evaluate_from_paths(gold_path, result_path)
+
+    if result:
+        output_files = evaluator._output_files()
+        print("\n[OK] 평가 완료!")
+        print(f"결과 파일:")
+        print(f"  - {output_files['json_file']} (상세 결과)")
+        print(f"  - {output_files['csv_file']} (표 형식)")
+        print(f"  - {output_files['summary_file']} (요약)")
+        print(f"  - {output_files['results_file']} (점수 기록, 재개용)")
+    else:
+        print("\n[FAIL] 평가 실패")
@@ -0,0 +1,112 @@
+"""
+정답(gold) 폴더 ↔ 모델 결과 폴더 매칭 인덱스
+
+폴더명을 (base_name, chunk_num) 키로 정규화하여 딕셔너리 조인으로 매칭 (O(R+G))
+- gold: val_XXX_result_NAME_chunk_N / val_XXX_result_NAME_chunkN / val_XXX_result_NAME
+- result: result_NAME_chunk_N / result_NAME
+- 각 디렉토리는 한 번만 스캔 (os.scandir 순서 유지 → 같은 키가 여럿이면 기존과 같이 먼저 나온 폴더 사용)
+"""
+
+import os
+import re
+import logging
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+# result_ 뒤 이름 + 선택적 _chunk_N(_chunkN) 접미사 (이름에 한글/공백/괄호 허용)
+FOLDER_KEY_PATTERN = re.compile(r'result_(?P<base>.+?)(?:_chunk_?(?P<chunk>\d+))?$')
+
+FolderKey = Tuple[str, Optional[str]]
+
+logger = logging.getLogger(__name__)
+
+
+def folder_key(name: str) -> Optional[FolderKey]:
+    """폴더명 → (base_name, chunk_num), chunk가 없으면 chunk_num=None"""
+    match = FOLDER_KEY_PATTERN.search(name)
+    if not match:
+        return None
+    return match.group('base'), match.group('chunk')
+
+
+def key_identifier(key: FolderKey) -> str:
+    """매칭 식별자 (기존 FileMatch.suffix 형식)"""
+    base_name, chunk_num = key
+    return f"{base_name}_chunk{chunk_num}" if chunk_num else base_name
+
+
+def scan_folders(path: Path, prefix: str = "") -> Iterator[Path]:
+    """하위 디렉토리 1회 스캔 (숨김 폴더 제외)"""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name.startswith(prefix) and not entry.name.startswith('.') and entry.is_dir():
+                yield Path(entry.path)
+
+
+class FolderIndex:
+    """gold 폴더 키 인덱스"""
+
+    def __init__(self, gold_path: Path, prefix: str = ""):
+        """
+        생성자
+
+        Args:
+            gold_path: 정답 데이터 디렉토리
+            prefix: 인덱싱할 폴더명 접두사 (예: "val_")
+        """
+        self.by_key: Dict[FolderKey, Path] = {}
+        self.names: Set[str] = set()
+        for folder in scan_folders(Path(gold_path), prefix):
+            self.names.add(folder.name)
+            key = folder_key(folder.name)
+            if key is not None:
+                self.by_key.setdefault(key, folder)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def lookup(self, key: FolderKey) -> Optional[Path]:
+        return self.by_key.get(key)
+
+
+def match_folders(gold_path: Path,
+                  result_path: Path,
+                  gold_prefix: str = "",
+                  result_file: Optional[str] = None,
+                  exact_name_fallback: bool = False) -> Tuple[List[Tuple[Path, Path, str]], List[str]]:
+    """
+    gold/result 디렉토리를 각각 한 번 스캔하여 매칭
+
+    Args:
+        gold_path: 정답 데이터 디렉토리
+        result_path: 모델 결과 디렉토리 (result_* 폴더)
+        gold_prefix: gold 폴더명 접두사 필터
+        result_file: 지정하면 result 폴더 안의 이 파일을 결과 경로로 사용 (없으면 건너뜀)
+        exact_name_fallback: 키 매칭 실패 시 같은 이름의 gold 폴더 사용
+
+    Returns:
+        ([(gold 폴더, 결과 경로, 식별자)], 매칭 실패한 result 폴더명 목록)
+    """
+    index = FolderIndex(gold_path, gold_prefix)
+    matches = []
+    unmatched = []
+
+    for result_folder in scan_folders(Path(result_path), "result_"):
+        result_target = result_folder
+        if result_file is not None:
+            result_target = result_folder / result_file
+            if not result_target.exists():
+                logger.warning(f"{result_file} 파일 없음: {result_folder}")
+                continue
+
+        key = folder_key(result_folder.name)
+        gold_folder = index.lookup(key) if key is not None else None
+        if gold_folder is None and exact_name_fallback and result_folder.name in index.names:
+            gold_folder = Path(gold_path) / result_folder.name
+
+        if gold_folder is None:
+            unmatched.append(result_folder.name)
+            continue
+        matches.append((gold_folder, result_target, key_identifier(key)))
+
+    return matches, unmatched
@@ -0,0 +1,251 @@
+"""
+어휘 기반 평가 지표 (API 호출 없음)
+
+- ROUGE-L: 토큰 LCS 기반 F1, 비트 병렬 LCS (Allison-Dix/Hyyrö)로 O(n·m/w)
+  (짧은 쪽만 파이썬 루프, 긴 쪽은 정수 비트 연산 한 번으로 처리)
+- chrF: 문자 n-gram(1~6) F-score (beta=2, 공백 제외) → 조사/어미가 붙는 한국어에서 토큰 일치보다 안정적
+- 필드별 정밀도/재현율/F1: notion 스키마 필드(core_objectives, expected_effects ...)별 문자 bigram 겹침
+  (필드 텍스트는 추출 시 notion 객체에서 만든 것을 사용, 없을 때만 비교 텍스트를 나눔 / 한 글자 값은 unigram)
+- compute_lexical_metrics: 모든 쌍을 프로세스 풀로 한 번에 계산
+"""
+
+import re
+import json
+import logging
+import time
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from text_extraction import FieldTexts, field_value_text, strip_code_fence
+
+logger = logging.getLogger(__name__)
+
+# base_model_meeting_processor 응답 형식의 필드
+SCHEMA_FIELDS = (
+    "project_name",
+    "project_purpose",
+    "project_period",
+    "project_manager",
+    "core_objectives",
+    "core_idea",
+    "idea_description",
+    "execution_plan",
+    "expected_effects",
+)
+
+FIELD_SCORING_VERSION = 2  # 필드 텍스트/점수 규칙이 바뀌면 올림 (이전 결과 JSONL을 이어서 쓰지 않도록)
+
+CHRF_ORDER = 6
+CHRF_BETA = 2.0
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+_KEY_LINE_PATTERN = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*):(?: (.*))?$")
+
+
+def tokenize(text: str) -> List[str]:
+    """ROUGE-L용 토큰 (소문자 단어/어절, 문장부호 제외)"""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def lcs_length(a: Sequence[Any], b: Sequence[Any]) -> int:
+    """
+    비트 병렬 LCS 길이
+
+    긴 시퀀스의 위치를 정수 비트로 두고, 짧은 시퀀스의 원소마다
+    V = (V + (V & M)) | (V & ~M) 한 번씩 갱신 (LCS = 긴 시퀀스 길이 중 0이 된 비트 수)
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return 0
+
+    masks: Dict[Any, int] = {}
+    for i, item in enumerate(a):
+        masks[item] = masks.get(item, 0) | (1 << i)
+
+    full = (1 << len(a)) - 1
+    v = full
+    for item in b:
+        m = masks.get(item)
+        if m:
+            u = v & m
+            v = ((v + u) | (v - u)) & full
+    return len(a) - bin(v).count("1")
+
+
+def rouge_l(reference: str, candidate: str) -> float:
+    """ROUGE-L F1 (토큰 LCS 기준)"""
+    ref_tokens = tokenize(reference)
+    cand_tokens = tokenize(candidate)
+    if not ref_tokens or not cand_tokens:
+        return 0.0
+    lcs = lcs_length(ref_tokens, cand_tokens)
+    if not lcs:
+        return 0.0
+    precision = lcs / len(cand_tokens)
+    recall = lcs / len(ref_tokens)
+    return 2 * precision * recall / (precision + recall)
+
+
+def _char_ngrams(text: str, n: int) -> Counter:
+    return Counter(text[i:i + n] for i in range(len(text) - n + 1))
+
+
+def chrf(reference: str, candidate: str, order: int = CHRF_ORDER, beta: float = CHRF_BETA) -> float:
+    """chrF (문자 n-gram 정밀도/재현율을 차수별 평균 후 F-beta, 0~1)"""
+    ref = "".join(reference.split())
+    cand = "".join(candidate.split())
+    precisions, recalls = [], []
+    for n in range(1, order + 1):
+        ref_ngrams = _char_ngrams(ref, n)
+        cand_ngrams = _char_ngrams(cand, n)
+        if not ref_ngrams or not cand_ngrams:
+            break  # 문서가 n보다 짧으면 그 이상 차수는 제외
+        overlap = sum((ref_ngrams & cand_ngrams).values())
+        precisions.append(overlap / sum(cand_ngrams.values()))
+        recalls.append(overlap / sum(ref_ngrams.values()))
+    if not precisions:
+        return 0.0
+    precision = sum(precisions) / len(precisions)
+    recall = sum(recalls) / len(recalls)
+    if not precision and not recall:
+        return 0.0
+    beta2 = beta * beta
+    return (1 + beta2) * precision * recall / (beta2 * precision + recall)
+
+
+def split_fields(text: str, fields: Sequence[str] = SCHEMA_FIELDS) -> Dict[str, str]:
+    """
+    비교 텍스트(compact 또는 json 형식) → 필드별 텍스트
+
+    추출 시 필드 텍스트가 없을 때(notion이 객체가 아닌 결과, evaluate_single 등)만 사용하는 대체 경로
+    compact 형식에서는 스키마 필드 키 줄만 구역을 바꾸고, 중첩 값의 키 줄("phase: ...")은 현재 필드의 값으로 둠
+
+    Args:
+        text: text_extraction으로 추출한 텍스트
+        fields: 나눌 최상위 필드
+
+    Returns:
+        필드 → 텍스트 (목록 항목은 줄 단위, 없는 필드는 빈 문자열)
+    """
+    sections = {name: [] for name in fields}
+
+    stripped = strip_code_fence(text.strip())
+    if stripped.startswith("{"):
+        try:
+            parsed = json.loads(stripped)
+        except ValueError:
+            parsed = None
+        if isinstance(parsed, dict):
+            return {name: field_value_text(parsed.get(name)) for name in fields}
+
+    # compact 형식: "필드: 값" 또는 "필드:" 다음 "- 항목" 줄
+    current: Optional[str] = None
+    for line in stripped.splitlines():
+        match = _KEY_LINE_PATTERN.match(line)
+        if match and (match.group(1) in SCHEMA_FIELDS or match.group(1) in sections):
+            current = match.group(1) if match.group(1) in sections else None
+            value = match.group(2)
+        elif match:
+            value = match.group(2)  # 중첩 값의 키 줄 → 현재 필드의 값
+        else:
+            value = line[2:] if line.startswith("- ") else line
+        if current is not None and value:
+            sections[current].append(value)
+    return {name: "\n".join(lines) for name, lines in sections.items()}
+
+
+def field_overlap(reference: str, candidate: str) -> Optional[Dict[str, float]]:
+    """필드 하나의 문자 bigram 정밀도/재현율/F1 (둘 다 비어 있으면 None, 한쪽이 한 글자면 unigram)"""
+    ref = "".join(reference.split())
+    cand = "".join(candidate.split())
+    if not ref and not cand:
+        return None
+    order = 2 if len(ref) != 1 and len(cand) != 1 else 1  # 한 글자 값("김", "3")은 bigram이 없어 항상 0점이 됨
+    ref_ngrams = _char_ngrams(ref, order)
+    cand_ngrams = _char_ngrams(cand, order)
+    overlap = sum((ref_ngrams & cand_ngrams).values())
+    precision = overlap / sum(cand_ngrams.values()) if cand_ngrams else 0.0
+    recall = overlap / sum(ref_ngrams.values()) if ref_ngrams else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {"precision": precision, "recall": recall, "f1": f1}
+
+
+def score_pair(pair: Tuple[str, str, Optional[FieldTexts], Optional[FieldTexts]],
+               fields: Sequence[str] = SCHEMA_FIELDS) -> Dict[str, Any]:
+    """
+    (정답 텍스트, 결과 텍스트, 정답 필드, 결과 필드) 한 쌍의 어휘 지표
+
+    필드 텍스트는 추출 시 notion 객체에서 만든 것(없으면 None → 비교 텍스트를 split_fields로 나눔)
+
+    Returns:
+        {"rouge_l", "chrf", "fields": {필드: {"precision", "recall", "f1"}}} (양쪽 다 없는 필드는 제외)
+    """
+    reference, candidate, ref_fields, cand_fields = pair
+    field_scores = {}
+    if fields:
+        if ref_fields is None:
+            ref_fields = split_fields(reference, fields)
+        if cand_fields is None:
+            cand_fields = split_fields(candidate, fields)
+        for name in fields:
+            scores = field_overlap(ref_fields.get(name, ""), cand_fields.get(name, ""))
+            if scores is not None:
+                field_scores[name] = scores
+    return {
+        "rouge_l": rouge_l(reference, candidate),
+        "chrf": chrf(reference, candidate),
+        "fields": field_scores
+    }
+
+
+def compute_lexical_metrics(texts1: Sequence[str],
+                            texts2: Sequence[str],
+                            fields: Sequence[str] = SCHEMA_FIELDS,
+                            workers: int = 4,
+                            executor: Optional[Executor] = None,
+                            fields1: Optional[Sequence[Optional[FieldTexts]]] = None,
+                            fields2: Optional[Sequence[Optional[FieldTexts]]] = None) -> List[Dict[str, Any]]:
+    """
+    모든 쌍의 어휘 지표를 프로세스 풀로 계산
+
+    Args:
+        texts1: 정답 텍스트 목록
+        texts2: 결과 텍스트 목록 (texts1과 같은 순서)
+        fields: 필드별 점수를 계산할 스키마 필드 (빈 목록이면 생략)
+        workers: 프로세스 수 (1 이하이면 현재 프로세스에서 계산)
+        executor: 호출자가 유지하는 프로세스 풀 (청크마다 호출할 때 풀 생성 비용을 한 번만 내도록)
+        fields1: 정답 필드별 텍스트 목록 (추출 시 notion 객체에서 만든 것, 없거나 항목이 None이면 텍스트를 나눔)
+        fields2: 결과 필드별 텍스트 목록
+
+    Returns:
+        입력 순서대로 score_pair 결과
+    """
+    fields1 = fields1 if fields1 is not None else [None] * len(texts1)
+    fields2 = fields2 if fields2 is not None else [None] * len(texts2)
+    pairs = list(zip(texts1, texts2, fields1, fields2))
+    if not pairs:
+        return []
+
+    start = time.perf_counter()
+    scorer = partial(score_pair, fields=tuple(fields))
+    results = None
+    if workers > 1 and len(pairs) > 1:
+        chunksize = max(1, len(pairs) // (workers * 4))
+        try:
+            if executor is not None:
+                results = list(executor.map(scorer, pairs, chunksize=chunksize))
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    results = list(pool.map(scorer, pairs, chunksize=chunksize))
+        except Exception as e:
+            logger.warning(f"어휘 지표 프로세스 풀 실패: {e}. 현재 프로세스에서 계산합니다.")
+    if results is None:
+        workers = 1
+        results = [scorer(pair) for pair in pairs]
+
+    logger.info(f"어휘 지표 계산 완료: {len(pairs)}쌍, {time.perf_counter() - start:.2f}초 ({workers} 프로세스)")
+    return results
+
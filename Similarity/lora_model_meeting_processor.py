@@ -1,7 +1,7 @@
 import json
 import os
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime
 from pathlib import Path
 from dataclasses import dataclass, field
@@ -12,6 +12,10 @@ from vllm import LLM, SamplingParams
 from transformers import AutoTokenizer
 from huggingface_hub import login
 
+from lora_registry import LoRAAdapterRegistry
+from offline_pipeline import Prefetcher
+from run_manifest import RunManifest, file_sha256, prompt_version, atomic_write_json, STATUS_DONE, STATUS_FAILED
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -19,6 +23,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+NOTION_SYSTEM_PROMPT = """당신은 회의록을 분석하여 체계적인 프로젝트 기획안을 작성하는 전문가입니다.
+회의에서 논의된 내용을 바탕으로 명확하고 실행 가능한 기획안을 작성해주세요.
+응답은 반드시 요청된 JSON 형식으로만 제공하세요."""
+
 
 class ModelConfig:
     """모델 설정 관리 클래스"""
@@ -44,6 +52,20 @@ class ModelConfig:
         self.DTYPE: str = "auto"
         self.TRUST_REMOTE_CODE: bool = True
         
+        # LoRA 서빙 설정
+        # dynamic: 병합 없이 vLLM LoRA 서빙 (요청마다 어댑터 선택), merge: 병합 체크포인트 저장 후 로딩
+        self.LORA_SERVING: str = "dynamic"
+        self.LORA_ADAPTERS: Dict[str, str] = {}  # 추가 어댑터 {이름: 경로}
+        self.MAX_LORAS: int = 4  # GPU에 동시에 올릴 어댑터 수 (초과 시 LRU 교체)
+        self.MAX_CPU_LORAS: int = 16  # CPU 캐시에 보관할 어댑터 수
+        self.MAX_LORA_RANK: int = 0  # 0이면 어댑터 설정에서 자동 결정
+        self.ACTIVE_ADAPTER: Optional[str] = None  # 배치 처리에 사용할 어댑터 (None이면 기본, "base"면 베이스 모델)
+        
+        # 재실행 설정
+        self.RESUME: bool = True  # 실행 매니페스트에 완료로 기록된 청크는 건너뜀
+        self.RUN_MANIFEST_PATH: Optional[str] = None  # None이면 출력 디렉토리의 run_manifest.sqlite
+        self.PREFETCH_FILES: int = 4  # 생성 중에 미리 로드할 회의 파일 수 (0이면 미리 읽지 않음)
+        
         # 설정 파일 로드
         self.load_from_yaml(config_path)
     
@@ -70,6 +92,15 @@ class ModelConfig:
                 self.TENSOR_PARALLEL_SIZE = lora_config.get('tensor_parallel_size', self.TENSOR_PARALLEL_SIZE)
                 self.GPU_MEMORY_UTILIZATION = lora_config.get('gpu_memory_utilization', self.GPU_MEMORY_UTILIZATION)
                 self.MAX_MODEL_LEN = lora_config.get('max_model_len', self.MAX_MODEL_LEN)
+                self.LORA_SERVING = lora_config.get('lora_serving', self.LORA_SERVING)
+                self.LORA_ADAPTERS = lora_config.get('lora_adapters', self.LORA_ADAPTERS) or {}
+                self.MAX_LORAS = lora_config.get('max_loras', self.MAX_LORAS)
+                self.MAX_CPU_LORAS = lora_config.get('max_cpu_loras', self.MAX_CPU_LORAS)
+                self.MAX_LORA_RANK = lora_config.get('max_lora_rank', self.MAX_LORA_RANK)
+                self.ACTIVE_ADAPTER = lora_config.get('active_adapter', self.ACTIVE_ADAPTER)
+                self.RESUME = lora_config.get('resume', self.RESUME)
+                self.RUN_MANIFEST_PATH = lora_config.get('run_manifest', self.RUN_MANIFEST_PATH)
+                self.PREFETCH_FILES = lora_config.get('prefetch_files', self.PREFETCH_FILES)
                 
                 logger.info(f"설정 파일 로드 완료: {config_path}")
         except FileNotFoundError:
@@ -84,6 +115,7 @@ class MeetingData:
     transcript: Optional[str] = None
     chunks: Optional[List[str]] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    input_hash: Optional[str] = None  # 입력 파일 내용 해시 (실행 매니페스트 키)
     
     @property
     def is_chunked(self) -> bool:
@@ -120,9 +152,59 @@ class QwenVLLMMeetingGenerator:
         self.model = None
         self.tokenizer = None
         self.sampling_params = None
+        self.lora_registry: Optional[LoRAAdapterRegistry] = None
+        self._lora_enabled = False
+        self._max_lora_rank = 0
+        self._model_path: Optional[str] = None  # 실제로 로드한 모델 (병합 실패 시 베이스 모델)
+        self.run_manifest: Optional[RunManifest] = None
         
         self._initialize_model()
     
+    def _build_lora_registry(self) -> LoRAAdapterRegistry:
+        """설정의 기본 어댑터(lora_model_path)와 추가 어댑터(lora_adapters) 등록"""
+        registry = LoRAAdapterRegistry(base_dir=Path(__file__).parent)
+        registry.register("default", self.config.LORA_MODEL_PATH, default=True)
+        for name, path in self.config.LORA_ADAPTERS.items():
+            registry.register(name, path)
+        return registry
+    
+    def _lora_engine_kwargs(self) -> Dict[str, Any]:
+        """vLLM LoRA 서빙 엔진 인자 (어댑터가 없으면 빈 딕셔너리)"""
+        if len(self.lora_registry) == 0:
+            logger.info("등록된 LoRA 어댑터가 없음. 베이스 모델만 사용")
+            return {}
+        max_lora_rank = self.config.MAX_LORA_RANK or self.lora_registry.max_rank() or 16
+        return {
+            "enable_lora": True,
+            "max_loras": self.config.MAX_LORAS,
+            "max_cpu_loras": max(self.config.MAX_CPU_LORAS, self.config.MAX_LORAS),
+            "max_lora_rank": max_lora_rank
+        }
+    
+    def register_adapter(self, name: str, path: str, default: bool = False) -> bool:
+        """
+        실행 중 어댑터 추가/교체 (엔진 재시작 없음)
+        
+        Args:
+            name: 어댑터 이름
+            path: 어댑터 디렉토리
+            default: 기본 어댑터로 지정
+            
+        Returns:
+            등록 성공 여부
+        """
+        if self.lora_registry is None or not self._lora_enabled:
+            logger.error("LoRA 서빙 모드가 아니어서 어댑터를 추가할 수 없습니다 (lora_serving: dynamic 필요)")
+            return False
+        # rank는 등록 전에 확인 (등록 후 되돌리면 같은 이름의 기존 어댑터까지 사라짐)
+        return self.lora_registry.register(name, path, default=default, max_rank=self._max_lora_rank)
+    
+    def _lora_request(self, adapter: Optional[str] = None):
+        """요청별 LoRARequest (LoRA 서빙 모드가 아니면 None)"""
+        if self.lora_registry is None or not self._lora_enabled:
+            return None
+        return self.lora_registry.lora_request(adapter)
+    
     def _merge_lora_if_needed(self) -> str:
         """필요시 LoRA 모델 병합"""
         # 현재 스크립트 위치 기준으로 경로 설정
@@ -244,8 +326,22 @@ class QwenVLLMMeetingGenerator:
         try:
             logger.info("vLLM 모델 초기화 시작...")
             
-            # LoRA 병합 확인 및 수행
-            model_path = self._merge_lora_if_needed()
+            lora_kwargs = {}
+            if self.config.LORA_SERVING == "merge":
+                # LoRA 병합 확인 및 수행
+                model_path = self._merge_lora_if_needed()
+            else:
+                # 병합 없이 베이스 모델 + 요청별 어댑터 적용
+                model_path = self.config.BASE_MODEL_PATH
+                self.lora_registry = self._build_lora_registry()
+                lora_kwargs = self._lora_engine_kwargs()
+                self._lora_enabled = bool(lora_kwargs)
+                self._max_lora_rank = lora_kwargs.get("max_lora_rank", 0)
+                if self._lora_enabled:
+                    logger.info(f"vLLM LoRA 서빙: 어댑터 {self.lora_registry.names}, "
+                                f"GPU {lora_kwargs['max_loras']}개 / CPU {lora_kwargs['max_cpu_loras']}개, rank {self._max_lora_rank}")
+            
+            self._model_path = model_path
             
             # 토크나이저 로드
             self.tokenizer = AutoTokenizer.from_pretrained(model_path)
@@ -264,6 +360,7 @@ class QwenVLLMMeetingGenerator:
                 enforce_eager=False,  # CUDA graphs 사용 (더 빠름)
                 max_num_batched_tokens=self.config.MAX_MODEL_LEN,
                 max_num_seqs=256,  # 동시 처리 시퀀스 수
+                **lora_kwargs
             )
             
             # 샘플링 파라미터 설정
@@ -281,6 +378,81 @@ class QwenVLLMMeetingGenerator:
             logger.error(f"vLLM 모델 초기화 실패: {e}")
             raise
     
+    def _prompt_version(self) -> str:
+        """결과에 영향을 주는 프롬프트 템플릿/청킹/생성 설정의 버전 해시"""
+        try:
+            import sys
+            ai_engine_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'ai-engine-dev')
+            if ai_engine_path not in sys.path:
+                sys.path.insert(0, ai_engine_path)
+            from prd_generation_prompts import generate_notion_project_prompt
+            from meeting_analysis_prompts import generate_meeting_analysis_user_prompt
+            templates = (
+                generate_notion_project_prompt("{meeting_transcript}"),
+                generate_meeting_analysis_user_prompt("{transcript}", "{additional_context}")
+            )
+        except ImportError:
+            templates = ("fallback",)
+        
+        return prompt_version(
+            NOTION_SYSTEM_PROMPT, *templates,
+            self.config.CHUNK_SIZE, self.config.CHUNK_OVERLAP, self.config.MAX_NEW_TOKENS,
+            self.config.TEMPERATURE, self.config.TOP_P, self.config.REPETITION_PENALTY
+        )
+    
+    @staticmethod
+    def _adapter_weights_hash(adapter_path: Optional[str]) -> str:
+        """어댑터 가중치(adapter_model.safetensors) 내용 해시 앞 16자리 (파일이 없으면 "missing")"""
+        if adapter_path:
+            for file_name in ("adapter_model.safetensors", "adapter_model.bin"):
+                weights_file = Path(adapter_path) / file_name
+                if weights_file.exists():
+                    return file_sha256(weights_file)[:16]
+        return "missing"
+    
+    def open_run_manifest(self, output_dir: Path, adapter: Optional[str] = None) -> RunManifest:
+        """
+        실행 매니페스트 열기 (재실행 시 완료된 청크 건너뛰기)
+        
+        Args:
+            output_dir: 출력 디렉토리 (매니페스트 기본 위치)
+            adapter: 처리에 사용할 LoRA 어댑터 이름 (어댑터별로 완료 여부를 따로 기록)
+            
+        Returns:
+            RunManifest 객체
+        """
+        if self._lora_enabled and adapter != "base":
+            # 같은 경로에 다시 학습한 어댑터를 덮어써도 이전 결과를 재사용하지 않도록 가중치 내용 해시 포함
+            adapter_name = adapter or self.lora_registry.default_adapter
+            adapter_path = self.lora_registry.get_stats()["adapters"].get(adapter_name, {}).get("path")
+            model_key = f"{self.config.BASE_MODEL_PATH}+{adapter_name}:{adapter_path}@{self._adapter_weights_hash(adapter_path)}"
+        elif self.config.LORA_SERVING != "merge" or self._model_path == self.config.BASE_MODEL_PATH:
+            # 어댑터 없이 베이스 모델 (dynamic에서 등록된 어댑터가 없거나 "base" 지정, 병합 실패로 베이스 모델 사용)
+            model_key = self.config.BASE_MODEL_PATH
+        else:
+            model_key = f"{self.config.MERGED_MODEL_PATH} (merged {self.config.LORA_MODEL_PATH})"
+        
+        manifest_path = self.config.RUN_MANIFEST_PATH or Path(output_dir) / "run_manifest.sqlite"
+        self.run_manifest = RunManifest(manifest_path, model_key, self._prompt_version())
+        logger.info(f"실행 매니페스트: {manifest_path} (프롬프트 버전 {self.run_manifest.prompt_version})")
+        return self.run_manifest
+    
+    def _completed_chunks(self, meeting_data: MeetingData) -> set:
+        if self.run_manifest is None or not self.config.RESUME or not meeting_data.input_hash:
+            return set()
+        return self.run_manifest.completed_chunks(meeting_data.input_hash)
+    
+    def _record_chunk(self, meeting_data: MeetingData, chunk_idx: int, status: str,
+                      output_path: Path, error: Optional[str] = None) -> None:
+        if self.run_manifest is None or not meeting_data.input_hash:
+            return
+        self.run_manifest.mark(
+            meeting_data.input_hash, chunk_idx, status,
+            source=meeting_data.metadata.get("source_file"),
+            output_path=output_path,
+            error=error
+        )
+    
     def find_meeting_files(self, base_dir: str) -> List[Path]:
         """
         회의 파일 검색
@@ -377,25 +549,26 @@ class QwenVLLMMeetingGenerator:
                     "is_chunked": True,
                     "total_chunks": len(chunks)
                 }
-                return MeetingData(chunks=chunks, metadata=metadata)
+                return MeetingData(chunks=chunks, metadata=metadata, input_hash=file_sha256(file_path))
             else:
                 metadata["chunking_info"] = {
                     "is_chunked": False,
                     "total_chunks": 1
                 }
-                return MeetingData(transcript=full_text, metadata=metadata)
+                return MeetingData(transcript=full_text, metadata=metadata, input_hash=file_sha256(file_path))
                 
         except Exception as e:
             logger.error(f"파일 로드 오류 ({file_path}): {e}")
             return None
     
-    def generate_response(self, system_prompt: str, user_prompt: str) -> Optional[str]:
+    def generate_response(self, system_prompt: str, user_prompt: str, adapter: Optional[str] = None) -> Optional[str]:
         """
         vLLM을 사용한 모델 응답 생성
         
         Args:
             system_prompt: 시스템 프롬프트
             user_prompt: 사용자 프롬프트
+            adapter: LoRA 어댑터 이름 (None이면 기본 어댑터, "base"면 베이스 모델)
             
         Returns:
             생성된 응답 또는 None
@@ -416,7 +589,8 @@ class QwenVLLMMeetingGenerator:
             # vLLM 생성
             outputs = self.model.generate(
                 prompts=[prompt],
-                sampling_params=self.sampling_params
+                sampling_params=self.sampling_params,
+                lora_request=self._lora_request(adapter)
             )
             
 
@@ -431,12 +605,15 @@ class QwenVLLMMeetingGenerator:
             logger.error(f"응답 생성 오류: {e}")
             return None
     
-    def generate_batch_responses(self, prompts: List[Tuple[str, str]]) -> List[Optional[str]]:
+    def generate_batch_responses(self,
+                                 prompts: List[Tuple[str, str]],
+                                 adapters: Optional[Union[str, List[Optional[str]]]] = None) -> List[Optional[str]]:
         """
         배치 처리를 위한 vLLM 생성 (더 효율적)
         
         Args:
             prompts: (system_prompt, user_prompt) 튜플 리스트
+            adapters: LoRA 어댑터 이름 (전체 공통 또는 프롬프트별 리스트, 서로 다른 어댑터도 한 배치로 처리)
             
         Returns:
             생성된 응답 리스트
@@ -456,10 +633,17 @@ class QwenVLLMMeetingGenerator:
                 )
                 formatted_prompts.append(prompt)
             
+            # 프롬프트별 어댑터
+            if isinstance(adapters, list):
+                lora_request = [self._lora_request(adapter) for adapter in adapters]
+            else:
+                lora_request = self._lora_request(adapters)
+            
             # vLLM 배치 생성
             outputs = self.model.generate(
                 prompts=formatted_prompts,
-                sampling_params=self.sampling_params
+                sampling_params=self.sampling_params,
+                lora_request=lora_request
             )
             
             # 결과 추출
@@ -502,12 +686,13 @@ class QwenVLLMMeetingGenerator:
             logger.warning("JSON 파싱 실패, 원본 텍스트 반환")
             return {"raw_text": response}
     
-    def generate_notion_project(self, transcript: str) -> Dict[str, Any]:
+    def generate_notion_project(self, transcript: str, adapter: Optional[str] = None) -> Dict[str, Any]:
         """
         노션 프로젝트 생성
         
         Args:
             transcript: 회의록 텍스트
+            adapter: LoRA 어댑터 이름
             
         Returns:
             생성 결과
@@ -562,11 +747,7 @@ class QwenVLLMMeetingGenerator:
 """
             
             user_prompt = generate_notion_project_prompt(transcript)
-            system_prompt = """당신은 회의록을 분석하여 체계적인 프로젝트 기획안을 작성하는 전문가입니다.
-회의에서 논의된 내용을 바탕으로 명확하고 실행 가능한 기획안을 작성해주세요.
-응답은 반드시 요청된 JSON 형식으로만 제공하세요."""
-            
-            response = self.generate_response(system_prompt, user_prompt)
+            response = self.generate_response(NOTION_SYSTEM_PROMPT, user_prompt, adapter=adapter)
             
             if not response:
                 return {"success": False, "error": "응답 생성 실패"}
@@ -582,7 +763,8 @@ class QwenVLLMMeetingGenerator:
                        meeting_data: MeetingData,
                        output_dir: Path,
                        file_index: int,
-                       parent_folder: str) -> Tuple[int, int]:
+                       parent_folder: str,
+                       adapter: Optional[str] = None) -> Tuple[int, int]:
         """
         회의 데이터 처리
         
@@ -591,6 +773,7 @@ class QwenVLLMMeetingGenerator:
             output_dir: 출력 디렉토리
             file_index: 파일 인덱스
             parent_folder: 부모 폴더명
+            adapter: LoRA 어댑터 이름 (None이면 기본 어댑터)
             
         Returns:
             (성공 수, 실패 수) 튜플
@@ -598,6 +781,15 @@ class QwenVLLMMeetingGenerator:
         success_count = 0
         fail_count = 0
         
+        # 이전 실행에서 완료된 청크는 성공으로 집계하고 건너뜀
+        completed = self._completed_chunks(meeting_data)
+        if completed:
+            total = len(meeting_data.chunks) if meeting_data.is_chunked else 1
+            success_count += len(completed)
+            logger.info(f"이전 실행에서 완료된 청크 {len(completed)}/{total}개 건너뜀")
+            if len(completed) >= total:
+                return success_count, fail_count
+        
         if meeting_data.is_chunked:
             # 청킹된 데이터 배치 처리 준비
             batch_prompts = []
@@ -615,12 +807,12 @@ class QwenVLLMMeetingGenerator:
                 # 폴백 함수는 이미 generate_notion_project 메서드에서 정의됨
                 pass
             
-            system_prompt = """당신은 회의록을 분석하여 체계적인 프로젝트 기획안을 작성하는 전문가입니다.
-회의에서 논의된 내용을 바탕으로 명확하고 실행 가능한 기획안을 작성해주세요.
-응답은 반드시 요청된 JSON 형식으로만 제공하세요."""
+            system_prompt = NOTION_SYSTEM_PROMPT
             
-            # 배치 프롬프트 준비
-            for idx, chunk_text in enumerate(meeting_data.chunks):
+            # 배치 프롬프트 준비 (완료되지 않은 청크만)
+            pending_indices = [idx for idx in range(len(meeting_data.chunks)) if idx not in completed]
+            for idx in pending_indices:
+                chunk_text = meeting_data.chunks[idx]
                 if idx == 0:
                     # 첫 번째 청크는 노션 프로젝트 프롬프트 사용
                     user_prompt = generate_notion_project_prompt(chunk_text)
@@ -637,11 +829,11 @@ class QwenVLLMMeetingGenerator:
             logger.info(f"{len(batch_prompts)}개 청크 배치 처리 시작")
             
             # 배치 생성
-            responses = self.generate_batch_responses(batch_prompts)
+            responses = self.generate_batch_responses(batch_prompts, adapters=adapter)
             
             # 결과 처리
             total_chunks = len(meeting_data.chunks)
-            for chunk_idx, (chunk_text, response) in enumerate(zip(meeting_data.chunks, responses)):
+            for chunk_idx, response in zip(pending_indices, responses):
                 # 청크가 1개면 _chunk_X 붙이지 않음
                 if total_chunks == 1:
                     chunk_dir = output_dir / parent_folder
@@ -667,8 +859,9 @@ class QwenVLLMMeetingGenerator:
                         }
                     }
                     
-                    with open(chunk_dir / "result.json", 'w', encoding='utf-8') as f:
-                        json.dump(chunk_result, f, ensure_ascii=False, indent=2)
+                    # 임시 파일 → rename (중단되어도 반쯤 쓰인 result.json이 남지 않음)
+                    atomic_write_json(chunk_dir / "result.json", chunk_result)
+                    self._record_chunk(meeting_data, chunk_idx, STATUS_DONE, chunk_dir / "result.json")
                     
                     success_count += 1
                     if total_chunks > 1:
@@ -677,6 +870,7 @@ class QwenVLLMMeetingGenerator:
                         logger.info(f"저장 완료")
                 else:
                     fail_count += 1
+                    self._record_chunk(meeting_data, chunk_idx, STATUS_FAILED, chunk_dir / "result.json", "empty generation output")
                     if total_chunks > 1:
                         logger.error(f"청크 {chunk_idx+1}/{total_chunks} 생성 실패")
                     else:
@@ -685,11 +879,11 @@ class QwenVLLMMeetingGenerator:
         else:
             # 단일 텍스트 처리 (청크되지 않은 파일도 저장)
             logger.info("전체 회의록 처리 중")
-            result = self.generate_notion_project(meeting_data.transcript)
+            result = self.generate_notion_project(meeting_data.transcript, adapter=adapter)
+            single_dir = output_dir / parent_folder
             
             if result["success"]:
                 # 단일 파일도 저장
-                single_dir = output_dir / parent_folder
                 single_dir.mkdir(exist_ok=True)
                 
                 single_result = {
@@ -704,13 +898,14 @@ class QwenVLLMMeetingGenerator:
                     }
                 }
                 
-                with open(single_dir / "result.json", 'w', encoding='utf-8') as f:
-                    json.dump(single_result, f, ensure_ascii=False, indent=2)
+                atomic_write_json(single_dir / "result.json", single_result)
+                self._record_chunk(meeting_data, 0, STATUS_DONE, single_dir / "result.json")
                 
                 success_count += 1
                 logger.info("저장 완료")
             else:
                 fail_count += 1
+                self._record_chunk(meeting_data, 0, STATUS_FAILED, single_dir / "result.json", result.get('error'))
                 logger.error(f"생성 실패: {result.get('error')}")
         
         return success_count, fail_count
@@ -766,6 +961,9 @@ def main():
         logger.error(f"모델 초기화 실패: {e}")
         return
     
+    # 실행 매니페스트 (재실행 시 완료된 청크 건너뛰기)
+    generator.open_run_manifest(output_dir, adapter=config.ACTIVE_ADAPTER)
+    
     # 회의 파일 검색 (설정에서 경로 가져오기)
     input_dir = config.INPUT_DIR
     meeting_files = generator.find_meeting_files(input_dir)
@@ -785,14 +983,15 @@ def main():
     stats = ProcessingStats(total=len(meeting_files))
     dataset = []
     
-    # 각 파일 처리
-    for i, file_path in enumerate(meeting_files, 1):
+    # 각 파일 처리 (다음 파일 로드/청킹은 생성 중에 미리 수행)
+    prefetcher = Prefetcher(generator.load_meeting_data, depth=config.PREFETCH_FILES, workers=1)
+    for i, (file_path, meeting_data, load_error) in enumerate(prefetcher.map(meeting_files), 1):
         parent_folder = file_path.parent.name
         logger.info(f"\n[{i}/{len(meeting_files)}] {parent_folder}/{file_path.name} 처리 중...")
         
         try:
-            # 데이터 로드
-            meeting_data = generator.load_meeting_data(file_path)
+            if load_error is not None:
+                raise load_error
             if not meeting_data:
                 stats.failed += 1
                 stats.processed += 1
@@ -803,7 +1002,7 @@ def main():
             
             # 처리
             success, fail = generator.process_meeting(
-                meeting_data, output_dir, i, parent_folder
+                meeting_data, output_dir, i, parent_folder, adapter=config.ACTIVE_ADAPTER
             )
             
             stats.success += success
@@ -824,6 +1023,7 @@ def main():
     logger.info(f"  실패: {stats.failed}개")
     logger.info(f"  청킹 처리: {stats.chunked}개")
     logger.info(f"  성공률: {stats.success_rate:.1f}%")
+    logger.info(f"  매니페스트 상태: {generator.run_manifest.summary()}")
     
     logger.info(f"\n✅ 모든 처리 완료! 결과는 {output_dir}에 저장되었습니다.")
 
@@ -0,0 +1,153 @@
+"""
+vLLM 멀티 LoRA 어댑터 레지스트리
+
+베이스 모델 하나에 여러 LoRA 어댑터(테넌트별/실험별)를 병합 없이 요청 단위로 적용
+- 어댑터 이름 → LoRARequest(이름, 고유 ID, 경로) 매핑
+- GPU에는 max_loras개까지 상주, 초과 시 vLLM이 가장 오래 쓰지 않은 어댑터를 CPU 캐시로 내림 (LRU)
+- CPU 캐시(max_cpu_loras)에서도 밀려나면 다음 요청 때 디스크에서 다시 로드
+- 실행 중 어댑터 추가/교체 가능 (같은 이름 재등록 시 새 ID 발급 → 이전 가중치 재사용 방지)
+"""
+
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+# vLLM이 지원하는 max_lora_rank 값
+SUPPORTED_LORA_RANKS = (8, 16, 32, 64, 128, 256)
+
+
+def read_adapter_rank(adapter_path: Path) -> Optional[int]:
+    """adapter_config.json의 LoRA rank(r) 읽기"""
+    config_file = Path(adapter_path) / "adapter_config.json"
+    try:
+        with open(config_file, 'r', encoding='utf-8') as f:
+            return int(json.load(f).get("r", 0)) or None
+    except (FileNotFoundError, ValueError, json.JSONDecodeError):
+        return None
+
+
+def restore_adapter_weights(adapter_path: Path) -> None:
+    """
+    이전 병합 방식이 .disabled로 바꿔 둔 safetensors 복원
+
+    vLLM은 adapter_model.safetensors를 직접 읽으므로 변환/이름 변경이 필요 없음
+    """
+    adapter_path = Path(adapter_path)
+    safetensors_file = adapter_path / "adapter_model.safetensors"
+    disabled_file = adapter_path / "adapter_model.safetensors.disabled"
+    if disabled_file.exists() and not safetensors_file.exists():
+        disabled_file.rename(safetensors_file)
+        logger.info(f"safetensors 파일 복원: {safetensors_file}")
+
+
+class LoRAAdapterRegistry:
+    """어댑터 이름 → vLLM LoRARequest 관리 (스레드 안전)"""
+
+    def __init__(self, base_dir: Optional[Path] = None):
+        """
+        생성자
+
+        Args:
+            base_dir: 상대 경로 어댑터의 기준 디렉토리
+        """
+        self.base_dir = Path(base_dir) if base_dir else Path.cwd()
+        self._adapters: Dict[str, Dict[str, Any]] = {}
+        self._next_id = 1
+        self._lock = threading.Lock()
+        self.default_adapter: Optional[str] = None
+
+    def _resolve(self, path: Union[str, Path]) -> Path:
+        path = Path(path)
+        return path if path.is_absolute() else self.base_dir / path
+
+    def register(self, name: str, path: Union[str, Path], default: bool = False,
+                 max_rank: Optional[int] = None) -> bool:
+        """
+        어댑터 등록 (같은 이름이면 교체)
+
+        Args:
+            name: 어댑터 이름 (요청 시 지정하는 값)
+            path: 어댑터 디렉토리 (adapter_config.json 포함)
+            default: 이름 없이 요청할 때 사용할 어댑터로 지정
+            max_rank: 실행 중인 엔진의 max_lora_rank (넘으면 등록하지 않고 기존 어댑터도 그대로 유지)
+
+        Returns:
+            등록 성공 여부
+        """
+        adapter_path = self._resolve(path)
+        if not (adapter_path / "adapter_config.json").exists():
+            logger.warning(f"LoRA 어댑터를 찾을 수 없음: {adapter_path}")
+            return False
+        rank = read_adapter_rank(adapter_path)
+        if max_rank is not None and (rank or 0) > max_rank:
+            logger.error(f"어댑터 rank({rank})가 엔진 max_lora_rank({max_rank})보다 큽니다: {name}")
+            return False
+
+        restore_adapter_weights(adapter_path)
+        with self._lock:
+            replaced = name in self._adapters
+            self._adapters[name] = {
+                "id": self._next_id,
+                "path": str(adapter_path),
+                "rank": rank,
+                "requests": 0
+            }
+            self._next_id += 1
+            if default or self.default_adapter is None:
+                self.default_adapter = name
+        logger.info(f"LoRA 어댑터 {'교체' if replaced else '등록'}: {name} → {adapter_path}")
+        return True
+
+    def unregister(self, name: str) -> None:
+        with self._lock:
+            self._adapters.pop(name, None)
+            if self.default_adapter == name:
+                self.default_adapter = next(iter(self._adapters), None)
+
+    @property
+    def names(self) -> List[str]:
+        with self._lock:
+            return list(self._adapters)
+
+    def __len__(self) -> int:
+        return len(self._adapters)
+
+    def max_rank(self) -> Optional[int]:
+        """등록된 어댑터 중 최대 rank를 vLLM 지원 값으로 올림"""
+        ranks = [info["rank"] for info in self._adapters.values() if info["rank"]]
+        if not ranks:
+            return None
+        return next((rank for rank in SUPPORTED_LORA_RANKS if rank >= max(ranks)), SUPPORTED_LORA_RANKS[-1])
+
+    def lora_request(self, name: Optional[str] = None):
+        """
+        요청에 붙일 LoRARequest
+
+        Args:
+            name: 어댑터 이름 (None이면 기본 어댑터, "base"면 어댑터 없이 베이스 모델)
+
+        Returns:
+            LoRARequest 또는 None
+        """
+        from vllm.lora.request import LoRARequest
+
+        with self._lock:
+            name = name or self.default_adapter
+            if name is None or name == "base":
+                return None
+            info = self._adapters.get(name)
+            if info is None:
+                raise KeyError(f"등록되지 않은 LoRA 어댑터: {name} (등록됨: {list(self._adapters)})")
+            info["requests"] += 1
+            return LoRARequest(name, info["id"], info["path"])
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "default": self.default_adapter,
+                "adapters": {name: dict(info) for name, info in self._adapters.items()}
+            }
@@ -0,0 +1,161 @@
+"""
+OpenAI 호환 임베딩 모의 서버 (표준 라이브러리 HTTP 서버)
+
+API 키/인터넷 없이 async_embedding_client와 평가기 동작을 점검할 때 사용
+- POST /v1/embeddings: 문자 n-gram 해싱 벡터 반환 (같은 텍스트 → 항상 같은 벡터)
+- 입력 1개/요청 전체 토큰 한도 초과 시 400 (OpenAI와 같은 "maximum context length" 메시지)
+- --fail-rate: 지정 비율로 429 + Retry-After 응답 (재시도 점검)
+- --latency: 요청마다 지연(초) (동시 요청 효과 점검)
+
+사용법:
+    python mock_embedding_server.py --port 8089 --fail-rate 0.1 --latency 0.2
+    # config.yaml: embedding_options: {base_url: "http://127.0.0.1:8089/v1"}
+"""
+
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+from embedding_providers import HashingEmbeddingProvider
+
+
+def estimate_tokens(text: str) -> int:
+    """async_embedding_client.TokenCounter 추정치와 같은 기준"""
+    return len(text.encode('utf-8')) // 2 + 1
+
+
+class MockEmbeddingServer(ThreadingHTTPServer):
+    """모의 서버 설정 + 요청 통계"""
+
+    daemon_threads = True
+
+    def __init__(self,
+                 address,
+                 max_input_tokens: int = 8191,
+                 max_request_tokens: int = 300_000,
+                 fail_rate: float = 0.0,
+                 latency: float = 0.0,
+                 dimensions: int = 256,
+                 seed: Optional[int] = None):
+        super().__init__(address, MockEmbeddingHandler)
+        self.max_input_tokens = max_input_tokens
+        self.max_request_tokens = max_request_tokens
+        self.fail_rate = fail_rate
+        self.latency = latency
+        self.embedder = HashingEmbeddingProvider(n_features=dimensions)
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.rejected = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+
+class MockEmbeddingHandler(BaseHTTPRequestHandler):
+    server: MockEmbeddingServer
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, status: int, body: dict, headers: Optional[dict] = None) -> None:
+        payload = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _error(self, status: int, message: str, headers: Optional[dict] = None) -> None:
+        self._reply(status, {"error": {"message": message, "type": "invalid_request_error"}}, headers)
+
+    def do_POST(self):
+        if self.path.rstrip('/') not in ("/v1/embeddings", "/embeddings"):
+            return self._error(404, f"unknown path {self.path}")
+
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            fail = server.random.random() < server.fail_rate
+        try:
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            inputs = body.get("input", [])
+            inputs = [inputs] if isinstance(inputs, str) else inputs
+            if server.latency:
+                time.sleep(server.latency)
+
+            if fail:
+                with server.lock:
+                    server.rejected += 1
+                return self._error(429, "Rate limit reached (mock)", {"Retry-After": "0.05"})
+
+            tokens = [estimate_tokens(text) for text in inputs]
+            if any(count > server.max_input_tokens for count in tokens):
+                return self._error(400, f"This model's maximum context length is {server.max_input_tokens} tokens")
+            if sum(tokens) > server.max_request_tokens:
+                return self._error(400, f"Too many tokens in request: max_tokens_per_request {server.max_request_tokens}")
+
+            vectors = server.embedder.embed(inputs)
+            data = [
+                {"object": "embedding", "index": i, "embedding": vector.tolist() if vector is not None else []}
+                for i, vector in enumerate(vectors)
+            ]
+            self._reply(200, {
+                "object": "list",
+                "data": data,
+                "model": body.get("model", "mock"),
+                "usage": {"prompt_tokens": sum(tokens), "total_tokens": sum(tokens)}
+            })
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+
+def start_server(port: int = 0, **options) -> MockEmbeddingServer:
+    """백그라운드 스레드에서 서버 시작 (port=0이면 빈 포트), server.shutdown()으로 종료"""
+    server = MockEmbeddingServer(("127.0.0.1", port), **options)
+    threading.Thread(target=server.serve_forever, name="mock-embedding-server", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OpenAI 호환 임베딩 모의 서버")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--max-input-tokens", type=int, default=8191)
+    parser.add_argument("--max-request-tokens", type=int, default=300_000)
+    parser.add_argument("--fail-rate", type=float, default=0.0, help="429 응답 비율")
+    parser.add_argument("--latency", type=float, default=0.0, help="요청당 지연(초)")
+    parser.add_argument("--dimensions", type=int, default=256)
+    args = parser.parse_args()
+
+    server = MockEmbeddingServer(
+        ("127.0.0.1", args.port),
+        max_input_tokens=args.max_input_tokens,
+        max_request_tokens=args.max_request_tokens,
+        fail_rate=args.fail_rate,
+        latency=args.latency,
+        dimensions=args.dimensions
+    )
+    print(f"🧪 모의 임베딩 서버: {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+오프라인 배치 처리 I/O 파이프라인
+
+GPU 생성 중에 CPU 작업(입력 로드/프롬프트 구성/토큰화, 결과 저장)을 겹쳐 실행
+- Prefetcher: 다음 K개 회의 파일의 작업을 스레드 풀에서 미리 준비 (입력 순서 유지)
+- BackgroundWriter: 결과 JSON 직렬화/저장을 스레드 풀에서 처리
+- GPUUtilizationMonitor: 실행 중 GPU 사용률 샘플링 + 생성 호출 구간(busy) 비율 집계
+"""
+
+import time
+import shutil
+import threading
+import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class Prefetcher:
+    """입력 목록에 prepare_fn을 최대 depth개 앞서 적용하고 결과를 입력 순서대로 반환"""
+
+    def __init__(self, prepare_fn: Callable[[Any], Any], depth: int = 4, workers: int = 2):
+        """
+        생성자
+
+        Args:
+            prepare_fn: 입력 1개 → 준비된 작업 (예외는 반환 시 그대로 전달)
+            depth: 미리 준비할 입력 수 (0이면 호출 스레드에서 순차 처리)
+            workers: 준비 스레드 수
+        """
+        self.prepare_fn = prepare_fn
+        self.depth = max(0, depth)
+        self.workers = max(1, workers)
+
+    def map(self, items: Iterable[Any]) -> Iterator[Tuple[Any, Any, Optional[BaseException]]]:
+        """(입력, 결과, 예외) 순서대로 생성"""
+        if self.depth == 0:
+            for item in items:
+                try:
+                    yield item, self.prepare_fn(item), None
+                except Exception as e:
+                    yield item, None, e
+            return
+
+        item_iter = iter(items)
+        queue = deque()
+        sentinel = object()
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="prefetch") as executor:
+            def fill():
+                while len(queue) < self.depth:
+                    item = next(item_iter, sentinel)
+                    if item is sentinel:
+                        return
+                    queue.append((item, executor.submit(self.prepare_fn, item)))
+
+            fill()
+            while queue:
+                item, future = queue.popleft()
+                fill()  # 현재 항목을 넘기기 전에 다음 항목 준비 시작
+                try:
+                    yield item, future.result(), None
+                except Exception as e:
+                    yield item, None, e
+
+
+class BackgroundWriter:
+    """결과 저장 작업을 스레드 풀에서 실행하고 완료 시 콜백 호출"""
+
+    def __init__(self, workers: int = 2):
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="writer") if workers > 0 else None
+
+    def submit(self, fn: Callable, *args, on_done: Optional[Callable[[Any, Optional[BaseException]], None]] = None) -> None:
+        """
+        저장 작업 제출 (workers=0이면 즉시 실행)
+
+        Args:
+            fn: 저장 함수
+            on_done: (반환값, 예외) 콜백 — 저장 스레드에서 호출되므로 공유 상태는 직접 잠가야 함
+        """
+        if self._executor is None:
+            try:
+                result, error = fn(*args), None
+            except Exception as e:
+                result, error = None, e
+            if on_done:
+                on_done(result, error)
+            return
+
+        future = self._executor.submit(fn, *args)
+        if on_done:
+            future.add_done_callback(lambda f: on_done(
+                None if f.exception() else f.result(), f.exception()
+            ))
+
+    def close(self) -> None:
+        """대기 중인 저장 작업 완료까지 대기"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _read_gpu_utilization_nvml(handles) -> Optional[float]:
+    import pynvml
+    values = [pynvml.nvmlDeviceGetUtilizationRates(handle).gpu for handle in handles]
+    return sum(values) / len(values) if values else None
+
+
+def _read_gpu_utilization_smi() -> Optional[float]:
+    output = subprocess.run(
+        ["nvidia-smi", "--query-gpu=utilization.gpu", "--format=csv,noheader,nounits"],
+        capture_output=True, text=True, timeout=5
+    ).stdout
+    values = [float(line) for line in output.split() if line.strip()]
+    return sum(values) / len(values) if values else None
+
+
+class GPUUtilizationMonitor:
+    """
+    실행 중 GPU 사용률 집계
+
+    - 사용률 샘플: pynvml → nvidia-smi 순으로 사용 (둘 다 없으면 샘플 없이 busy 비율만)
+    - busy 비율: 생성 호출(llm.generate / engine.step) 안에 있던 시간 / 전체 실행 시간
+    """
+
+    def __init__(self, interval: float = 1.0):
+        self.interval = interval
+        self.samples: List[float] = []
+        self._busy_time = 0.0
+        self._busy_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._reader: Optional[Callable[[], Optional[float]]] = None
+        self._started_at: Optional[float] = None
+        self._stopped_at: Optional[float] = None
+
+    def _init_reader(self) -> None:
+        try:
+            import pynvml
+            pynvml.nvmlInit()
+            handles = [pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(pynvml.nvmlDeviceGetCount())]
+            self._reader = lambda: _read_gpu_utilization_nvml(handles)
+            return
+        except Exception:
+            pass
+        if shutil.which("nvidia-smi"):
+            self._reader = _read_gpu_utilization_smi
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                value = self._reader()
+            except Exception:
+                continue
+            if value is not None:
+                self.samples.append(value)
+
+    def start(self) -> "GPUUtilizationMonitor":
+        self._started_at = time.perf_counter()
+        self._init_reader()
+        if self._reader is not None and self.interval > 0:
+            self._thread = threading.Thread(target=self._run, name="gpu-monitor", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 5)
+        self._stopped_at = time.perf_counter()
+
+    @contextmanager
+    def busy(self):
+        """생성 호출 구간 측정"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._busy_lock:
+                self._busy_time += time.perf_counter() - start
+
+    def summary(self) -> Dict[str, Any]:
+        end = self._stopped_at or time.perf_counter()
+        wall = end - self._started_at if self._started_at else 0.0
+        samples = sorted(self.samples)
+        return {
+            "wall_time": round(wall, 2),
+            "generate_time": round(self._busy_time, 2),
+            "busy_ratio": round(self._busy_time / wall, 3) if wall else None,
+            "gpu_util_mean": round(sum(samples) / len(samples), 1) if samples else None,
+            "gpu_util_p50": samples[len(samples) // 2] if samples else None,
+            "gpu_util_samples": len(samples)
+        }
@@ -0,0 +1,139 @@
+"""
+오프라인 생성 실행 매니페스트 (SQLite)
+
+(입력 파일 해시, 청크 번호, 모델, 프롬프트 버전) 단위로 처리 상태를 기록하여
+재실행 시 완료된 청크는 건너뛰고 실패/미완료 청크만 다시 처리
+- 입력 파일 내용이 바뀌면 해시가 달라져 자동으로 다시 처리
+- 프롬프트/청킹 설정이 바뀌면 prompt_version이 달라져 다시 처리
+- 결과 파일은 임시 파일에 쓴 뒤 rename (중단되어도 반쯤 쓰인 result.json이 남지 않음)
+"""
+
+import os
+import json
+import sqlite3
+import hashlib
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Union
+
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+
+
+def file_sha256(path: Union[str, Path]) -> str:
+    """입력 파일 내용 해시"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def prompt_version(*parts: Any) -> str:
+    """프롬프트 템플릿/청킹 설정 등 결과에 영향을 주는 값들의 짧은 해시"""
+    payload = json.dumps([str(part) for part in parts], ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:12]
+
+
+def atomic_write_json(path: Union[str, Path], data: Any, indent: Optional[int] = 2) -> None:
+    """같은 디렉토리의 임시 파일에 쓴 뒤 rename (원자적 교체)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+class RunManifest:
+    """청크 단위 처리 상태 기록 (스레드 안전)"""
+
+    def __init__(self, db_path: Union[str, Path], model: str, prompt_version: str):
+        """
+        생성자
+
+        Args:
+            db_path: SQLite 파일 경로 (보통 출력 디렉토리 안)
+            model: 모델 이름/경로
+            prompt_version: prompt_version()으로 만든 버전 문자열
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.model = model
+        self.prompt_version = prompt_version
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS chunks (
+                input_hash TEXT NOT NULL,
+                chunk_index INTEGER NOT NULL,
+                model TEXT NOT NULL,
+                prompt_version TEXT NOT NULL,
+                source TEXT,
+                output_path TEXT,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (input_hash, chunk_index, model, prompt_version)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def completed_chunks(self, input_hash: str) -> Set[int]:
+        """완료 기록이 있고 결과 파일도 남아 있는 청크 번호"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT chunk_index, output_path FROM chunks "
+                "WHERE input_hash=? AND model=? AND prompt_version=? AND status=?",
+                (input_hash, self.model, self.prompt_version, STATUS_DONE)
+            ).fetchall()
+        return {index for index, output_path in rows if output_path and os.path.exists(output_path)}
+
+    def mark(self,
+             input_hash: str,
+             chunk_index: int,
+             status: str,
+             source: Optional[str] = None,
+             output_path: Optional[Union[str, Path]] = None,
+             error: Optional[str] = None) -> None:
+        """청크 처리 결과 기록 (시도 횟수 누적)"""
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO chunks (input_hash, chunk_index, model, prompt_version, source, output_path,
+                                    status, attempts, error, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+                ON CONFLICT (input_hash, chunk_index, model, prompt_version) DO UPDATE SET
+                    source=excluded.source, output_path=excluded.output_path, status=excluded.status,
+                    attempts=chunks.attempts + 1, error=excluded.error, updated_at=excluded.updated_at
+                """,
+                (input_hash, chunk_index, self.model, self.prompt_version, source,
+                 str(output_path) if output_path else None, status, error, datetime.now().isoformat())
+            )
+            self._conn.commit()
+
+    def summary(self) -> Dict[str, int]:
+        """현재 모델/프롬프트 버전의 상태별 청크 수"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT status, COUNT(*) FROM chunks WHERE model=? AND prompt_version=? GROUP BY status",
+                (self.model, self.prompt_version)
+            ).fetchall()
+        return dict(rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
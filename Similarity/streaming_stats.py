@@ -0,0 +1,159 @@
+"""
+스트리밍 요약 통계 (점수를 하나씩 받아 고정 크기 메모리로 집계)
+
+- RunningStat: 개수/평균/표준편차(Welford)/최소/최대
+- 포아송 부트스트랩: 표본마다 Poisson(1) 가중치 B개를 더해 가며 평균의 신뢰구간 계산
+  (재표집을 위해 전체 점수를 보관할 필요 없음)
+- 가중치는 (시드, 표본 키)로 만든 난수 → 중단 후 재개하거나 처리 순서가 달라도 같은 신뢰구간
+- 모든 지표가 표본별 같은 가중치를 공유 (지표 간 비교가 같은 재표집 기준)
+"""
+
+import zlib
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class RunningStat:
+    """Welford 방식 개수/평균/분산/최소/최대"""
+
+    __slots__ = ("count", "mean", "m2", "min", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = float("inf")
+        self.max = float("-inf")
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    @property
+    def std(self) -> float:
+        """표본 표준편차 (ddof=1)"""
+        return (self.m2 / (self.count - 1)) ** 0.5 if self.count > 1 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        if not self.count:
+            return {"count": 0, "mean": None, "std": None, "min": None, "max": None}
+        return {"count": self.count, "mean": self.mean, "std": self.std, "min": self.min, "max": self.max}
+
+
+class MetricSummary:
+    """지표 하나의 스트리밍 요약 (RunningStat + 포아송 부트스트랩 평균 신뢰구간)"""
+
+    def __init__(self, bootstrap_samples: int = 1000, confidence: float = 0.95):
+        self.stat = RunningStat()
+        self.confidence = confidence
+        self.sums = np.zeros(bootstrap_samples)
+        self.weights = np.zeros(bootstrap_samples)
+
+    def add(self, value: float, weights: Optional[np.ndarray]) -> None:
+        self.stat.add(value)
+        if weights is not None and self.sums.size:
+            self.sums += weights * value
+            self.weights += weights
+
+    def interval(self) -> Tuple[Optional[float], Optional[float]]:
+        """평균의 부트스트랩 백분위 신뢰구간 (표본이 2개 미만이면 None)"""
+        valid = self.weights > 0
+        if self.stat.count < 2 or not valid.any():
+            return None, None
+        means = self.sums[valid] / self.weights[valid]
+        alpha = (1 - self.confidence) / 2
+        low, high = np.quantile(means, [alpha, 1 - alpha])
+        return float(low), float(high)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = self.stat.to_dict()
+        if self.sums.size:
+            data["ci_low"], data["ci_high"] = self.interval()
+        return data
+
+
+class StreamingSummary:
+    """여러 지표 + 필드별 점수의 스트리밍 요약"""
+
+    def __init__(self,
+                 metrics: Sequence[str],
+                 bootstrap_samples: int = 1000,
+                 confidence: float = 0.95,
+                 seed: int = 42):
+        """
+        생성자
+
+        Args:
+            metrics: 집계할 지표 이름 (add()의 values 키)
+            bootstrap_samples: 부트스트랩 반복 수 (0이면 신뢰구간 생략)
+            confidence: 신뢰수준
+            seed: 가중치 난수 시드 (표본 키와 함께 사용)
+        """
+        self.bootstrap_samples = max(0, bootstrap_samples)
+        self.confidence = confidence
+        self.seed = seed
+        self.metrics = {name: MetricSummary(self.bootstrap_samples, confidence) for name in metrics}
+        self.fields: Dict[str, Dict[str, RunningStat]] = {}
+
+    def _weights(self, key: str) -> Optional[np.ndarray]:
+        if not self.bootstrap_samples:
+            return None
+        rng = np.random.default_rng([self.seed, zlib.crc32(key.encode("utf-8"))])
+        return rng.poisson(1.0, self.bootstrap_samples)
+
+    def add(self,
+            key: str,
+            values: Dict[str, Optional[float]],
+            field_scores: Optional[Dict[str, Dict[str, float]]] = None) -> None:
+        """
+        표본 하나 추가
+
+        Args:
+            key: 표본 키 (부트스트랩 가중치 시드)
+            values: 지표 → 값 (None이면 해당 지표에서 제외)
+            field_scores: 필드 → {"precision", "recall", "f1"}
+        """
+        weights = self._weights(key)
+        for name, summary in self.metrics.items():
+            value = values.get(name)
+            if value is not None:
+                summary.add(float(value), weights)
+        for name, scores in (field_scores or {}).items():
+            stats = self.fields.setdefault(name, {metric: RunningStat() for metric in ("precision", "recall", "f1")})
+            for metric, stat in stats.items():
+                stat.add(scores[metric])
+
+    def count(self, metric: str) -> int:
+        return self.metrics[metric].stat.count
+
+    def mean(self, metric: str) -> Optional[float]:
+        """지표 평균 (값이 없으면 None)"""
+        stat = self.metrics[metric].stat
+        return stat.mean if stat.count else None
+
+    def interval(self, metric: str) -> Tuple[Optional[float], Optional[float]]:
+        return self.metrics[metric].interval()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """지표별 count/mean/std/min/max/ci_low/ci_high (값이 없는 지표는 제외)"""
+        data = {name: summary.to_dict() for name, summary in self.metrics.items() if summary.stat.count}
+        if self.bootstrap_samples:
+            data["bootstrap"] = {"samples": self.bootstrap_samples, "confidence": self.confidence}
+        return data
+
+    def field_summary(self) -> Dict[str, Dict[str, float]]:
+        """필드별 평균 정밀도/재현율/F1 (필드가 있는 표본 수 포함)"""
+        return {
+            name: {
+                "precision": stats["precision"].mean,
+                "recall": stats["recall"].mean,
+                "f1": stats["f1"].mean,
+                "count": stats["f1"].count
+            }
+            for name, stats in self.fields.items()
+        }
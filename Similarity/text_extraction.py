@@ -0,0 +1,309 @@
+"""
+평가용 텍스트 추출 (gold/result result.json → 비교 텍스트)
+
+- 평가 전에 매칭된 모든 쌍을 스레드 풀로 한 번에 추출 → 점수 계산 루프는 계산만 수행
+- text_format
+  - compact(기본): notion 출력(dict/list 또는 JSON 문자열)을 "키: 값" 줄 단위 텍스트로 정규화
+    (gold는 dict, 결과는 JSON 문자열이어도 같은 형태가 되고, 들여쓰기/괄호/따옴표가 점수와 토큰 수에 섞이지 않음)
+  - json: 이전 버전과 같은 json.dumps(indent=2) 출력 (이전 점수와 비교할 때)
+- 필드 텍스트: 렌더링한 텍스트를 다시 나누지 않고 파싱한 notion 객체의 최상위 필드별 값으로 추출 (필드별 F1용)
+- 추출 캐시: sqlite에 (파일 경로, 종류, 형식) → 텍스트/필드 저장, 파일 mtime/크기가 같을 때만 재사용
+"""
+
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+TEXT_FORMATS = ("compact", "json")
+EXTRACTOR_VERSION = 1  # 렌더링 규칙이 바뀌면 올려서 캐시 무효화
+
+GOLD = "gold"
+RESULT = "result"
+FIELDS_SUFFIX = ":fields"  # 캐시에서 필드 텍스트(JSON) 행의 종류 접미사
+
+FieldTexts = Dict[str, str]
+
+
+def strip_code_fence(text: str) -> str:
+    """```json 코드 블록 제거"""
+    if text.startswith("```json"):
+        return text.replace("```json", "").replace("```", "").strip()
+    return text
+
+
+def _render_lines(value: Any, lines: List[str], key: Optional[str] = None) -> None:
+    if isinstance(value, dict):
+        if key is not None:
+            lines.append(f"{key}:")
+        for child_key, child in value.items():
+            _render_lines(child, lines, str(child_key))
+    elif isinstance(value, list):
+        if key is not None:
+            lines.append(f"{key}:")
+        for item in value:
+            _render_lines(item, lines, None if isinstance(item, (dict, list)) else "-")
+    elif value is not None:
+        text = value if isinstance(value, str) else str(value)
+        if "\n" in text or "  " in text or "\t" in text or "\r" in text:
+            text = " ".join(text.split())
+        else:
+            text = text.strip()
+        if not text:
+            return
+        if key == "-":
+            lines.append(f"- {text}")
+        elif key is None:
+            lines.append(text)
+        else:
+            lines.append(f"{key}: {text}")
+
+
+def render_notion(value: Any, text_format: str = "compact") -> str:
+    """notion 출력(dict/list/문자열) → 비교용 텍스트"""
+    if text_format == "json":
+        if isinstance(value, dict):
+            return json.dumps(value, ensure_ascii=False, indent=2)
+        return strip_code_fence(value) if isinstance(value, str) else str(value)
+
+    if isinstance(value, str):
+        value = strip_code_fence(value.strip())
+        try:
+            parsed = json.loads(value)
+        except ValueError:
+            return value
+        if not isinstance(parsed, (dict, list)):
+            return value
+        value = parsed
+    lines: List[str] = []
+    _render_lines(value, lines)
+    return "\n".join(lines)
+
+
+def field_value_text(value: Any) -> str:
+    """필드 값 → 텍스트 (중첩 목록/객체는 값만 줄 단위로, 키 제외)"""
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return "\n".join(field_value_text(item) for item in value)
+    if isinstance(value, dict):
+        return "\n".join(field_value_text(item) for item in value.values())
+    return str(value)
+
+
+def notion_fields(value: Any) -> Optional[FieldTexts]:
+    """notion 출력(dict 또는 JSON 문자열) → 최상위 필드별 텍스트 (객체가 아니면 None)"""
+    if isinstance(value, str):
+        try:
+            value = json.loads(strip_code_fence(value.strip()))
+        except ValueError:
+            return None
+    if not isinstance(value, dict):
+        return None
+    return {str(key): field_value_text(child) for key, child in value.items()}
+
+
+def _result_notion(data: dict) -> Tuple[Optional[str], Any]:
+    """모델 결과 result.json의 notion 값 (출처: generation | notion_output | None)"""
+    # 1. 단일 JSON 파일의 경우 (result.generation_result.result 경로)
+    generation = data.get("result")
+    if isinstance(generation, dict) and isinstance(generation.get("generation_result"), dict) \
+            and "result" in generation["generation_result"]:
+        return "generation", generation["generation_result"]["result"]
+
+    # 2. notion_output이 있는 경우 (학습 후 결과)
+    if "notion_output" in data:
+        return "notion_output", data.get("notion_output", "")
+
+    # 3. 기타 형식
+    return None, None
+
+
+def gold_text_from_data(data: dict, text_format: str = "compact") -> str:
+    """정답 result.json → 텍스트 (notion_output)"""
+    return render_notion(data.get("notion_output", ""), text_format)
+
+
+def result_text_from_data(data: dict, text_format: str = "compact") -> str:
+    """모델 결과 result.json → 텍스트"""
+    source, result = _result_notion(data)
+    if source is None:
+        return ""
+    if source == "generation" and text_format == "json" and not isinstance(result, dict):
+        return str(result)
+    return render_notion(result, text_format)
+
+
+def gold_fields_from_data(data: dict) -> Optional[FieldTexts]:
+    """정답 result.json → 필드별 텍스트"""
+    return notion_fields(data.get("notion_output"))
+
+
+def result_fields_from_data(data: dict) -> Optional[FieldTexts]:
+    """모델 결과 result.json → 필드별 텍스트"""
+    return notion_fields(_result_notion(data)[1])
+
+
+class TextCache:
+    """추출 텍스트 캐시 (파일 mtime/크기가 바뀌면 다시 추출)"""
+
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS texts (
+                path TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                text_format TEXT NOT NULL,
+                version INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                text TEXT NOT NULL,
+                PRIMARY KEY (path, kind, text_format)
+            )"""
+        )
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._pending: List[tuple] = []  # commit() 때 한 번에 기록
+
+    def get(self, path: str, kind: str, text_format: str, stat: os.stat_result) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text FROM texts WHERE path = ? AND kind = ? AND text_format = ? "
+                "AND version = ? AND mtime_ns = ? AND size = ?",
+                (path, kind, text_format, EXTRACTOR_VERSION, stat.st_mtime_ns, stat.st_size)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put(self, path: str, kind: str, text_format: str, stat: os.stat_result, text: str) -> None:
+        with self._lock:
+            self._pending.append((path, kind, text_format, EXTRACTOR_VERSION, stat.st_mtime_ns, stat.st_size, text))
+
+    def commit(self) -> None:
+        with self._lock:
+            if self._pending:
+                self._conn.executemany("INSERT OR REPLACE INTO texts VALUES (?, ?, ?, ?, ?, ?, ?)", self._pending)
+                self._pending = []
+            self._conn.commit()
+
+    def close(self) -> None:
+        self.commit()
+        with self._lock:
+            self._conn.close()
+
+
+class TextExtractor:
+    """gold/result 텍스트 추출기 (형식/캐시/병렬 설정 공유)"""
+
+    def __init__(self,
+                 text_format: str = "compact",
+                 cache_path: Optional[Union[str, Path]] = None,
+                 workers: int = 8):
+        """
+        생성자
+
+        Args:
+            text_format: compact | json (이전 버전 출력)
+            cache_path: 추출 캐시 sqlite 경로 (None이면 캐시 없음)
+            workers: 추출 스레드 수
+        """
+        if text_format not in TEXT_FORMATS:
+            raise ValueError(f"알 수 없는 text_format: {text_format} (사용 가능: {', '.join(TEXT_FORMATS)})")
+        self.text_format = text_format
+        self.workers = max(1, workers)
+        self.cache = TextCache(cache_path) if cache_path else None
+
+    def _extract(self, json_path: Path, kind: str) -> Tuple[str, Optional[FieldTexts]]:
+        """(텍스트, 필드별 텍스트) 추출 (notion 출력이 객체가 아니면 필드는 None)"""
+        try:
+            stat = json_path.stat()
+        except FileNotFoundError:
+            logger.warning(f"{'result.json' if kind == GOLD else '결과 파일'} 없음: {json_path}")
+            return "", None
+
+        cache_key = os.path.abspath(json_path)
+        if self.cache is not None:
+            cached = self.cache.get(cache_key, kind, self.text_format, stat)
+            cached_fields = self.cache.get(cache_key, kind + FIELDS_SUFFIX, self.text_format, stat)
+            if cached is not None and cached_fields is not None:
+                return cached, json.loads(cached_fields)
+
+        try:
+            with open(json_path, encoding="utf-8") as f:
+                data = json.load(f)
+            if kind == GOLD:
+                text = gold_text_from_data(data, self.text_format)
+                fields = gold_fields_from_data(data)
+            else:
+                text = result_text_from_data(data, self.text_format)
+                fields = result_fields_from_data(data)
+        except Exception as e:
+            logger.error(f"{'Gold' if kind == GOLD else 'Result'} 텍스트 추출 실패 ({json_path}): {e}")
+            return "", None
+
+        if self.cache is not None:
+            self.cache.put(cache_key, kind, self.text_format, stat, text)
+            self.cache.put(cache_key, kind + FIELDS_SUFFIX, self.text_format, stat,
+                           json.dumps(fields, ensure_ascii=False))
+        return text, fields
+
+    def _gold_path(self, folder_path: Path) -> Path:
+        return Path(folder_path) / "result.json"
+
+    def _result_path(self, folder_or_file_path: Path) -> Path:
+        path = Path(folder_or_file_path)
+        return path / "result.json" if path.is_dir() else path
+
+    def extract_gold_text(self, folder_path: Path) -> str:
+        """정답 데이터에서 텍스트 추출"""
+        return self._extract(self._gold_path(folder_path), GOLD)[0]
+
+    def extract_result_text(self, folder_or_file_path: Path) -> str:
+        """결과 데이터에서 텍스트 추출 (폴더면 안의 result.json)"""
+        return self._extract(self._result_path(folder_or_file_path), RESULT)[0]
+
+    def _extract_pairs(self, pairs: Sequence[Tuple[Path, Path]]) -> List[Tuple[Tuple[str, Optional[FieldTexts]], ...]]:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="extract") as executor:
+            gold = executor.map(lambda path: self._extract(self._gold_path(path), GOLD), [gold for gold, _ in pairs])
+            result = executor.map(lambda path: self._extract(self._result_path(path), RESULT),
+                                  [result for _, result in pairs])
+            extracted = list(zip(gold, result))
+        if self.cache is not None:
+            self.cache.commit()
+        logger.info(f"텍스트 추출 완료: {len(pairs)}쌍, {time.perf_counter() - start:.2f}초 ({self.workers} 스레드)")
+        return extracted
+
+    def extract_pairs(self, pairs: Sequence[Tuple[Path, Path]]) -> List[Tuple[str, str]]:
+        """
+        (gold 폴더, 결과 경로) 목록을 스레드 풀로 한 번에 추출
+
+        Returns:
+            입력 순서대로 (gold 텍스트, 결과 텍스트)
+        """
+        return [(gold[0], result[0]) for gold, result in self._extract_pairs(pairs)]
+
+    def extract_matches(self, matches: Sequence[Any]) -> None:
+        """
+        FileMatch 목록의 비어 있는 텍스트 채우기
+
+        gold_text/result_text와 함께 gold_fields/result_fields(필드별 텍스트, notion이 객체가 아니면 None)도 채움
+        """
+        pending = [match for match in matches if not match.gold_text or not match.result_text]
+        if not pending:
+            return
+        extracted = self._extract_pairs([(match.gold_folder, match.result_file) for match in pending])
+        for match, ((gold_text, gold_fields), (result_text, result_fields)) in zip(pending, extracted):
+            if not match.gold_text:
+                match.gold_text, match.gold_fields = gold_text, gold_fields
+            if not match.result_text:
+                match.result_text, match.result_fields = result_text, result_fields
@@ -11,11 +11,16 @@ import logging
 from typing import Optional, Dict, Any, List
 from contextlib import asynccontextmanager
 import time
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
 
 import torch
 import numpy as np
-from fastapi import FastAPI, File, UploadFile, HTTPException
+from fastapi import FastAPI, File, UploadFile, HTTPException, WebSocket, WebSocketDisconnect, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
 
 # 로컬 모듈 임포트
@@ -42,6 +47,28 @@ from prd_generation_prompts import (
     NOTION_PROJECT_SCHEMA,
     TASK_MASTER_PRD_SCHEMA
 )
+from fused_pipeline_prompts import (
+    generate_fused_pipeline_system_prompt,
+    generate_fused_pipeline_user_prompt,
+    split_fused_result,
+    FUSED_PIPELINE_SCHEMA
+)
+from stage_serializer import serialize_stage_output
+from realtime_meeting import RealtimeMeetingSession, RealtimeConfig
+from metrics import inc, observe, set_gauge, render_metrics
+from profiling import span, add_span_attrs, profile_request, to_chrome_trace
+from llm_backend import GenerationResult, get_llm_backend, get_loaded_llm_backend, backend_supports_async
+from whisperx_engine import load_whisperx, whisperx_transcribe, is_whisperx_loaded
+from model_host import is_model_host_client, get_model_host_client
+from token_budget import get_token_budgeter
+from json_stop import trim_to_json_object
+from request_scheduler import (
+    get_request_scheduler,
+    current_request_context,
+    RequestContext,
+    Priority,
+    AdmissionRejected
+)
 
 # Triplet + BERT 모듈 임포트
 try:
@@ -59,10 +86,8 @@ import uvicorn
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# 글로벌 모델 변수
-whisper_model = None
-qwen_model = None
-qwen_tokenizer = None
+# max_tokens 예산에 걸려 잘린 응답을 이어서 생성하는 최대 횟수
+LLM_MAX_CONTINUATIONS = int(os.getenv("LLM_MAX_CONTINUATIONS", "2"))
 
 # 새로운 응답 모델들
 class NotionProjectResponse(BaseModel):
@@ -141,150 +166,189 @@ class HealthResponse(BaseModel):
     models_loaded: Dict[str, bool]
     memory_info: Optional[Dict[str, float]] = None
 
-def load_whisperx():
-    """WhisperX 모델 로딩"""
-    global whisper_model
+def load_qwen3():
+    """Qwen3-32B-AWQ 로딩 (LLM 백엔드 초기화, 기존 호출부 호환용)"""
+    backend = get_llm_backend()
+    return getattr(backend, "model", None), getattr(backend, "tokenizer", None)
+
+def record_generation_metrics(result: GenerationResult, stage: str, inference_time: float, max_tokens: int = 2048):
+    """생성 결과 → 추론 시간, 프리필/디코드 시간, 토큰 수 기록"""
+    observe("llm_inference_seconds", inference_time, stage=stage)
+    inc("llm_tokens_in_total", result.prompt_tokens, stage=stage)
+    inc("llm_tokens_out_total", result.completion_tokens, stage=stage)
+    add_span_attrs(
+        tokens_in=result.prompt_tokens,
+        tokens_out=result.completion_tokens,
+        finish_reason=result.finish_reason
+    )
     
-    if whisper_model is None:
-        logger.info("🎤 Loading WhisperX large-v3...")
-        try:
-            import whisperx
-            device = "cuda" if torch.cuda.is_available() else "cpu"
-            compute_type = "float16" if device == "cuda" else "int8"
-            
-            whisper_model = whisperx.load_model(
-                "large-v3", 
-                device, 
-                compute_type=compute_type,
-                language="ko"
-            )
-            logger.info("✅ WhisperX loaded successfully")
-            
-        except Exception as e:
-            logger.error(f"❌ WhisperX loading failed: {e}")
-            raise e
+    # JSON 조기 종료 (절약 토큰은 max_tokens까지 생성했을 경우 대비 상한값)
+    if result.stopped_early:
+        tokens_saved = max(0, max_tokens - result.completion_tokens)
+        inc("json_early_stops_total", stage=stage)
+        inc("llm_tokens_saved_total", tokens_saved, stage=stage)
+        add_span_attrs(stopped_early=True, tokens_saved_upper_bound=tokens_saved)
     
-    return whisper_model
+    # 프리픽스 캐시 적중 토큰 (지원하는 백엔드에서만 제공)
+    if result.cached_tokens is not None:
+        inc("cache_requests_total", result.prompt_tokens, cache="llm_prefix")
+        inc("cache_hits_total", result.cached_tokens, cache="llm_prefix")
+        add_span_attrs(cached_tokens=result.cached_tokens)
+    
+    # 프리필/디코드 분리 (엔진 타임스탬프를 제공하는 백엔드만)
+    if result.prefill_time is not None:
+        observe("llm_prefill_seconds", result.prefill_time, stage=stage)
+        add_span_attrs(prefill_ms=round(result.prefill_time * 1000, 3))
+    if result.decode_time is not None:
+        observe("llm_decode_seconds", result.decode_time, stage=stage)
+        add_span_attrs(decode_ms=round(result.decode_time * 1000, 3))
 
-def load_qwen3():
-    """Qwen3-32B-AWQ 모델 로딩 (VLLM 최적화)"""
-    global qwen_model, qwen_tokenizer
+def estimate_text_tokens(text: str) -> int:
+    """토큰 수 추정 (청킹 프로세서 기준, 없으면 글자 수 기반)"""
+    try:
+        from chunking_processor import get_chunking_processor
+        return get_chunking_processor(max_context_tokens=32768).estimate_tokens(text)
+    except ImportError:
+        return int(len(text) * 1.5)
+
+def plan_continuation(
+    messages: List[Dict[str, str]],
+    result: GenerationResult,
+    max_total_tokens: int
+) -> Optional[tuple]:
+    """max_tokens에 걸려 잘린 응답 → (이어쓰기 메시지, 남은 토큰), 이어쓸 필요 없으면 None"""
+    if result.finish_reason != "length":
+        return None
+    remaining = max_total_tokens - result.completion_tokens
+    if remaining <= 0:
+        return None
+    # 마지막 assistant 메시지를 이어서 생성 (처음부터 다시 생성하지 않음, 프리픽스 캐시 재사용)
+    return messages + [{"role": "assistant", "content": result.text}], remaining
+
+def merge_generation_results(first: GenerationResult, continuation: GenerationResult) -> GenerationResult:
+    """이어쓰기 결과 병합"""
+    def add_optional(a, b):
+        return None if a is None and b is None else (a or 0.0) + (b or 0.0)
     
-    if qwen_model is None or qwen_tokenizer is None:
-        logger.info("🚀 Loading Qwen3-32B-AWQ with VLLM...")
-        try:
-            # VLLM 사용 여부 체크
-            use_vllm = os.getenv("USE_VLLM", "true").lower() == "true"
-            
-            if use_vllm:
-                try:
-                    logger.info("⚡ Using VLLM for ultra-fast inference")
-                    from vllm import LLM
-                    from transformers import AutoTokenizer
-                except ImportError as e:
-                    logger.warning(f"⚠️ VLLM import failed: {e}")
-                    logger.info("🔄 Falling back to Transformers...")
-                    use_vllm = False
-                
-            if use_vllm:
-                model_name = "Qwen/Qwen3-32B-AWQ"
-                
-                try:
-                    # VLLM 모델 로딩
-                    qwen_model = LLM(
-                        model=model_name,
-                        tensor_parallel_size=1,
-                        gpu_memory_utilization=0.7,  # GPU 메모리 70%로 복원
-                        trust_remote_code=True,
-                        quantization="awq",  # AWQ 양자화 명시
-                        max_model_len=16384,  # 토큰 길이 원래대로 복원
-                        enforce_eager=True,  # CUDA 그래프 비활성화 (메모리 절약)
-                        swap_space=4,  # 4GB swap space로 복원
-                        max_num_seqs=64  # 동시 시퀀스 수 원래대로 복원
-                        # 메모리 절약을 위한 보수적 설정
-                    )
-                    
-                    # 토크나이저는 별도 로딩 (템플릿 적용용)
-                    qwen_tokenizer = AutoTokenizer.from_pretrained(
-                        model_name, trust_remote_code=True
-                    )
-                    
-                    logger.info("🎉 VLLM Qwen3-32B-AWQ loaded successfully")
-                except Exception as e:
-                    logger.error(f"❌ VLLM model loading failed: {e}")
-                    logger.info("🔄 Falling back to Transformers...")
-                    use_vllm = False
-                
-            if not use_vllm:
-                # 기존 Transformers 방식 (백업용)
-                try:
-                    logger.info("📚 Using Transformers (fallback mode)")
-                    from transformers import AutoTokenizer, AutoModelForCausalLM
-                except ImportError as e:
-                    logger.error(f"❌ Transformers import failed: {e}")
-                    raise RuntimeError("Both VLLM and Transformers unavailable!")
-                
-                model_name = "Qwen/Qwen3-32B-AWQ"
-                
-                qwen_tokenizer = AutoTokenizer.from_pretrained(
-                    model_name, trust_remote_code=True
-                )
-                
-                qwen_model = AutoModelForCausalLM.from_pretrained(
-                    model_name,
-                    device_map="auto",
-                    torch_dtype=torch.float16,
-                    trust_remote_code=True
+    return GenerationResult(
+        text=first.text + continuation.text,
+        prompt_tokens=first.prompt_tokens,
+        completion_tokens=first.completion_tokens + continuation.completion_tokens,
+        finish_reason=continuation.finish_reason,
+        cached_tokens=first.cached_tokens,
+        prefill_time=add_optional(first.prefill_time, continuation.prefill_time),
+        decode_time=add_optional(first.decode_time, continuation.decode_time),
+        stopped_early=continuation.stopped_early
+    )
+
+def finish_budgeted_generation(
+    result: GenerationResult,
+    stage: str,
+    input_tokens: int,
+    continued: bool,
+    json_mode: bool
+) -> GenerationResult:
+    """이어쓰기 후처리 + 출력 길이 학습"""
+    if continued and json_mode:
+        # 이어쓰기 구간은 JSON 조기 종료 상태를 이어받지 못하므로 병합 후 객체 뒤를 잘라냄
+        result.text, _ = trim_to_json_object(result.text)
+    get_token_budgeter().record(stage, input_tokens, result.completion_tokens, truncated=continued)
+    return result
+
+def run_llm_generate(
+    messages: List[Dict[str, str]],
+    stage: str = "default",
+    max_tokens: Optional[int] = None,
+    temperature: float = 0.3,
+    stop: Optional[List[str]] = None,
+    json_mode: bool = False
+) -> GenerationResult:
+    """
+    LLM 백엔드 동기 호출 (워커 스레드에서 실행)
+    
+    max_tokens를 지정하지 않으면 단계별 출력 길이 분포로 예산 결정, 잘리면 이어서 생성
+    """
+    backend = get_llm_backend()
+    budgeter = get_token_budgeter()
+    input_tokens = estimate_text_tokens("\n".join(message["content"] for message in messages))
+    if max_tokens is None:
+        max_tokens = budgeter.budget(stage, input_tokens)
+        set_gauge("llm_max_tokens_budget", max_tokens, stage=stage)
+    max_total_tokens = max(max_tokens, budgeter.cap(stage))
+    
+    logger.info(f"⚡ {backend.name} 추론 실행... (max_tokens={max_tokens})")
+    start_time = time.time()
+    
+    with span("llm_generate", stage=stage, backend=backend.name, max_tokens=max_tokens):
+        result = backend.generate(messages, max_tokens=max_tokens, temperature=temperature, stop=stop, json_mode=json_mode)
+        continued = False
+        for _ in range(LLM_MAX_CONTINUATIONS):
+            continuation = plan_continuation(messages, result, max_total_tokens)
+            if continuation is None:
+                break
+            continue_messages, remaining = continuation
+            logger.info(f"↪️ 응답이 잘려 이어서 생성 (남은 토큰: {remaining})")
+            inc("llm_continuations_total", stage=stage)
+            with span("llm_continue", remaining=remaining):
+                result = merge_generation_results(
+                    result,
+                    backend.generate(continue_messages, max_tokens=remaining, temperature=temperature, stop=stop)
                 )
-                
-                logger.info("✅ Transformers Qwen3-32B-AWQ loaded successfully")
-            
-        except Exception as e:
-            logger.error(f"❌ Qwen3-32B-AWQ loading failed: {e}")
-            # VLLM 실패 시 Transformers로 대체
-            if 'vllm' in str(e).lower():
-                logger.warning("🔄 VLLM failed, falling back to Transformers...")
-                os.environ["USE_VLLM"] = "false"
-                return load_qwen3()  # 재귀 호출로 Transformers 로딩
-            raise e
+            continued = True
+        inference_time = time.time() - start_time
+        record_generation_metrics(result, stage, inference_time, max_tokens)
     
-    return qwen_model, qwen_tokenizer
+    logger.info(f"🎉 {backend.name} 추론 완료: {inference_time:.3f}초")
+    return finish_budgeted_generation(result, stage, input_tokens, continued, json_mode)
 
-def generate_structured_response(
-    system_prompt: str, 
-    user_prompt: str, 
-    response_schema: Dict[str, Any],
+async def arun_llm_generate(
+    messages: List[Dict[str, str]],
+    stage: str = "default",
+    max_tokens: Optional[int] = None,
     temperature: float = 0.3,
-    max_input_tokens: int = 28000,  # Qwen3-32B AWQ 안전 마진 적용
-    enable_chunking: bool = True
-) -> Dict[str, Any]:
-    """구조화된 응답 생성 (청킹 지원)"""
+    stop: Optional[List[str]] = None,
+    json_mode: bool = False
+) -> GenerationResult:
+    """LLM 백엔드 비동기 호출 (HTTP 백엔드, 이벤트 루프에서 실행)"""
+    backend = get_llm_backend()
+    budgeter = get_token_budgeter()
+    input_tokens = estimate_text_tokens("\n".join(message["content"] for message in messages))
+    if max_tokens is None:
+        max_tokens = budgeter.budget(stage, input_tokens)
+        set_gauge("llm_max_tokens_budget", max_tokens, stage=stage)
+    max_total_tokens = max(max_tokens, budgeter.cap(stage))
     
-    # 청킹 필요 여부 확인
-    if enable_chunking:
-        try:
-            from chunking_processor import get_chunking_processor
-            chunking_processor = get_chunking_processor(max_context_tokens=32768)
-            
-            # 전체 프롬프트 토큰 수 추정
-            total_prompt = f"{system_prompt}\n{user_prompt}"
-            estimated_tokens = chunking_processor.estimate_tokens(total_prompt)
-            
-            if estimated_tokens > max_input_tokens:
-                logger.info(f"🔄 청킹 필요 감지 (토큰: {estimated_tokens} > {max_input_tokens})")
-                return generate_chunked_response(
-                    system_prompt, user_prompt, response_schema, 
-                    temperature, chunking_processor
-                )
-            else:
-                logger.info(f"📝 단일 처리 (토큰: {estimated_tokens})")
-        except ImportError:
-            logger.warning("⚠️ 청킹 프로세서를 불러올 수 없습니다. 기본 처리로 진행합니다.")
+    logger.info(f"⚡ {backend.name} 추론 요청... (max_tokens={max_tokens})")
+    start_time = time.time()
     
-    # 모델 로딩
-    qwen_model, qwen_tokenizer = load_qwen3()
+    with span("llm_generate", track_cpu=False, stage=stage, backend=backend.name, max_tokens=max_tokens):
+        result = await backend.agenerate(messages, max_tokens=max_tokens, temperature=temperature, stop=stop, json_mode=json_mode)
+        continued = False
+        for _ in range(LLM_MAX_CONTINUATIONS):
+            continuation = plan_continuation(messages, result, max_total_tokens)
+            if continuation is None:
+                break
+            continue_messages, remaining = continuation
+            logger.info(f"↪️ 응답이 잘려 이어서 생성 (남은 토큰: {remaining})")
+            inc("llm_continuations_total", stage=stage)
+            with span("llm_continue", track_cpu=False, remaining=remaining):
+                result = merge_generation_results(
+                    result,
+                    await backend.agenerate(continue_messages, max_tokens=remaining, temperature=temperature, stop=stop)
+                )
+            continued = True
+        inference_time = time.time() - start_time
+        record_generation_metrics(result, stage, inference_time, max_tokens)
     
-    # 스키마 예시 포함 프롬프트
+    logger.info(f"🎉 {backend.name} 추론 완료: {inference_time:.3f}초")
+    return finish_budgeted_generation(result, stage, input_tokens, continued, json_mode)
+
+def build_structured_messages(
+    system_prompt: str,
+    user_prompt: str,
+    response_schema: Dict[str, Any]
+) -> List[Dict[str, str]]:
+    """스키마 예시 포함 프롬프트 → chat 메시지"""
     schema_prompt = f"""
 {system_prompt}
 
@@ -307,96 +371,31 @@ You must respond with a JSON object following this exact structure:
 ```json
 """
     
-    # 메시지 구성
-    messages = [{"role": "user", "content": schema_prompt}]
-    
-    # 추론 실행 (VLLM vs Transformers)
-    use_vllm = os.getenv("USE_VLLM", "true").lower() == "true"
-    
-    if use_vllm and hasattr(qwen_model, 'generate'):
-        # VLLM 추론 (초고속!)
-        logger.info("⚡ VLLM 추론 실행...")
-        start_time = time.time()
-        
-        from vllm import SamplingParams
-        
-        # 샘플링 파라미터 설정
-        sampling_params = SamplingParams(
-            max_tokens=2048,
-            temperature=temperature,
-            top_p=0.9,
-            repetition_penalty=1.1,
-            stop=None
-        )
-        
-        # 메시지를 텍스트로 변환
-        text = qwen_tokenizer.apply_chat_template(
-            messages, 
-            tokenize=False, 
-            add_generation_prompt=True
-        )
-        
-        # VLLM 추론 실행
-        outputs = qwen_model.generate([text], sampling_params)
-        response = outputs[0].outputs[0].text
-        
-        inference_time = time.time() - start_time
-        logger.info(f"🎉 VLLM 추론 완료: {inference_time:.3f}초")
-        
-    else:
-        # Transformers 추론 (기존 방식)
-        logger.info("📚 Transformers 추론 실행...")
-        start_time = time.time()
-        
-        # 토큰화
-        text = qwen_tokenizer.apply_chat_template(
-            messages, 
-            tokenize=False, 
-            add_generation_prompt=True
-        )
-        
-        inputs = qwen_tokenizer([text], return_tensors="pt").to(qwen_model.device)
-        
-        # 추론 실행
-        with torch.no_grad():
-            outputs = qwen_model.generate(
-                **inputs,
-                max_new_tokens=2048,
-                temperature=temperature,
-                do_sample=True,
-                pad_token_id=qwen_tokenizer.eos_token_id,
-                repetition_penalty=1.1,
-                top_p=0.9
-            )
-        
-        # 결과 디코딩
-        response = qwen_tokenizer.decode(
-            outputs[0][len(inputs["input_ids"][0]):], 
-            skip_special_tokens=True
-        )
-        
-        inference_time = time.time() - start_time
-        logger.info(f"✅ Transformers 추론 완료: {inference_time:.3f}초")
-    
-    # JSON 추출 및 파싱
+    return [{"role": "user", "content": schema_prompt}]
+
+def parse_structured_response(response: str, stage: str = "default") -> Dict[str, Any]:
+    """LLM 응답에서 JSON 추출 및 파싱"""
+    parse_start = time.perf_counter()
     try:
-        # JSON 부분만 추출
-        if "```json" in response:
-            json_start = response.find("```json") + 7
-            json_end = response.find("```", json_start)
-            if json_end == -1:
-                json_content = response[json_start:].strip()
+        with span("json_parse", stage=stage):
+            # JSON 부분만 추출
+            if "```json" in response:
+                json_start = response.find("```json") + 7
+                json_end = response.find("```", json_start)
+                if json_end == -1:
+                    json_content = response[json_start:].strip()
+                else:
+                    json_content = response[json_start:json_end].strip()
             else:
-                json_content = response[json_start:json_end].strip()
-        else:
-            # JSON 마커가 없으면 전체 응답에서 JSON 찾기
-            json_content = response.strip()
-        
-        # JSON 파싱
-        parsed_result = json.loads(json_content)
+                # JSON 마커가 없으면 전체 응답에서 JSON 찾기
+                json_content = response.strip()
+            
+            # JSON 파싱
+            parsed_result = json.loads(json_content)
         return parsed_result
         
     except json.JSONDecodeError as e:
+        inc("json_parse_failures_total", stage=stage)
         logger.error(f"❌ JSON 파싱 실패: {e}")
         logger.error(f"Raw response: {response[:500]}...")
         return {
@@ -404,18 +403,152 @@ You must respond with a JSON object following this exact structure:
             "raw_response": response[:1000]
         }
     except Exception as e:
+        inc("json_parse_failures_total", stage=stage)
         logger.error(f"❌ 응답 처리 실패: {e}")
         return {
             "error": f"Response processing failed: {str(e)}",
-            "raw_response": response[:1000] if 'response' in locals() else "No response"
+            "raw_response": response[:1000] if response else "No response"
         }
+    finally:
+        observe("json_parse_seconds", time.perf_counter() - parse_start, stage=stage)
+
+def get_chunking_processor_if_needed(system_prompt: str, user_prompt: str, max_input_tokens: int):
+    """청킹이 필요하면 청킹 프로세서 반환, 아니면 None"""
+    try:
+        from chunking_processor import get_chunking_processor
+        chunking_processor = get_chunking_processor(max_context_tokens=32768)
+        
+        # 전체 프롬프트 토큰 수 추정
+        total_prompt = f"{system_prompt}\n{user_prompt}"
+        estimated_tokens = chunking_processor.estimate_tokens(total_prompt)
+        
+        if estimated_tokens > max_input_tokens:
+            logger.info(f"🔄 청킹 필요 감지 (토큰: {estimated_tokens} > {max_input_tokens})")
+            return chunking_processor
+        
+        logger.info(f"📝 단일 처리 (토큰: {estimated_tokens})")
+    except ImportError:
+        logger.warning("⚠️ 청킹 프로세서를 불러올 수 없습니다. 기본 처리로 진행합니다.")
+    return None
+
+def generate_structured_response(
+    system_prompt: str, 
+    user_prompt: str, 
+    response_schema: Dict[str, Any],
+    temperature: float = 0.3,
+    max_input_tokens: int = 28000,  # Qwen3-32B AWQ 안전 마진 적용
+    enable_chunking: bool = True,
+    stage: str = "default"
+) -> Dict[str, Any]:
+    """구조화된 응답 생성 (청킹 지원)
+    
+    stage: 메트릭 레이블 (notion / prd / tasks / rolling_summary 등)
+    """
+    
+    # 청킹 필요 여부 확인
+    if enable_chunking:
+        chunking_processor = get_chunking_processor_if_needed(system_prompt, user_prompt, max_input_tokens)
+        if chunking_processor is not None:
+            return generate_chunked_response(
+                system_prompt, user_prompt, response_schema, 
+                temperature, chunking_processor, stage=stage
+            )
+    
+    messages = build_structured_messages(system_prompt, user_prompt, response_schema)
+    result = run_llm_generate(messages, stage=stage, temperature=temperature, json_mode=True)
+    return parse_structured_response(result.text, stage)
+
+async def agenerate_structured_response(
+    system_prompt: str, 
+    user_prompt: str, 
+    response_schema: Dict[str, Any],
+    temperature: float = 0.3,
+    max_input_tokens: int = 28000,
+    enable_chunking: bool = True,
+    stage: str = "default"
+) -> Dict[str, Any]:
+    """구조화된 응답 생성 - 비동기 백엔드용 (청크는 동시에 요청하여 서빙 서버가 배치 처리)"""
+    if enable_chunking:
+        chunking_processor = get_chunking_processor_if_needed(system_prompt, user_prompt, max_input_tokens)
+        if chunking_processor is not None:
+            return await agenerate_chunked_response(
+                system_prompt, user_prompt, response_schema,
+                temperature, chunking_processor, stage=stage
+            )
+    
+    messages = build_structured_messages(system_prompt, user_prompt, response_schema)
+    result = await arun_llm_generate(messages, stage=stage, temperature=temperature, json_mode=True)
+    return parse_structured_response(result.text, stage)
+
+def build_chunk_prompts(system_prompt: str, chunk: Dict[str, Any], index: int, total: int):
+    """청크별 시스템/사용자 프롬프트"""
+    chunk_system_prompt = f"""{system_prompt}
+
+**청킹 처리 정보:**
+- 현재 청크: {index+1}/{total}
+- 이 청크는 전체 회의의 일부입니다
+- 이 청크에서 발견되는 내용만 분석하세요
+- 다른 청크의 내용은 나중에 통합됩니다"""
+
+    chunk_user_prompt = f"""다음은 전체 회의록의 일부입니다:
+
+{chunk['text']}
+
+위 내용을 분석하여 이 부분에서 발견되는 액션 아이템, 결정사항, 핵심 포인트를 추출하세요."""
+    
+    return chunk_system_prompt, chunk_user_prompt
+
+def split_into_chunks(chunking_processor, user_prompt: str, stage: str) -> List[Dict[str, Any]]:
+    """user_prompt 청킹"""
+    with span("chunking", stage=stage):
+        chunks = chunking_processor.create_chunks_with_overlap(user_prompt)
+        add_span_attrs(num_chunks=len(chunks))
+    logger.info(f"📊 총 {len(chunks)}개 청크 생성")
+    inc("llm_chunks_total", len(chunks), stage=stage)
+    return chunks
+
+def merge_chunked_results(
+    chunking_processor,
+    chunks: List[Dict[str, Any]],
+    chunk_results: List[Dict[str, Any]],
+    user_prompt: str,
+    start_time: float,
+    stage: str
+) -> Dict[str, Any]:
+    """청크 결과 통합 + 메타데이터 추가"""
+    logger.info("🔄 청크 결과 통합 중...")
+    with span("chunk_merge", stage=stage):
+        merged_result = chunking_processor.merge_chunk_results(chunk_results)
+    
+    processing_time = time.time() - start_time
+    logger.info(f"✅ 청킹 처리 완료 (소요시간: {processing_time:.2f}초)")
+    
+    # 메타데이터 추가
+    merged_result["metadata"] = merged_result.get("metadata", {})
+    merged_result["metadata"].update({
+        "chunking_applied": True,
+        "total_chunks": len(chunks),
+        "processing_time": processing_time,
+        "original_tokens": chunking_processor.estimate_tokens(user_prompt),
+        "chunks_info": [
+            {
+                "chunk_id": chunk["chunk_id"],
+                "tokens": chunk["estimated_tokens"],
+                "has_overlap": chunk["has_overlap"]
+            }
+            for chunk in chunks
+        ]
+    })
+    
+    return merged_result
 
 def generate_chunked_response(
     system_prompt: str,
     user_prompt: str, 
     response_schema: Dict[str, Any],
     temperature: float,
-    chunking_processor
+    chunking_processor,
+    stage: str = "default"
 ) -> Dict[str, Any]:
     """청킹된 프롬프트 처리"""
     try:
@@ -423,28 +556,12 @@ def generate_chunked_response(
         start_time = time.time()
         
         # 1. user_prompt를 청킹
-        chunks = chunking_processor.create_chunks_with_overlap(user_prompt)
-        logger.info(f"📊 총 {len(chunks)}개 청크 생성")
+        chunks = split_into_chunks(chunking_processor, user_prompt, stage)
         
         # 2. 각 청크별로 처리
-        chunk_results = []
-        for i, chunk in enumerate(chunks):
+        def process_chunk(i: int, chunk: Dict[str, Any]) -> Dict[str, Any]:
             logger.info(f"🔄 청크 {i+1}/{len(chunks)} 처리 중... (토큰: {chunk['estimated_tokens']})")
-            
-            # 청크별 시스템 프롬프트 수정
-            chunk_system_prompt = f"""{system_prompt}
-
-**청킹 처리 정보:**
-- 현재 청크: {i+1}/{len(chunks)}
-- 이 청크는 전체 회의의 일부입니다
-- 이 청크에서 발견되는 내용만 분석하세요
-- 다른 청크의 내용은 나중에 통합됩니다"""
-
-            chunk_user_prompt = f"""다음은 전체 회의록의 일부입니다:
-
-{chunk['text']}
-
-위 내용을 분석하여 이 부분에서 발견되는 액션 아이템, 결정사항, 핵심 포인트를 추출하세요."""
+            chunk_system_prompt, chunk_user_prompt = build_chunk_prompts(system_prompt, chunk, i, len(chunks))
             
             # 단일 청크 처리
             chunk_result = generate_structured_response(
@@ -452,37 +569,62 @@ def generate_chunked_response(
                 user_prompt=chunk_user_prompt,
                 response_schema=response_schema,
                 temperature=temperature,
-                enable_chunking=False  # 재귀 방지
+                enable_chunking=False,  # 재귀 방지
+                stage=stage
             )
-            
-            chunk_results.append(chunk_result)
             logger.info(f"✅ 청크 {i+1} 처리 완료")
+            return chunk_result
+        
+        if get_llm_backend().supports_batching and len(chunks) > 1:
+            # 배치 백엔드: 청크를 동시에 제출해 한 번의 generate로 묶이도록 함
+            with ThreadPoolExecutor(max_workers=len(chunks)) as pool:
+                futures = [
+                    pool.submit(contextvars.copy_context().run, process_chunk, i, chunk)
+                    for i, chunk in enumerate(chunks)
+                ]
+                chunk_results = [future.result() for future in futures]
+        else:
+            chunk_results = [process_chunk(i, chunk) for i, chunk in enumerate(chunks)]
         
         # 3. 결과 통합
-        logger.info("🔄 청크 결과 통합 중...")
-        merged_result = chunking_processor.merge_chunk_results(chunk_results)
+        return merge_chunked_results(chunking_processor, chunks, chunk_results, user_prompt, start_time, stage)
         
-        processing_time = time.time() - start_time
-        logger.info(f"✅ 청킹 처리 완료 (소요시간: {processing_time:.2f}초)")
+    except Exception as e:
+        logger.error(f"❌ 청킹 처리 실패: {e}")
+        return {
+            "error": f"Chunking processing failed: {str(e)}",
+            "fallback_message": "청킹 처리에 실패했습니다. 기본 처리를 시도하세요."
+        }
+
+async def agenerate_chunked_response(
+    system_prompt: str,
+    user_prompt: str,
+    response_schema: Dict[str, Any],
+    temperature: float,
+    chunking_processor,
+    stage: str = "default"
+) -> Dict[str, Any]:
+    """청킹된 프롬프트 처리 - 비동기 백엔드용 (청크 동시 요청)"""
+    try:
+        logger.info("🚀 청킹 기반 처리 시작 (동시 요청)...")
+        start_time = time.time()
         
-        # 메타데이터 추가
-        merged_result["metadata"] = merged_result.get("metadata", {})
-        merged_result["metadata"].update({
-            "chunking_applied": True,
-            "total_chunks": len(chunks),
-            "processing_time": processing_time,
-            "original_tokens": chunking_processor.estimate_tokens(user_prompt),
-            "chunks_info": [
-                {
-                    "chunk_id": chunk["chunk_id"],
-                    "tokens": chunk["estimated_tokens"],
-                    "has_overlap": chunk["has_overlap"]
-                }
-                for chunk in chunks
-            ]
-        })
+        chunks = split_into_chunks(chunking_processor, user_prompt, stage)
+        
+        async def process_chunk(i: int, chunk: Dict[str, Any]) -> Dict[str, Any]:
+            chunk_system_prompt, chunk_user_prompt = build_chunk_prompts(system_prompt, chunk, i, len(chunks))
+            return await agenerate_structured_response(
+                system_prompt=chunk_system_prompt,
+                user_prompt=chunk_user_prompt,
+                response_schema=response_schema,
+                temperature=temperature,
+                enable_chunking=False,  # 재귀 방지
+                stage=stage
+            )
         
-        return merged_result
+        chunk_results = await asyncio.gather(*[process_chunk(i, chunk) for i, chunk in enumerate(chunks)])
+        
+        return merge_chunked_results(chunking_processor, chunks, list(chunk_results), user_prompt, start_time, stage)
         
     except Exception as e:
         logger.error(f"❌ 청킹 처리 실패: {e}")
@@ -491,6 +633,45 @@ def generate_chunked_response(
             "fallback_message": "청킹 처리에 실패했습니다. 기본 처리를 시도하세요."
         }
 
+def estimate_llm_cost(prompt_text: str, max_new_tokens: int = 2048, max_input_tokens: int = 28000) -> float:
+    """스케줄러 입장 제어용 LLM 비용 추정 (입력 토큰 + 청크별 출력 예산)"""
+    input_tokens = estimate_text_tokens(prompt_text)
+    num_calls = max(1, -(-input_tokens // max_input_tokens))
+    return float(input_tokens + max_new_tokens * num_calls)
+
+async def run_scheduled(fn, *args, kind: str = "llm", cost: float = 0.0, **kwargs):
+    """GPU 작업을 요청 스케줄러를 거쳐 실행 (동기 함수는 워커 스레드, 코루틴 함수는 이벤트 루프)"""
+    return await get_request_scheduler().submit(fn, *args, kind=kind, cost=cost, **kwargs)
+
+async def generate_structured_response_scheduled(
+    system_prompt: str,
+    user_prompt: str,
+    response_schema: Dict[str, Any],
+    **kwargs
+) -> Dict[str, Any]:
+    """generate_structured_response의 스케줄링 버전 (이벤트 루프를 막지 않음)"""
+    cost = estimate_llm_cost(
+        f"{system_prompt}\n{user_prompt}\n{json.dumps(response_schema, ensure_ascii=False)}",
+        get_token_budgeter().cap(kwargs.get("stage", "default"))
+    )
+    fn = agenerate_structured_response if backend_supports_async() else generate_structured_response
+    return await run_scheduled(
+        fn,
+        system_prompt, user_prompt, response_schema,
+        kind="llm", cost=cost, **kwargs
+    )
+
+async def generate_text_scheduled(
+    messages: List[Dict[str, str]],
+    stage: str = "default",
+    **generate_kwargs
+) -> GenerationResult:
+    """자유 형식 chat 생성의 스케줄링 버전"""
+    prompt_text = "\n".join(message["content"] for message in messages)
+    cost = estimate_llm_cost(prompt_text, generate_kwargs.get("max_tokens", 2048))
+    fn = arun_llm_generate if backend_supports_async() else run_llm_generate
+    return await run_scheduled(fn, messages, kind="llm", cost=cost, stage=stage, **generate_kwargs)
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """앱 시작/종료 시 모델 로딩/정리"""
@@ -500,7 +681,17 @@ async def lifespan(app: FastAPI):
     preload_enabled = os.getenv("PRELOAD_MODELS", "true").lower() == "true"
     logger.info(f"🔧 Model preloading: {'Enabled' if preload_enabled else 'Disabled'}")
     
-    if preload_enabled:
+    if is_model_host_client():
+        # 엔진은 모델 호스트가 로딩 → 워커는 호스트 연결만 확인
+        logger.info(f"🔗 Using model host: {os.getenv('MODEL_HOST_SOCKET')}")
+        try:
+            await asyncio.get_event_loop().run_in_executor(
+                None, get_model_host_client().wait_until_ready, float(os.getenv("MODEL_HOST_CONNECT_TIMEOUT", "600"))
+            )
+            logger.info("✅ Model host connected")
+        except Exception as e:
+            logger.error(f"❌ Model host connection failed: {e}")
+    elif preload_enabled:
         try:
             logger.info("📦 Starting parallel model preloading...")
             import asyncio
@@ -574,6 +765,14 @@ async def lifespan(app: FastAPI):
     yield
     
     logger.info("🛑 Shutting down TtalKkak Final AI Server...")
+    
+    # LLM 백엔드 연결 정리 (HTTP 백엔드의 연결 풀 등)
+    llm_backend = get_loaded_llm_backend()
+    if llm_backend is not None:
+        if hasattr(llm_backend, "aclose"):
+            await llm_backend.aclose()
+        else:
+            llm_backend.close()
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -592,6 +791,63 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+def build_request_context(headers) -> RequestContext:
+    """요청 헤더 → 스케줄링 컨텍스트 (X-Priority, X-Tenant-Id, X-Deadline-Ms)"""
+    deadline_ms = headers.get("x-deadline-ms")
+    return RequestContext(
+        priority=Priority.parse(headers.get("x-priority")),
+        tenant_id=headers.get("x-tenant-id") or "default",
+        deadline=time.monotonic() + float(deadline_ms) / 1000.0 if deadline_ms else None
+    )
+
+@app.middleware("http")
+async def scheduling_context_middleware(request: Request, call_next):
+    """요청별 우선순위/테넌트/데드라인 설정"""
+    try:
+        ctx = build_request_context(request.headers)
+    except ValueError as e:
+        return JSONResponse(status_code=400, content={"success": False, "error": str(e)})
+    current_request_context.set(ctx)
+    
+    # 종단 간 처리 시간 (등록된 경로만 레이블로 사용해 카디널리티 제한)
+    path = request.url.path
+    endpoint = path if any(getattr(route, "path", None) == path for route in app.routes) else "other"
+    start_time = time.perf_counter()
+    response = await call_next(request)
+    if endpoint != "/metrics":
+        observe("request_seconds", time.perf_counter() - start_time, endpoint=endpoint, status=str(response.status_code))
+    return response
+
+@app.middleware("http")
+async def profiling_middleware(request: Request, call_next):
+    """?profile=1 또는 X-Profile 헤더 요청에 구간 트리 첨부 (profile=chrome이면 Chrome trace 형식)"""
+    mode = request.query_params.get("profile") or request.headers.get("x-profile")
+    if not mode or mode.lower() in ("0", "false"):
+        return await call_next(request)
+    
+    with profile_request(request.url.path, method=request.method) as root:
+        response = await call_next(request)
+        body = b"".join([chunk async for chunk in response.body_iterator])
+    
+    headers = {k: v for k, v in response.headers.items() if k.lower() != "content-length"}
+    if response.headers.get("content-type", "").startswith("application/json"):
+        payload = json.loads(body)
+        if isinstance(payload, dict):
+            payload["profile"] = to_chrome_trace(root) if mode.lower() == "chrome" else root.to_dict()
+            return JSONResponse(content=payload, status_code=response.status_code, headers=headers)
+    return Response(content=body, status_code=response.status_code, headers=headers)
+
+@app.exception_handler(AdmissionRejected)
+async def admission_rejected_handler(request: Request, exc: AdmissionRejected):
+    """입장 거절 → 429 (대기열 초과) / 503 (데드라인 충족 불가)"""
+    headers = {"Retry-After": str(int(exc.retry_after) + 1)} if exc.retry_after is not None else None
+    logger.warning(f"🚦 요청 거절 ({exc.status_code}): {exc.reason}")
+    return JSONResponse(
+        status_code=exc.status_code,
+        content={"success": False, "error": exc.reason},
+        headers=headers
+    )
+
 @app.get("/")
 async def root():
     """루트 엔드포인트"""
@@ -605,7 +861,9 @@ async def root():
             "2-Stage PRD Process",
             "Notion Project Generation", 
             "Task Master PRD Format",
-            "Advanced Task Generation"
+            "Advanced Task Generation",
+            "Realtime Meeting Mode (WebSocket /ws/meeting)",
+            "Priority Scheduling & Admission Control"
         ],
         "workflow": "회의록 → Triplet 필터링 → 기획안 → Task Master PRD → 업무생성",
         "docs": "/docs"
@@ -628,51 +886,95 @@ async def health_check():
         except:
             pass
     
+    models_loaded = {
+        "whisperx": is_whisperx_loaded(),
+        "qwen3": get_loaded_llm_backend() is not None,
+        "triplet_bert": TRIPLET_AVAILABLE
+    }
+    
+    # 모델 호스트 모드: 엔진은 호스트 프로세스가 소유
+    if is_model_host_client():
+        try:
+            host_statuses = await asyncio.get_event_loop().run_in_executor(None, get_model_host_client().status)
+            for key in ("whisperx", "qwen3"):
+                models_loaded[key] = all(status.get("models_loaded", {}).get(key, False) for status in host_statuses)
+        except Exception as e:
+            logger.warning(f"⚠️ 모델 호스트 상태 조회 실패: {e}")
+            models_loaded["whisperx"] = models_loaded["qwen3"] = False
+    
     return HealthResponse(
         status="healthy",
         gpu_available=gpu_available,
         gpu_count=gpu_count,
-        models_loaded={
-            "whisperx": whisper_model is not None,
-            "qwen3": qwen_model is not None,
-            "triplet_bert": TRIPLET_AVAILABLE
-        },
+        models_loaded=models_loaded,
         memory_info=memory_info
     )
 
+@app.get("/scheduler/stats")
+async def scheduler_stats():
+    """요청 스케줄러 대기열 지표 (오토스케일링용)"""
+    return get_request_scheduler().get_stats()
+
+@app.get("/token-budget/stats")
+async def token_budget_stats():
+    """단계별 출력 길이 분포와 max_tokens 예산 현황"""
+    return get_token_budgeter().get_stats()
+
+@app.get("/speculative/stats")
+async def speculative_stats():
+    """추측 디코딩 설정과 초안 수락률"""
+    backend = get_loaded_llm_backend()
+    if backend is None:
+        return {"enabled": False, "loaded": False}
+    stats = await asyncio.get_event_loop().run_in_executor(None, backend.spec_decode_stats)
+    return stats or {"enabled": False}
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus 스크레이프 엔드포인트"""
+    backend = get_loaded_llm_backend()
+    if backend is not None:
+        # 엔진/서빙 서버의 누적 수락 토큰을 메트릭에 반영
+        try:
+            await asyncio.get_event_loop().run_in_executor(None, backend.spec_decode_stats)
+        except Exception as e:
+            logger.debug(f"추측 디코딩 통계 갱신 실패: {e}")
+    stats = get_request_scheduler().get_stats()
+    for priority, depth in stats["queue_depth"].items():
+        set_gauge("scheduler_queue_depth", depth, priority=priority)
+    set_gauge("scheduler_running", stats["running"])
+    # 모델 호스트 모드: 전사/BERT/배치 지표는 호스트 프로세스에서 기록됨 → source="model_host" 레이블로 함께 노출
+    remote = []
+    if is_model_host_client():
+        remote = await asyncio.get_event_loop().run_in_executor(None, get_model_host_client().metrics)
+    return PlainTextResponse(render_metrics(remote), media_type="text/plain; version=0.0.4")
+
 @app.post("/transcribe", response_model=TranscriptionResponse)
 async def transcribe_audio(audio: UploadFile = File(...)):
     """음성 파일 전사 (WhisperX)"""
     try:
         logger.info(f"🎤 Transcribing audio: {audio.filename}")
         
-        # 모델 로딩
-        whisper_model = load_whisperx()
-        
         # 오디오 파일 임시 저장
-        audio_content = await audio.read()
-        
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-            temp_file.write(audio_content)
-            temp_path = temp_file.name
+        with span("upload_spool", track_cpu=False, filename=audio.filename):
+            audio_content = await audio.read()
+            
+            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
+                temp_file.write(audio_content)
+                temp_path = temp_file.name
+            add_span_attrs(bytes=len(audio_content))
         
         try:
             # WhisperX 전사 실행
-            result = whisper_model.transcribe(temp_path, batch_size=16)
-            
-            segments = result.get("segments", [])
-            full_text = " ".join([seg.get("text", "") for seg in segments])
+            transcription = await run_scheduled(
+                whisperx_transcribe, temp_path, kind="asr", cost=len(audio_content)
+            )
             
-            logger.info(f"✅ Transcription completed: {len(full_text)} characters")
+            logger.info(f"✅ Transcription completed: {len(transcription['full_text'])} characters")
             
             return TranscriptionResponse(
                 success=True,
-                transcription={
-                    "segments": segments,
-                    "full_text": full_text,
-                    "language": result.get("language", "ko"),
-                    "duration": sum([seg.get("end", 0) - seg.get("start", 0) for seg in segments])
-                }
+                transcription=transcription
             )
             
         finally:
@@ -682,6 +984,8 @@ async def transcribe_audio(audio: UploadFile = File(...)):
             except:
                 pass
                 
+    except AdmissionRejected:
+        raise
     except Exception as e:
         logger.error(f"❌ Transcription error: {e}")
         return TranscriptionResponse(
@@ -712,7 +1016,10 @@ async def transcribe_audio_enhanced(
             try:
                 triplet_processor = get_triplet_processor()
                 
-                enhanced_result = triplet_processor.process_whisperx_result(
+                enhanced_result = await run_scheduled(
+                    triplet_processor.process_whisperx_result,
+                    kind="bert",
+                    cost=len(basic_result.transcription["full_text"]),
                     whisperx_result=basic_result.transcription,
                     enable_bert_filtering=enable_bert_filtering,
                     save_noise_log=save_noise_log
@@ -730,6 +1037,8 @@ async def transcribe_audio_enhanced(
                     )
                 else:
                     logger.warning("⚠️ Triplet processing failed, using basic transcription")
+            except AdmissionRejected:
+                raise
             except Exception as e:
                 logger.warning(f"⚠️ Triplet processing error: {e}")
         
@@ -741,6 +1050,8 @@ async def transcribe_audio_enhanced(
             processing_stats={"triplet_available": TRIPLET_AVAILABLE}
         )
         
+    except AdmissionRejected:
+        raise
     except Exception as e:
         logger.error(f"❌ Enhanced transcription error: {e}")
         return EnhancedTranscriptionResponse(
@@ -759,11 +1070,12 @@ async def generate_notion_project(request: AnalysisRequest):
         user_prompt = generate_notion_project_prompt(request.transcript)
         
         # 구조화된 응답 생성
-        result = generate_structured_response(
+        result = await generate_structured_response_scheduled(
             system_prompt=system_prompt,
             user_prompt=user_prompt,
             response_schema=NOTION_PROJECT_SCHEMA,
-            temperature=0.3
+            temperature=0.3,
+            stage="notion"
         )
         
         if "error" in result:
@@ -773,10 +1085,12 @@ async def generate_notion_project(request: AnalysisRequest):
             )
         
         # 데이터 검증
-        validated_result = validate_notion_project(result)
+        with span("validate", stage="notion"):
+            validated_result = validate_notion_project(result)
         
         # 노션 형식으로 포맷팅
-        formatted_notion = format_notion_project(validated_result)
+        with span("format", stage="notion"):
+            formatted_notion = format_notion_project(validated_result)
         
         logger.info("✅ Stage 1 completed: Notion project generated")
         
@@ -786,6 +1100,8 @@ async def generate_notion_project(request: AnalysisRequest):
             formatted_notion=formatted_notion
         )
         
+    except AdmissionRejected:
+        raise
     except Exception as e:
         logger.error(f"❌ Notion project generation error: {e}")
         return NotionProjectResponse(
@@ -804,11 +1120,12 @@ async def generate_task_master_prd(notion_project: Dict[str, Any]):
         user_prompt = generate_task_master_prd_prompt(notion_project)
         
         # 구조화된 응답 생성
-        result = generate_structured_response(
+        result = await generate_structured_response_scheduled(
             system_prompt=system_prompt,
             user_prompt=user_prompt,
             response_schema=TASK_MASTER_PRD_SCHEMA,
-            temperature=0.3
+            temperature=0.3,
+            stage="prd"
         )
         
         if "error" in result:
@@ -818,10 +1135,12 @@ async def generate_task_master_prd(notion_project: Dict[str, Any]):
             )
         
         # 데이터 검증
-        validated_result = validate_task_master_prd(result)
+        with span("validate", stage="prd"):
+            validated_result = validate_task_master_prd(result)
         
         # Task Master PRD 형식으로 포맷팅
-        formatted_prd = format_task_master_prd(validated_result)
+        with span("format", stage="prd"):
+            formatted_prd = format_task_master_prd(validated_result)
         
         logger.info("✅ Stage 2 completed: Task Master PRD generated")
         
@@ -831,6 +1150,8 @@ async def generate_task_master_prd(notion_project: Dict[str, Any]):
             formatted_prd=formatted_prd
         )
         
+    except AdmissionRejected:
+        raise
     except Exception as e:
         logger.error(f"❌ Task Master PRD generation error: {e}")
         return TaskMasterPRDResponse(
@@ -838,6 +1159,53 @@ async def generate_task_master_prd(notion_project: Dict[str, Any]):
             error=str(e)
         )
 
+def build_meeting_analysis_result(
+    validated_result: Dict[str, Any],
+    processing_time: float,
+    process_type: str
+) -> MeetingAnalysisResult:
+    """validate_meeting_analysis 결과 → TaskItem 기반 MeetingAnalysisResult"""
+    # TaskItem 객체로 변환
+    task_items = []
+    for i, item in enumerate(validated_result.get("action_items", [])):
+        task_item = TaskItem(
+            id=i + 1,
+            title=item.get("task", f"Task {i+1}"),
+            description=item.get("task", ""),
+            priority=item.get("priority", "medium"),
+            assignee=item.get("assignee", "미지정"),
+            deadline=item.get("deadline", "미정"),
+            complexity=calculate_task_complexity_advanced(
+                TaskItem(
+                    id=i + 1,
+                    title=item.get("task", ""),
+                    description=item.get("task", ""),
+                    priority=item.get("priority", "medium")
+                )
+            ),
+            status="pending"
+        )
+        task_items.append(task_item)
+    
+    # 의존성 검증
+    task_items = validate_task_dependencies(task_items)
+    
+    # 최종 결과 구성
+    return MeetingAnalysisResult(
+        summary=validated_result.get("summary", ""),
+        action_items=task_items,
+        decisions=validated_result.get("decisions", []),
+        next_steps=validated_result.get("next_steps", []),
+        key_points=validated_result.get("key_points", []),
+        participants=validated_result.get("participants", []),
+        follow_up=validated_result.get("follow_up", {}),
+        metadata={
+            "processing_time": processing_time,
+            "total_tasks": len(task_items),
+            "process_type": process_type
+        }
+    )
+
 @app.post("/two-stage-analysis", response_model=TwoStageAnalysisResponse)
 async def two_stage_analysis(request: TwoStageAnalysisRequest):
     """2단계 프로세스 통합 분석"""
@@ -894,55 +1262,22 @@ async def two_stage_analysis(request: TwoStageAnalysisRequest):
             Task Master의 프롬프트 엔지니어링을 적용하여 체계적이고 실행 가능한 태스크를 생성하세요.
             """
             
-            result = generate_structured_response(
+            result = await generate_structured_response_scheduled(
                 system_prompt=system_prompt,
                 user_prompt=user_prompt,
                 response_schema=TASK_SCHEMA_EXAMPLE,
-                temperature=0.3
+                temperature=0.3,
+                stage="tasks"
             )
             
             # 결과 후처리
-            validated_result = validate_meeting_analysis(result)
+            with span("validate", stage="tasks"):
+                validated_result = validate_meeting_analysis(result)
             
-            # TaskItem 객체로 변환
-            task_items = []
-            for i, item in enumerate(validated_result.get("action_items", [])):
-                task_item = TaskItem(
-                    id=i + 1,
-                    title=item.get("task", f"Task {i+1}"),
-                    description=item.get("task", ""),
-                    priority=item.get("priority", "medium"),
-                    assignee=item.get("assignee", "미지정"),
-                    deadline=item.get("deadline", "미정"),
-                    complexity=calculate_task_complexity_advanced(
-                        TaskItem(
-                            id=i + 1,
-                            title=item.get("task", ""),
-                            description=item.get("task", ""),
-                            priority=item.get("priority", "medium")
-                        )
-                    ),
-                    status="pending"
-                )
-                task_items.append(task_item)
-            
-            # 의존성 검증
-            task_items = validate_task_dependencies(task_items)
-            
-            # 최종 결과 구성
-            stage3_result = MeetingAnalysisResult(
-                summary=validated_result.get("summary", ""),
-                action_items=task_items,
-                decisions=validated_result.get("decisions", []),
-                next_steps=validated_result.get("next_steps", []),
-                key_points=validated_result.get("key_points", []),
-                participants=validated_result.get("participants", []),
-                follow_up=validated_result.get("follow_up", {}),
-                metadata={
-                    "processing_time": time.time() - start_time,
-                    "total_tasks": len(task_items),
-                    "process_type": "2-stage-task-master"
-                }
+            stage3_result = build_meeting_analysis_result(
+                validated_result,
+                processing_time=time.time() - start_time,
+                process_type="2-stage-task-master"
             )
         
         total_time = time.time() - start_time
@@ -957,6 +1292,8 @@ async def two_stage_analysis(request: TwoStageAnalysisRequest):
             processing_time=total_time
         )
         
+    except AdmissionRejected:
+        raise
     except Exception as e:
         logger.error(f"❌ 2-stage analysis error: {e}")
         return TwoStageAnalysisResponse(
@@ -970,15 +1307,13 @@ async def enhanced_two_stage_pipeline_text(request: dict):
     try:
         logger.info("🚀 Starting text-based 2-stage pipeline...")
         
+        start_time = time.time()
         transcript = request.get("transcript", "")
         if not transcript:
             raise ValueError("transcript가 필요합니다")
             
         enable_bert_filtering = request.get("enable_bert_filtering", True)
         
-        # VLLM 사용 여부 확인
-        use_vllm = os.getenv("USE_VLLM", "true").lower() == "true"
-        
         # 텍스트를 직접 처리하여 Triplet 생성 및 필터링
         if TRIPLET_AVAILABLE and enable_bert_filtering:
             try:
@@ -990,7 +1325,10 @@ async def enhanced_two_stage_pipeline_text(request: dict):
                     "language": "ko"
                 }
                 
-                enhanced_result = triplet_processor.process_whisperx_result(
+                enhanced_result = await run_scheduled(
+                    triplet_processor.process_whisperx_result,
+                    kind="bert",
+                    cost=len(transcript),
                     whisperx_result=mock_whisperx_result,
                     enable_bert_filtering=enable_bert_filtering,
                     save_noise_log=False
@@ -1005,6 +1343,8 @@ async def enhanced_two_stage_pipeline_text(request: dict):
                     triplet_stats = {}
                     classification_stats = {}
                     
+            except AdmissionRejected:
+                raise
             except Exception as e:
                 logger.warning(f"Triplet 처리 실패, 원본 텍스트 사용: {e}")
                 filtered_transcript = transcript
@@ -1015,40 +1355,85 @@ async def enhanced_two_stage_pipeline_text(request: dict):
             triplet_stats = {}
             classification_stats = {}
         
+        # 단일 호출 모드: 기획안/PRD/업무를 한 번의 생성으로 출력 (회의록 프리필 1회)
+        # 청킹이 필요한 긴 회의록이나 복합 응답 파싱 실패 시에는 아래 3단계 호출로 처리
+        if request.get("fused", False):
+            fused_system_prompt = generate_fused_pipeline_system_prompt(request.get("num_tasks", 5))
+            fused_user_prompt = generate_fused_pipeline_user_prompt(filtered_transcript)
+            if get_chunking_processor_if_needed(fused_system_prompt, fused_user_prompt, 28000) is None:
+                fused_result = await generate_structured_response_scheduled(
+                    system_prompt=fused_system_prompt,
+                    user_prompt=fused_user_prompt,
+                    response_schema=FUSED_PIPELINE_SCHEMA,
+                    temperature=0.3,
+                    enable_chunking=False,
+                    stage="fused"
+                )
+                try:
+                    with span("validate", stage="fused"):
+                        stage1_notion, stage2_prd, validated_tasks = split_fused_result(fused_result)
+                except ValueError as e:
+                    logger.warning(f"⚠️ 단일 호출 결과 사용 불가, 3단계 호출로 전환: {e}")
+                else:
+                    stage3_tasks = build_meeting_analysis_result(
+                        validated_tasks,
+                        processing_time=time.time() - start_time,
+                        process_type="fused"
+                    )
+                    if not request.get("generate_notion", True):
+                        stage1_notion = None
+                    if not request.get("generate_prd", True):
+                        stage2_prd = None
+                    if not request.get("generate_tasks", True):
+                        stage3_tasks = None
+                    
+                    return EnhancedTwoStageResult(
+                        success=True,
+                        triplet_stats=triplet_stats,
+                        classification_stats=classification_stats,
+                        stage1_notion=stage1_notion,
+                        stage2_prd=stage2_prd,
+                        stage3_tasks=stage3_tasks,
+                        formatted_notion=format_notion_project(stage1_notion) if stage1_notion else None,
+                        formatted_prd=format_task_master_prd(stage2_prd) if stage2_prd else None,
+                        original_transcript_length=len(transcript),
+                        filtered_transcript_length=len(filtered_transcript),
+                        noise_reduction_ratio=1.0 - (len(filtered_transcript) / len(transcript)) if transcript else 0,
+                        processing_time=time.time() - start_time
+                    )
+            else:
+                logger.info("🔄 회의록이 길어 단일 호출 대신 3단계 호출로 처리")
+        
         # Stage 1: Notion 프로젝트 생성
         stage1_notion = None
         if request.get("generate_notion", True):
             try:
                 # 기존 generate_notion_project 함수 로직 사용
-                system_prompt = generate_notion_project_prompt()
-                user_prompt = f"다음 회의록을 바탕으로 노션 기획안을 작성해주세요:\n\n{filtered_transcript}"
+                system_prompt = "당신은 회의록을 분석하여 체계적인 프로젝트 기획안을 작성하는 전문가입니다."
+                user_prompt = generate_notion_project_prompt(filtered_transcript)
                 
-                if use_vllm and qwen_model and qwen_tokenizer:
-                    from vllm import SamplingParams
-                    sampling_params = SamplingParams(
-                        temperature=0.3,
-                        max_tokens=2048,
-                        stop=["<|im_end|>", "<|endoftext|>"]
-                    )
-                    
-                    messages = [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ]
-                    
-                    formatted_prompt = qwen_tokenizer.apply_chat_template(
-                        messages, tokenize=False, add_generation_prompt=True
-                    )
-                    
-                    outputs = qwen_model.generate([formatted_prompt], sampling_params)
-                    result_text = outputs[0].outputs[0].text.strip()
-                    
-                    try:
-                        import json
-                        stage1_notion = json.loads(result_text)
-                    except:
-                        stage1_notion = {"title": "AI 프로젝트", "overview": result_text}
+                messages = [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ]
+                
+                result = await generate_text_scheduled(
+                    messages,
+                    stage="notion",
+                    temperature=0.3,
+                    stop=["<|im_end|>", "<|endoftext|>"],
+                    json_mode=True
+                )
+                result_text = result.text.strip()
+                
+                try:
+                    stage1_notion = json.loads(result_text)
+                except:
+                    inc("json_parse_failures_total", stage="notion")
+                    stage1_notion = {"title": "AI 프로젝트", "overview": result_text}
                         
+            except AdmissionRejected:
+                raise
             except Exception as e:
                 logger.error(f"Notion 생성 실패: {e}")
                 stage1_notion = None
@@ -1057,34 +1442,31 @@ async def enhanced_two_stage_pipeline_text(request: dict):
         stage2_prd = None
         if stage1_notion and request.get("generate_prd", True):
             try:
-                system_prompt = generate_task_master_prd_prompt()
-                user_prompt = f"다음 노션 프로젝트를 바탕으로 Task Master PRD를 작성해주세요:\n\n{json.dumps(stage1_notion, ensure_ascii=False, indent=2)}"
+                system_prompt = generate_task_master_prd_prompt(stage1_notion)
+                user_prompt = f"다음 노션 프로젝트를 바탕으로 Task Master PRD를 작성해주세요:\n\n{serialize_stage_output(stage1_notion, stage='prd', key_order=NOTION_PROJECT_SCHEMA)}"
                 
-                if use_vllm and qwen_model and qwen_tokenizer:
-                    from vllm import SamplingParams
-                    sampling_params = SamplingParams(
-                        temperature=0.3,
-                        max_tokens=2048,
-                        stop=["<|im_end|>", "<|endoftext|>"]
-                    )
-                    
-                    messages = [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ]
-                    
-                    formatted_prompt = qwen_tokenizer.apply_chat_template(
-                        messages, tokenize=False, add_generation_prompt=True
-                    )
-                    
-                    outputs = qwen_model.generate([formatted_prompt], sampling_params)
-                    result_text = outputs[0].outputs[0].text.strip()
-                    
-                    try:
-                        stage2_prd = json.loads(result_text)
-                    except:
-                        stage2_prd = {"title": "PRD", "overview": result_text}
+                messages = [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ]
+                
+                result = await generate_text_scheduled(
+                    messages,
+                    stage="prd",
+                    temperature=0.3,
+                    stop=["<|im_end|>", "<|endoftext|>"],
+                    json_mode=True
+                )
+                result_text = result.text.strip()
+                
+                try:
+                    stage2_prd = json.loads(result_text)
+                except:
+                    inc("json_parse_failures_total", stage="prd")
+                    stage2_prd = {"title": "PRD", "overview": result_text}
                         
+            except AdmissionRejected:
+                raise
             except Exception as e:
                 logger.error(f"PRD 생성 실패: {e}")
                 stage2_prd = None
@@ -1093,34 +1475,31 @@ async def enhanced_two_stage_pipeline_text(request: dict):
         stage3_tasks = None
         if stage2_prd and request.get("generate_tasks", True):
             try:
-                system_prompt = generate_meeting_analysis_system_prompt()
-                user_prompt = f"다음 PRD를 바탕으로 업무 태스크들을 생성해주세요:\n\n{json.dumps(stage2_prd, ensure_ascii=False, indent=2)}"
+                system_prompt = generate_meeting_analysis_system_prompt(request.get("num_tasks", 5))
+                user_prompt = f"다음 PRD를 바탕으로 업무 태스크들을 생성해주세요:\n\n{serialize_stage_output(stage2_prd, stage='tasks', key_order=TASK_MASTER_PRD_SCHEMA)}"
                 
-                if use_vllm and qwen_model and qwen_tokenizer:
-                    from vllm import SamplingParams
-                    sampling_params = SamplingParams(
-                        temperature=0.3,
-                        max_tokens=2048,
-                        stop=["<|im_end|>", "<|endoftext|>"]
-                    )
-                    
-                    messages = [
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt}
-                    ]
-                    
-                    formatted_prompt = qwen_tokenizer.apply_chat_template(
-                        messages, tokenize=False, add_generation_prompt=True
-                    )
-                    
-                    outputs = qwen_model.generate([formatted_prompt], sampling_params)
-                    result_text = outputs[0].outputs[0].text.strip()
-                    
-                    try:
-                        stage3_tasks = json.loads(result_text)
-                    except:
-                        stage3_tasks = {"action_items": []}
+                messages = [
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": user_prompt}
+                ]
+                
+                result = await generate_text_scheduled(
+                    messages,
+                    stage="tasks",
+                    temperature=0.3,
+                    stop=["<|im_end|>", "<|endoftext|>"],
+                    json_mode=True
+                )
+                result_text = result.text.strip()
+                
+                try:
+                    stage3_tasks = json.loads(result_text)
+                except:
+                    inc("json_parse_failures_total", stage="tasks")
+                    stage3_tasks = {"action_items": []}
                         
+            except AdmissionRejected:
+                raise
             except Exception as e:
                 logger.error(f"업무 생성 실패: {e}")
                 stage3_tasks = None
@@ -1137,9 +1516,11 @@ async def enhanced_two_stage_pipeline_text(request: dict):
             original_transcript_length=len(transcript),
             filtered_transcript_length=len(filtered_transcript),
             noise_reduction_ratio=1.0 - (len(filtered_transcript) / len(transcript)) if transcript else 0,
-            processing_time=time.time() - time.time()
+            processing_time=time.time() - start_time
         )
         
+    except AdmissionRejected:
+        raise
     except Exception as e:
         logger.error(f"❌ Text-based 2-stage pipeline error: {e}")
         return EnhancedTwoStageResult(
@@ -1231,6 +1612,8 @@ async def enhanced_two_stage_pipeline(
             processing_time=total_time
         )
         
+    except AdmissionRejected:
+        raise
     except Exception as e:
         logger.error(f"❌ Enhanced 2-stage pipeline error: {e}")
         return EnhancedTwoStageResult(
@@ -1265,7 +1648,10 @@ async def final_pipeline(
                         "language": "ko"
                     }
                     
-                    enhanced_result = triplet_processor.process_whisperx_result(
+                    enhanced_result = await run_scheduled(
+                        triplet_processor.process_whisperx_result,
+                        kind="bert",
+                        cost=len(transcript),
                         whisperx_result=mock_whisperx_result,
                         enable_bert_filtering=True,
                         save_noise_log=False
@@ -1277,6 +1663,8 @@ async def final_pipeline(
                     else:
                         full_text = transcript
                         logger.warning("BERT filtering failed, using original text")
+                except AdmissionRejected:
+                    raise
                 except Exception as e:
                     logger.warning(f"BERT filtering error: {e}, using original text")
                     full_text = transcript
@@ -1298,7 +1686,10 @@ async def final_pipeline(
             if TRIPLET_AVAILABLE:
                 try:
                     triplet_processor = get_triplet_processor()
-                    enhanced_result = triplet_processor.process_whisperx_result(
+                    enhanced_result = await run_scheduled(
+                        triplet_processor.process_whisperx_result,
+                        kind="bert",
+                        cost=len(raw_text),
                         whisperx_result=transcribe_result.transcription,
                         enable_bert_filtering=True,
                         save_noise_log=False
@@ -1310,6 +1701,8 @@ async def final_pipeline(
                     else:
                         full_text = raw_text
                         logger.warning("BERT filtering failed on audio, using original transcription")
+                except AdmissionRejected:
+                    raise
                 except Exception as e:
                     logger.warning(f"BERT filtering error on audio: {e}, using original transcription")
                     full_text = raw_text
@@ -1354,6 +1747,8 @@ async def final_pipeline(
             }
         }
         
+    except AdmissionRejected:
+        raise
     except Exception as e:
         logger.error(f"❌ Final pipeline error: {e}")
         return {
@@ -1362,6 +1757,192 @@ async def final_pipeline(
             "error": str(e)
         }
 
+@app.websocket("/ws/meeting")
+async def realtime_meeting(websocket: WebSocket):
+    """🎙️ 실시간 회의 모드: PCM 스트림 → 증분 전사 → Triplet 필터링 → 롤링 요약 → 종료 시 최종 분석
+    
+    프로토콜:
+    - 클라이언트 → 서버 (binary): 16kHz mono 16-bit little-endian PCM 프레임
+    - 클라이언트 → 서버 (text): {"type": "start", ...설정} / {"type": "end"}
+    - 서버 → 클라이언트 (text): ready / utterances / filtered / rolling_summary / final / error
+    """
+    await websocket.accept()
+    loop = asyncio.get_event_loop()
+    scheduler = get_request_scheduler()
+    
+    try:
+        request_context = build_request_context(websocket.headers)
+    except ValueError as e:
+        await websocket.send_json({"type": "error", "error": str(e)})
+        await websocket.close()
+        return
+    current_request_context.set(request_context)
+    
+    options = {"num_tasks": 5, "generate_notion": True, "generate_tasks": True}
+    session = None
+    audio_ready = asyncio.Event()
+    ended = False
+    
+    def create_session(start_message: Dict[str, Any]) -> RealtimeMeetingSession:
+        config = RealtimeConfig(
+            sample_rate=int(start_message.get("sample_rate", 16000)),
+            window_seconds=float(start_message.get("window_seconds", 30.0)),
+            step_seconds=float(start_message.get("step_seconds", 5.0)),
+            summary_every_utterances=int(start_message.get("summary_every_utterances", 12)),
+            enable_bert_filtering=bool(start_message.get("enable_bert_filtering", True))
+        )
+        if config.sample_rate != 16000:
+            raise ValueError("sample_rate는 16000만 지원합니다 (WhisperX 입력 형식)")
+        
+        # 세션 처리는 워커 스레드에서 실행되므로 스케줄러에는 이벤트 루프를 통해 제출
+        def scheduled_transcribe(audio):
+            return scheduler.run_from_thread(
+                loop, whisperx_transcribe, audio,
+                kind="asr", cost=audio.nbytes // 2, ctx=request_context
+            )
+        
+        def scheduled_generate(system_prompt, user_prompt, response_schema, **kwargs):
+            cost = estimate_llm_cost(f"{system_prompt}\n{user_prompt}")
+            return scheduler.run_from_thread(
+                loop, generate_structured_response, system_prompt, user_prompt, response_schema,
+                kind="llm", cost=cost, ctx=request_context, **kwargs
+            )
+        
+        return RealtimeMeetingSession(
+            transcribe_fn=scheduled_transcribe,
+            generate_fn=scheduled_generate,
+            triplet_processor=get_triplet_processor() if TRIPLET_AVAILABLE else None,
+            config=config
+        )
+    
+    async def send_events(events: List[Dict[str, Any]]):
+        for event in events:
+            await websocket.send_json(event)
+    
+    async def process_loop():
+        # 수신과 분리된 처리 루프 (전사/분류/요약은 워커 스레드에서 실행)
+        while not ended:
+            await audio_ready.wait()
+            audio_ready.clear()
+            if session is not None and session.ready_for_transcription():
+                try:
+                    events = await loop.run_in_executor(None, session.process_pending)
+                except AdmissionRejected as e:
+                    # 처리되지 않은 오디오/발화는 세션에 남아 다음 주기에 재시도됨
+                    await websocket.send_json({"type": "error", "error": e.reason, "retryable": True})
+                    continue
+                except Exception as e:
+                    # 전사/분류/요약 실패로 루프가 끝나면 이후 오디오가 쌓이기만 하고 종료 시 최종 분석도 실패
+                    # → 이번 주기만 오류로 알리고 계속 처리 (남은 오디오는 다음 주기나 finish()에서 다시 처리)
+                    logger.error(f"❌ 실시간 처리 실패: {e}")
+                    await websocket.send_json({"type": "error", "error": str(e), "retryable": True})
+                    continue
+                await send_events(events)
+    
+    processor_task = None
+    
+    try:
+        while True:
+            message = await websocket.receive()
+            
+            if message.get("type") == "websocket.disconnect":
+                logger.info("🔌 실시간 회의 연결 종료 (클라이언트)")
+                break
+            
+            if message.get("bytes"):
+                if session is None:
+                    session = create_session({})
+                    processor_task = asyncio.create_task(process_loop())
+                session.add_audio(message["bytes"])
+                if session.ready_for_transcription():
+                    audio_ready.set()
+                continue
+            
+            if not message.get("text"):
+                continue
+            
+            control = json.loads(message["text"])
+            
+            if control.get("type") == "start":
+                if session is not None:
+                    await websocket.send_json({"type": "error", "error": "세션이 이미 시작되었습니다"})
+                    continue
+                options.update({k: control[k] for k in options if k in control})
+                session = create_session(control)
+                processor_task = asyncio.create_task(process_loop())
+                logger.info("🎙️ 실시간 회의 세션 시작")
+                await websocket.send_json({"type": "ready"})
+            
+            elif control.get("type") == "end":
+                logger.info("🏁 실시간 회의 종료 요청, 최종 분석 시작...")
+                ended = True
+                audio_ready.set()
+                if processor_task is not None:
+                    await processor_task
+                
+                if session is None:
+                    await websocket.send_json({"type": "error", "error": "수신된 오디오가 없습니다"})
+                    break
+                
+                start_time = time.time()
+                events = await loop.run_in_executor(None, session.finish)
+                await send_events(events)
+                
+                # 이미 필터링/요약된 결과로 최종 분석 → 업로드 후 배치 처리보다 훨씬 짧은 입력
+                try:
+                    from chunking_processor import get_chunking_processor
+                    chunking_processor = get_chunking_processor(max_context_tokens=32768)
+                except ImportError:
+                    chunking_processor = None
+                
+                analysis_request = TwoStageAnalysisRequest(
+                    transcript=session.build_condensed_transcript(chunking_processor),
+                    generate_notion=options["generate_notion"],
+                    generate_tasks=options["generate_tasks"],
+                    num_tasks=options["num_tasks"]
+                )
+                analysis_result = await two_stage_analysis(analysis_request)
+                
+                await websocket.send_json({
+                    "type": "final",
+                    "result": {
+                        "success": analysis_result.success,
+                        "error": analysis_result.error,
+                        "rolling_summary": session.state,
+                        "filtered_transcript": session.filtered_transcript,
+                        "notion_project": analysis_result.stage1_notion,
+                        "task_master_prd": analysis_result.stage2_prd,
+                        "generated_tasks": jsonable_encoder(analysis_result.stage3_tasks) if analysis_result.stage3_tasks else None,
+                        "formatted_notion": analysis_result.formatted_notion,
+                        "formatted_prd": analysis_result.formatted_prd,
+                        "session_stats": session.get_stats(),
+                        "finalize_time": time.time() - start_time
+                    }
+                })
+                logger.info(f"✅ 실시간 회의 최종 분석 완료: {time.time() - start_time:.2f}초")
+                break
+            
+            else:
+                await websocket.send_json({"type": "error", "error": f"알 수 없는 메시지 타입: {control.get('type')}"})
+    
+    except WebSocketDisconnect:
+        logger.info("🔌 실시간 회의 연결 종료")
+    except Exception as e:
+        logger.error(f"❌ Realtime meeting error: {e}")
+        try:
+            await websocket.send_json({"type": "error", "error": str(e)})
+        except Exception:
+            pass
+    finally:
+        ended = True
+        audio_ready.set()
+        if processor_task is not None and not processor_task.done():
+            processor_task.cancel()
+        try:
+            await websocket.close()
+        except Exception:
+            pass
+
 if __name__ == "__main__":
     # 환경 변수 설정
     host = os.getenv("HOST", "0.0.0.0")
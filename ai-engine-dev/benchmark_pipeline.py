@@ -0,0 +1,497 @@
+#!/usr/bin/env python3
+"""
+TtalKkak 파이프라인 벤치마크
+가짜 모델(benchmark_stubs)로 CPU만 있는 환경에서도 재현 가능한 성능 측정
+- chunking / triplets / classification / merge / e2e(동시성) / fused(단일 호출) / handoff(단계 간 직렬화) 스위트
+- 결과를 JSON으로 저장하고 이전 커밋 결과와 비교 가능
+
+사용 예:
+    python benchmark_pipeline.py --output bench.json
+    python benchmark_pipeline.py --suites e2e --concurrency 1,4,8 --latency-scale 0.1
+    python benchmark_pipeline.py --compare baseline.json --threshold 0.15
+    python benchmark_pipeline.py --suites handoff --handoff-inputs "results/*.json"
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import logging
+import glob
+import argparse
+import platform
+import statistics
+import subprocess
+from typing import Any, Callable, Dict, List, Optional
+
+# 현재 디렉토리를 Python path에 추가
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from benchmark_stubs import (
+    StubLatency,
+    FakeGPU,
+    FakeWhisperX,
+    FakeBertClassifier,
+    FakeLLM,
+    generate_synthetic_meeting
+)
+from chunking_processor import TtalKkakChunkingProcessor
+from triplet_processor import TripletProcessor
+from request_scheduler import RequestScheduler, SchedulerConfig, RequestContext, Priority
+from prd_generation_prompts import (
+    generate_notion_project_prompt,
+    generate_task_master_prd_prompt,
+    NOTION_PROJECT_SCHEMA,
+    TASK_MASTER_PRD_SCHEMA
+)
+from meeting_analysis_prompts import generate_meeting_analysis_system_prompt, MEETING_ANALYSIS_SCHEMA
+from fused_pipeline_prompts import (
+    generate_fused_pipeline_system_prompt,
+    generate_fused_pipeline_user_prompt,
+    split_fused_result,
+    FUSED_PIPELINE_SCHEMA
+)
+from stage_serializer import serialize_stage_output, HANDOFF_FORMATS
+from token_budget import TokenBudgeter, FUSED_STAGE, FUSED_CAP_MULTIPLIER
+
+ALL_SUITES = ["chunking", "triplets", "classification", "merge", "e2e", "fused", "handoff"]
+STAGE_SCHEMA = {"summary": "", "action_items": [], "decisions": [], "key_points": [], "next_steps": [], "participants": []}
+
+
+def measure(fn: Callable[[], Any], repeat: int) -> Dict[str, Any]:
+    """fn을 repeat회 실행하여 지연 시간 통계 반환 (마지막 결과 포함)"""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start_time)
+    return {"stats": summarize(timings), "result": result}
+
+
+def summarize(timings: List[float]) -> Dict[str, float]:
+    ordered = sorted(timings)
+    p95_index = min(len(ordered) - 1, int(round(0.95 * (len(ordered) - 1))))
+    return {
+        "runs": len(ordered),
+        "mean_s": statistics.mean(ordered),
+        "p50_s": statistics.median(ordered),
+        "p95_s": ordered[p95_index],
+        "min_s": ordered[0]
+    }
+
+
+def bench_chunking(durations: List[float], repeat: int, **_) -> List[Dict[str, Any]]:
+    """토큰 추정 + 겹침 청킹"""
+    chunker = TtalKkakChunkingProcessor(max_context_tokens=32768)
+    results = []
+    for minutes in durations:
+        text = generate_synthetic_meeting(minutes)["full_text"]
+        estimate = measure(lambda: chunker.estimate_tokens(text), repeat)
+        chunking = measure(lambda: chunker.create_chunks_with_overlap(text), repeat)
+        results.append({
+            "duration_min": minutes,
+            "chars": len(text),
+            "estimated_tokens": estimate["result"],
+            "num_chunks": len(chunking["result"]),
+            "estimate_tokens": estimate["stats"],
+            "create_chunks": chunking["stats"]
+        })
+    return results
+
+
+def bench_triplets(durations: List[float], repeat: int, **_) -> List[Dict[str, Any]]:
+    """WhisperX 결과 → Triplet 변환"""
+    processor = TripletProcessor()
+    results = []
+    for minutes in durations:
+        meeting = generate_synthetic_meeting(minutes)
+        run = measure(lambda: processor.whisperx_to_triplets(meeting), repeat)
+        results.append({
+            "duration_min": minutes,
+            "segments": len(meeting["segments"]),
+            "triplets": len(run["result"]),
+            "build": run["stats"]
+        })
+    return results
+
+
+def bench_classification(durations: List[float], repeat: int, latency: StubLatency, **_) -> List[Dict[str, Any]]:
+    """배치 크기별 BERT 분류 처리량 (가짜 분류기의 배치 비용 모델 사용)"""
+    processor = TripletProcessor()
+    meeting = generate_synthetic_meeting(max(durations))
+    triplets = processor.whisperx_to_triplets(meeting)
+    results = []
+    for batch_size in (1, 8, 16, 32, 64):
+        classifier = FakeBertClassifier(latency)
+        run = measure(lambda: classifier.classify_triplets_batch(triplets, batch_size=batch_size), repeat)
+        results.append({
+            "batch_size": batch_size,
+            "triplets": len(triplets),
+            "classify": run["stats"],
+            "triplets_per_second": len(triplets) / run["stats"]["p50_s"] if run["stats"]["p50_s"] > 0 else None
+        })
+    return results
+
+
+def bench_merge(durations: List[float], repeat: int, **_) -> List[Dict[str, Any]]:
+    """청크별 LLM 결과 통합"""
+    chunker = TtalKkakChunkingProcessor(max_context_tokens=32768)
+    llm = FakeLLM(StubLatency(latency_scale=0.0), chunking_processor=chunker)
+    results = []
+    for minutes in durations:
+        chunks = chunker.create_chunks_with_overlap(generate_synthetic_meeting(minutes)["full_text"])
+        chunk_results = [
+            llm.generate_structured_response("", chunk["text"], STAGE_SCHEMA, enable_chunking=False)
+            for chunk in chunks
+        ]
+        # merge_chunk_results는 입력 항목을 수정하므로 매 실행마다 새로 복사
+        run = measure(lambda: chunker.merge_chunk_results(json.loads(json.dumps(chunk_results))), repeat)
+        results.append({
+            "duration_min": minutes,
+            "num_chunks": len(chunks),
+            "action_items": len(run["result"].get("action_items", [])),
+            "merge": run["stats"]
+        })
+    return results
+
+
+def run_pipeline_sync_step(llm: FakeLLM, chunker: TtalKkakChunkingProcessor, stage: str, user_prompt: str) -> Dict[str, Any]:
+    """서버의 generate_structured_response와 같은 청킹 → 청크별 호출 → 통합 흐름"""
+    chunks = chunker.create_chunks_with_overlap(user_prompt)
+    chunk_results = [
+        llm.generate_structured_response("", chunk["text"], STAGE_SCHEMA, enable_chunking=False, stage=stage)
+        for chunk in chunks
+    ]
+    return chunker.merge_chunk_results(chunk_results)
+
+
+async def run_meeting(
+    scheduler: RequestScheduler,
+    whisper: FakeWhisperX,
+    processor: TripletProcessor,
+    llm: FakeLLM,
+    chunker: TtalKkakChunkingProcessor,
+    meeting: Dict[str, Any],
+    ctx: RequestContext
+) -> float:
+    """한 회의의 전체 파이프라인 (음성 → 필터링 → 3단계 LLM)"""
+    start_time = time.perf_counter()
+    transcription = await scheduler.submit(whisper.transcribe, meeting, kind="asr", cost=meeting["duration"] * 32000, ctx=ctx)
+    transcription["full_text"] = " ".join(seg["text"] for seg in transcription["segments"])
+
+    enhanced = await scheduler.submit(
+        processor.process_whisperx_result, transcription,
+        kind="bert", cost=len(transcription["full_text"]), ctx=ctx,
+        enable_bert_filtering=True, save_noise_log=False
+    )
+    text = enhanced.get("filtered_transcript") or transcription["full_text"]
+
+    previous = text
+    for stage in ("notion", "prd", "tasks"):
+        result = await scheduler.submit(
+            run_pipeline_sync_step, llm, chunker, stage, previous,
+            kind="llm", cost=chunker.estimate_tokens(previous) + llm.latency.llm_output_tokens, ctx=ctx
+        )
+        previous = json.dumps(result, ensure_ascii=False)
+    return time.perf_counter() - start_time
+
+
+def bench_e2e(durations: List[float], repeat: int, latency: StubLatency, concurrency: List[int], gpu_slots: int, **_) -> List[Dict[str, Any]]:
+    """동시 요청 수별 종단 간 처리량/지연 시간 (단일 GPU 직렬 실행 모델)"""
+    chunker = TtalKkakChunkingProcessor(max_context_tokens=32768)
+    results = []
+
+    for minutes in durations:
+        meeting = generate_synthetic_meeting(minutes)
+        for level in concurrency:
+            gpu = FakeGPU(enabled=True)
+            whisper = FakeWhisperX(latency, gpu)
+            processor = TripletProcessor()
+            processor.bert_classifier = FakeBertClassifier(latency, gpu)
+            llm = FakeLLM(latency, gpu, chunking_processor=chunker)
+            scheduler = RequestScheduler(SchedulerConfig(max_concurrency=gpu_slots, tenant_concurrency=gpu_slots))
+
+            async def run_level():
+                # 동시에 level개 요청이 진행되는 폐쇄형 부하 (총 level * repeat개 회의)
+                semaphore = asyncio.Semaphore(level)
+                
+                async def client(i):
+                    async with semaphore:
+                        return await run_meeting(
+                            scheduler, whisper, processor, llm, chunker, meeting,
+                            RequestContext(priority=Priority.BATCH, tenant_id=f"tenant-{i % level}")
+                        )
+                
+                return await asyncio.gather(*[client(i) for i in range(level * repeat)])
+
+            wall_start = time.perf_counter()
+            latencies = asyncio.run(run_level())
+            wall_time = time.perf_counter() - wall_start
+
+            results.append({
+                "duration_min": minutes,
+                "concurrency": level,
+                "meetings": len(latencies),
+                "wall_s": wall_time,
+                "meetings_per_minute": len(latencies) / wall_time * 60 if wall_time > 0 else None,
+                "latency": summarize(latencies),
+                "gpu_busy_ratio": gpu.busy_time / wall_time if wall_time > 0 else None,
+                "llm_calls": llm.calls,
+                "llm_tokens_in": llm.tokens_in,
+                "llm_tokens_out": llm.tokens_out,
+                "avg_queue_wait_s": scheduler.get_stats()["avg_wait_seconds"]
+            })
+    return results
+
+
+def run_three_call_pipeline(llm: FakeLLM, text: str, num_tasks: int = 5, handoff_format: Optional[str] = None) -> Dict[str, Any]:
+    """/two-stage-pipeline-text의 3단계 호출 (앞 단계 결과를 직렬화하여 다음 프롬프트에 다시 삽입)"""
+    notion = llm.generate_structured_response("", generate_notion_project_prompt(text), NOTION_PROJECT_SCHEMA, stage="notion")
+    prd = llm.generate_structured_response(
+        generate_task_master_prd_prompt(notion),
+        f"다음 노션 프로젝트를 바탕으로 Task Master PRD를 작성해주세요:\n\n"
+        f"{serialize_stage_output(notion, stage='prd', fmt=handoff_format, key_order=NOTION_PROJECT_SCHEMA)}",
+        TASK_MASTER_PRD_SCHEMA, stage="prd"
+    )
+    tasks = llm.generate_structured_response(
+        generate_meeting_analysis_system_prompt(num_tasks),
+        f"다음 PRD를 바탕으로 업무 태스크들을 생성해주세요:\n\n"
+        f"{serialize_stage_output(prd, stage='tasks', fmt=handoff_format, key_order=TASK_MASTER_PRD_SCHEMA)}",
+        MEETING_ANALYSIS_SCHEMA, stage="tasks"
+    )
+    return {"notion": notion, "prd": prd, "tasks": tasks}
+
+
+def run_fused_pipeline(llm: FakeLLM, text: str, num_tasks: int = 5, max_input_tokens: int = 28000) -> Dict[str, Any]:
+    """단일 호출 모드 (회의록 1회 프리필 → 복합 스키마 → 단계별 검증)
+    서버와 동일하게 입력이 max_input_tokens를 넘거나 응답이 잘리면/섹션이 빠지면 3단계 호출로 대체"""
+    system_prompt = generate_fused_pipeline_system_prompt(num_tasks)
+    user_prompt = generate_fused_pipeline_user_prompt(text)
+    if llm._estimate_tokens(f"{system_prompt}\n{user_prompt}") > max_input_tokens:
+        return {**run_three_call_pipeline(llm, text, num_tasks), "fallback": "input_tokens"}
+
+    result = llm.generate_structured_response(system_prompt, user_prompt, FUSED_PIPELINE_SCHEMA, stage=FUSED_STAGE)
+    try:
+        notion, prd, tasks = split_fused_result(result)
+    except ValueError:
+        return {**run_three_call_pipeline(llm, text, num_tasks), "fallback": "invalid_response"}
+    return {"notion": notion, "prd": prd, "tasks": tasks, "fallback": None}
+
+
+def bench_fused(durations: List[float], repeat: int, latency: StubLatency, budgeter: Optional[TokenBudgeter] = None, **_) -> List[Dict[str, Any]]:
+    """3단계 호출 vs 단일 호출: 실행당 LLM 호출 수/입출력 토큰/지연 시간 (대체 경로 포함)"""
+    chunker = TtalKkakChunkingProcessor(max_context_tokens=32768)
+    budgeter = budgeter or TokenBudgeter(enabled=False)
+    results = []
+    for minutes in durations:
+        text = generate_synthetic_meeting(minutes)["full_text"]
+        entry = {"duration_min": minutes, "fused_max_tokens": budgeter.cap(FUSED_STAGE)}
+        for mode, pipeline in (("three_call", run_three_call_pipeline), ("fused", run_fused_pipeline)):
+            llm = FakeLLM(latency, FakeGPU(enabled=False), chunking_processor=chunker, budgeter=budgeter)
+            run = measure(lambda: pipeline(llm, text), repeat)
+            entry[f"{mode}_calls"] = llm.calls // repeat
+            entry[f"{mode}_tokens_in"] = llm.tokens_in // repeat
+            entry[f"{mode}_tokens_out"] = llm.tokens_out // repeat
+            entry[f"{mode}_truncated"] = llm.truncated // repeat
+            entry[mode] = run["stats"]
+        entry["fused_fallback"] = run["result"]["fallback"]
+        entry["tokens_in_saved_ratio"] = 1.0 - entry["fused_tokens_in"] / entry["three_call_tokens_in"] if entry["three_call_tokens_in"] else None
+        results.append(entry)
+    return results
+
+
+def load_handoff_samples(pattern: str) -> List[Dict[str, Any]]:
+    """저장된 실제 파이프라인 응답(/two-stage-pipeline-text 등)에서 단계별 결과 추출"""
+    samples = []
+    for path in sorted(glob.glob(pattern)):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        notion = data.get("stage1_notion") or data.get("notion")
+        prd = data.get("stage2_prd") or data.get("prd")
+        if isinstance(notion, dict) and isinstance(prd, dict):
+            samples.append({"source": os.path.basename(path), "notion": notion, "prd": prd})
+    return samples
+
+
+def bench_handoff(durations: List[float], repeat: int, latency: StubLatency, handoff_inputs: Optional[str] = None, **_) -> List[Dict[str, Any]]:
+    """단계 간 직렬화 형식별 프롬프트 토큰 수 / 예상 프리필 시간 / 직렬화 시간"""
+    chunker = TtalKkakChunkingProcessor(max_context_tokens=32768)
+    if handoff_inputs:
+        samples = load_handoff_samples(handoff_inputs)
+    else:
+        llm = FakeLLM(StubLatency(latency_scale=0.0), chunking_processor=chunker)
+        samples = []
+        for minutes in durations:
+            outputs = run_three_call_pipeline(llm, generate_synthetic_meeting(minutes)["full_text"], handoff_format="pretty")
+            samples.append({"source": f"synthetic-{minutes:g}min", "notion": outputs["notion"], "prd": outputs["prd"]})
+
+    results = []
+    for sample in samples:
+        entry = {"source": sample["source"]}
+        for fmt in HANDOFF_FORMATS:
+            def serialize():
+                return (
+                    serialize_stage_output(sample["notion"], fmt=fmt, key_order=NOTION_PROJECT_SCHEMA)
+                    + serialize_stage_output(sample["prd"], fmt=fmt, key_order=TASK_MASTER_PRD_SCHEMA)
+                )
+            run = measure(serialize, repeat)
+            tokens = chunker.estimate_tokens(run["result"])
+            entry[f"{fmt}_tokens"] = tokens
+            entry[f"{fmt}_prefill_ms"] = round(tokens / latency.llm_prefill_tokens_per_second * 1000, 2)
+            entry[f"{fmt}_serialize"] = run["stats"]
+        for fmt in ("minified", "outline"):
+            entry[f"{fmt}_saved_ratio"] = 1.0 - entry[f"{fmt}_tokens"] / entry["pretty_tokens"] if entry["pretty_tokens"] else None
+        results.append(entry)
+    return results
+
+
+SUITES = {
+    "chunking": bench_chunking,
+    "triplets": bench_triplets,
+    "classification": bench_classification,
+    "merge": bench_merge,
+    "e2e": bench_e2e,
+    "fused": bench_fused,
+    "handoff": bench_handoff
+}
+
+
+def get_git_commit() -> str:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return "unknown"
+
+
+def flatten_timings(report: Dict[str, Any]) -> Dict[str, float]:
+    """비교용 평탄화: {"suite/항목키/측정이름": p50_s}"""
+    flat = {}
+    for suite, entries in report.get("results", {}).items():
+        for entry in entries:
+            key_parts = [f"{k}={entry[k]}" for k in ("duration_min", "batch_size", "concurrency") if k in entry]
+            for name, value in entry.items():
+                if isinstance(value, dict) and "p50_s" in value:
+                    flat[f"{suite}/{','.join(key_parts)}/{name}"] = value["p50_s"]
+    return flat
+
+
+def compare_reports(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """p50 기준 threshold 이상 느려진 항목 목록"""
+    current_flat = flatten_timings(current)
+    baseline_flat = flatten_timings(baseline)
+    regressions = []
+    for key, value in sorted(current_flat.items()):
+        base = baseline_flat.get(key)
+        if base is None or base <= 0:
+            continue
+        change = (value - base) / base
+        marker = "🔴" if change > threshold else ("🟢" if change < -threshold else "⚪")
+        print(f"   {marker} {key}: {base * 1000:.3f}ms → {value * 1000:.3f}ms ({change * 100:+.1f}%)")
+        if change > threshold:
+            regressions.append(key)
+    return regressions
+
+
+def parse_list(value: str, cast=float) -> List:
+    return [cast(v) for v in value.split(",") if v.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TtalKkak 파이프라인 벤치마크 (가짜 모델 사용)")
+    parser.add_argument("--suites", default=",".join(ALL_SUITES), help="실행할 스위트 (쉼표 구분)")
+    parser.add_argument("--durations", default="10,30,60,180", help="회의 길이(분) 목록")
+    parser.add_argument("--e2e-durations", default="30", help="e2e 스위트의 회의 길이(분) 목록")
+    parser.add_argument("--concurrency", default="1,2,4", help="e2e 동시 요청 수 목록")
+    parser.add_argument("--gpu-slots", type=int, default=1, help="스케줄러 동시 실행 슬롯 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+    parser.add_argument("--latency-scale", type=float, default=0.02, help="가짜 모델 지연 배율 (0이면 CPU 비용만)")
+    parser.add_argument("--asr-rtf", type=float, default=70.0, help="가짜 WhisperX 실시간 배율")
+    parser.add_argument("--bert-batch-ms", type=float, default=8.0, help="가짜 BERT 배치당 고정 비용(ms)")
+    parser.add_argument("--bert-item-ms", type=float, default=0.4, help="가짜 BERT 발화당 비용(ms)")
+    parser.add_argument("--llm-prefill-tps", type=float, default=4000.0, help="가짜 LLM 프리필 토큰/초")
+    parser.add_argument("--llm-decode-tps", type=float, default=40.0, help="가짜 LLM 디코드 토큰/초")
+    parser.add_argument("--llm-output-tokens", type=int, default=600, help="가짜 LLM 호출당 출력 토큰 수")
+    parser.add_argument("--llm-max-tokens-cap", type=int, default=2048, help="단계별 출력 상한 (서버 LLM_MAX_TOKENS_CAP)")
+    parser.add_argument("--fused-max-tokens", type=int, default=None, help="fused 단계 출력 상한 (서버 LLM_FUSED_MAX_TOKENS, 기본: 단계 상한 × 3)")
+    parser.add_argument("--handoff-inputs", default=None, help="handoff 스위트에 쓸 실제 파이프라인 응답 JSON (glob, 없으면 합성 회의)")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.15, help="회귀 판정 기준 (p50 증가율)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    latency = StubLatency(
+        asr_realtime_factor=args.asr_rtf,
+        bert_batch_overhead_ms=args.bert_batch_ms,
+        bert_per_item_ms=args.bert_item_ms,
+        llm_prefill_tokens_per_second=args.llm_prefill_tps,
+        llm_decode_tokens_per_second=args.llm_decode_tps,
+        llm_output_tokens=args.llm_output_tokens,
+        latency_scale=args.latency_scale
+    )
+    budgeter = TokenBudgeter(
+        max_tokens_cap=args.llm_max_tokens_cap,
+        stage_caps={FUSED_STAGE: args.fused_max_tokens or args.llm_max_tokens_cap * FUSED_CAP_MULTIPLIER},
+        enabled=False
+    )
+    suites = [s.strip() for s in args.suites.split(",") if s.strip()]
+    unknown = [s for s in suites if s not in SUITES]
+    if unknown:
+        parser.error(f"알 수 없는 스위트: {unknown} (가능: {ALL_SUITES})")
+
+    report = {
+        "meta": {
+            "git_commit": get_git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S")
+        },
+        "config": {**vars(args), "latency": latency.__dict__},
+        "results": {}
+    }
+
+    print("🧪 TtalKkak 파이프라인 벤치마크 시작")
+    for suite in suites:
+        print(f"\n▶️  {suite}")
+        suite_start = time.time()
+        durations = parse_list(args.e2e_durations if suite == "e2e" else args.durations)
+        report["results"][suite] = SUITES[suite](
+            durations=durations,
+            repeat=args.repeat,
+            latency=latency,
+            concurrency=parse_list(args.concurrency, int),
+            gpu_slots=args.gpu_slots,
+            handoff_inputs=args.handoff_inputs,
+            budgeter=budgeter
+        )
+        for entry in report["results"][suite]:
+            summary = {k: v for k, v in entry.items() if not isinstance(v, dict)}
+            timings = {k: f"{v['p50_s'] * 1000:.2f}ms" for k, v in entry.items() if isinstance(v, dict) and "p50_s" in v}
+            print(f"   {summary} {timings}")
+        print(f"   ⏱️  {time.time() - suite_start:.2f}초")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 결과 저장: {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"\n📊 비교: {baseline.get('meta', {}).get('git_commit')} → {report['meta']['git_commit']}")
+        regressions = compare_reports(report, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ 성능 회귀 {len(regressions)}건 (기준 {args.threshold * 100:.0f}%)")
+            sys.exit(1)
+        print("\n✅ 성능 회귀 없음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,279 @@
+"""
+TtalKkak 벤치마크용 가짜 모델
+GPU/가중치 없이 파이프라인 성능을 재현 가능하게 측정하기 위한 스텁
+- 결정적(seed 고정) 한국어 합성 회의록 생성
+- WhisperX / BERT / LLM 대역 (지연 시간 설정 가능)
+"""
+
+import copy
+import time
+import random
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from token_budget import TokenBudgeter
+
+SPEAKERS = ["SPEAKER_00", "SPEAKER_01", "SPEAKER_02", "SPEAKER_03"]
+PEOPLE = ["김민수", "이지은", "박준호", "최수진", "정다은"]
+TOPICS = [
+    "로그인 API", "결제 모듈", "슬랙 연동", "노션 동기화", "대시보드 화면",
+    "배포 파이프라인", "회의록 요약 기능", "알림 서비스", "데이터베이스 마이그레이션", "모바일 반응형 UI"
+]
+ACTIONS = ["설계 문서 작성", "코드 리뷰", "테스트 케이스 보강", "성능 측정", "버그 수정", "프로토타입 구현", "요구사항 정리"]
+DEADLINES = ["오늘 오후", "내일 오전", "이번 주 금요일", "다음 주 월요일", "스프린트 종료 전", "월말"]
+DECISIONS = ["기존 구조를 유지하는 방향", "외부 라이브러리를 도입하는 방향", "일정을 1주 미루는 방향", "MVP 범위에서 제외하는 방향"]
+CAUSES = ["캐시 만료 설정", "권한 체크 누락", "네트워크 타임아웃", "스키마 불일치", "동시성 처리 문제"]
+
+BUSINESS_TEMPLATES = [
+    "{topic} 관련해서 {person}님이 {deadline}까지 {action} 진행해 주세요.",
+    "{topic}은 {decision}으로 결정하겠습니다.",
+    "현재 {topic} 진행률은 {percent}퍼센트 정도이고 남은 작업은 {action}입니다.",
+    "{topic} 이슈는 {cause} 때문에 발생한 것 같아서 {person}님이 확인해 보기로 했습니다.",
+    "{topic} 쪽은 {deadline}까지 {action} 끝내고 공유드리겠습니다.",
+    "{topic} 우선순위를 높여서 이번 스프린트에 포함시키는 게 좋겠습니다.",
+    "{person}님, {topic} {action} 결과를 다음 회의 때 발표해 주실 수 있을까요?"
+]
+
+# 잡담/추임새 (BERT 대역이 노이즈로 분류하는 발화)
+NOISE_UTTERANCES = [
+    "네 네 알겠습니다.",
+    "잠깐만요, 화면 공유 잘 보이시나요?",
+    "아 오늘 점심 뭐 드셨어요?",
+    "소리가 조금 끊기는 것 같아요.",
+    "하하 그러게요.",
+    "음 잠시만요.",
+    "다들 주말 잘 보내셨어요?",
+    "아 네 맞아요 맞아요."
+]
+NOISE_SET = set(NOISE_UTTERANCES)
+
+
+def generate_synthetic_meeting(
+    duration_minutes: float,
+    seed: int = 42,
+    noise_ratio: float = 0.3,
+    avg_segment_seconds: float = 6.0
+) -> Dict[str, Any]:
+    """
+    결정적 한국어 합성 회의록 (WhisperX 결과 형식)
+
+    같은 duration/seed면 항상 같은 결과를 반환
+    """
+    rng = random.Random(f"{seed}:{duration_minutes}:{noise_ratio}")
+    segments = []
+    current = 0.0
+    total_seconds = duration_minutes * 60
+
+    while current < total_seconds:
+        length = max(1.5, rng.gauss(avg_segment_seconds, 2.0))
+        if rng.random() < noise_ratio:
+            text = rng.choice(NOISE_UTTERANCES)
+        else:
+            text = rng.choice(BUSINESS_TEMPLATES).format(
+                topic=rng.choice(TOPICS),
+                person=rng.choice(PEOPLE),
+                deadline=rng.choice(DEADLINES),
+                action=rng.choice(ACTIONS),
+                decision=rng.choice(DECISIONS),
+                cause=rng.choice(CAUSES),
+                percent=rng.randrange(10, 100, 10)
+            )
+        segments.append({
+            "start": round(current, 2),
+            "end": round(current + length, 2),
+            "speaker": rng.choice(SPEAKERS),
+            "text": text
+        })
+        current += length
+
+    return {
+        "segments": segments,
+        "full_text": " ".join(seg["text"] for seg in segments),
+        "language": "ko",
+        "duration": total_seconds
+    }
+
+
+@dataclass
+class StubLatency:
+    """가짜 모델 지연 시간 설정 (latency_scale=0이면 지연 없이 순수 CPU 비용만 측정)"""
+    asr_realtime_factor: float = 70.0  # 오디오 1초를 1/70초에 전사
+    bert_batch_overhead_ms: float = 8.0  # 배치당 고정 비용
+    bert_per_item_ms: float = 0.4  # 발화당 비용
+    llm_prefill_tokens_per_second: float = 4000.0
+    llm_decode_tokens_per_second: float = 40.0
+    llm_output_tokens: int = 600
+    latency_scale: float = 1.0
+
+
+class FakeGPU:
+    """단일 GPU 직렬 실행을 흉내내는 전역 잠금 (동시성 벤치마크용)"""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self.busy_time = 0.0
+
+    def run(self, seconds: float) -> None:
+        if seconds <= 0:
+            return
+        if not self.enabled:
+            time.sleep(seconds)
+            return
+        with self._lock:
+            time.sleep(seconds)
+            self.busy_time += seconds
+
+
+class FakeWhisperX:
+    """WhisperX 대역: transcribe(audio_input, batch_size)"""
+
+    def __init__(self, latency: Optional[StubLatency] = None, gpu: Optional[FakeGPU] = None):
+        self.latency = latency or StubLatency()
+        self.gpu = gpu or FakeGPU(enabled=False)
+
+    def transcribe(self, audio_input, batch_size: int = 16) -> Dict[str, Any]:
+        """audio_input: 합성 회의록(dict) 또는 회의 길이(분)"""
+        meeting = audio_input if isinstance(audio_input, dict) else generate_synthetic_meeting(float(audio_input))
+        audio_seconds = meeting.get("duration", 0.0)
+        self.gpu.run(audio_seconds / self.latency.asr_realtime_factor * self.latency.latency_scale)
+        return {"segments": copy.deepcopy(meeting["segments"]), "language": meeting.get("language", "ko")}
+
+
+class FakeBertClassifier:
+    """TtalkkakBERTClassifier 대역 (잡담 문장 목록 기반 분류)"""
+
+    def __init__(self, latency: Optional[StubLatency] = None, gpu: Optional[FakeGPU] = None):
+        self.latency = latency or StubLatency()
+        self.gpu = gpu or FakeGPU(enabled=False)
+        self.batches = 0
+
+    def classify_triplets_batch(self, triplets: List[Dict[str, Any]], batch_size: int = 32) -> List[Dict[str, Any]]:
+        classified = []
+        for i in range(0, len(triplets), batch_size):
+            batch = triplets[i:i + batch_size]
+            cost_ms = self.latency.bert_batch_overhead_ms + self.latency.bert_per_item_ms * len(batch)
+            self.gpu.run(cost_ms / 1000.0 * self.latency.latency_scale)
+            self.batches += 1
+            for triplet in batch:
+                target = triplet.get("target", "").replace("[TGT]", "").replace("[/TGT]", "").strip()
+                labeled = dict(triplet)
+                labeled["label"] = 1 if target in NOISE_SET else 0
+                labeled["confidence"] = 0.9
+                labeled["text_length"] = len(target)
+                classified.append(labeled)
+        return classified
+
+    def get_classification_stats(self, classified_triplets: List[Dict[str, Any]]) -> Dict[str, Any]:
+        total = len(classified_triplets)
+        noise = sum(1 for t in classified_triplets if t.get("label") == 1)
+        return {
+            "total_triplets": total,
+            "important_triplets": total - noise,
+            "noise_triplets": noise,
+            "noise_reduction_ratio": noise / total if total else 0.0,
+            "avg_confidence": 0.9
+        }
+
+
+class FakeLLM:
+    """generate_structured_response 대역 (프리필/디코드 지연 모델)"""
+
+    def __init__(
+        self,
+        latency: Optional[StubLatency] = None,
+        gpu: Optional[FakeGPU] = None,
+        chunking_processor=None,
+        budgeter: Optional[TokenBudgeter] = None
+    ):
+        self.latency = latency or StubLatency()
+        self.gpu = gpu or FakeGPU(enabled=False)
+        self.chunking_processor = chunking_processor
+        # 단계별 출력 상한 (서버와 같은 cap(stage), 이어쓰기 포함 전체 출력 기준)
+        self.budgeter = budgeter or TokenBudgeter(enabled=False)
+        self.calls = 0
+        self.tokens_in = 0
+        self.tokens_out = 0
+        self.truncated = 0
+        self._lock = threading.Lock()
+
+    def _estimate_tokens(self, text: str) -> int:
+        if self.chunking_processor is not None:
+            return self.chunking_processor.estimate_tokens(text)
+        return int(len(text) * 1.5)
+
+    def generate_structured_response(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        response_schema: Dict[str, Any],
+        temperature: float = 0.3,
+        max_input_tokens: int = 28000,
+        enable_chunking: bool = True,
+        stage: str = "default",
+        max_tokens: Optional[int] = None
+    ) -> Dict[str, Any]:
+        input_tokens = self._estimate_tokens(f"{system_prompt}\n{user_prompt}")
+        sections = self._composite_sections(response_schema)
+        needed_tokens = self.latency.llm_output_tokens * max(1, len(sections))
+        max_tokens = max_tokens or self.budgeter.cap(stage)
+        truncated = needed_tokens > max_tokens
+        output_tokens = min(needed_tokens, max_tokens)
+        seconds = (
+            input_tokens / self.latency.llm_prefill_tokens_per_second
+            + output_tokens / self.latency.llm_decode_tokens_per_second
+        ) * self.latency.latency_scale
+        self.gpu.run(seconds)
+
+        with self._lock:
+            self.calls += 1
+            self.tokens_in += input_tokens
+            self.tokens_out += output_tokens
+            if truncated:
+                self.truncated += 1
+
+        if truncated:
+            # 상한에서 잘린 JSON → 서버 parse_structured_response와 같은 오류 형태
+            return {
+                "error": f"JSON parsing failed: 출력이 max_tokens({max_tokens})에서 잘림 (필요 {needed_tokens})",
+                "raw_response": ""
+            }
+        if sections:
+            return {name: self._build_response(user_prompt, response_schema[name]) for name in sections}
+        return self._build_response(user_prompt, response_schema)
+
+    @staticmethod
+    def _composite_sections(response_schema: Dict[str, Any]) -> List[str]:
+        """복합 스키마(fused: 모든 값이 단계별 스키마)면 섹션 이름 목록 (섹션마다 한 단계 분량 출력)"""
+        if not isinstance(response_schema, dict) or not response_schema:
+            return []
+        if all(isinstance(value, dict) for value in response_schema.values()):
+            return list(response_schema)
+        return []
+
+    @staticmethod
+    def _build_response(user_prompt: str, response_schema: Dict[str, Any]) -> Dict[str, Any]:
+        """스키마 예시를 바탕으로 입력 내용이 반영된 결정적 응답 생성"""
+        result = copy.deepcopy(response_schema) if isinstance(response_schema, dict) else {}
+        lines = [line.strip() for line in user_prompt.replace(". ", ".\n").split("\n") if line.strip()]
+        action_lines = [line for line in lines if "까지" in line][:10]
+        decision_lines = [line for line in lines if "결정" in line][:5]
+
+        result.update({
+            "summary": " ".join(lines[:2])[:200],
+            "action_items": [
+                {
+                    "task": line[:80],
+                    "assignee": next((p for p in PEOPLE if p in line), "미지정"),
+                    "deadline": next((d for d in DEADLINES if d in line), "미정"),
+                    "priority": ["high", "medium", "low"][i % 3]
+                }
+                for i, line in enumerate(action_lines)
+            ],
+            "decisions": decision_lines,
+            "key_points": lines[2:5],
+            "next_steps": [line[:60] for line in action_lines[:3]],
+            "participants": sorted({p for p in PEOPLE if p in user_prompt})
+        })
+        return result
@@ -10,6 +10,9 @@ from typing import List, Dict, Any, Optional
 from transformers import AutoTokenizer, AutoModelForSequenceClassification
 import logging
 
+from metrics import observe
+from profiling import span
+
 logger = logging.getLogger(__name__)
 
 class TtalkkakBERTClassifier:
@@ -167,38 +170,41 @@ class TtalkkakBERTClassifier:
                 
                 logger.info(f"📊 배치 {batch_idx+1}/{num_batches} 처리 중: {i+1}-{batch_end}/{len(texts)}")
                 
-                # 배치 토크나이징
-                inputs = self.tokenizer(
-                    batch_texts,
-                    return_tensors="pt",
-                    padding=True,
-                    truncation=True,
-                    max_length=512
-                )
+                with span("bert_tokenize", batch=batch_idx, size=len(batch_texts)):
+                    # 배치 토크나이징
+                    inputs = self.tokenizer(
+                        batch_texts,
+                        return_tensors="pt",
+                        padding=True,
+                        truncation=True,
+                        max_length=512
+                    )
                 
-                # GPU로 이동
-                inputs = {k: v.to(self.device) for k, v in inputs.items()}
+                    # GPU로 이동
+                    inputs = {k: v.to(self.device) for k, v in inputs.items()}
                 
-                # 배치 추론 실행 (GPU 메모리 최적화)
-                with torch.no_grad():
-                    # Mixed Precision으로 메모리 절약
-                    if hasattr(torch.cuda, 'amp') and torch.cuda.is_available():
-                        with torch.cuda.amp.autocast():
+                # GPU 비동기 실행을 고려해 결과를 CPU로 가져올 때까지를 추론 구간으로 측정
+                with span("bert_infer", batch=batch_idx, size=len(batch_texts)):
+                    # 배치 추론 실행 (GPU 메모리 최적화)
+                    with torch.no_grad():
+                        # Mixed Precision으로 메모리 절약
+                        if hasattr(torch.cuda, 'amp') and torch.cuda.is_available():
+                            with torch.cuda.amp.autocast():
+                                outputs = self.model(**inputs)
+                        else:
                             outputs = self.model(**inputs)
-                    else:
-                        outputs = self.model(**inputs)
                     
-                    predictions = torch.argmax(outputs.logits, dim=-1)
-                    confidences = torch.softmax(outputs.logits, dim=-1)
+                        predictions = torch.argmax(outputs.logits, dim=-1)
+                        confidences = torch.softmax(outputs.logits, dim=-1)
                 
-                # GPU 메모리 정리
-                del inputs
-                if torch.cuda.is_available():
-                    torch.cuda.empty_cache()
+                    # GPU 메모리 정리
+                    del inputs
+                    if torch.cuda.is_available():
+                        torch.cuda.empty_cache()
                 
-                # 결과 수집
-                batch_predictions = predictions.cpu().numpy()
-                batch_confidences = confidences.cpu().numpy()
+                    # 결과 수집
+                    batch_predictions = predictions.cpu().numpy()
+                    batch_confidences = confidences.cpu().numpy()
                 
                 all_predictions.extend(batch_predictions)
                 for j, conf_scores in enumerate(batch_confidences):
@@ -207,6 +213,7 @@ class TtalkkakBERTClassifier:
                     all_confidences.append(confidence)
                 
                 batch_elapsed = time.time() - batch_processing_start
+                observe("bert_batch_seconds", batch_elapsed)
                 logger.info(f"   ⏱️  배치 {batch_idx+1} 완료: {batch_elapsed:.3f}초 ({len(batch_texts)}개 처리)")
             
             # 3. 결과 통합
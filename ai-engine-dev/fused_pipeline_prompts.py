@@ -0,0 +1,77 @@
+"""
+TtalKkak 단일 호출(fused) 파이프라인 프롬프트
+회의록 → 기획안 + Task Master PRD + 업무 목록을 한 번의 생성으로 출력
+- 3단계 호출에서는 앞 단계 JSON을 다음 단계 프롬프트에 다시 넣어 프리필이 3번 발생
+- 필터링된 회의록을 한 번만 프리필하고 세 결과를 하나의 복합 스키마로 생성
+- 결과는 기존 단계별 검증 함수로 나눠 검증하여 기존 응답 형식과 동일하게 반환
+"""
+
+from typing import Any, Dict, Tuple
+
+from prd_generation_prompts import (
+    NOTION_PROJECT_SCHEMA,
+    TASK_MASTER_PRD_SCHEMA,
+    validate_notion_project,
+    validate_task_master_prd
+)
+from meeting_analysis_prompts import (
+    MEETING_ANALYSIS_SCHEMA,
+    validate_meeting_analysis
+)
+
+# 복합 응답 스키마 (생성 순서 = 기획안 → PRD → 업무, 뒤 항목이 앞 항목을 참조할 수 있도록)
+FUSED_PIPELINE_SCHEMA = {
+    "notion": NOTION_PROJECT_SCHEMA,
+    "prd": TASK_MASTER_PRD_SCHEMA,
+    "tasks": MEETING_ANALYSIS_SCHEMA
+}
+
+
+def generate_fused_pipeline_system_prompt(num_tasks: int = 5) -> str:
+    """단일 호출 파이프라인 시스템 프롬프트"""
+    return f"""You are an AI assistant that turns a Korean meeting transcript into three linked planning documents in a single response.
+
+**Documents to produce (in this order):**
+1. "notion": 노션에 업로드할 프로젝트 기획안 (프로젝트명, 목적, 핵심 목표, 핵심 아이디어, 실행 계획, 기대 효과)
+2. "prd": 위 기획안을 Task Master PRD 형식으로 변환한 문서 (overview ~ appendix 8개 섹션)
+3. "tasks": 위 PRD를 바탕으로 한 회의 분석 결과와 정확히 {num_tasks}개의 실행 가능한 개발 태스크
+
+**Guidelines:**
+- "prd"는 "notion"의 내용을, "tasks"는 "prd"의 내용을 근거로 일관되게 작성
+- 앞에서 작성한 내용을 반복해서 옮겨 적지 말고 필요한 부분만 참조
+- Tasks must be specific, measurable and ordered by priority and dependencies
+- Set priority levels to high/medium/low and extract assignees/deadlines when mentioned
+- 모든 내용은 한국어로 작성 (기술 용어 제외)
+
+**Output Format:**
+Respond with a single JSON object with exactly the keys "notion", "prd" and "tasks".
+No additional text or explanation outside the JSON response.
+"""
+
+
+def generate_fused_pipeline_user_prompt(meeting_transcript: str) -> str:
+    """단일 호출 파이프라인 사용자 프롬프트"""
+    return f"""다음 회의록을 바탕으로 노션 기획안, Task Master PRD, 업무 태스크를 작성해주세요:
+
+{meeting_transcript}
+"""
+
+
+def split_fused_result(fused_result: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """복합 응답 → (기획안, PRD, 회의 분석) 각각 기존 검증 함수로 검증 (섹션이 빠지거나 객체가 아니면 ValueError)"""
+    if not isinstance(fused_result, dict) or "error" in fused_result:
+        raise ValueError(f"fused 응답 파싱 실패: {fused_result.get('error') if isinstance(fused_result, dict) else fused_result}")
+
+    # 빠지거나 객체가 아닌 섹션을 빈 객체로 검증하면 "[… 입력 필요]" 자리표시 문서가 성공으로 반환되므로
+    # 호출부가 3단계 호출로 전환하도록 ValueError
+    missing = [name for name in FUSED_PIPELINE_SCHEMA if not isinstance(fused_result.get(name), dict)]
+    if missing:
+        raise ValueError(f"fused 응답에 섹션 누락 또는 형식 오류: {', '.join(missing)}")
+
+    notion = validate_notion_project(fused_result["notion"])
+    prd = validate_task_master_prd(fused_result["prd"])
+    tasks = validate_meeting_analysis(fused_result["tasks"])
+    # validate_meeting_analysis가 제외하는 참석자/후속 조치는 그대로 유지
+    tasks["participants"] = fused_result["tasks"].get("participants", [])
+    tasks["follow_up"] = fused_result["tasks"].get("follow_up", {})
+    return notion, prd, tasks
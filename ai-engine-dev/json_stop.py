@@ -0,0 +1,202 @@
+"""
+TtalKkak JSON 완료 감지
+스트리밍 출력에서 최상위 JSON 객체가 닫히는 순간을 감지해 디코딩 조기 종료
+- 문자열 내부의 괄호, 이스케이프(\\") 인식
+- <think>...</think> 추론 블록과 ```json 코드 펜스 앞의 설명문은 무시
+- vLLM logits processor (객체가 닫히면 EOS 강제)
+- Transformers StoppingCriteria (배치 내 시퀀스별 종료)
+- OpenAI 호환 스트리밍 (감지 즉시 스트림 종료)
+
+절약 토큰 수는 max_tokens - 실제 생성 토큰으로 집계하므로 상한값
+(모델이 어차피 곧 EOS를 냈을 수도 있음)
+"""
+
+import time
+from typing import List, Optional, Tuple
+
+try:
+    import torch
+    from transformers import StoppingCriteria
+    HF_AVAILABLE = True
+except ImportError:
+    StoppingCriteria = object
+    HF_AVAILABLE = False
+
+THINK_OPEN = "<think>"
+THINK_CLOSE = "</think>"
+FENCE = "```"
+
+
+class JsonCompletionDetector:
+    """
+    최상위 JSON 객체 완료 감지기 (문자 단위 증분 처리)
+
+    사용 예:
+        detector = JsonCompletionDetector()
+        for piece in stream:
+            if detector.feed(piece):
+                break
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.started = False
+        self.done = False
+        self.in_think = False
+        self.in_fence = False
+        self.end_offset: Optional[int] = None  # 닫는 괄호 다음 위치 (입력 전체 기준)
+        self._consumed = 0
+        self._recent = ""  # 객체 시작 전 태그/펜스 감지용 꼬리 문자열
+
+    def _scan_preamble(self, char: str) -> bool:
+        """객체 시작 전 문자 처리, 이 문자에서 객체가 시작되면 True"""
+        self._recent = (self._recent + char)[-len(THINK_CLOSE):]
+
+        if self.in_think:
+            if self._recent.endswith(THINK_CLOSE):
+                self.in_think = False
+            return False
+        if self._recent.endswith(THINK_OPEN):
+            self.in_think = True
+            return False
+        if self._recent.endswith(FENCE):
+            self.in_fence = not self.in_fence
+            return False
+        return char == "{"
+
+    def feed(self, text: str) -> bool:
+        """텍스트 조각 추가, 최상위 객체가 닫혔으면 True"""
+        if self.done:
+            return True
+
+        for index, char in enumerate(text):
+            if not self.started:
+                if self._scan_preamble(char):
+                    self.started = True
+                    self.depth = 1
+                continue
+
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif char == "\\":
+                    self.escape = True
+                elif char == '"':
+                    self.in_string = False
+                continue
+
+            if char == '"':
+                self.in_string = True
+            elif char in "{[":
+                self.depth += 1
+            elif char in "}]":
+                self.depth -= 1
+                if self.depth == 0:
+                    self.done = True
+                    self.end_offset = self._consumed + index + 1
+                    break
+
+        self._consumed += len(text)
+        return self.done
+
+
+def trim_to_json_object(text: str) -> Tuple[str, bool]:
+    """최상위 객체가 닫힌 위치 뒤의 텍스트 제거 → (텍스트, 객체 완료 여부)"""
+    detector = JsonCompletionDetector()
+    if detector.feed(text):
+        trimmed = text[:detector.end_offset]
+        # 코드 펜스 안에서 끝났으면 펜스를 닫아 기존 파서(```json ... ```)와 호환
+        if detector.in_fence:
+            trimmed += f"\n{FENCE}"
+        return trimmed, True
+    return text, False
+
+
+class _TokenStreamDetector:
+    """토큰 ID 스트림 → 감지기 (토큰 단위 디코딩, 괄호/따옴표는 ASCII라 충분)"""
+
+    def __init__(self, tokenizer):
+        self.tokenizer = tokenizer
+        self.detector = JsonCompletionDetector()
+        self.seen = 0
+        self.finished_at: Optional[int] = None  # 객체가 닫힌 토큰 수
+
+    def update(self, token_ids) -> bool:
+        if self.finished_at is not None:
+            return True
+        for token_id in token_ids[self.seen:]:
+            self.seen += 1
+            piece = self.tokenizer.decode([token_id], skip_special_tokens=True)
+            if self.detector.feed(piece):
+                self.finished_at = self.seen
+                return True
+        return False
+
+
+class JsonLogitsProcessor:
+    """
+    vLLM logits processor (V0 엔진의 SamplingParams.logits_processors)
+
+    객체가 닫힌 다음 스텝에서 EOS 외 모든 토큰을 막아 생성 종료
+    요청마다 새 인스턴스 필요 (시퀀스별 상태 보유)
+    """
+
+    def __init__(self, tokenizer):
+        self.eos_token_id = tokenizer.eos_token_id
+        self._stream = _TokenStreamDetector(tokenizer)
+
+    @property
+    def stopped_early(self) -> bool:
+        return self._stream.finished_at is not None
+
+    def __call__(self, output_token_ids: List[int], logits):
+        if self._stream.update(output_token_ids):
+            eos_logit = logits[self.eos_token_id].clone()
+            logits.fill_(float("-inf"))
+            logits[self.eos_token_id] = eos_logit if eos_logit.isfinite() else 0.0
+        return logits
+
+
+class JsonStoppingCriteria(StoppingCriteria):
+    """
+    배치 생성용 시퀀스별 JSON 종료 조건 (transformers>=4.39: 행별 bool 텐서 반환)
+
+    finished_steps[i]: i번째 시퀀스가 JSON을 닫은 디코드 스텝 수 (미완료면 None)
+    first_step_time: 첫 토큰 생성 시각 (프리필/디코드 분리 측정용)
+    enabled=False면 종료 판단 없이 시각만 기록
+    """
+
+    def __init__(self, tokenizer, batch_size: int, enabled: bool = True):
+        self.tokenizer = tokenizer
+        self.batch_size = batch_size
+        self.enabled = enabled
+        self.reset()
+
+    def reset(self) -> None:
+        self.detectors = [JsonCompletionDetector() for _ in range(self.batch_size)]
+        self.finished_steps: List[Optional[int]] = [None] * self.batch_size
+        self.first_step_time: Optional[float] = None
+        self.steps = 0
+
+    def __call__(self, input_ids, scores, **kwargs):
+        self.steps += 1
+        if self.first_step_time is None:
+            self.first_step_time = time.time()
+        if not self.enabled:
+            return torch.zeros(input_ids.shape[0], dtype=torch.bool, device=input_ids.device)
+
+        last_tokens = input_ids[:, -1].tolist()
+        for i, token_id in enumerate(last_tokens):
+            if self.finished_steps[i] is not None:
+                continue
+            piece = self.tokenizer.decode([token_id], skip_special_tokens=True)
+            if self.detectors[i].feed(piece):
+                self.finished_steps[i] = self.steps
+
+        return torch.tensor(
+            [step is not None for step in self.finished_steps],
+            dtype=torch.bool,
+            device=input_ids.device
+        )
@@ -0,0 +1,784 @@
+"""
+TtalKkak LLM 백엔드
+Qwen3 추론 엔진을 교체 가능하도록 추상화
+- VLLMBackend: 프로세스 내 vLLM (기본)
+- TransformersBackend: 프로세스 내 Transformers (vLLM 불가 시 대체)
+- OpenAICompatibleBackend: 별도 서빙 프로세스(vLLM serve 등)에 연결 풀로 HTTP 호출
+  → API 서버를 여러 워커로 수평 확장 가능
+- ModelHostBackend (model_host.py): 같은 장비의 모델 호스트 프로세스에 Unix 소켓으로 호출
+
+환경변수:
+    LLM_BACKEND=vllm|transformers|openai|model_host
+        (미설정 시 MODEL_HOST_SOCKET이 있으면 model_host, 아니면 USE_VLLM 값으로 결정)
+    LLM_MODEL_NAME, LLM_BASE_URL, LLM_API_KEY, LLM_TIMEOUT, LLM_MAX_CONNECTIONS
+    SPECULATIVE_* (speculative_decoding.py 참고, vllm 백엔드 전용)
+"""
+
+import os
+import json
+import time
+import asyncio
+import logging
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from micro_batcher import MicroBatcher
+from speculative_decoding import SpeculativeConfig, SpecDecodeTracker
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_NAME = "Qwen/Qwen3-32B-AWQ"
+
+
+@dataclass
+class GenerationResult:
+    """백엔드 공통 생성 결과"""
+    text: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    finish_reason: Optional[str] = None
+    cached_tokens: Optional[int] = None  # 프리픽스 캐시 적중 토큰 (지원 시)
+    prefill_time: Optional[float] = None  # 첫 토큰까지 (지원 시)
+    decode_time: Optional[float] = None  # 첫 토큰 이후 (지원 시)
+    stopped_early: bool = False  # json_mode에서 JSON 객체가 닫혀 조기 종료됨
+
+
+def per_sequence_max_tokens(max_tokens: Union[int, Sequence[int]], count: int) -> List[int]:
+    """generate_batch의 max_tokens (공통 정수 또는 시퀀스별 목록) → 시퀀스별 목록"""
+    if isinstance(max_tokens, int):
+        return [max_tokens] * count
+    budgets = list(max_tokens)
+    if len(budgets) != count:
+        raise ValueError(f"max_tokens 수 불일치: {len(budgets)} != {count}")
+    return budgets
+
+
+def render_chat_prompt(tokenizer, messages: List[Dict[str, str]]) -> str:
+    """
+    chat 템플릿 적용
+
+    마지막 메시지가 assistant면 새 응답을 시작하지 않고 그 내용을 이어서 생성 (잘린 응답 이어쓰기)
+    """
+    if messages and messages[-1].get("role") == "assistant":
+        return tokenizer.apply_chat_template(messages, tokenize=False, continue_final_message=True)
+    return tokenizer.apply_chat_template(messages, tokenize=False, add_generation_prompt=True)
+
+
+class LLMBackend(ABC):
+    """
+    LLM 백엔드 인터페이스 (chat 메시지 → 텍스트)
+
+    마지막 메시지가 assistant면 그 내용을 이어서 생성 (render_chat_prompt)
+    """
+
+    name = "base"
+    # True면 agenerate가 이벤트 루프에서 직접 실행 가능 (워커 스레드 불필요)
+    supports_async = False
+    # True면 여러 스레드의 동시 generate 호출을 내부에서 묶어 처리 (청크 동시 제출이 유리)
+    supports_batching = False
+    # 동시에 실행해도 처리량이 늘어나는 요청 수 (요청 스케줄러 기본 동시 실행 슬롯 수)
+    max_concurrency = 1
+
+    @abstractmethod
+    def load(self) -> None:
+        """모델/연결 준비 (여러 번 호출해도 안전해야 함)"""
+
+    @property
+    @abstractmethod
+    def is_loaded(self) -> bool:
+        """로딩 완료 여부"""
+
+    @abstractmethod
+    def generate(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int = 2048,
+        temperature: float = 0.3,
+        top_p: float = 0.9,
+        repetition_penalty: float = 1.1,
+        stop: Optional[List[str]] = None,
+        json_mode: bool = False
+    ) -> GenerationResult:
+        """
+        동기 생성 (워커 스레드에서 호출)
+
+        json_mode: 응답이 JSON 객체임을 알림 (지원하는 백엔드는 객체가 닫히면 조기 종료)
+        """
+
+    def generate_batch(self, messages_list: List[List[Dict[str, str]]], max_tokens: Union[int, Sequence[int]] = 2048, **kwargs) -> List[GenerationResult]:
+        """
+        여러 대화를 한 번에 생성 (기본 구현은 순차 실행, 배치 가능한 엔진은 재정의)
+
+        max_tokens: 공통 예산 또는 시퀀스별 예산 목록 (단계별 예산이 다른 요청도 한 배치로 처리)
+        """
+        budgets = per_sequence_max_tokens(max_tokens, len(messages_list))
+        return [self.generate(messages, max_tokens=budget, **kwargs) for messages, budget in zip(messages_list, budgets)]
+
+    async def agenerate(self, messages: List[Dict[str, str]], **kwargs) -> GenerationResult:
+        """비동기 생성 (기본 구현은 워커 스레드에서 generate 실행)"""
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, lambda: self.generate(messages, **kwargs))
+
+    def close(self) -> None:
+        """자원 정리"""
+
+    def spec_decode_stats(self) -> Optional[Dict[str, Any]]:
+        """추측 디코딩 초안 수락 통계 (사용하지 않으면 None)"""
+        return None
+
+    def describe(self) -> Dict[str, Any]:
+        return {"backend": self.name, "loaded": self.is_loaded}
+
+
+class VLLMBackend(LLMBackend):
+    """프로세스 내 vLLM 엔진"""
+
+    name = "vllm"
+
+    def __init__(self, model_name: str = DEFAULT_MODEL_NAME, speculative: Optional[SpeculativeConfig] = None, **engine_kwargs):
+        self.model_name = model_name
+        self.speculative = speculative or SpeculativeConfig()
+        self.spec_tracker = SpecDecodeTracker("vllm") if self.speculative.enabled else None
+        self.engine_kwargs = {
+            "tensor_parallel_size": 1,
+            "gpu_memory_utilization": 0.7,  # GPU 메모리 70%
+            "trust_remote_code": True,
+            "quantization": "awq",  # AWQ 양자화 명시
+            "max_model_len": 16384,
+            "enforce_eager": True,  # CUDA 그래프 비활성화 (메모리 절약)
+            "swap_space": 4,
+            "max_num_seqs": 64,
+            **engine_kwargs
+        }
+        self.model = None
+        self.tokenizer = None
+        self.json_stop_supported = True
+
+    def load(self) -> None:
+        if self.model is not None:
+            return
+        logger.info("⚡ Using VLLM for ultra-fast inference")
+        from vllm import LLM
+        from transformers import AutoTokenizer
+
+        if self.speculative.enabled:
+            try:
+                self.model = LLM(model=self.model_name, **self.engine_kwargs, **self.speculative.to_engine_kwargs())
+                self._register_spec_logger()
+                logger.info(f"🎯 Speculative decoding enabled: {self.speculative.describe()}")
+            except Exception as e:
+                # 초안 모델 문제로 서버 모델까지 Transformers로 대체되지 않도록 추측 디코딩만 끔
+                logger.warning(f"⚠️ 추측 디코딩 초기화 실패, 일반 디코딩으로 로딩: {e}")
+                self.speculative = SpeculativeConfig()
+                self.spec_tracker = None
+        if self.model is None:
+            self.model = LLM(model=self.model_name, **self.engine_kwargs)
+        # 토크나이저는 별도 로딩 (템플릿 적용용)
+        self.tokenizer = AutoTokenizer.from_pretrained(self.model_name, trust_remote_code=True)
+        logger.info("🎉 VLLM Qwen3-32B-AWQ loaded successfully")
+
+    def _register_spec_logger(self) -> None:
+        """V0 엔진: 엔진 통계(spec_decode_metrics)를 받는 stat logger 등록 (V1은 get_metrics로 조회)"""
+        engine = getattr(self.model, "llm_engine", None)
+        if engine is not None and hasattr(engine, "add_logger"):
+            try:
+                engine.add_logger("ttalkkak_spec_decode", self.spec_tracker)
+            except Exception as e:
+                logger.debug(f"stat logger 등록 불가: {e}")
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.model is not None
+
+    def generate(self, messages, max_tokens=2048, temperature=0.3, top_p=0.9, repetition_penalty=1.1, stop=None, json_mode=False) -> GenerationResult:
+        return self.generate_batch(
+            [messages], max_tokens=max_tokens, temperature=temperature,
+            top_p=top_p, repetition_penalty=repetition_penalty, stop=stop, json_mode=json_mode
+        )[0]
+
+    def generate_batch(self, messages_list, max_tokens=2048, temperature=0.3, top_p=0.9, repetition_penalty=1.1, stop=None, json_mode=False) -> List[GenerationResult]:
+        from vllm import SamplingParams
+        from json_stop import JsonLogitsProcessor, trim_to_json_object
+
+        self.load()
+        texts = [render_chat_prompt(self.tokenizer, messages) for messages in messages_list]
+
+        # JSON 조기 종료는 시퀀스별 상태가 필요하므로 요청마다 logits processor 생성
+        use_json_stop = json_mode and self.json_stop_supported
+        processors = [JsonLogitsProcessor(self.tokenizer) if use_json_stop else None for _ in texts]
+        budgets = per_sequence_max_tokens(max_tokens, len(texts))
+        sampling_params = [
+            SamplingParams(
+                max_tokens=budget,
+                temperature=temperature,
+                top_p=top_p,
+                repetition_penalty=repetition_penalty,
+                stop=stop,
+                logits_processors=[processor] if processor else None
+            )
+            for processor, budget in zip(processors, budgets)
+        ]
+
+        # 한 번의 generate 호출로 연속 배치 처리
+        try:
+            request_outputs = self.model.generate(texts, sampling_params)
+        except (ValueError, NotImplementedError) as e:
+            if not use_json_stop:
+                raise
+            # V1 엔진 등 요청별 logits processor 미지원 → 조기 종료 없이 재시도
+            logger.warning(f"⚠️ vLLM logits processor 미지원, JSON 조기 종료 비활성화: {e}")
+            self.json_stop_supported = False
+            return self.generate_batch(
+                messages_list, max_tokens=max_tokens, temperature=temperature, top_p=top_p,
+                repetition_penalty=repetition_penalty, stop=stop, json_mode=False
+            )
+
+        if self.spec_tracker is not None:
+            self.spec_tracker.poll_llm(self.model)
+
+        results = []
+        for request_output, processor in zip(request_outputs, processors):
+            result = self._to_result(request_output)
+            if processor is not None and processor.stopped_early:
+                result.text, _ = trim_to_json_object(result.text)
+                result.stopped_early = True
+            results.append(result)
+        return results
+
+    @staticmethod
+    def _to_result(request_output) -> GenerationResult:
+        completion = request_output.outputs[0]
+
+        result = GenerationResult(
+            text=completion.text,
+            prompt_tokens=len(request_output.prompt_token_ids or []),
+            completion_tokens=len(completion.token_ids),
+            finish_reason=completion.finish_reason,
+            cached_tokens=getattr(request_output, "num_cached_tokens", None)
+        )
+
+        # 엔진 타임스탬프 기반 프리필/디코드 분리 (V0 엔진의 RequestMetrics)
+        engine_metrics = getattr(request_output, "metrics", None)
+        first_scheduled = getattr(engine_metrics, "first_scheduled_time", None)
+        first_token = getattr(engine_metrics, "first_token_time", None)
+        last_token = getattr(engine_metrics, "last_token_time", None)
+        if first_scheduled and first_token:
+            result.prefill_time = max(0.0, first_token - first_scheduled)
+            if last_token:
+                result.decode_time = max(0.0, last_token - first_token)
+        return result
+
+    def spec_decode_stats(self) -> Optional[Dict[str, Any]]:
+        if self.spec_tracker is None:
+            return None
+        if self.model is not None:
+            self.spec_tracker.poll_llm(self.model)
+        return {**self.speculative.describe(), **self.spec_tracker.get_stats()}
+
+    def describe(self) -> Dict[str, Any]:
+        return {**super().describe(), "model": self.model_name, "speculative": self.speculative.describe()}
+
+
+class TransformersBackend(LLMBackend):
+    """
+    프로세스 내 Transformers (대체 경로)
+
+    동시 요청을 마이크로 배치 큐로 모아 한 번의 generate로 처리
+    - 왼쪽 패딩 + 정적 KV 캐시
+    - json_mode면 시퀀스별로 JSON 객체가 닫히는 즉시 종료
+    """
+
+    name = "transformers"
+    supports_batching = True
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_MODEL_NAME,
+        max_batch_size: int = 4,
+        batch_wait_ms: float = 20.0,
+        static_cache: bool = True
+    ):
+        self.model_name = model_name
+        self.static_cache = static_cache
+        self.model = None
+        self.tokenizer = None
+        self._load_lock = threading.Lock()
+        self._batcher = MicroBatcher("transformers", self._process_batch, max_batch_size, batch_wait_ms)
+
+    def load(self) -> None:
+        with self._load_lock:
+            if self.model is not None:
+                return
+            logger.info("📚 Using Transformers (fallback mode)")
+            import torch
+            from transformers import AutoTokenizer, AutoModelForCausalLM
+
+            tokenizer = AutoTokenizer.from_pretrained(self.model_name, trust_remote_code=True)
+            # 배치 생성은 왼쪽 패딩 필요 (생성 위치를 오른쪽 끝에 정렬)
+            tokenizer.padding_side = "left"
+            if tokenizer.pad_token is None:
+                tokenizer.pad_token = tokenizer.eos_token
+            self.tokenizer = tokenizer
+            self.model = AutoModelForCausalLM.from_pretrained(
+                self.model_name,
+                device_map="auto",
+                torch_dtype=torch.float16,
+                trust_remote_code=True
+            )
+            logger.info("✅ Transformers Qwen3-32B-AWQ loaded successfully")
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.model is not None
+
+    @property
+    def max_concurrency(self) -> int:
+        # 배치 크기만큼 요청이 동시에 generate를 호출해야 서로 다른 요청이 한 배치로 묶임
+        return self._batcher.max_batch_size
+
+    def generate(self, messages, max_tokens=2048, temperature=0.3, top_p=0.9, repetition_penalty=1.1, stop=None, json_mode=False) -> GenerationResult:
+        generate_kwargs = {
+            "temperature": temperature,
+            "top_p": top_p,
+            "repetition_penalty": repetition_penalty,
+            "stop": tuple(stop) if stop else None,
+            "json_mode": json_mode
+        }
+        # 샘플링 파라미터가 같은 동시 요청끼리 한 배치로 묶임 (max_tokens는 시퀀스별로 적용하므로 키에서 제외)
+        key = tuple(sorted(generate_kwargs.items()))
+        return self._batcher.submit((messages, max_tokens, generate_kwargs), key=key)
+
+    def _process_batch(self, items) -> List[GenerationResult]:
+        generate_kwargs = dict(items[0][2])
+        generate_kwargs["stop"] = list(generate_kwargs["stop"]) if generate_kwargs["stop"] else None
+        return self.generate_batch(
+            [messages for messages, _, _ in items],
+            max_tokens=[max_tokens for _, max_tokens, _ in items],
+            **generate_kwargs
+        )
+
+    def generate_batch(self, messages_list, max_tokens=2048, temperature=0.3, top_p=0.9, repetition_penalty=1.1, stop=None, json_mode=False) -> List[GenerationResult]:
+        import torch
+        from transformers import StoppingCriteriaList
+        from json_stop import JsonStoppingCriteria, trim_to_json_object
+
+        self.load()
+        texts = [render_chat_prompt(self.tokenizer, messages) for messages in messages_list]
+        # 배치는 가장 큰 예산으로 생성하고 시퀀스별 예산으로 잘라냄
+        budgets = per_sequence_max_tokens(max_tokens, len(texts))
+        inputs = self.tokenizer(texts, return_tensors="pt", padding=True).to(self.model.device)
+        padded_length = inputs["input_ids"].shape[1]
+        prompt_lengths = inputs["attention_mask"].sum(dim=1).tolist()
+
+        # JSON 종료 감지 + 첫 토큰 시각 기록 (json_mode가 아니면 감지 결과는 사용하지 않음)
+        json_criteria = JsonStoppingCriteria(self.tokenizer, len(texts), enabled=json_mode)
+        generate_kwargs = {
+            "max_new_tokens": max(budgets),
+            "temperature": temperature,
+            "do_sample": True,
+            "pad_token_id": self.tokenizer.pad_token_id,
+            "repetition_penalty": repetition_penalty,
+            "top_p": top_p,
+            "stopping_criteria": StoppingCriteriaList([json_criteria])
+        }
+        if self.static_cache:
+            generate_kwargs["cache_implementation"] = "static"
+
+        start_time = time.time()
+        with torch.no_grad():
+            try:
+                outputs = self.model.generate(**inputs, **generate_kwargs)
+            except (ValueError, TypeError) as e:
+                if not self.static_cache:
+                    raise
+                # 정적 캐시를 지원하지 않는 모델/버전 → 동적 캐시로 재시도
+                logger.warning(f"⚠️ 정적 KV 캐시 사용 불가, 동적 캐시로 전환: {e}")
+                self.static_cache = False
+                generate_kwargs.pop("cache_implementation")
+                json_criteria.reset()
+                start_time = time.time()
+                outputs = self.model.generate(**inputs, **generate_kwargs)
+        end_time = time.time()
+
+        prefill_time = decode_time = None
+        if json_criteria.first_step_time is not None:
+            prefill_time = json_criteria.first_step_time - start_time
+            decode_time = end_time - json_criteria.first_step_time
+
+        results = []
+        eos_ids = {self.tokenizer.eos_token_id, self.tokenizer.pad_token_id}
+        for i, output in enumerate(outputs):
+            completion_ids = output[padded_length:].tolist()[:budgets[i]]
+            finish_reason = "length"
+
+            json_step = json_criteria.finished_steps[i]
+            if json_step is not None and json_step > budgets[i]:
+                json_step = None  # 자기 예산 안에서는 JSON이 닫히지 않음
+            if json_step is not None:
+                completion_ids = completion_ids[:json_step]
+                finish_reason = "stop"
+            else:
+                # 먼저 끝난 시퀀스 뒤쪽은 패딩으로 채워짐
+                for index, token_id in enumerate(completion_ids):
+                    if token_id in eos_ids:
+                        completion_ids = completion_ids[:index]
+                        finish_reason = "stop"
+                        break
+
+            response = self.tokenizer.decode(completion_ids, skip_special_tokens=True)
+            if json_step is not None:
+                # 닫는 괄호와 같은 토큰에 붙은 뒷부분 제거
+                response, _ = trim_to_json_object(response)
+            # stop 문자열은 generate에 직접 넘기지 않고 결과에서 잘라냄 (구버전 transformers 호환)
+            for stop_text in stop or []:
+                if stop_text in response:
+                    response = response[:response.index(stop_text)]
+                    finish_reason = "stop"
+
+            results.append(GenerationResult(
+                text=response,
+                prompt_tokens=int(prompt_lengths[i]),
+                completion_tokens=len(completion_ids),
+                finish_reason=finish_reason,
+                prefill_time=prefill_time,
+                decode_time=decode_time,
+                stopped_early=json_step is not None
+            ))
+        return results
+
+
+class OpenAICompatibleBackend(LLMBackend):
+    """OpenAI 호환 /v1/chat/completions 서버 클라이언트 (연결 풀 재사용)"""
+
+    name = "openai"
+    supports_async = True
+    max_concurrency = 8  # 서빙 엔진이 동시 요청을 연속 배치로 처리
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8001",
+        model_name: str = DEFAULT_MODEL_NAME,
+        api_key: Optional[str] = None,
+        timeout: float = 600.0,
+        max_connections: int = 64,
+        max_retries: int = 2,
+        vllm_extensions: bool = True
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.model_name = model_name
+        self.api_key = api_key
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_retries = max_retries
+        # repetition_penalty 등 vLLM 전용 샘플링 파라미터 전송 여부
+        self.vllm_extensions = vllm_extensions
+        self._client = None
+        self._async_client = None
+        self._lock = threading.Lock()
+        # 서빙 서버(vllm serve --speculative-config ...)의 /metrics에서 수락률 집계
+        self.spec_tracker = SpecDecodeTracker("openai")
+
+    def _client_kwargs(self) -> Dict[str, Any]:
+        import httpx
+
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        return {
+            "base_url": self.base_url,
+            "headers": headers,
+            "timeout": httpx.Timeout(self.timeout, connect=10.0),
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections
+            )
+        }
+
+    def load(self) -> None:
+        with self._lock:
+            if self._client is None:
+                import httpx
+                self._client = httpx.Client(**self._client_kwargs())
+                logger.info(f"🔗 OpenAI 호환 LLM 서버 연결: {self.base_url} (model={self.model_name})")
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._client is not None
+
+    def _get_async_client(self):
+        # AsyncClient는 생성된 이벤트 루프에 묶이므로 워커 프로세스당 하나를 지연 생성
+        if self._async_client is None:
+            import httpx
+            self._async_client = httpx.AsyncClient(**self._client_kwargs())
+        return self._async_client
+
+    def _build_payload(self, messages, max_tokens, temperature, top_p, repetition_penalty, stop) -> Dict[str, Any]:
+        payload = {
+            "model": self.model_name,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "top_p": top_p
+        }
+        if stop:
+            payload["stop"] = stop
+        if self.vllm_extensions:
+            payload["repetition_penalty"] = repetition_penalty
+            if messages and messages[-1].get("role") == "assistant":
+                # 잘린 응답 이어쓰기 (vLLM chat 템플릿 확장 파라미터)
+                payload["add_generation_prompt"] = False
+                payload["continue_final_message"] = True
+        return payload
+
+    @staticmethod
+    def _parse_response(data: Dict[str, Any]) -> GenerationResult:
+        choice = data["choices"][0]
+        usage = data.get("usage") or {}
+        prompt_details = usage.get("prompt_tokens_details") or {}
+        return GenerationResult(
+            text=(choice.get("message") or {}).get("content") or "",
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            completion_tokens=usage.get("completion_tokens", 0),
+            finish_reason=choice.get("finish_reason"),
+            cached_tokens=prompt_details.get("cached_tokens")
+        )
+
+    @staticmethod
+    def _parse_sse_line(line: str) -> Optional[Dict[str, Any]]:
+        """SSE 'data: {...}' 줄 → 이벤트 (종료 표시/빈 줄은 None)"""
+        if not line.startswith("data:"):
+            return None
+        data = line[len("data:"):].strip()
+        if not data or data == "[DONE]":
+            return None
+        return json.loads(data)
+
+    def _stream_payload(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return {**payload, "stream": True, "stream_options": {"include_usage": True}}
+
+    @staticmethod
+    def _accumulate(state: Dict[str, Any], event: Dict[str, Any]) -> bool:
+        """스트림 이벤트 누적, JSON 객체가 닫혔으면 True"""
+        if event.get("usage"):
+            state["usage"] = event["usage"]
+        for choice in event.get("choices") or []:
+            delta = (choice.get("delta") or {}).get("content") or ""
+            if choice.get("finish_reason"):
+                state["finish_reason"] = choice["finish_reason"]
+            if delta:
+                state["parts"].append(delta)
+                state["chunks"] += 1
+                if state["detector"].feed(delta):
+                    return True
+        return False
+
+    @staticmethod
+    def _stream_result(state: Dict[str, Any], stopped_early: bool) -> GenerationResult:
+        from json_stop import trim_to_json_object
+
+        text = "".join(state["parts"])
+        usage = state.get("usage") or {}
+        if stopped_early:
+            text, _ = trim_to_json_object(text)
+        return GenerationResult(
+            text=text,
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            # 조기 종료 시 usage가 오지 않으므로 스트림 청크 수(≈토큰 수)로 대체
+            completion_tokens=usage.get("completion_tokens", state["chunks"]),
+            finish_reason="stop" if stopped_early else state.get("finish_reason"),
+            cached_tokens=((usage.get("prompt_tokens_details") or {}).get("cached_tokens")),
+            stopped_early=stopped_early
+        )
+
+    @staticmethod
+    def _new_stream_state() -> Dict[str, Any]:
+        from json_stop import JsonCompletionDetector
+        return {"parts": [], "chunks": 0, "detector": JsonCompletionDetector()}
+
+    def _generate_json_stream(self, payload: Dict[str, Any]) -> GenerationResult:
+        """스트리밍으로 받다가 JSON 객체가 닫히면 연결 종료 (서버는 요청 중단)"""
+        state = self._new_stream_state()
+        stopped_early = False
+        with self._client.stream("POST", "/v1/chat/completions", json=self._stream_payload(payload)) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                event = self._parse_sse_line(line)
+                if event is not None and self._accumulate(state, event):
+                    stopped_early = True
+                    break
+        return self._stream_result(state, stopped_early)
+
+    async def _agenerate_json_stream(self, client, payload: Dict[str, Any]) -> GenerationResult:
+        state = self._new_stream_state()
+        stopped_early = False
+        async with client.stream("POST", "/v1/chat/completions", json=self._stream_payload(payload)) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                event = self._parse_sse_line(line)
+                if event is not None and self._accumulate(state, event):
+                    stopped_early = True
+                    break
+        return self._stream_result(state, stopped_early)
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        import httpx
+
+        if isinstance(error, (httpx.ConnectError, httpx.RemoteProtocolError, httpx.ReadError)):
+            return True
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in (429, 502, 503, 504)
+        return False
+
+    def generate(self, messages, max_tokens=2048, temperature=0.3, top_p=0.9, repetition_penalty=1.1, stop=None, json_mode=False) -> GenerationResult:
+        self.load()
+        payload = self._build_payload(messages, max_tokens, temperature, top_p, repetition_penalty, stop)
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                if json_mode:
+                    return self._generate_json_stream(payload)
+                response = self._client.post("/v1/chat/completions", json=payload)
+                response.raise_for_status()
+                return self._parse_response(response.json())
+            except Exception as e:
+                if attempt >= self.max_retries or not self._is_retryable(e):
+                    raise
+                logger.warning(f"⚠️ LLM 서버 요청 실패, 재시도 {attempt + 1}/{self.max_retries}: {e}")
+                time.sleep(0.5 * (2 ** attempt))
+
+    async def agenerate(self, messages, max_tokens=2048, temperature=0.3, top_p=0.9, repetition_penalty=1.1, stop=None, json_mode=False) -> GenerationResult:
+        client = self._get_async_client()
+        payload = self._build_payload(messages, max_tokens, temperature, top_p, repetition_penalty, stop)
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                if json_mode:
+                    return await self._agenerate_json_stream(client, payload)
+                response = await client.post("/v1/chat/completions", json=payload)
+                response.raise_for_status()
+                return self._parse_response(response.json())
+            except Exception as e:
+                if attempt >= self.max_retries or not self._is_retryable(e):
+                    raise
+                logger.warning(f"⚠️ LLM 서버 요청 실패, 재시도 {attempt + 1}/{self.max_retries}: {e}")
+                await asyncio.sleep(0.5 * (2 ** attempt))
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        # AsyncClient는 이벤트 루프 종료 시 aclose() 필요
+        self._async_client = None
+
+    async def aclose(self) -> None:
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        self.close()
+
+    def spec_decode_stats(self) -> Optional[Dict[str, Any]]:
+        if not self.vllm_extensions:
+            return None
+        self.load()
+        try:
+            response = self._client.get("/metrics", timeout=5.0)
+            response.raise_for_status()
+        except Exception as e:
+            logger.debug(f"서빙 서버 메트릭 조회 실패: {e}")
+            return None
+        self.spec_tracker.update_from_prometheus(response.text)
+        stats = self.spec_tracker.get_stats()
+        return {"enabled": True, **stats} if stats["draft_tokens"] else None
+
+    def describe(self) -> Dict[str, Any]:
+        return {**super().describe(), "base_url": self.base_url, "model": self.model_name}
+
+
+def create_transformers_backend(model_name: str = DEFAULT_MODEL_NAME) -> TransformersBackend:
+    """환경변수 기반 Transformers 백엔드 (TRANSFORMERS_MAX_BATCH, TRANSFORMERS_BATCH_WAIT_MS, TRANSFORMERS_STATIC_CACHE)"""
+    return TransformersBackend(
+        model_name,
+        max_batch_size=int(os.getenv("TRANSFORMERS_MAX_BATCH", "4")),
+        batch_wait_ms=float(os.getenv("TRANSFORMERS_BATCH_WAIT_MS", "20")),
+        static_cache=os.getenv("TRANSFORMERS_STATIC_CACHE", "true").lower() == "true"
+    )
+
+
+def create_llm_backend(backend_type: Optional[str] = None) -> LLMBackend:
+    """환경변수 기반 백엔드 생성 (로딩은 하지 않음)"""
+    if backend_type is None:
+        use_vllm = os.getenv("USE_VLLM", "true").lower() == "true"
+        default_type = "vllm" if use_vllm else "transformers"
+        if os.getenv("MODEL_HOST_SOCKET"):
+            default_type = "model_host"
+        backend_type = os.getenv("LLM_BACKEND", default_type)
+    backend_type = backend_type.lower()
+    model_name = os.getenv("LLM_MODEL_NAME", DEFAULT_MODEL_NAME)
+
+    if backend_type == "vllm":
+        return VLLMBackend(model_name, speculative=SpeculativeConfig.from_env())
+    if backend_type == "transformers":
+        return create_transformers_backend(model_name)
+    if backend_type in ("openai", "http"):
+        return OpenAICompatibleBackend(
+            base_url=os.getenv("LLM_BASE_URL", "http://localhost:8001"),
+            model_name=model_name,
+            api_key=os.getenv("LLM_API_KEY"),
+            timeout=float(os.getenv("LLM_TIMEOUT", "600")),
+            max_connections=int(os.getenv("LLM_MAX_CONNECTIONS", "64")),
+            vllm_extensions=os.getenv("LLM_VLLM_EXTENSIONS", "true").lower() == "true"
+        )
+    if backend_type == "model_host":
+        from model_host import ModelHostBackend
+        return ModelHostBackend()
+    raise ValueError(f"알 수 없는 LLM_BACKEND: {backend_type} (vllm/transformers/openai/model_host)")
+
+
+# 전역 인스턴스
+_llm_backend = None
+_llm_backend_lock = threading.Lock()
+
+
+def get_llm_backend() -> LLMBackend:
+    """전역 LLM 백엔드 반환 (최초 호출 시 로딩, vLLM 실패 시 Transformers로 대체)"""
+    global _llm_backend
+    if _llm_backend is not None:
+        return _llm_backend
+
+    with _llm_backend_lock:
+        if _llm_backend is None:
+            backend = create_llm_backend()
+            try:
+                backend.load()
+            except Exception as e:
+                if not isinstance(backend, VLLMBackend):
+                    raise
+                logger.error(f"❌ VLLM model loading failed: {e}")
+                logger.warning("🔄 VLLM failed, falling back to Transformers...")
+                os.environ["USE_VLLM"] = "false"
+                backend = create_transformers_backend(backend.model_name)
+                backend.load()
+            _llm_backend = backend
+    return _llm_backend
+
+
+def backend_max_concurrency() -> int:
+    """현재(또는 생성될) 백엔드의 권장 동시 실행 수 (로딩을 유발하지 않음)"""
+    if _llm_backend is not None:
+        return _llm_backend.max_concurrency
+    return create_llm_backend().max_concurrency
+
+
+def get_loaded_llm_backend() -> Optional[LLMBackend]:
+    """로딩된 백엔드가 있으면 반환 (헬스 체크용, 로딩을 유발하지 않음)"""
+    return _llm_backend
+
+
+def backend_supports_async() -> bool:
+    """현재(또는 생성될) 백엔드가 이벤트 루프에서 직접 호출 가능한지 (로딩을 유발하지 않음)"""
+    if _llm_backend is not None:
+        return _llm_backend.supports_async
+    return create_llm_backend().supports_async
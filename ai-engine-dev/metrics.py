@@ -0,0 +1,286 @@
+"""
+TtalKkak 성능 지표 수집
+Prometheus 텍스트 포맷으로 노출하는 경량 메트릭 레지스트리
+- Counter / Gauge / Histogram (레이블 지원, 스레드 안전)
+- timer(): 모든 모듈에서 공통으로 사용하는 구간 측정 API
+- snapshot() / render_metrics(remote=...): 다른 프로세스(모델 호스트)의 지표를 레이블을 붙여 함께 노출
+"""
+
+import time
+import threading
+import logging
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from profiling import span
+
+logger = logging.getLogger(__name__)
+
+METRIC_PREFIX = "ttalkkak_"
+
+# 지연 시간 히스토그램 버킷 (초) - BERT 배치(수십 ms)부터 장시간 회의 전체 처리(수십 분)까지
+DEFAULT_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0)
+
+
+def _escape_label_value(value: str) -> str:
+    """Prometheus 레이블 값 이스케이프 (역슬래시, 큰따옴표, 줄바꿈)"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class _Metric:
+    """레이블 조합별 값을 보관하는 기본 메트릭"""
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str):
+        self.name = METRIC_PREFIX + name
+        self.documentation = documentation
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _label_key(labels: Dict[str, str]) -> Tuple[Tuple[str, str], ...]:
+        return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    @staticmethod
+    def _format_labels(label_key: Tuple[Tuple[str, str], ...], extra: Optional[Tuple[str, str]] = None) -> str:
+        pairs = list(label_key) + ([extra] if extra else [])
+        if not pairs:
+            return ""
+        escaped = [f'{k}="{_escape_label_value(v)}"' for k, v in pairs]
+        return "{" + ",".join(escaped) + "}"
+
+    def snapshot(self) -> List[Tuple[Tuple[Tuple[str, str], ...], Any]]:
+        """레이블 조합별 현재 값 복사본 (프로세스 간 전달용)"""
+        raise NotImplementedError
+
+    def _render_series(self, key: Tuple[Tuple[str, str], ...], value: Any) -> List[str]:
+        return [f"{self.name}{self._format_labels(key)} {value}"]
+
+    def render(self, extra_series: Iterable[Tuple[Tuple[Tuple[str, str], ...], Any]] = ()) -> List[str]:
+        """
+        HELP/TYPE + 레이블 조합별 값
+
+        Args:
+            extra_series: 다른 프로세스의 snapshot() 값 (레이블 구분 필요)
+        """
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        for key, value in list(self.snapshot()) + list(extra_series):
+            lines.extend(self._render_series(key, value))
+        return lines
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str):
+        super().__init__(name, documentation)
+        self._values: Dict[Tuple, float] = {}
+
+    def inc(self, value: float = 1.0, **labels) -> None:
+        key = self._label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + value
+
+    def snapshot(self) -> List[Tuple[Tuple[Tuple[str, str], ...], Any]]:
+        with self._lock:
+            return list(self._values.items())
+
+
+class Gauge(_Metric):
+    """현재 값 게이지"""
+    metric_type = "gauge"
+
+    def __init__(self, name: str, documentation: str):
+        super().__init__(name, documentation)
+        self._values: Dict[Tuple, float] = {}
+
+    def set(self, value: float, **labels) -> None:
+        key = self._label_key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def snapshot(self) -> List[Tuple[Tuple[Tuple[str, str], ...], Any]]:
+        with self._lock:
+            return list(self._values.items())
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램"""
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple, Dict] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._label_key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = {"buckets": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+                self._series[key] = series
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series["buckets"][i] += 1
+            series["sum"] += value
+            series["count"] += 1
+
+    def snapshot(self) -> List[Tuple[Tuple[Tuple[str, str], ...], Any]]:
+        with self._lock:
+            return [
+                (key, {"buckets": list(series["buckets"]), "sum": series["sum"], "count": series["count"]})
+                for key, series in self._series.items()
+            ]
+
+    def _render_series(self, key: Tuple[Tuple[str, str], ...], series: Dict) -> List[str]:
+        lines = []
+        for bound, count in zip(self.buckets, series["buckets"]):
+            lines.append(f"{self.name}_bucket{self._format_labels(key, ('le', repr(float(bound))))} {count}")
+        lines.append(f"{self.name}_bucket{self._format_labels(key, ('le', '+Inf'))} {series['count']}")
+        lines.append(f"{self.name}_sum{self._format_labels(key)} {series['sum']}")
+        lines.append(f"{self.name}_count{self._format_labels(key)} {series['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    """메트릭 레지스트리 (이름 → 메트릭)"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, documentation: str, **kwargs) -> _Metric:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = cls(name, documentation, **kwargs)
+                self._metrics[name] = metric
+            elif not isinstance(metric, cls):
+                raise TypeError(f"메트릭 타입 불일치: {name} ({type(metric).__name__} != {cls.__name__})")
+            return metric
+
+    def counter(self, name: str, documentation: str = "") -> Counter:
+        return self._get_or_create(Counter, name, documentation)
+
+    def gauge(self, name: str, documentation: str = "") -> Gauge:
+        return self._get_or_create(Gauge, name, documentation)
+
+    def histogram(self, name: str, documentation: str = "", buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, buckets=buckets)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """전체 지표 복사본 (이름 → 타입/설명/버킷/값, pickle 가능)"""
+        with self._lock:
+            metrics = dict(self._metrics)
+        return {
+            name: {
+                "type": metric.metric_type,
+                "documentation": metric.documentation,
+                "buckets": getattr(metric, "buckets", None),
+                "series": metric.snapshot()
+            }
+            for name, metric in metrics.items()
+        }
+
+    def render(self, remote: Iterable[Tuple[Dict[str, str], Dict[str, Dict[str, Any]]]] = ()) -> str:
+        """
+        Prometheus 텍스트 포맷 (text/plain; version=0.0.4)
+
+        Args:
+            remote: (추가 레이블, 다른 프로세스의 snapshot()) 목록 → 같은 이름의 지표에 레이블을 붙여 합침
+        """
+        extra: Dict[str, List] = {}
+        for labels, snapshot in remote:
+            for name, data in snapshot.items():
+                if name not in self._metrics:
+                    # 이 프로세스에서는 기록하지 않는 지표 (예: 호스트의 전사 시간) → 같은 타입으로 등록
+                    cls = {"counter": Counter, "gauge": Gauge, "histogram": Histogram}[data["type"]]
+                    options = {"buckets": tuple(data["buckets"])} if data["buckets"] else {}
+                    self._get_or_create(cls, name, data["documentation"], **options)
+                extra.setdefault(name, []).extend(
+                    (tuple(sorted(dict(key, **labels).items())), value) for key, value in data["series"]
+                )
+
+        lines = []
+        with self._lock:
+            metrics = dict(self._metrics)
+        for name, metric in metrics.items():
+            lines.extend(metric.render(extra.get(name, ())))
+        return "\n".join(lines) + "\n"
+
+
+# 전역 레지스트리
+registry = MetricsRegistry()
+
+# 파이프라인 표준 메트릭 정의
+TRANSCRIPTION_SECONDS = registry.histogram("transcription_seconds", "WhisperX 전사 시간")
+TRIPLET_BUILD_SECONDS = registry.histogram("triplet_build_seconds", "WhisperX 결과 → Triplet 변환 시간")
+BERT_BATCH_SECONDS = registry.histogram("bert_batch_seconds", "BERT 분류 배치 1개 추론 시간")
+LLM_PREFILL_SECONDS = registry.histogram("llm_prefill_seconds", "LLM 프리필(첫 토큰까지) 시간")
+LLM_DECODE_SECONDS = registry.histogram("llm_decode_seconds", "LLM 디코드(첫 토큰 이후) 시간")
+LLM_INFERENCE_SECONDS = registry.histogram("llm_inference_seconds", "LLM 추론 전체 시간")
+JSON_PARSE_SECONDS = registry.histogram("json_parse_seconds", "LLM 응답 JSON 추출/파싱 시간")
+REQUEST_SECONDS = registry.histogram("request_seconds", "엔드포인트 종단 간 처리 시간")
+BATCH_QUEUE_WAIT_SECONDS = registry.histogram("batch_queue_wait_seconds", "마이크로 배치 큐 대기 시간")
+BATCH_SIZE = registry.histogram("batch_size", "마이크로 배치 크기", buckets=(1, 2, 4, 8, 16, 32, 64))
+
+LLM_TOKENS_IN = registry.counter("llm_tokens_in_total", "LLM 입력 토큰 수")
+LLM_TOKENS_OUT = registry.counter("llm_tokens_out_total", "LLM 출력 토큰 수")
+LLM_CHUNKS = registry.counter("llm_chunks_total", "청킹 처리로 생성된 청크 수")
+JSON_FAILURES = registry.counter("json_parse_failures_total", "LLM 응답 JSON 파싱 실패 수")
+CACHE_HITS = registry.counter("cache_hits_total", "캐시 적중 수 (cache 레이블로 구분)")
+CACHE_REQUESTS = registry.counter("cache_requests_total", "캐시 조회 수 (cache 레이블로 구분)")
+JSON_EARLY_STOPS = registry.counter("json_early_stops_total", "JSON 객체 완료로 조기 종료된 생성 수")
+LLM_TOKENS_SAVED = registry.counter("llm_tokens_saved_total", "JSON 조기 종료로 절약한 출력 토큰 수 (max_tokens 기준 상한값)")
+LLM_CONTINUATIONS = registry.counter("llm_continuations_total", "max_tokens 예산 초과로 이어서 생성한 횟수")
+LLM_SPEC_DRAFT_TOKENS = registry.counter("llm_spec_draft_tokens_total", "추측 디코딩 초안 모델이 제안한 토큰 수")
+LLM_SPEC_ACCEPTED_TOKENS = registry.counter("llm_spec_accepted_tokens_total", "추측 디코딩에서 대상 모델이 수락한 초안 토큰 수")
+
+QUEUE_DEPTH = registry.gauge("scheduler_queue_depth", "스케줄러 우선순위별 대기열 길이")
+QUEUE_RUNNING = registry.gauge("scheduler_running", "스케줄러 실행 중 작업 수")
+LLM_MAX_TOKENS_BUDGET = registry.gauge("llm_max_tokens_budget", "단계별 최근 max_tokens 예산")
+LLM_SPEC_ACCEPTANCE_RATE = registry.gauge("llm_spec_acceptance_rate", "추측 디코딩 누적 초안 수락률")
+
+
+def inc(name: str, value: float = 1.0, **labels) -> None:
+    """카운터 증가"""
+    registry.counter(name).inc(value, **labels)
+
+
+def observe(name: str, seconds: float, **labels) -> None:
+    """히스토그램에 값 기록"""
+    registry.histogram(name).observe(seconds, **labels)
+
+
+def set_gauge(name: str, value: float, **labels) -> None:
+    """게이지 값 설정"""
+    registry.gauge(name).set(value, **labels)
+
+
+@contextmanager
+def timer(name: str, **labels):
+    """
+    구간 시간 측정 후 히스토그램에 기록
+
+    사용 예:
+        with timer("transcription_seconds"):
+            result = whisper_model.transcribe(audio)
+    """
+    start_time = time.perf_counter()
+    try:
+        # 프로파일링 중인 요청이면 같은 구간을 span으로도 기록
+        with span(name[:-len("_seconds")] if name.endswith("_seconds") else name, **labels):
+            yield
+    finally:
+        observe(name, time.perf_counter() - start_time, **labels)
+
+
+def render_metrics(remote: Iterable[Tuple[Dict[str, str], Dict[str, Dict[str, Any]]]] = ()) -> str:
+    """/metrics 응답 본문 (remote: 모델 호스트 등 다른 프로세스의 (레이블, registry.snapshot()) 목록)"""
+    return registry.render(remote)
+
+
+def metrics_snapshot() -> Dict[str, Dict[str, Any]]:
+    """다른 프로세스에 전달할 지표 복사본"""
+    return registry.snapshot()
@@ -0,0 +1,133 @@
+"""
+TtalKkak 마이크로 배치 큐
+여러 스레드(요청)에서 동시에 들어온 작업을 짧게 모아 한 번의 GPU 호출로 처리
+- max_wait_ms 동안 또는 max_batch_size개가 모일 때까지 대기 후 실행
+- 배치 키가 같은 작업끼리만 묶음 (샘플링 파라미터 등)
+- 실행은 전용 스레드 하나에서 직렬로 수행 (GPU 엔진 스레드 안전성 보장)
+"""
+
+import time
+import queue
+import logging
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from metrics import observe
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _BatchItem:
+    payload: Any
+    key: Hashable
+    future: Future = field(default_factory=Future)
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class MicroBatcher:
+    """
+    동시 요청 → 배치 실행
+
+    process_batch(payloads) 는 입력과 같은 순서·길이의 결과 리스트를 반환해야 함
+
+    사용 예:
+        batcher = MicroBatcher("llm", lambda items: backend.generate_batch(items), max_batch_size=8)
+        result = batcher.submit(messages)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        process_batch: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = 8,
+        max_wait_ms: float = 10.0
+    ):
+        self.name = name
+        self.process_batch = process_batch
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000.0
+        self._queue: "queue.Queue[_BatchItem]" = queue.Queue()
+        self._pending: List[_BatchItem] = []  # 키가 달라 이번 배치에서 제외된 작업
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.stats = {"batches": 0, "items": 0, "max_batch": 0}
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name=f"batcher-{self.name}", daemon=True)
+                self._thread.start()
+
+    def submit(self, payload: Any, key: Hashable = None, timeout: Optional[float] = None) -> Any:
+        """작업 제출 후 결과 대기 (호출 스레드 블로킹)"""
+        return self.submit_async(payload, key).result(timeout=timeout)
+
+    def submit_async(self, payload: Any, key: Hashable = None) -> Future:
+        self._ensure_thread()
+        item = _BatchItem(payload=payload, key=key)
+        self._queue.put(item)
+        return item.future
+
+    def _collect(self) -> List[_BatchItem]:
+        """첫 작업 기준으로 같은 키의 작업을 최대 max_wait 동안 수집"""
+        first = self._pending.pop(0) if self._pending else self._queue.get()
+        batch = [first]
+
+        # 이전에 보류된 같은 키 작업 먼저 합류
+        remaining = []
+        for item in self._pending:
+            if item.key == first.key and len(batch) < self.max_batch_size:
+                batch.append(item)
+            else:
+                remaining.append(item)
+        self._pending = remaining
+
+        deadline = time.monotonic() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item.key == first.key:
+                batch.append(item)
+            else:
+                self._pending.append(item)
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            now = time.monotonic()
+            for item in batch:
+                observe("batch_queue_wait_seconds", now - item.enqueued_at, batcher=self.name)
+
+            self.stats["batches"] += 1
+            self.stats["items"] += len(batch)
+            self.stats["max_batch"] = max(self.stats["max_batch"], len(batch))
+            observe("batch_size", len(batch), batcher=self.name)
+
+            try:
+                results = self.process_batch([item.payload for item in batch])
+                if len(results) != len(batch):
+                    raise RuntimeError(f"배치 결과 수 불일치: {len(results)} != {len(batch)}")
+            except Exception as e:
+                logger.error(f"❌ {self.name} 배치 처리 실패 (크기 {len(batch)}): {e}")
+                for item in batch:
+                    item.future.set_exception(e)
+                continue
+
+            for item, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    item.future.set_exception(result)
+                else:
+                    item.future.set_result(result)
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = dict(self.stats)
+        stats["avg_batch"] = stats["items"] / stats["batches"] if stats["batches"] else 0.0
+        stats["queued"] = self._queue.qsize() + len(self._pending)
+        return stats
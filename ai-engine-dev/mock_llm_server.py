@@ -0,0 +1,200 @@
+"""
+TtalKkak OpenAI 호환 모의 LLM 서버
+GPU 없이 LLM_BACKEND=openai 경로(연결 풀, 재시도, 동시 청크 요청)를 검증하기 위한 서버
+- POST /v1/chat/completions, GET /v1/models, GET /health
+- 응답은 benchmark_stubs.FakeLLM과 같은 결정적 JSON (실제 모델처럼 JSON 뒤에 설명문이 붙음)
+- stream=true면 SSE로 조각 전송 (JSON 조기 종료 시 클라이언트가 연결을 끊음)
+
+사용 예:
+    python mock_llm_server.py --port 8001 --latency-ms 200
+    LLM_BACKEND=openai LLM_BASE_URL=http://localhost:8001 python ai_server_final_with_triplets.py
+"""
+
+import json
+import time
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+
+from benchmark_stubs import FakeLLM
+
+SCHEMA_MARKER = "**Response Schema:**"
+# JSON 뒤에 이어지는 불필요한 출력 (조기 종료 효과 확인용)
+TRAILING_TEXT = "\n\n위 JSON은 회의 내용을 바탕으로 작성되었습니다. 추가로 궁금한 점이 있으면 말씀해 주세요."
+STREAM_PIECE_CHARS = 4
+
+
+def extract_schema(prompt: str) -> Dict[str, Any]:
+    """build_structured_messages 프롬프트에서 스키마 예시 추출 (없으면 빈 dict)"""
+    if SCHEMA_MARKER not in prompt:
+        return {}
+    start = prompt.find("```json", prompt.find(SCHEMA_MARKER))
+    end = prompt.find("```", start + 7)
+    if start == -1 or end == -1:
+        return {}
+    try:
+        schema = json.loads(prompt[start + 7:end])
+        return schema if isinstance(schema, dict) else {}
+    except json.JSONDecodeError:
+        return {}
+
+
+def build_content(payload: Dict[str, Any]) -> Tuple[str, int]:
+    """요청 → (응답 텍스트, 프롬프트 토큰 추정치)"""
+    messages = payload.get("messages", [])
+    prompt = "\n".join(str(message.get("content", "")) for message in messages)
+    result = FakeLLM._build_response(prompt, extract_schema(prompt))
+    content = f"```json\n{json.dumps(result, ensure_ascii=False)}\n```{TRAILING_TEXT}"
+    return content, int(len(prompt) * 1.5)
+
+
+def build_completion(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """chat completion 요청 → OpenAI 형식 응답"""
+    content, prompt_tokens = build_content(payload)
+    completion_tokens = min(int(len(content) * 1.5), int(payload.get("max_tokens") or 2048))
+    return {
+        "id": f"chatcmpl-mock-{int(time.time() * 1000)}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": payload.get("model", "mock"),
+        "choices": [{
+            "index": 0,
+            "message": {"role": "assistant", "content": content},
+            "finish_reason": "stop"
+        }],
+        "usage": {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens
+        }
+    }
+
+
+class MockLLMHandler(BaseHTTPRequestHandler):
+    """요청 핸들러 (지연 시간은 server.latency_seconds)"""
+
+    protocol_version = "HTTP/1.1"  # keep-alive (연결 풀 재사용 확인용)
+
+    def _send_json(self, status: int, body: Dict[str, Any]) -> None:
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "healthy"})
+        elif self.path == "/v1/models":
+            self._send_json(200, {"object": "list", "data": [{"id": "mock", "object": "model"}]})
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b"{}"
+        if self.path != "/v1/chat/completions":
+            self._send_json(404, {"error": "not found"})
+            return
+        try:
+            payload = json.loads(body)
+        except json.JSONDecodeError as e:
+            self._send_json(400, {"error": f"invalid json: {e}"})
+            return
+
+        time.sleep(self.server.latency_seconds)
+        self.server.request_count += 1
+        if payload.get("stream"):
+            self._send_stream(payload)
+        else:
+            self._send_json(200, build_completion(payload))
+
+    def _send_stream(self, payload: Dict[str, Any]) -> None:
+        """SSE 스트리밍 응답 (조각 하나 ≈ 토큰 하나)"""
+        content, prompt_tokens = build_content(payload)
+        pieces = [content[i:i + STREAM_PIECE_CHARS] for i in range(0, len(content), STREAM_PIECE_CHARS)]
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        try:
+            for piece in pieces:
+                event = {"choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}]}
+                self.wfile.write(f"data: {json.dumps(event, ensure_ascii=False)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+                time.sleep(self.server.token_latency_seconds)
+                self.server.streamed_pieces += 1
+
+            final = {"choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]}
+            usage = {"choices": [], "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": len(pieces),
+                "total_tokens": prompt_tokens + len(pieces)
+            }}
+            for event in (final, usage):
+                self.wfile.write(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            # 클라이언트가 JSON 완료 후 연결 종료 (조기 종료)
+            self.server.aborted_streams += 1
+
+    def log_message(self, format, *args):
+        # 벤치마크 중 출력 억제
+        pass
+
+
+def create_mock_server(
+    host: str = "127.0.0.1",
+    port: int = 0,
+    latency_ms: float = 0.0,
+    token_latency_ms: float = 0.0
+) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((host, port), MockLLMHandler)
+    server.daemon_threads = True
+    server.latency_seconds = latency_ms / 1000.0
+    server.token_latency_seconds = token_latency_ms / 1000.0
+    server.request_count = 0
+    server.streamed_pieces = 0
+    server.aborted_streams = 0
+    return server
+
+
+def start_mock_server(
+    port: int = 0,
+    latency_ms: float = 0.0,
+    host: str = "127.0.0.1",
+    token_latency_ms: float = 0.0
+) -> Tuple[ThreadingHTTPServer, str]:
+    """백그라운드 스레드에서 서버 시작 → (server, base_url), 종료는 server.shutdown()"""
+    server = create_mock_server(host, port, latency_ms, token_latency_ms)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main(argv: Optional[list] = None):
+    parser = argparse.ArgumentParser(description="OpenAI 호환 모의 LLM 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="요청당 인위적 지연")
+    parser.add_argument("--token-latency-ms", type=float, default=0.0, help="스트리밍 조각당 인위적 지연")
+    args = parser.parse_args(argv)
+
+    server = create_mock_server(args.host, args.port, args.latency_ms, args.token_latency_ms)
+    print(f"🧪 Mock LLM server: http://{args.host}:{args.port} (latency={args.latency_ms}ms)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
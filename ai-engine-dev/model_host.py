@@ -0,0 +1,410 @@
+"""
+TtalKkak 모델 호스트
+GPU 하나당 하나의 프로세스가 Qwen3 / WhisperX / BERT 엔진을 소유하고,
+여러 uvicorn 워커가 Unix 소켓으로 호출하는 구조
+- 워커: 파싱, 검증, 포맷팅, I/O (CPU 작업, 코어 수만큼 확장)
+- 호스트: GPU 엔진 + 워커 간 마이크로 배치 (GPU 메모리 중복 없음)
+
+실행 예:
+    python model_host.py --socket /tmp/ttalkkak_model_host.sock
+    MODEL_HOST_SOCKET=/tmp/ttalkkak_model_host.sock WORKERS=4 python ai_server_final_with_triplets.py
+
+환경변수:
+    MODEL_HOST_SOCKET: 소켓 경로 (쉼표로 여러 개 지정 시 GPU별 호스트에 분산)
+    MODEL_HOST_AUTHKEY: 연결 인증 키 (필수, 호스트와 워커가 같은 값 사용 / run_optimized_server.sh가 실행마다 생성)
+    MODEL_HOST_LLM_BATCH, MODEL_HOST_BERT_BATCH: 최대 배치 요청 수
+    MODEL_HOST_BATCH_WAIT_MS: 배치 수집 대기 시간
+    MODEL_HOST_TIMEOUT: 워커 측 호출 타임아웃(초)
+"""
+
+import os
+import time
+import queue
+import logging
+import argparse
+import threading
+from multiprocessing.connection import Listener, Client
+from typing import Any, Callable, Dict, List, Optional
+
+from llm_backend import LLMBackend, GenerationResult
+from metrics import metrics_snapshot
+from micro_batcher import MicroBatcher
+from speculative_decoding import SpecDecodeTracker
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOCKET_PATH = "/tmp/ttalkkak_model_host.sock"
+
+
+def get_authkey() -> bytes:
+    """연결 인증 키 (pickle로 호출을 주고받으므로 고정 기본값 없이 MODEL_HOST_AUTHKEY 필수)"""
+    authkey = os.getenv("MODEL_HOST_AUTHKEY")
+    if not authkey:
+        raise RuntimeError("MODEL_HOST_AUTHKEY가 설정되지 않았습니다 (호스트와 워커에 같은 임의의 키 지정)")
+    return authkey.encode("utf-8")
+
+
+def is_model_host_client() -> bool:
+    """현재 프로세스가 모델 호스트를 사용하는 워커인지 (호스트 자신은 False)"""
+    return bool(os.getenv("MODEL_HOST_SOCKET"))
+
+
+class ModelHostError(RuntimeError):
+    """모델 호스트에서 발생한 오류 (원격 예외 타입/메시지 포함)"""
+
+    def __init__(self, error_type: str, message: str):
+        super().__init__(f"{error_type}: {message}")
+        self.error_type = error_type
+
+
+# ============================================================
+# 호스트 (GPU 엔진 소유)
+# ============================================================
+
+class ModelHost:
+    """엔진 로딩 + 요청 디스패치 + 워커 간 배치"""
+
+    def __init__(self, llm_batch_size: int = 16, bert_batch_size: int = 8, batch_wait_ms: float = 10.0):
+        self.llm_batcher = MicroBatcher("llm", self._process_llm_batch, llm_batch_size, batch_wait_ms)
+        self.bert_batcher = MicroBatcher("bert", self._process_bert_batch, bert_batch_size, batch_wait_ms)
+        self._asr_lock = threading.Lock()  # WhisperX는 파일 단위로 내부 배치 → 직렬 실행
+        self.started_at = time.time()
+        self.handlers: Dict[str, Callable[..., Any]] = {
+            "ping": lambda: "pong",
+            "status": self.status,
+            "metrics": metrics_snapshot,  # 호스트에서 기록한 전사/BERT/배치 지표 → 워커 /metrics
+            "llm_generate": self.llm_generate,
+            "transcribe": self.transcribe,
+            "bert_classify": self.bert_classify,
+            "bert_stats": self.bert_stats
+        }
+
+    # ---- 엔진 ----
+
+    def preload(self) -> None:
+        """엔진 사전 로딩 (실패한 엔진은 첫 요청 시 재시도)"""
+        from llm_backend import get_llm_backend
+        from whisperx_engine import load_whisperx
+
+        for name, loader in [("LLM", get_llm_backend), ("WhisperX", load_whisperx), ("BERT", self._get_bert)]:
+            start_time = time.time()
+            try:
+                loader()
+                logger.info(f"✅ {name} loaded in {time.time() - start_time:.2f} seconds")
+            except Exception as e:
+                logger.error(f"❌ {name} loading failed: {e}")
+
+    @staticmethod
+    def _get_bert():
+        from bert_classifier import get_bert_classifier
+        return get_bert_classifier()
+
+    # ---- 핸들러 ----
+
+    def llm_generate(self, messages: List[Dict[str, str]], max_tokens: int = 2048, **generate_kwargs) -> GenerationResult:
+        # 샘플링 파라미터가 같은 요청끼리만 한 배치로 묶음 (max_tokens는 시퀀스별로 적용하므로 키에서 제외)
+        key = tuple(sorted((k, tuple(v) if isinstance(v, list) else v) for k, v in generate_kwargs.items()))
+        return self.llm_batcher.submit((messages, max_tokens, generate_kwargs), key=key)
+
+    def _process_llm_batch(self, items) -> List[GenerationResult]:
+        from llm_backend import get_llm_backend
+        generate_kwargs = items[0][2]
+        return get_llm_backend().generate_batch(
+            [messages for messages, _, _ in items],
+            max_tokens=[max_tokens for _, max_tokens, _ in items],
+            **generate_kwargs
+        )
+
+    def transcribe(self, audio_input, batch_size: int = 16) -> Dict[str, Any]:
+        from whisperx_engine import transcribe_local
+        with self._asr_lock:
+            return transcribe_local(audio_input, batch_size=batch_size)
+
+    def bert_classify(self, triplets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return self.bert_batcher.submit(triplets)
+
+    def _process_bert_batch(self, items: List[List[Dict[str, Any]]]) -> List[List[Dict[str, Any]]]:
+        # 여러 워커의 triplet을 이어붙여 한 번에 분류한 뒤 요청별로 다시 분할
+        merged = [triplet for triplets in items for triplet in triplets]
+        classified = self._get_bert().classify_triplets_batch(merged)
+        results, offset = [], 0
+        for triplets in items:
+            results.append(classified[offset:offset + len(triplets)])
+            offset += len(triplets)
+        return results
+
+    def bert_stats(self, classified_triplets: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return self._get_bert().get_classification_stats(classified_triplets)
+
+    def status(self) -> Dict[str, Any]:
+        from llm_backend import get_loaded_llm_backend
+        from whisperx_engine import is_whisperx_loaded
+        import bert_classifier
+
+        backend = get_loaded_llm_backend()
+        return {
+            "pid": os.getpid(),
+            "uptime": time.time() - self.started_at,
+            "models_loaded": {
+                "whisperx": is_whisperx_loaded(),
+                "qwen3": backend is not None,
+                "triplet_bert": bert_classifier.bert_classifier is not None
+            },
+            "batching": {
+                "llm": self.llm_batcher.get_stats(),
+                "bert": self.bert_batcher.get_stats()
+            },
+            "speculative": backend.spec_decode_stats() if backend is not None else None
+        }
+
+    # ---- 서버 ----
+
+    def _serve_connection(self, conn) -> None:
+        """연결 하나 = 워커의 호출 슬롯 하나 (요청/응답 순차 처리)"""
+        try:
+            while True:
+                try:
+                    method, args, kwargs = conn.recv()
+                except EOFError:
+                    break
+                try:
+                    handler = self.handlers[method]
+                    conn.send(("ok", handler(*args, **kwargs)))
+                except Exception as e:
+                    logger.error(f"❌ 모델 호스트 처리 실패 ({method}): {e}")
+                    conn.send(("error", type(e).__name__, str(e)))
+        except (OSError, EOFError) as e:
+            logger.warning(f"⚠️ 워커 연결 종료: {e}")
+        finally:
+            conn.close()
+
+    def serve_forever(self, socket_path: str) -> None:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        listener = Listener(address=socket_path, family="AF_UNIX", authkey=get_authkey())
+        os.chmod(socket_path, 0o600)
+        logger.info(f"🖥️ 모델 호스트 대기 중: {socket_path} (pid={os.getpid()})")
+        try:
+            while True:
+                try:
+                    conn = listener.accept()
+                except Exception as e:
+                    # 인증 실패 등은 해당 연결만 거절
+                    logger.warning(f"⚠️ 연결 수락 실패: {e}")
+                    continue
+                threading.Thread(target=self._serve_connection, args=(conn,), daemon=True).start()
+        finally:
+            listener.close()
+
+
+# ============================================================
+# 워커 측 클라이언트
+# ============================================================
+
+class ModelHostClient:
+    """
+    모델 호스트 호출 클라이언트 (스레드 안전)
+
+    호출마다 유휴 연결을 빌려 쓰고 반납 (연결 풀)
+    소켓이 여러 개면 진행 중 호출이 가장 적은 호스트로 분산
+    """
+
+    def __init__(self, socket_paths: List[str], timeout: float = 600.0, max_idle: int = 16):
+        self.socket_paths = socket_paths
+        self.timeout = timeout
+        self._idle = {path: queue.LifoQueue(maxsize=max_idle) for path in socket_paths}
+        self._inflight = {path: 0 for path in socket_paths}
+        self._lock = threading.Lock()
+
+    def _pick_host(self) -> str:
+        with self._lock:
+            path = min(self.socket_paths, key=lambda p: self._inflight[p])
+            self._inflight[path] += 1
+            return path
+
+    def _connect(self, path: str):
+        try:
+            return self._idle[path].get_nowait()
+        except queue.Empty:
+            return Client(address=path, family="AF_UNIX", authkey=get_authkey())
+
+    def _release(self, path: str, conn) -> None:
+        try:
+            self._idle[path].put_nowait(conn)
+        except queue.Full:
+            conn.close()
+
+    def call(self, method: str, *args, **kwargs) -> Any:
+        path = self._pick_host()
+        try:
+            return self.call_host(path, method, *args, **kwargs)
+        finally:
+            with self._lock:
+                self._inflight[path] -= 1
+
+    def call_host(self, path: str, method: str, *args, **kwargs) -> Any:
+        """지정한 호스트 호출 (호스트별 조회용, 일반 호출은 call로 분산)"""
+        for attempt in range(2):
+            conn = self._connect(path)
+            try:
+                conn.send((method, args, kwargs))
+                if not conn.poll(self.timeout):
+                    conn.close()
+                    raise TimeoutError(f"모델 호스트 응답 시간 초과 ({method}, {self.timeout}초)")
+                response = conn.recv()
+            except (EOFError, BrokenPipeError, ConnectionResetError):
+                # 호스트 재시작 등으로 끊긴 유휴 연결 → 새 연결로 한 번 재시도
+                conn.close()
+                if attempt == 1:
+                    raise
+                continue
+
+            self._release(path, conn)
+            if response[0] == "ok":
+                return response[1]
+            raise ModelHostError(response[1], response[2])
+
+    def wait_until_ready(self, timeout: float = 600.0, interval: float = 1.0) -> None:
+        """호스트 소켓이 열릴 때까지 대기 (워커 시작 시)"""
+        deadline = time.time() + timeout
+        for path in self.socket_paths:
+            while True:
+                try:
+                    conn = Client(address=path, family="AF_UNIX", authkey=get_authkey())
+                    conn.send(("ping", (), {}))
+                    conn.recv()
+                    self._release(path, conn)
+                    break
+                except (FileNotFoundError, ConnectionRefusedError):
+                    if time.time() > deadline:
+                        raise TimeoutError(f"모델 호스트에 연결할 수 없습니다: {path}")
+                    time.sleep(interval)
+
+    def metrics(self) -> List[Dict[str, Any]]:
+        """호스트별 지표 복사본 (metrics.render_metrics의 remote 형식, 조회 실패한 호스트는 제외)"""
+        snapshots = []
+        for path in self.socket_paths:
+            try:
+                snapshots.append(({"source": "model_host", "host": path}, self.call_host(path, "metrics")))
+            except Exception as e:
+                logger.warning(f"⚠️ 모델 호스트 지표 조회 실패 ({path}): {e}")
+        return snapshots
+
+    def status(self) -> List[Dict[str, Any]]:
+        """호스트별 상태 (헬스 체크용)"""
+        statuses = []
+        for path in self.socket_paths:
+            conn = self._connect(path)
+            try:
+                conn.send(("status", (), {}))
+                response = conn.recv()
+                self._release(path, conn)
+                if response[0] == "ok":
+                    statuses.append({"socket": path, **response[1]})
+                else:
+                    statuses.append({"socket": path, "error": f"{response[1]}: {response[2]}"})
+            except Exception as e:
+                conn.close()
+                statuses.append({"socket": path, "error": str(e)})
+        return statuses
+
+
+class ModelHostBackend(LLMBackend):
+    """모델 호스트의 LLM 엔진 호출 (워커 간 배치는 호스트에서 수행)"""
+
+    name = "model_host"
+    supports_batching = True  # 동시 호출은 호스트의 배치 큐에서 합쳐짐
+    max_concurrency = 8
+
+    def __init__(self, client: Optional[ModelHostClient] = None):
+        self._client = client
+        self.spec_tracker = SpecDecodeTracker("model_host")
+
+    def load(self) -> None:
+        if self._client is None:
+            self._client = get_model_host_client()
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._client is not None
+
+    def generate(self, messages, max_tokens=2048, temperature=0.3, top_p=0.9, repetition_penalty=1.1, stop=None, json_mode=False) -> GenerationResult:
+        self.load()
+        return self._client.call(
+            "llm_generate", messages,
+            max_tokens=max_tokens, temperature=temperature, top_p=top_p,
+            repetition_penalty=repetition_penalty, stop=stop, json_mode=json_mode
+        )
+
+    def spec_decode_stats(self) -> Optional[Dict[str, Any]]:
+        """호스트별 누적 초안/수락 토큰 합산"""
+        self.load()
+        host_stats = [status["speculative"] for status in self._client.status() if status.get("speculative")]
+        if not host_stats:
+            return None
+        self.spec_tracker.update_totals(
+            sum(stats["draft_tokens"] for stats in host_stats),
+            sum(stats["accepted_tokens"] for stats in host_stats),
+            sum(stats.get("emitted_tokens", 0) for stats in host_stats)
+        )
+        return {"enabled": True, "hosts": len(host_stats), **self.spec_tracker.get_stats()}
+
+    def describe(self) -> Dict[str, Any]:
+        return {**super().describe(), "sockets": self._client.socket_paths if self._client else None}
+
+
+class RemoteBertClassifier:
+    """TtalkkakBERTClassifier와 같은 인터페이스의 모델 호스트 프록시"""
+
+    def __init__(self, client: Optional[ModelHostClient] = None):
+        self.client = client or get_model_host_client()
+
+    def classify_triplets_batch(self, triplets: List[Dict[str, Any]], batch_size: int = 32) -> List[Dict[str, Any]]:
+        return self.client.call("bert_classify", triplets)
+
+    def get_classification_stats(self, classified_triplets: List[Dict[str, Any]]) -> Dict[str, Any]:
+        return self.client.call("bert_stats", classified_triplets)
+
+
+# 전역 인스턴스
+_model_host_client = None
+_model_host_client_lock = threading.Lock()
+
+
+def get_model_host_client() -> ModelHostClient:
+    """전역 모델 호스트 클라이언트 반환 (MODEL_HOST_SOCKET 기반)"""
+    global _model_host_client
+    with _model_host_client_lock:
+        if _model_host_client is None:
+            socket_paths = [p.strip() for p in os.getenv("MODEL_HOST_SOCKET", DEFAULT_SOCKET_PATH).split(",") if p.strip()]
+            _model_host_client = ModelHostClient(
+                socket_paths,
+                timeout=float(os.getenv("MODEL_HOST_TIMEOUT", "600"))
+            )
+    return _model_host_client
+
+
+def main(argv: Optional[list] = None):
+    parser = argparse.ArgumentParser(description="TtalKkak 모델 호스트 (GPU 엔진 소유 프로세스)")
+    parser.add_argument("--socket", default=os.getenv("MODEL_HOST_SOCKET", DEFAULT_SOCKET_PATH).split(",")[0])
+    parser.add_argument("--no-preload", action="store_true", help="첫 요청 시 엔진 로딩")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    # 호스트 자신은 로컬 엔진을 사용 (워커용 설정 제거)
+    os.environ.pop("MODEL_HOST_SOCKET", None)
+    if os.getenv("LLM_BACKEND") == "model_host":
+        os.environ.pop("LLM_BACKEND")
+
+    host = ModelHost(
+        llm_batch_size=int(os.getenv("MODEL_HOST_LLM_BATCH", "16")),
+        bert_batch_size=int(os.getenv("MODEL_HOST_BERT_BATCH", "8")),
+        batch_wait_ms=float(os.getenv("MODEL_HOST_BATCH_WAIT_MS", "10"))
+    )
+    if not args.no_preload:
+        host.preload()
+    host.serve_forever(args.socket)
+
+
+if __name__ == "__main__":
+    main()
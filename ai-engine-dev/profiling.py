@@ -0,0 +1,129 @@
+"""
+TtalKkak 요청 단위 프로파일링
+?profile=1 (또는 X-Profile 헤더) 요청에 대해 구간(span) 트리를 수집
+- 구간별 wall time / CPU time (스레드 기준)
+- contextvars 기반이라 워커 스레드(run_in_executor + copy_context)로도 전파
+- 구조화된 트리 또는 Chrome trace(JSON) 형식으로 내보내기
+"""
+
+import os
+import time
+import threading
+import contextvars
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+# 현재 활성 구간 (프로파일링 비활성 요청에서는 None → 오버헤드 없음)
+_current_span: contextvars.ContextVar = contextvars.ContextVar("current_profile_span", default=None)
+
+
+@dataclass
+class Span:
+    """프로파일 구간"""
+    name: str
+    start: float = field(default_factory=time.perf_counter)
+    cpu_start: float = field(default_factory=time.thread_time)
+    thread_id: int = field(default_factory=threading.get_ident)
+    end: Optional[float] = None
+    cpu_time: Optional[float] = None
+    attrs: Dict[str, Any] = field(default_factory=dict)
+    children: List["Span"] = field(default_factory=list)
+    # await를 포함하는 구간은 이벤트 루프 스레드의 다른 요청 작업까지 섞이므로 CPU time 미집계
+    track_cpu: bool = True
+
+    def finish(self) -> None:
+        self.end = time.perf_counter()
+        # CPU time은 구간을 연 스레드 기준 (다른 스레드로 넘어간 작업은 자식 구간에서 집계)
+        if self.track_cpu and threading.get_ident() == self.thread_id:
+            self.cpu_time = time.thread_time() - self.cpu_start
+
+    @property
+    def wall_time(self) -> float:
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    def to_dict(self, origin: Optional[float] = None) -> Dict[str, Any]:
+        """구조화된 구간 트리"""
+        origin = self.start if origin is None else origin
+        return {
+            "name": self.name,
+            "start_ms": round((self.start - origin) * 1000, 3),
+            "wall_ms": round(self.wall_time * 1000, 3),
+            "cpu_ms": round(self.cpu_time * 1000, 3) if self.cpu_time is not None else None,
+            "attrs": self.attrs,
+            "children": [child.to_dict(origin) for child in list(self.children)]
+        }
+
+
+@contextmanager
+def span(name: str, track_cpu: bool = True, **attrs):
+    """
+    하위 구간 측정 (프로파일링 중이 아니면 아무 것도 하지 않음)
+
+    await를 감싸는 구간은 track_cpu=False로 지정
+
+    사용 예:
+        with span("bert_tokenize", batch=3):
+            inputs = tokenizer(batch_texts, ...)
+    """
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+
+    child = Span(name=name, attrs=dict(attrs), track_cpu=track_cpu)
+    parent.children.append(child)
+    token = _current_span.set(child)
+    try:
+        yield child
+    finally:
+        child.finish()
+        _current_span.reset(token)
+
+
+def add_span_attrs(**attrs) -> None:
+    """현재 구간에 속성 추가 (토큰 수 등)"""
+    current = _current_span.get()
+    if current is not None:
+        current.attrs.update(attrs)
+
+
+def is_profiling() -> bool:
+    return _current_span.get() is not None
+
+
+@contextmanager
+def profile_request(name: str, **attrs):
+    """요청 전체를 루트 구간으로 프로파일링"""
+    root = Span(name=name, attrs=dict(attrs), track_cpu=False)
+    token = _current_span.set(root)
+    try:
+        yield root
+    finally:
+        root.finish()
+        _current_span.reset(token)
+
+
+def to_chrome_trace(root: Span) -> Dict[str, Any]:
+    """Chrome trace 형식 (chrome://tracing, Perfetto에서 열기)"""
+    events = []
+    pid = os.getpid()
+
+    def visit(node: Span):
+        args = dict(node.attrs)
+        if node.cpu_time is not None:
+            args["cpu_ms"] = round(node.cpu_time * 1000, 3)
+        events.append({
+            "name": node.name,
+            "ph": "X",
+            "ts": round((node.start - root.start) * 1_000_000, 1),
+            "dur": round(node.wall_time * 1_000_000, 1),
+            "pid": pid,
+            "tid": node.thread_id,
+            "args": args
+        })
+        for child in list(node.children):
+            visit(child)
+
+    visit(root)
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
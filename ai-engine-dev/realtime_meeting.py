@@ -0,0 +1,366 @@
+"""
+TtalKkak 실시간 회의 모드
+WebSocket으로 들어오는 PCM 스트림을 롤링 윈도우로 증분 전사하고,
+확정된 발화마다 Triplet + BERT 필터링과 증분 LLM 요약을 수행
+"""
+
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# 롤링 요약 응답 스키마 (액션 아이템은 MEETING_ANALYSIS_SCHEMA와 동일한 형태)
+ROLLING_SUMMARY_SCHEMA = {
+    "summary": "지금까지의 회의 내용을 3-5줄로 요약",
+    "key_points": ["핵심 포인트들"],
+    "decisions": ["지금까지 확정된 결정사항들"],
+    "action_items": [
+        {
+            "task": "구체적인 업무 내용",
+            "assignee": "담당자명 또는 부서",
+            "deadline": "예상 마감일 (YYYY-MM-DD 또는 상대적 기간)",
+            "priority": "high/medium/low"
+        }
+    ]
+}
+
+ROLLING_SUMMARY_SYSTEM_PROMPT = """당신은 진행 중인 회의를 실시간으로 정리하는 회의록 작성 전문가입니다.
+이전까지 정리된 회의 상태와 새로 확정된 발화를 받아 회의 상태를 갱신합니다.
+- 기존 내용은 유지하되 새 발화로 바뀐 내용은 반영하세요
+- 액션 아이템은 중복 없이 누적하세요
+- 응답은 반드시 요청된 JSON 형식으로만 제공하세요"""
+
+
+@dataclass
+class RealtimeConfig:
+    """실시간 회의 모드 설정"""
+    sample_rate: int = 16000
+    window_seconds: float = 30.0  # 최대 전사 윈도우 길이
+    step_seconds: float = 5.0  # 새 오디오가 이만큼 쌓이면 전사 수행
+    finalize_margin_seconds: float = 2.0  # 윈도우 끝에서 이만큼 떨어진 세그먼트만 확정
+    summary_every_utterances: int = 12  # 중요 발화 N개마다 롤링 요약 갱신
+    context_utterances: int = 2  # Triplet 다음 맥락 발화 수 (create_triplets와 동일)
+    enable_bert_filtering: bool = True
+
+
+class RealtimeMeetingSession:
+    """
+    실시간 회의 세션
+    PCM 누적 → 롤링 윈도우 전사 → 발화 확정 → Triplet/BERT 필터링 → 롤링 요약
+    """
+
+    def __init__(
+        self,
+        transcribe_fn: Callable[[np.ndarray], Dict[str, Any]],
+        generate_fn: Callable[..., Dict[str, Any]],
+        triplet_processor: Optional[Any] = None,
+        config: Optional[RealtimeConfig] = None
+    ):
+        """
+        Args:
+            transcribe_fn: float32 오디오 배열을 받아 WhisperX 형식 결과를 반환하는 함수
+            generate_fn: generate_structured_response와 같은 시그니처의 LLM 호출 함수
+            triplet_processor: TripletProcessor 인스턴스 (None이면 필터링 생략)
+            config: 세션 설정
+        """
+        self.config = config or RealtimeConfig()
+        self.transcribe_fn = transcribe_fn
+        self.generate_fn = generate_fn
+        self.triplet_processor = triplet_processor
+
+        self._lock = threading.Lock()
+        self._buffer = np.zeros(0, dtype=np.float32)
+        self._buffer_offset = 0.0  # 버퍼 시작 지점의 절대 시간(초)
+        self._samples_since_transcribe = 0
+
+        self.utterances: List[Dict[str, Any]] = []  # 확정된 전체 발화
+        self.important_utterances: List[Dict[str, Any]] = []  # 필터링 후 유지된 발화
+        self._next_classify_idx = 0  # 아직 분류되지 않은 첫 발화 인덱스
+        self._pending_summary: List[Dict[str, Any]] = []  # 요약에 반영되지 않은 중요 발화
+
+        self.state: Dict[str, Any] = {
+            "summary": "",
+            "key_points": [],
+            "decisions": [],
+            "action_items": []
+        }
+        self.stats = {
+            "audio_seconds": 0.0,
+            "transcribe_calls": 0,
+            "transcribe_time": 0.0,
+            "classify_time": 0.0,
+            "summary_updates": 0,
+            "summary_time": 0.0
+        }
+        self.started_at = time.time()
+
+    # ------------------------------------------------------------------
+    # 오디오 입력
+    # ------------------------------------------------------------------
+    def add_audio(self, pcm_bytes: bytes) -> None:
+        """16-bit little-endian mono PCM 프레임 추가"""
+        if not pcm_bytes:
+            return
+        samples = np.frombuffer(pcm_bytes, dtype="<i2").astype(np.float32) / 32768.0
+        with self._lock:
+            self._buffer = np.concatenate([self._buffer, samples])
+            self._samples_since_transcribe += len(samples)
+            self.stats["audio_seconds"] += len(samples) / self.config.sample_rate
+
+    def ready_for_transcription(self) -> bool:
+        """전사 주기 도달 여부"""
+        step_samples = int(self.config.step_seconds * self.config.sample_rate)
+        return self._samples_since_transcribe >= step_samples
+
+    # ------------------------------------------------------------------
+    # 증분 처리
+    # ------------------------------------------------------------------
+    def process_pending(self) -> List[Dict[str, Any]]:
+        """누적된 오디오를 전사하고 이벤트 목록 반환 (블로킹, 워커 스레드에서 호출)"""
+        events = []
+        new_utterances = self._transcribe_window(final=False)
+        if new_utterances:
+            events.append({"type": "utterances", "utterances": new_utterances})
+            events.extend(self._classify_ready(final=False))
+            events.extend(self._maybe_update_summary(force=False))
+        return events
+
+    def finish(self) -> List[Dict[str, Any]]:
+        """회의 종료: 남은 오디오/발화를 모두 확정하고 최종 요약 갱신"""
+        events = []
+        new_utterances = self._transcribe_window(final=True)
+        if new_utterances:
+            events.append({"type": "utterances", "utterances": new_utterances})
+        events.extend(self._classify_ready(final=True))
+        events.extend(self._maybe_update_summary(force=True))
+        return events
+
+    def _transcribe_window(self, final: bool) -> List[Dict[str, Any]]:
+        """롤링 윈도우 전사 후 확정된 발화만 반환"""
+        with self._lock:
+            window = self._buffer.copy()
+            offset = self._buffer_offset
+            self._samples_since_transcribe = 0
+
+        if len(window) == 0:
+            return []
+
+        window_duration = len(window) / self.config.sample_rate
+
+        start_time = time.time()
+        result = self.transcribe_fn(window)
+        self.stats["transcribe_calls"] += 1
+        self.stats["transcribe_time"] += time.time() - start_time
+
+        segments = [seg for seg in result.get("segments", []) if seg.get("text", "").strip()]
+
+        if final:
+            finalized = segments
+        else:
+            cutoff = window_duration - self.config.finalize_margin_seconds
+            finalized = [seg for seg in segments if seg.get("end", 0.0) <= cutoff]
+
+            # 긴 독백으로 윈도우가 가득 찬 경우 마지막 세그먼트를 제외하고 강제 확정
+            if not finalized and window_duration >= self.config.window_seconds and segments:
+                finalized = segments[:-1] if len(segments) > 1 else segments
+
+        if not finalized and not final:
+            # 아무 발화도 확정되지 않았고 윈도우가 너무 길면 오래된 오디오 폐기
+            max_samples = int(self.config.window_seconds * self.config.sample_rate)
+            if len(window) > max_samples and not segments:
+                self._drop_audio(len(window) - max_samples)
+            return []
+
+        new_utterances = []
+        for seg in finalized:
+            index = len(self.utterances)
+            utterance = {
+                "index": index,
+                "start": round(offset + seg.get("start", 0.0), 3),
+                "end": round(offset + seg.get("end", 0.0), 3),
+                "speaker": seg.get("speaker", "SPEAKER_00"),
+                "text": seg.get("text", "").strip()
+            }
+            self.utterances.append(utterance)
+            new_utterances.append(utterance)
+
+        # 확정된 구간까지 버퍼에서 제거 (최종 플러시면 전부 제거)
+        if final:
+            consumed = len(window)
+        else:
+            last_end = finalized[-1].get("end", 0.0)
+            consumed = min(len(window), int(last_end * self.config.sample_rate))
+        self._drop_audio(consumed)
+
+        return new_utterances
+
+    def _drop_audio(self, num_samples: int) -> None:
+        """버퍼 앞부분 제거 (전사 중 추가된 오디오는 보존)"""
+        if num_samples <= 0:
+            return
+        with self._lock:
+            self._buffer = self._buffer[num_samples:]
+            self._buffer_offset += num_samples / self.config.sample_rate
+
+    def _classify_ready(self, final: bool) -> List[Dict[str, Any]]:
+        """다음 맥락이 확보된 발화만 Triplet/BERT로 분류"""
+        # Triplet은 앞뒤 2개 발화를 맥락으로 사용하므로 뒤쪽 맥락이 채워진 발화까지만 분류
+        if final:
+            ready_end = len(self.utterances)
+        else:
+            ready_end = len(self.utterances) - self.config.context_utterances
+
+        start = self._next_classify_idx
+        if ready_end <= start:
+            return []
+
+        targets = self.utterances[start:ready_end]
+        classify_start = time.time()
+
+        if self.triplet_processor is not None and self.config.enable_bert_filtering:
+            kept = self._filter_with_triplets(start, ready_end)
+        else:
+            kept = targets
+
+        self.stats["classify_time"] += time.time() - classify_start
+        self._next_classify_idx = ready_end
+
+        self.important_utterances.extend(kept)
+        self._pending_summary.extend(kept)
+
+        kept_indices = {u["index"] for u in kept}
+        return [{
+            "type": "filtered",
+            "classified": len(targets),
+            "kept": sorted(kept_indices),
+            "dropped": [u["index"] for u in targets if u["index"] not in kept_indices]
+        }]
+
+    def _filter_with_triplets(self, start: int, end: int) -> List[Dict[str, Any]]:
+        """발화 구간을 맥락 포함 Triplet으로 만들어 중요 발화만 반환"""
+        context = self.config.context_utterances
+        slice_start = max(0, start - context)
+        slice_end = min(len(self.utterances), end + context)
+        window = self.utterances[slice_start:slice_end]
+
+        try:
+            triplets = self.triplet_processor.whisperx_to_triplets({
+                "segments": [
+                    {"text": u["text"], "start": u["start"], "end": u["end"], "speaker": u["speaker"]}
+                    for u in window
+                ]
+            })
+            # 맥락용 앞뒤 발화를 제외한 대상 Triplet만 분류
+            target_offset = start - slice_start
+            target_triplets = triplets[target_offset:target_offset + (end - start)]
+            classified = self.triplet_processor.classify_triplets(target_triplets)
+        except Exception as e:
+            logger.warning(f"⚠️ 실시간 Triplet 필터링 실패, 전체 발화 유지: {e}")
+            return self.utterances[start:end]
+
+        return [
+            utterance
+            for utterance, triplet in zip(self.utterances[start:end], classified)
+            if triplet.get("label", 0) == 0
+        ]
+
+    def _maybe_update_summary(self, force: bool) -> List[Dict[str, Any]]:
+        """중요 발화가 충분히 쌓이면 롤링 요약 증분 갱신"""
+        if not self._pending_summary:
+            return []
+        if not force and len(self._pending_summary) < self.config.summary_every_utterances:
+            return []
+
+        new_lines = "\n".join(
+            f"[{_format_timestamp(u['start'])}] {u['speaker']}: {u['text']}"
+            for u in self._pending_summary
+        )
+        user_prompt = f"""**현재까지의 회의 상태:**
+{json.dumps(self.state, ensure_ascii=False, separators=(",", ":"))}
+
+**새로 확정된 발화:**
+{new_lines}
+
+위 발화를 반영하여 회의 상태 전체를 갱신하세요."""
+
+        summary_start = time.time()
+        result = self.generate_fn(
+            system_prompt=ROLLING_SUMMARY_SYSTEM_PROMPT,
+            user_prompt=user_prompt,
+            response_schema=ROLLING_SUMMARY_SCHEMA,
+            temperature=0.2,
+            enable_chunking=False,
+            stage="rolling_summary"
+        )
+        self.stats["summary_time"] += time.time() - summary_start
+
+        if not isinstance(result, dict) or "error" in result:
+            logger.warning(f"⚠️ 롤링 요약 갱신 실패, 다음 주기에 재시도: {result.get('error') if isinstance(result, dict) else result}")
+            return []
+
+        for field_name in self.state:
+            value = result.get(field_name)
+            if value:
+                self.state[field_name] = value
+
+        self._pending_summary = []
+        self.stats["summary_updates"] += 1
+
+        return [{"type": "rolling_summary", "state": self.state}]
+
+    # ------------------------------------------------------------------
+    # 최종 결과
+    # ------------------------------------------------------------------
+    @property
+    def filtered_transcript(self) -> str:
+        """필터링된 발화로 구성한 전사본"""
+        return "\n".join(
+            f"[{_format_timestamp(u['start'])}] {u['speaker']}: {u['text']}"
+            for u in self.important_utterances
+        )
+
+    @property
+    def full_transcript(self) -> str:
+        """필터링 전 전체 전사본"""
+        return " ".join(u["text"] for u in self.utterances)
+
+    def build_condensed_transcript(self, chunking_processor=None) -> str:
+        """
+        최종 분석용 입력 구성
+        롤링 요약 상태를 앞에 두고, 토큰 예산 안이면 필터링된 전사본도 함께 포함
+        """
+        state_section = f"""**실시간 회의 정리 결과:**
+요약: {self.state.get('summary', '')}
+핵심 포인트: {'; '.join(map(str, self.state.get('key_points', [])))}
+결정사항: {'; '.join(map(str, self.state.get('decisions', [])))}
+액션 아이템: {json.dumps(self.state.get('action_items', []), ensure_ascii=False, separators=(",", ":"))}"""
+
+        transcript = self.filtered_transcript
+        if chunking_processor is not None:
+            total_tokens = chunking_processor.estimate_tokens(state_section + transcript)
+            if total_tokens > chunking_processor.max_input_tokens:
+                logger.info(f"📊 필터링 전사본이 길어 롤링 요약만 사용 (토큰: {total_tokens})")
+                return state_section
+
+        return f"{state_section}\n\n**필터링된 회의 전사본:**\n{transcript}"
+
+    def get_stats(self) -> Dict[str, Any]:
+        """세션 통계"""
+        return {
+            **self.stats,
+            "total_utterances": len(self.utterances),
+            "important_utterances": len(self.important_utterances),
+            "session_time": time.time() - self.started_at
+        }
+
+
+def _format_timestamp(seconds: float) -> str:
+    """초 → HH:MM:SS"""
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{(seconds % 3600) // 60:02d}:{seconds % 60:02d}"
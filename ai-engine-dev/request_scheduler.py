@@ -0,0 +1,375 @@
+"""
+TtalKkak 요청 스케줄러
+GPU 엔진(WhisperX / BERT / Qwen3) 앞단의 우선순위 기반 입장 제어
+- 우선순위 클래스: interactive > batch > background (대기 시간에 따른 에이징 적용)
+- 테넌트별 동시 실행 제한
+- 예상 비용(토큰 수) 기반 서비스 시간 추정과 입장 제어
+- 데드라인을 지킬 수 없는 요청은 대기열에 넣지 않고 즉시 거절
+"""
+
+import os
+import time
+import asyncio
+import logging
+import itertools
+import contextvars
+from enum import IntEnum
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from profiling import span
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(IntEnum):
+    """우선순위 클래스 (값이 작을수록 먼저 처리)"""
+    INTERACTIVE = 0
+    BATCH = 1
+    BACKGROUND = 2
+
+    @classmethod
+    def parse(cls, value: Optional[str]) -> "Priority":
+        if not value:
+            return cls.INTERACTIVE
+        try:
+            return cls[value.strip().upper()]
+        except KeyError:
+            raise ValueError(f"알 수 없는 우선순위: {value} (interactive/batch/background)")
+
+
+class AdmissionRejected(Exception):
+    """입장 거절 (대기열 초과 또는 데드라인 충족 불가)"""
+
+    def __init__(self, reason: str, retry_after: Optional[float] = None, status_code: int = 429):
+        super().__init__(reason)
+        self.reason = reason
+        self.retry_after = retry_after
+        self.status_code = status_code  # 429: 대기열 초과, 503: 데드라인 충족 불가
+
+
+@dataclass
+class RequestContext:
+    """요청 단위 스케줄링 정보 (미들웨어에서 설정)"""
+    priority: Priority = Priority.INTERACTIVE
+    tenant_id: str = "default"
+    deadline: Optional[float] = None  # time.monotonic() 기준 절대 시각
+
+
+# 현재 요청의 스케줄링 정보
+current_request_context: contextvars.ContextVar = contextvars.ContextVar(
+    "current_request_context", default=RequestContext()
+)
+
+
+@dataclass
+class SchedulerConfig:
+    """스케줄러 설정 (환경변수로 조정)"""
+    max_concurrency: int = 1  # 동시에 GPU 작업을 실행할 수 있는 슬롯 수
+    tenant_concurrency: int = 1  # 테넌트당 동시 실행 슬롯 수
+    max_queue_size: int = 256  # 전체 대기열 최대 길이
+    background_queue_share: float = 0.5  # background가 차지할 수 있는 대기열 비율
+    aging_seconds: float = 120.0  # 이 시간만큼 대기하면 우선순위 한 단계 상승
+    ewma_alpha: float = 0.2  # 처리량 추정 EWMA 계수
+    # 작업 종류별 초기 처리량 추정 (비용 단위/초)
+    initial_throughput: Dict[str, float] = field(default_factory=lambda: {
+        "llm": 400.0,  # 토큰/초 (프롬프트 + 출력 예산)
+        "asr": 320000.0,  # 오디오 바이트/초
+        "bert": 20000.0  # 문자/초
+    })
+
+    @classmethod
+    def from_env(cls, default_concurrency: int = 1) -> "SchedulerConfig":
+        """
+        환경변수 기반 설정
+
+        Args:
+            default_concurrency: SCHEDULER_MAX_CONCURRENCY가 없을 때 동시 실행 슬롯 수
+                (LLM 백엔드의 max_concurrency, 테넌트당 기본값은 그 절반)
+        """
+        max_concurrency = int(os.getenv("SCHEDULER_MAX_CONCURRENCY", str(default_concurrency)))
+        return cls(
+            max_concurrency=max_concurrency,
+            tenant_concurrency=int(os.getenv("SCHEDULER_TENANT_CONCURRENCY", str(max(1, max_concurrency // 2)))),
+            max_queue_size=int(os.getenv("SCHEDULER_MAX_QUEUE", "256")),
+            aging_seconds=float(os.getenv("SCHEDULER_AGING_SECONDS", "120"))
+        )
+
+
+@dataclass
+class _QueueEntry:
+    """대기 중인 작업"""
+    seq: int
+    priority: Priority
+    tenant_id: str
+    kind: str
+    cost: float
+    deadline: Optional[float]
+    enqueued_at: float
+    future: asyncio.Future
+
+    def effective_priority(self, now: float, aging_seconds: float) -> float:
+        waited = now - self.enqueued_at
+        boost = waited / aging_seconds if aging_seconds > 0 else 0.0
+        return max(float(Priority.INTERACTIVE), float(self.priority) - boost)
+
+
+class RequestScheduler:
+    """우선순위/테넌트/데드라인 인식 GPU 작업 스케줄러"""
+
+    def __init__(self, config: Optional[SchedulerConfig] = None):
+        self.config = config or SchedulerConfig.from_env()
+        self._queue: List[_QueueEntry] = []
+        self._seq = itertools.count()
+        self._running = 0
+        self._running_by_tenant: Dict[str, int] = {}
+        self._running_cost = 0.0
+        self._throughput = dict(self.config.initial_throughput)
+
+        self.stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "rejected_queue_full": 0,
+            "rejected_deadline": 0,
+            "expired_in_queue": 0,
+            "total_wait_time": 0.0
+        }
+
+        logger.info(
+            f"🚦 요청 스케줄러 초기화 - 동시 실행: {self.config.max_concurrency}, "
+            f"테넌트당: {self.config.tenant_concurrency}, 대기열: {self.config.max_queue_size}"
+        )
+
+    # ------------------------------------------------------------------
+    # 비용 추정
+    # ------------------------------------------------------------------
+    def estimate_service_time(self, kind: str, cost: float) -> float:
+        """비용 → 예상 처리 시간(초)"""
+        throughput = self._throughput.get(kind) or self.config.initial_throughput.get("llm", 400.0)
+        return cost / throughput if throughput > 0 else 0.0
+
+    def estimate_wait_time(self, priority: Priority) -> float:
+        """현재 대기열 기준 예상 대기 시간 (같거나 높은 우선순위 작업만 고려)"""
+        ahead = sum(
+            self.estimate_service_time(entry.kind, entry.cost)
+            for entry in self._queue
+            if entry.priority <= priority
+        )
+        running = self._running_cost / max(self.config.max_concurrency, 1)
+        return ahead / max(self.config.max_concurrency, 1) + running
+
+    def _record_completion(self, kind: str, cost: float, elapsed: float) -> None:
+        """실측 처리량으로 EWMA 갱신"""
+        if elapsed <= 0 or cost <= 0:
+            return
+        observed = cost / elapsed
+        alpha = self.config.ewma_alpha
+        previous = self._throughput.get(kind, observed)
+        self._throughput[kind] = (1 - alpha) * previous + alpha * observed
+
+    # ------------------------------------------------------------------
+    # 입장 제어
+    # ------------------------------------------------------------------
+    def _admit(self, ctx: RequestContext, kind: str, cost: float) -> None:
+        """대기열 진입 전 입장 검사"""
+        if len(self._queue) >= self.config.max_queue_size:
+            self.stats["rejected_queue_full"] += 1
+            raise AdmissionRejected("대기열이 가득 찼습니다", retry_after=self.estimate_wait_time(ctx.priority))
+
+        if ctx.priority == Priority.BACKGROUND:
+            background_limit = int(self.config.max_queue_size * self.config.background_queue_share)
+            queued_background = sum(1 for e in self._queue if e.priority == Priority.BACKGROUND)
+            if queued_background >= background_limit:
+                self.stats["rejected_queue_full"] += 1
+                raise AdmissionRejected("background 대기열이 가득 찼습니다", retry_after=self.estimate_wait_time(ctx.priority))
+
+        if ctx.deadline is not None:
+            expected_finish = time.monotonic() + self.estimate_wait_time(ctx.priority) + self.estimate_service_time(kind, cost)
+            if expected_finish > ctx.deadline:
+                self.stats["rejected_deadline"] += 1
+                raise AdmissionRejected(
+                    f"데드라인 내 처리 불가 (예상 완료 {expected_finish - time.monotonic():.1f}초 후, "
+                    f"남은 시간 {ctx.deadline - time.monotonic():.1f}초)",
+                    status_code=503
+                )
+
+    def _dispatch(self) -> None:
+        """실행 가능한 슬롯에 대기 작업 배정"""
+        now = time.monotonic()
+
+        # 데드라인이 이미 지킬 수 없게 된 작업은 대기열에서 제거
+        alive = []
+        for entry in self._queue:
+            if entry.future.done():
+                continue
+            if entry.deadline is not None and now + self.estimate_service_time(entry.kind, entry.cost) > entry.deadline:
+                self.stats["expired_in_queue"] += 1
+                entry.future.set_exception(AdmissionRejected("대기 중 데드라인 초과", status_code=503))
+                continue
+            alive.append(entry)
+        self._queue = alive
+
+        while self._running < self.config.max_concurrency and self._queue:
+            candidates = [
+                e for e in self._queue
+                if self._running_by_tenant.get(e.tenant_id, 0) < self.config.tenant_concurrency
+            ]
+            if not candidates:
+                break
+
+            # 에이징 적용 우선순위 → 데드라인 → 도착 순
+            chosen = min(candidates, key=lambda e: (
+                e.effective_priority(now, self.config.aging_seconds),
+                e.deadline if e.deadline is not None else float("inf"),
+                e.seq
+            ))
+            self._queue.remove(chosen)
+            self._running += 1
+            self._running_by_tenant[chosen.tenant_id] = self._running_by_tenant.get(chosen.tenant_id, 0) + 1
+            self._running_cost += self.estimate_service_time(chosen.kind, chosen.cost)
+            self.stats["total_wait_time"] += now - chosen.enqueued_at
+            chosen.future.set_result(True)
+
+    def _release(self, tenant_id: str, kind: str, cost: float) -> None:
+        self._running -= 1
+        self._running_by_tenant[tenant_id] -= 1
+        if self._running_by_tenant[tenant_id] <= 0:
+            del self._running_by_tenant[tenant_id]
+        self._running_cost = max(0.0, self._running_cost - self.estimate_service_time(kind, cost))
+        self._dispatch()
+
+    # ------------------------------------------------------------------
+    # 실행
+    # ------------------------------------------------------------------
+    async def submit(
+        self,
+        fn: Callable[..., Any],
+        *args,
+        kind: str = "llm",
+        cost: float = 0.0,
+        ctx: Optional[RequestContext] = None,
+        **kwargs
+    ) -> Any:
+        """
+        블로킹 GPU 작업을 스케줄링 후 워커 스레드에서 실행 (코루틴 함수는 이벤트 루프에서 await)
+
+        Args:
+            fn: 실행할 동기 함수 또는 코루틴 함수
+            kind: 작업 종류 (llm / asr / bert)
+            cost: 예상 비용 (llm은 토큰 수, asr은 오디오 바이트, bert는 문자 수)
+            ctx: 스케줄링 정보 (None이면 현재 요청 컨텍스트 사용)
+        """
+        ctx = ctx or current_request_context.get()
+        self.stats["submitted"] += 1
+        self._admit(ctx, kind, cost)
+
+        loop = asyncio.get_event_loop()
+        entry = _QueueEntry(
+            seq=next(self._seq),
+            priority=ctx.priority,
+            tenant_id=ctx.tenant_id,
+            kind=kind,
+            cost=cost,
+            deadline=ctx.deadline,
+            enqueued_at=time.monotonic(),
+            future=loop.create_future()
+        )
+        self._queue.append(entry)
+        self._dispatch()
+
+        try:
+            with span("scheduler_wait", track_cpu=False, kind=kind, priority=ctx.priority.name.lower()):
+                await entry.future
+        except asyncio.CancelledError:
+            if entry in self._queue:
+                self._queue.remove(entry)
+            elif entry.future.done() and not entry.future.cancelled() and entry.future.exception() is None:
+                # 슬롯을 배정받은 직후 취소된 경우 슬롯 반환
+                self._release(ctx.tenant_id, kind, cost)
+            raise
+
+        start_time = time.monotonic()
+        try:
+            if asyncio.iscoroutinefunction(fn):
+                # 비동기 작업(HTTP LLM 백엔드 등)은 워커 스레드 없이 이벤트 루프에서 실행
+                with span(f"{kind}_task", track_cpu=False, fn=fn.__name__):
+                    result = await fn(*args, **kwargs)
+            else:
+                # 컨텍스트(요청 정보, 프로파일 등)를 워커 스레드로 전달
+                context = contextvars.copy_context()
+                result = await loop.run_in_executor(None, lambda: context.run(_run_in_span, kind, fn, *args, **kwargs))
+            self.stats["completed"] += 1
+            return result
+        except Exception:
+            self.stats["failed"] += 1
+            raise
+        finally:
+            self._record_completion(kind, cost, time.monotonic() - start_time)
+            self._release(ctx.tenant_id, kind, cost)
+
+    def run_from_thread(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        fn: Callable[..., Any],
+        *args,
+        kind: str = "llm",
+        cost: float = 0.0,
+        ctx: Optional[RequestContext] = None,
+        **kwargs
+    ) -> Any:
+        """워커 스레드에서 스케줄러를 거쳐 실행 (실시간 세션 등 동기 코드용)"""
+        future = asyncio.run_coroutine_threadsafe(
+            self.submit(fn, *args, kind=kind, cost=cost, ctx=ctx, **kwargs), loop
+        )
+        return future.result()
+
+    # ------------------------------------------------------------------
+    # 모니터링
+    # ------------------------------------------------------------------
+    def get_stats(self) -> Dict[str, Any]:
+        """오토스케일링용 대기열 지표"""
+        now = time.monotonic()
+        queue_depth = {p.name.lower(): 0 for p in Priority}
+        oldest_wait = {p.name.lower(): 0.0 for p in Priority}
+        for entry in self._queue:
+            name = entry.priority.name.lower()
+            queue_depth[name] += 1
+            oldest_wait[name] = max(oldest_wait[name], now - entry.enqueued_at)
+
+        started = self.stats["completed"] + self.stats["failed"] + self._running
+        return {
+            "queue_depth": queue_depth,
+            "queue_depth_total": len(self._queue),
+            "oldest_wait_seconds": oldest_wait,
+            "running": self._running,
+            "running_by_tenant": dict(self._running_by_tenant),
+            "max_concurrency": self.config.max_concurrency,
+            "utilization": self._running / max(self.config.max_concurrency, 1),
+            "estimated_backlog_seconds": {
+                p.name.lower(): self.estimate_wait_time(p) for p in Priority
+            },
+            "throughput_estimate": dict(self._throughput),
+            "avg_wait_seconds": self.stats["total_wait_time"] / started if started else 0.0,
+            **self.stats
+        }
+
+
+def _run_in_span(kind: str, fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """워커 스레드 안에서 구간을 열어 CPU time이 해당 스레드 기준으로 집계되도록 실행"""
+    with span(f"{kind}_task", fn=getattr(fn, "__name__", repr(fn))):
+        return fn(*args, **kwargs)
+
+
+# 전역 인스턴스
+_request_scheduler = None
+
+
+def get_request_scheduler() -> RequestScheduler:
+    """전역 요청 스케줄러 인스턴스 반환"""
+    global _request_scheduler
+    if _request_scheduler is None:
+        # 동시 실행 슬롯 기본값은 LLM 백엔드 기준 (외부 서빙/모델 호스트/배치 백엔드는 동시 요청을 합쳐 처리)
+        from llm_backend import backend_max_concurrency
+        _request_scheduler = RequestScheduler(SchedulerConfig.from_env(default_concurrency=backend_max_concurrency()))
+    return _request_scheduler
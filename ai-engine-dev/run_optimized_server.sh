@@ -9,7 +9,24 @@ export PRELOAD_MODELS=true
 export USE_VLLM=true  # VLLM 활성화
 export HOST=0.0.0.0
 export PORT=8000
-export WORKERS=1
+
+# LLM 백엔드 (vllm: 프로세스 내, openai: 별도 서빙 서버에 HTTP 연결)
+export LLM_BACKEND=${LLM_BACKEND:-vllm}
+export LLM_BASE_URL=${LLM_BASE_URL:-http://localhost:8001}
+
+# 모델 호스트 모드 (GPU별 모델 호스트 프로세스 1개 + 경량 HTTP 워커 N개)
+export MODEL_HOST=${MODEL_HOST:-false}
+if [ "$MODEL_HOST" = "true" ]; then
+    export WORKERS=${WORKERS:-4}
+    export MODEL_HOST_GPUS=${MODEL_HOST_GPUS:-0}
+    # 호스트/워커 연결 인증 키 (지정하지 않으면 실행마다 임의 생성)
+    export MODEL_HOST_AUTHKEY=${MODEL_HOST_AUTHKEY:-$(python -c "import secrets; print(secrets.token_hex(32))")}
+elif [ "$LLM_BACKEND" = "openai" ] || [ "$LLM_BACKEND" = "http" ]; then
+    # LLM은 별도 서빙 서버가 배치 처리 → API 워커를 늘려 동시 요청 전달
+    export WORKERS=${WORKERS:-4}
+else
+    export WORKERS=1  # 워커마다 모델을 로딩하므로 단일 워커
+fi
 
 # GPU 메모리 설정
 export PYTORCH_CUDA_ALLOC_CONF=max_split_size_mb:512
@@ -18,14 +35,33 @@ export PYTORCH_CUDA_ALLOC_CONF=max_split_size_mb:512
 export VLLM_ATTENTION_BACKEND=FLASH_ATTN  # Flash Attention 사용
 export VLLM_USE_MODELSCOPE=false
 
+# 추측 디코딩 (같은 Qwen3 계열 소형 모델로 초안 생성 → 32B가 검증)
+export SPECULATIVE_DECODING=${SPECULATIVE_DECODING:-false}
+export SPECULATIVE_DRAFT_MODEL=${SPECULATIVE_DRAFT_MODEL:-Qwen/Qwen3-4B-AWQ}
+export SPECULATIVE_NUM_TOKENS=${SPECULATIVE_NUM_TOKENS:-5}
+
+# 단계 간 결과 전달 형식 (pretty / minified / outline, 단계별: STAGE_HANDOFF_FORMAT_PRD, STAGE_HANDOFF_FORMAT_TASKS)
+export STAGE_HANDOFF_FORMAT=${STAGE_HANDOFF_FORMAT:-minified}
+
+# 요청 스케줄러 설정 (우선순위/테넌트/데드라인 입장 제어)
+# SCHEDULER_MAX_CONCURRENCY / SCHEDULER_TENANT_CONCURRENCY 미설정 시 LLM 백엔드 기준 기본값
+# (vllm 프로세스 내: 1, transformers: TRANSFORMERS_MAX_BATCH, openai/model_host: 8, 테넌트당은 절반)
+export SCHEDULER_MAX_QUEUE=${SCHEDULER_MAX_QUEUE:-256}
+
 echo "🔧 설정된 환경변수:"
 echo "   - PRELOAD_MODELS=$PRELOAD_MODELS"
 echo "   - USE_VLLM=$USE_VLLM"
 echo "   - HOST=$HOST"
 echo "   - PORT=$PORT"
 echo "   - WORKERS=$WORKERS"
+echo "   - MODEL_HOST=$MODEL_HOST"
 echo "   - PYTORCH_CUDA_ALLOC_CONF=$PYTORCH_CUDA_ALLOC_CONF"
 echo "   - VLLM_ATTENTION_BACKEND=$VLLM_ATTENTION_BACKEND"
+echo "   - LLM_BACKEND=$LLM_BACKEND"
+echo "   - STAGE_HANDOFF_FORMAT=$STAGE_HANDOFF_FORMAT"
+echo "   - SPECULATIVE_DECODING=$SPECULATIVE_DECODING ($SPECULATIVE_DRAFT_MODEL, k=$SPECULATIVE_NUM_TOKENS)"
+echo "   - SCHEDULER_MAX_CONCURRENCY=${SCHEDULER_MAX_CONCURRENCY:-auto}"
+echo "   - SCHEDULER_TENANT_CONCURRENCY=${SCHEDULER_TENANT_CONCURRENCY:-auto}"
 
 echo ""
 echo "🚀 VLLM + 최적화 기능:"
@@ -57,4 +93,20 @@ echo ""
 echo "🎉 서버 시작 중..."
 
 # Python 서버 실행
-python ai_server_final_with_triplets.py
\ No newline at end of file
+if [ "$MODEL_HOST" = "true" ]; then
+    SOCKETS=""
+    HOST_PIDS=""
+    for GPU in ${MODEL_HOST_GPUS//,/ }; do
+        SOCKET=/tmp/ttalkkak_model_host_${GPU}.sock
+        echo "🖥️ 모델 호스트 시작 (GPU $GPU): $SOCKET"
+        CUDA_VISIBLE_DEVICES=$GPU python model_host.py --socket "$SOCKET" &
+        HOST_PIDS="$HOST_PIDS $!"
+        SOCKETS="${SOCKETS:+$SOCKETS,}$SOCKET"
+    done
+    trap "kill $HOST_PIDS 2>/dev/null" EXIT
+
+    # 워커는 모델을 로딩하지 않고 호스트에 연결 (호스트 준비될 때까지 대기)
+    MODEL_HOST_SOCKET=$SOCKETS LLM_BACKEND=model_host python ai_server_final_with_triplets.py
+else
+    python ai_server_final_with_triplets.py
+fi
\ No newline at end of file
@@ -0,0 +1,211 @@
+"""
+TtalKkak 추측 디코딩 (speculative decoding)
+Qwen3-32B-AWQ 서버 모델의 디코드를 같은 계열의 작은 초안 모델로 가속
+- 초안 모델이 k개 토큰을 먼저 제안 → 대상 모델이 한 번의 forward로 검증
+- 출력이 정형화된 한국어 JSON이라 초안 수락률이 높을수록 디코드 지연 감소
+- 같은 토크나이저(Qwen3 계열)를 쓰는 모델만 초안으로 사용 가능
+- method=ngram: 초안 모델 없이 프롬프트 n-gram 조회 (회의록 인용이 많은 단계용)
+- vLLM 버전별 엔진 인자 형식(speculative_model / speculative_config) 자동 선택
+- 초안/수락 토큰 수와 수락률을 메트릭으로 노출
+
+환경변수:
+    SPECULATIVE_DECODING=true|false (기본 false)
+    SPECULATIVE_METHOD=draft|ngram, SPECULATIVE_DRAFT_MODEL, SPECULATIVE_NUM_TOKENS,
+    SPECULATIVE_DRAFT_TP, SPECULATIVE_DRAFT_QUANTIZATION, SPECULATIVE_NGRAM_MAX
+"""
+
+import os
+import re
+import threading
+import logging
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Optional
+
+from metrics import inc, set_gauge
+
+logger = logging.getLogger(__name__)
+
+# Similarity 모듈에서 이미 사용 중인 Qwen3 소형 모델 (32B와 토크나이저 공유)
+DEFAULT_DRAFT_MODEL = "Qwen/Qwen3-4B-AWQ"
+
+# vLLM Prometheus 카운터 이름 (V0: *_total 누적, V1: 동일 이름의 Counter)
+_PROM_DRAFT = "vllm:spec_decode_num_draft_tokens"
+_PROM_ACCEPTED = "vllm:spec_decode_num_accepted_tokens"
+_PROM_EMITTED = "vllm:spec_decode_num_emitted_tokens"
+
+
+@dataclass
+class SpeculativeConfig:
+    """추측 디코딩 설정"""
+    enabled: bool = False
+    method: str = "draft"  # draft | ngram
+    draft_model: str = DEFAULT_DRAFT_MODEL
+    num_speculative_tokens: int = 5
+    draft_tensor_parallel_size: int = 1
+    draft_quantization: Optional[str] = None  # None이면 초안 모델 config에서 자동 감지
+    ngram_prompt_lookup_max: int = 4
+
+    @classmethod
+    def from_env(cls) -> "SpeculativeConfig":
+        return cls(
+            enabled=os.getenv("SPECULATIVE_DECODING", "false").lower() == "true",
+            method=os.getenv("SPECULATIVE_METHOD", "draft").lower(),
+            draft_model=os.getenv("SPECULATIVE_DRAFT_MODEL", DEFAULT_DRAFT_MODEL),
+            num_speculative_tokens=int(os.getenv("SPECULATIVE_NUM_TOKENS", "5")),
+            draft_tensor_parallel_size=int(os.getenv("SPECULATIVE_DRAFT_TP", "1")),
+            draft_quantization=os.getenv("SPECULATIVE_DRAFT_QUANTIZATION") or None,
+            ngram_prompt_lookup_max=int(os.getenv("SPECULATIVE_NGRAM_MAX", "4"))
+        )
+
+    def describe(self) -> Dict[str, Any]:
+        if not self.enabled:
+            return {"enabled": False}
+        return {
+            "enabled": True,
+            "method": self.method,
+            "draft_model": self.draft_model if self.method == "draft" else None,
+            "num_speculative_tokens": self.num_speculative_tokens
+        }
+
+    def to_engine_kwargs(self, legacy: Optional[bool] = None) -> Dict[str, Any]:
+        """vLLM LLM(...) 인자 (legacy=None이면 설치된 vLLM의 EngineArgs로 판단)"""
+        if not self.enabled:
+            return {}
+        if self.method not in ("draft", "ngram"):
+            raise ValueError(f"알 수 없는 SPECULATIVE_METHOD: {self.method} (draft/ngram)")
+        if legacy is None:
+            legacy = uses_legacy_engine_args()
+
+        # 수락률 집계는 엔진 통계 로깅이 켜져 있어야 동작
+        kwargs: Dict[str, Any] = {"disable_log_stats": False}
+        if legacy:
+            # vLLM <= 0.8: 개별 인자
+            kwargs["num_speculative_tokens"] = self.num_speculative_tokens
+            if self.method == "ngram":
+                kwargs["speculative_model"] = "[ngram]"
+                kwargs["ngram_prompt_lookup_max"] = self.ngram_prompt_lookup_max
+                kwargs["ngram_prompt_lookup_min"] = 1
+            else:
+                kwargs["speculative_model"] = self.draft_model
+                kwargs["speculative_draft_tensor_parallel_size"] = self.draft_tensor_parallel_size
+                if self.draft_quantization:
+                    kwargs["speculative_model_quantization"] = self.draft_quantization
+            return kwargs
+
+        # 신규 vLLM: speculative_config 딕셔너리
+        spec: Dict[str, Any] = {"num_speculative_tokens": self.num_speculative_tokens}
+        if self.method == "ngram":
+            spec.update({"method": "ngram", "prompt_lookup_max": self.ngram_prompt_lookup_max, "prompt_lookup_min": 1})
+        else:
+            spec.update({"model": self.draft_model, "draft_tensor_parallel_size": self.draft_tensor_parallel_size})
+            if self.draft_quantization:
+                spec["quantization"] = self.draft_quantization
+        kwargs["speculative_config"] = spec
+        return kwargs
+
+
+def uses_legacy_engine_args() -> bool:
+    """설치된 vLLM이 speculative_model 개별 인자를 쓰는지"""
+    try:
+        from vllm import EngineArgs
+    except ImportError:
+        return False
+    return "speculative_model" in {field.name for field in fields(EngineArgs)}
+
+
+class SpecDecodeTracker:
+    """
+    엔진 누적 초안/수락 토큰 수 → 메트릭 반영
+
+    vLLM 버전마다 값을 얻는 경로가 달라 세 가지 입력을 지원:
+    - log(stats): V0 엔진 stat logger 인터페이스 (llm_engine.add_logger로 등록)
+    - poll_llm(llm): V1 엔진의 LLM.get_metrics()
+    - update_from_prometheus(text): vllm serve의 /metrics 텍스트 (HTTP 백엔드)
+    """
+
+    def __init__(self, source: str = "vllm"):
+        self.source = source
+        self.draft_tokens = 0
+        self.accepted_tokens = 0
+        self.emitted_tokens = 0
+        self._lock = threading.Lock()
+
+    def update_totals(self, draft_tokens: float, accepted_tokens: float, emitted_tokens: Optional[float] = None) -> None:
+        """누적값 갱신, 증가분만 카운터에 반영 (엔진 재시작으로 값이 줄면 새 기준으로 사용)"""
+        with self._lock:
+            draft_delta = int(draft_tokens) - self.draft_tokens
+            accepted_delta = int(accepted_tokens) - self.accepted_tokens
+            self.draft_tokens = int(draft_tokens)
+            self.accepted_tokens = int(accepted_tokens)
+            if emitted_tokens is not None:
+                self.emitted_tokens = int(emitted_tokens)
+            rate = self.acceptance_rate
+
+        if draft_delta > 0:
+            inc("llm_spec_draft_tokens_total", draft_delta, source=self.source)
+        if accepted_delta > 0:
+            inc("llm_spec_accepted_tokens_total", accepted_delta, source=self.source)
+        if rate is not None:
+            set_gauge("llm_spec_acceptance_rate", rate, source=self.source)
+
+    @property
+    def acceptance_rate(self) -> Optional[float]:
+        return self.accepted_tokens / self.draft_tokens if self.draft_tokens else None
+
+    # V0 StatLoggerBase 호환 (덕 타이핑)
+    def log(self, stats) -> None:
+        spec_metrics = getattr(stats, "spec_decode_metrics", None)
+        if spec_metrics is not None:
+            self.update_totals(spec_metrics.draft_tokens, spec_metrics.accepted_tokens, spec_metrics.emitted_tokens)
+
+    def info(self, type: str, obj) -> None:
+        pass
+
+    def poll_llm(self, llm) -> None:
+        """V1 엔진: LLM.get_metrics()의 카운터 읽기"""
+        get_metrics = getattr(llm, "get_metrics", None)
+        if get_metrics is None:
+            return
+        try:
+            totals = {}
+            for metric in get_metrics():
+                if metric.name in (_PROM_DRAFT, _PROM_ACCEPTED):
+                    totals[metric.name] = totals.get(metric.name, 0) + getattr(metric, "value", 0)
+        except Exception as e:
+            logger.debug(f"vLLM 메트릭 조회 실패: {e}")
+            return
+        if _PROM_DRAFT in totals:
+            self.update_totals(totals[_PROM_DRAFT], totals.get(_PROM_ACCEPTED, 0))
+
+    def update_from_prometheus(self, text: str) -> None:
+        """Prometheus 텍스트에서 카운터 합산 (레이블 조합 전체)"""
+        totals = parse_prometheus_counters(text, (_PROM_DRAFT, _PROM_ACCEPTED, _PROM_EMITTED))
+        if totals.get(_PROM_DRAFT):
+            self.update_totals(totals[_PROM_DRAFT], totals.get(_PROM_ACCEPTED, 0), totals.get(_PROM_EMITTED))
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "draft_tokens": self.draft_tokens,
+                "accepted_tokens": self.accepted_tokens,
+                "emitted_tokens": self.emitted_tokens,
+                "acceptance_rate": self.acceptance_rate
+            }
+
+
+_PROM_LINE = re.compile(r"^([a-zA-Z_:][a-zA-Z0-9_:]*)(\{[^}]*\})?\s+([0-9.eE+-]+)")
+
+
+def parse_prometheus_counters(text: str, names) -> Dict[str, float]:
+    """name 또는 name_total 샘플 값을 이름별로 합산"""
+    totals: Dict[str, float] = {}
+    for line in text.splitlines():
+        match = _PROM_LINE.match(line)
+        if not match:
+            continue
+        name = match.group(1)
+        if name.endswith("_total"):
+            name = name[:-len("_total")]
+        if name in names:
+            totals[name] = totals.get(name, 0.0) + float(match.group(3))
+    return totals
@@ -0,0 +1,87 @@
+"""
+TtalKkak 단계 간 결과 직렬화
+앞 단계 JSON을 다음 단계 프롬프트에 넣을 때의 형식 (프롬프트 토큰 절감)
+- pretty: json.dumps(indent=2) (기존 방식)
+- minified: 공백 없는 JSON (정보 손실 없음)
+- outline: 스키마 순서의 "키: 값" 개요 (괄호/따옴표/들여쓰기 제거, 가장 짧음)
+
+환경변수:
+    STAGE_HANDOFF_FORMAT (전체 기본값, 기본 minified)
+    STAGE_HANDOFF_FORMAT_<STAGE> (단계별 지정, 예: STAGE_HANDOFF_FORMAT_PRD=outline)
+"""
+
+import os
+import json
+from typing import Any, Dict, Iterable, List, Optional
+
+HANDOFF_FORMATS = ("pretty", "minified", "outline")
+DEFAULT_HANDOFF_FORMAT = "minified"
+
+
+def get_handoff_format(stage: str) -> str:
+    """단계별 직렬화 형식 (단계별 환경변수 → 전체 기본값)"""
+    value = os.getenv(f"STAGE_HANDOFF_FORMAT_{stage.upper()}") or os.getenv("STAGE_HANDOFF_FORMAT", DEFAULT_HANDOFF_FORMAT)
+    value = value.strip().lower()
+    return value if value in HANDOFF_FORMATS else DEFAULT_HANDOFF_FORMAT
+
+
+def ordered_keys(data: Dict[str, Any], key_order: Optional[Iterable[str]] = None) -> List[str]:
+    """스키마 순서 키 → 나머지 키 (입력 순서) — 같은 스키마면 항상 같은 순서"""
+    keys = [key for key in (key_order or []) if key in data]
+    keys += [key for key in data if key not in keys]
+    return keys
+
+
+def _inline(value: Any) -> str:
+    """한 줄 값 (줄바꿈은 공백으로)"""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+    return " ".join(str(value).split())
+
+
+def _outline_lines(data: Any, key_order: Optional[Iterable[str]], indent: str) -> List[str]:
+    lines = []
+    if isinstance(data, dict):
+        for key in ordered_keys(data, key_order):
+            value = data[key]
+            if value in (None, "", [], {}):
+                continue
+            if isinstance(value, (dict, list)):
+                lines.append(f"{indent}{key}:")
+                lines.extend(_outline_lines(value, None, indent + " "))
+            else:
+                lines.append(f"{indent}{key}: {_inline(value)}")
+    elif isinstance(data, list):
+        for item in data:
+            if isinstance(item, dict):
+                # 목록 안의 객체는 한 줄로 (k=v; k=v)
+                fields = [f"{key}={_inline(item[key])}" for key in ordered_keys(item) if item[key] not in (None, "", [], {})]
+                lines.append(f"{indent}- {'; '.join(fields)}")
+            else:
+                lines.append(f"{indent}- {_inline(item)}")
+    else:
+        lines.append(f"{indent}{_inline(data)}")
+    return lines
+
+
+def serialize_stage_output(
+    data: Any,
+    stage: str = "default",
+    fmt: Optional[str] = None,
+    key_order: Optional[Iterable[str]] = None
+) -> str:
+    """
+    앞 단계 결과 → 다음 단계 프롬프트용 문자열
+
+    stage: 받는 단계 이름 (형식 설정 조회용)
+    fmt: 지정하면 설정 대신 사용
+    key_order: outline 형식의 최상위 필드 순서 (보통 앞 단계 응답 스키마의 키)
+    """
+    fmt = fmt or get_handoff_format(stage)
+    if fmt == "pretty":
+        return json.dumps(data, ensure_ascii=False, indent=2)
+    if fmt == "outline":
+        return "\n".join(_outline_lines(data, key_order, ""))
+    if isinstance(data, dict) and key_order:
+        data = {key: data[key] for key in ordered_keys(data, key_order)}
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
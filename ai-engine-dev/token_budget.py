@@ -0,0 +1,158 @@
+"""
+TtalKkak 출력 토큰 예산
+단계(stage)별 최근 출력 길이 분포로 max_tokens를 동적으로 결정
+- 단계 × 입력 크기 구간별 p95 × 여유율
+- 표본이 부족하면 단계 전체 → 기본값 순으로 대체
+- max_tokens를 줄이면 vLLM이 예약하는 KV 캐시가 줄어 동시 스케줄 가능한 시퀀스 증가
+- 예산이 모자라 잘린 응답은 호출부에서 이어서 생성 (처음부터 다시 생성하지 않음)
+- 상한은 단계별 (단일 호출 fused는 기획안/PRD/업무 세 문서를 한 번에 출력하므로 기본 3배)
+
+환경변수:
+    TOKEN_BUDGET_ENABLED, TOKEN_BUDGET_PERCENTILE, TOKEN_BUDGET_HEADROOM,
+    TOKEN_BUDGET_MIN_SAMPLES, TOKEN_BUDGET_WINDOW, LLM_MAX_TOKENS_CAP,
+    LLM_FUSED_MAX_TOKENS (기본: LLM_MAX_TOKENS_CAP × 3)
+"""
+
+import os
+import math
+import threading
+from bisect import bisect_right
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+# 입력 토큰 구간 경계 (~1k, ~4k, ~16k, 그 이상)
+DEFAULT_BUCKET_EDGES = (1000, 4000, 16000)
+
+# fused 단계 출력 = 3단계 호출(notion/prd/tasks) 출력 합계
+FUSED_STAGE = "fused"
+FUSED_CAP_MULTIPLIER = 3
+
+
+def percentile(values, q: float) -> float:
+    """최근접 순위 백분위수 (q: 0~1)"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    rank = max(1, math.ceil(q * len(ordered)))
+    return float(ordered[rank - 1])
+
+
+class TokenBudgeter:
+    """단계별 출력 길이 학습 → max_tokens 결정 (스레드 안전)"""
+
+    def __init__(
+        self,
+        max_tokens_cap: int = 2048,
+        min_tokens: int = 256,
+        percentile_q: float = 0.95,
+        headroom: float = 1.2,
+        min_samples: int = 20,
+        window: int = 200,
+        bucket_edges: Tuple[int, ...] = DEFAULT_BUCKET_EDGES,
+        enabled: bool = True,
+        stage_caps: Optional[Dict[str, int]] = None
+    ):
+        self.max_tokens_cap = max_tokens_cap
+        # 단계별 상한 (없는 단계는 max_tokens_cap)
+        self.stage_caps = dict(stage_caps) if stage_caps is not None else {FUSED_STAGE: max_tokens_cap * FUSED_CAP_MULTIPLIER}
+        self.min_tokens = min(min_tokens, max_tokens_cap)
+        self.percentile_q = percentile_q
+        self.headroom = headroom
+        self.min_samples = min_samples
+        self.window = window
+        self.bucket_edges = tuple(bucket_edges)
+        self.enabled = enabled
+        self._samples: Dict[Tuple[str, int], Deque[int]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"budgeted": 0, "default": 0, "truncated": 0}
+
+    @classmethod
+    def from_env(cls) -> "TokenBudgeter":
+        max_tokens_cap = int(os.getenv("LLM_MAX_TOKENS_CAP", "2048"))
+        fused_cap = int(os.getenv("LLM_FUSED_MAX_TOKENS", str(max_tokens_cap * FUSED_CAP_MULTIPLIER)))
+        return cls(
+            max_tokens_cap=max_tokens_cap,
+            stage_caps={FUSED_STAGE: fused_cap},
+            percentile_q=float(os.getenv("TOKEN_BUDGET_PERCENTILE", "0.95")),
+            headroom=float(os.getenv("TOKEN_BUDGET_HEADROOM", "1.2")),
+            min_samples=int(os.getenv("TOKEN_BUDGET_MIN_SAMPLES", "20")),
+            window=int(os.getenv("TOKEN_BUDGET_WINDOW", "200")),
+            enabled=os.getenv("TOKEN_BUDGET_ENABLED", "true").lower() == "true"
+        )
+
+    def cap(self, stage: str) -> int:
+        """단계 출력 상한 (이어쓰기를 포함한 전체 출력도 이 값까지)"""
+        return self.stage_caps.get(stage, self.max_tokens_cap)
+
+    def bucket(self, input_tokens: int) -> int:
+        return bisect_right(self.bucket_edges, input_tokens)
+
+    def bucket_label(self, bucket: int) -> str:
+        if bucket >= len(self.bucket_edges):
+            return f"{self.bucket_edges[-1]}+"
+        lower = self.bucket_edges[bucket - 1] if bucket > 0 else 0
+        return f"{lower}-{self.bucket_edges[bucket]}"
+
+    def record(self, stage: str, input_tokens: int, output_tokens: int, truncated: bool = False) -> None:
+        """완료된 생성의 출력 길이 기록 (잘린 응답은 이어서 생성한 뒤의 전체 길이를 기록)"""
+        with self._lock:
+            key = (stage, self.bucket(input_tokens))
+            samples = self._samples.get(key)
+            if samples is None:
+                samples = self._samples[key] = deque(maxlen=self.window)
+            samples.append(int(output_tokens))
+            if truncated:
+                self.stats["truncated"] += 1
+
+    def _stage_samples(self, stage: str):
+        return [value for (name, _), samples in self._samples.items() if name == stage for value in samples]
+
+    def budget(self, stage: str, input_tokens: int) -> int:
+        """이번 호출의 max_tokens"""
+        cap = self.cap(stage)
+        if not self.enabled:
+            return cap
+
+        with self._lock:
+            samples = list(self._samples.get((stage, self.bucket(input_tokens)), ()))
+            if len(samples) < self.min_samples:
+                samples = self._stage_samples(stage)
+            if len(samples) < self.min_samples:
+                self.stats["default"] += 1
+                return cap
+            self.stats["budgeted"] += 1
+
+        budget = percentile(samples, self.percentile_q) * self.headroom
+        # 64 단위 올림 (요청 간 값 흔들림 완화)
+        budget = int(math.ceil(budget / 64.0) * 64)
+        return max(self.min_tokens, min(cap, budget))
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            buckets = {
+                f"{stage}:{self.bucket_label(bucket)}": {
+                    "samples": len(samples),
+                    "p50": percentile(samples, 0.5),
+                    "p95": percentile(samples, 0.95)
+                }
+                for (stage, bucket), samples in sorted(self._samples.items())
+            }
+        return {
+            "enabled": self.enabled,
+            "max_tokens_cap": self.max_tokens_cap,
+            "stage_caps": dict(self.stage_caps),
+            "buckets": buckets,
+            **self.stats
+        }
+
+
+# 전역 인스턴스
+_token_budgeter: Optional[TokenBudgeter] = None
+
+
+def get_token_budgeter() -> TokenBudgeter:
+    """전역 토큰 예산기 반환"""
+    global _token_budgeter
+    if _token_budgeter is None:
+        _token_budgeter = TokenBudgeter.from_env()
+    return _token_budgeter
@@ -21,7 +21,7 @@ except ImportError as e:
     logging.warning(f"⚠️ Triplet 모듈 임포트 실패: {e}")
     logging.info("💡 루트 디렉토리의 triplet 파일들을 확인해주세요")
 
-from bert_classifier import get_bert_classifier
+from metrics import timer
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +37,15 @@ class TripletProcessor:
     def _ensure_bert_classifier(self):
         """BERT 분류기 지연 로딩"""
         if self.bert_classifier is None:
-            self.bert_classifier = get_bert_classifier()
+            # torch/transformers는 실제 분류가 필요할 때만 로딩 (벤치마크 스텁 주입 허용)
+            from model_host import is_model_host_client
+            if is_model_host_client():
+                # 모델 호스트 모드: 분류는 호스트에서 워커 간 배치로 실행
+                from model_host import RemoteBertClassifier
+                self.bert_classifier = RemoteBertClassifier()
+            else:
+                from bert_classifier import get_bert_classifier
+                self.bert_classifier = get_bert_classifier()
     
     def whisperx_to_triplets(self, whisperx_result: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -72,7 +80,8 @@ class TripletProcessor:
                 })
             
             # Triplet 구조 생성
-            triplets = create_structured_triplets(structured_data)
+            with timer("triplet_build_seconds"):
+                triplets = create_structured_triplets(structured_data)
             
             logger.info(f"✅ Triplet 변환 완료: {len(structured_data)} → {len(triplets)}개 Triplet")
             
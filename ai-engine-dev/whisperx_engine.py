@@ -0,0 +1,78 @@
+"""
+TtalKkak WhisperX 엔진
+WhisperX 모델 로딩과 전사 실행
+- 일반 모드: 프로세스 내 모델 사용
+- 모델 호스트 모드(MODEL_HOST_SOCKET): 모델 호스트 프로세스에 전사 요청
+"""
+
+import logging
+from typing import Any, Dict
+
+import torch
+
+from metrics import timer
+from profiling import span
+from model_host import is_model_host_client, get_model_host_client
+
+logger = logging.getLogger(__name__)
+
+# 글로벌 모델 변수
+whisper_model = None
+
+def load_whisperx():
+    """WhisperX 모델 로딩"""
+    global whisper_model
+    
+    if whisper_model is None:
+        logger.info("🎤 Loading WhisperX large-v3...")
+        try:
+            import whisperx
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+            compute_type = "float16" if device == "cuda" else "int8"
+            
+            whisper_model = whisperx.load_model(
+                "large-v3", 
+                device, 
+                compute_type=compute_type,
+                language="ko"
+            )
+            logger.info("✅ WhisperX loaded successfully")
+            
+        except Exception as e:
+            logger.error(f"❌ WhisperX loading failed: {e}")
+            raise e
+    
+    return whisper_model
+
+def is_whisperx_loaded() -> bool:
+    return whisper_model is not None
+
+def transcribe_local(audio_input, batch_size: int = 16) -> Dict[str, Any]:
+    """프로세스 내 WhisperX 전사 (파일 경로 또는 16kHz float32 오디오 배열)"""
+    whisper_model = load_whisperx()
+    
+    # 파일 경로 입력이면 디코딩을 분리해 구간별로 측정
+    if isinstance(audio_input, str):
+        import whisperx
+        with span("audio_decode"):
+            audio_input = whisperx.load_audio(audio_input)
+    
+    with timer("transcription_seconds"):
+        result = whisper_model.transcribe(audio_input, batch_size=batch_size)
+    
+    segments = result.get("segments", [])
+    full_text = " ".join([seg.get("text", "") for seg in segments])
+    
+    return {
+        "segments": segments,
+        "full_text": full_text,
+        "language": result.get("language", "ko"),
+        "duration": sum([seg.get("end", 0) - seg.get("start", 0) for seg in segments])
+    }
+
+def whisperx_transcribe(audio_input, batch_size: int = 16) -> Dict[str, Any]:
+    """WhisperX 전사 실행 (모델 호스트 모드면 호스트에서 실행, 파일 경로는 같은 장비이므로 그대로 전달)"""
+    if is_model_host_client():
+        with timer("transcription_seconds"):
+            return get_model_host_client().call("transcribe", audio_input, batch_size=batch_size)
+    return transcribe_local(audio_input, batch_size=batch_size)